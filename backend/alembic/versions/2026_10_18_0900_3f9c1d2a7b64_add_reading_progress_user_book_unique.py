@@ -0,0 +1,39 @@
+"""Add unique (user_id, book_id) constraint to reading_progress
+
+Revision ID: 3f9c1d2a7b64
+Revises: bb1c85ad7a7e
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3f9c1d2a7b64'
+down_revision = 'bb1c85ad7a7e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep only the most recent progress row per user and book so the
+    # constraint can be created on databases that already hold duplicates
+    op.execute(
+        """
+        DELETE FROM reading_progress
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM reading_progress GROUP BY user_id, book_id
+        )
+        """
+    )
+
+    # Backs get_by_user_and_book and the ON CONFLICT target of the upsert
+    op.create_unique_constraint(
+        'unique_user_book_progress', 'reading_progress', ['user_id', 'book_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'unique_user_book_progress', 'reading_progress', type_='unique'
+    )
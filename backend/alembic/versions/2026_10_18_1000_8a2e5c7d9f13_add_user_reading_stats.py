@@ -0,0 +1,195 @@
+"""Add user_reading_stats summary table maintained by triggers
+
+Revision ID: 8a2e5c7d9f13
+Revises: 3f9c1d2a7b64
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8a2e5c7d9f13'
+down_revision = '3f9c1d2a7b64'
+branch_labels = None
+depends_on = None
+
+# Trigger SQL as of this revision, copied from app/models/user_reading_stats.py
+# so the migration does not change when the model does
+POSTGRES_STATS_FUNCTION = """
+CREATE OR REPLACE FUNCTION user_reading_stats_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NOT (
+            NEW.user_id IS DISTINCT FROM OLD.user_id
+            OR NEW.is_completed IS DISTINCT FROM OLD.is_completed
+            OR NEW.status IS DISTINCT FROM OLD.status
+            OR NEW.reading_time_minutes IS DISTINCT FROM OLD.reading_time_minutes
+        ) THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+
+        UPDATE user_reading_stats SET
+            total_books = total_books - 1,
+            completed_books = completed_books -
+                (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading -
+                (CASE WHEN OLD.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes -
+                COALESCE(OLD.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = OLD.user_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO user_reading_stats (user_id) VALUES (NEW.user_id)
+        ON CONFLICT (user_id) DO NOTHING;
+
+        UPDATE user_reading_stats SET
+            total_books = total_books + 1,
+            completed_books = completed_books +
+                (CASE WHEN NEW.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading +
+                (CASE WHEN NEW.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes +
+                COALESCE(NEW.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = NEW.user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+POSTGRES_STATS_TRIGGER = """
+CREATE TRIGGER reading_progress_stats
+AFTER INSERT OR UPDATE OR DELETE ON reading_progress
+FOR EACH ROW EXECUTE FUNCTION user_reading_stats_delta()
+"""
+
+SQLITE_STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS reading_progress_stats_insert
+    AFTER INSERT ON reading_progress
+    BEGIN
+        INSERT INTO user_reading_stats (user_id)
+        SELECT NEW.user_id WHERE NOT EXISTS (
+            SELECT 1 FROM user_reading_stats WHERE user_id = NEW.user_id
+        );
+
+        UPDATE user_reading_stats SET
+            total_books = total_books + 1,
+            completed_books = completed_books +
+                (CASE WHEN NEW.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading +
+                (CASE WHEN NEW.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes +
+                COALESCE(NEW.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = NEW.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reading_progress_stats_update
+    AFTER UPDATE ON reading_progress
+    WHEN (
+            NEW.user_id IS NOT OLD.user_id
+            OR NEW.is_completed IS NOT OLD.is_completed
+            OR NEW.status IS NOT OLD.status
+            OR NEW.reading_time_minutes IS NOT OLD.reading_time_minutes
+        )
+    BEGIN
+
+        UPDATE user_reading_stats SET
+            total_books = total_books - 1,
+            completed_books = completed_books -
+                (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading -
+                (CASE WHEN OLD.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes -
+                COALESCE(OLD.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = OLD.user_id;
+        INSERT INTO user_reading_stats (user_id)
+        SELECT NEW.user_id WHERE NOT EXISTS (
+            SELECT 1 FROM user_reading_stats WHERE user_id = NEW.user_id
+        );
+
+        UPDATE user_reading_stats SET
+            total_books = total_books + 1,
+            completed_books = completed_books +
+                (CASE WHEN NEW.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading +
+                (CASE WHEN NEW.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes +
+                COALESCE(NEW.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = NEW.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reading_progress_stats_delete
+    AFTER DELETE ON reading_progress
+    BEGIN
+
+        UPDATE user_reading_stats SET
+            total_books = total_books - 1,
+            completed_books = completed_books -
+                (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading -
+                (CASE WHEN OLD.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes -
+                COALESCE(OLD.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = OLD.user_id;
+    END
+    """,
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_reading_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('total_books', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('completed_books', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('currently_reading', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('total_reading_time_minutes', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+
+    # Backfill from existing progress before the triggers take over
+    op.execute(
+        """
+        INSERT INTO user_reading_stats (
+            user_id, total_books, completed_books, currently_reading,
+            total_reading_time_minutes
+        )
+        SELECT
+            user_id,
+            COUNT(*),
+            SUM(CASE WHEN is_completed THEN 1 ELSE 0 END),
+            SUM(CASE WHEN status = 'reading' THEN 1 ELSE 0 END),
+            COALESCE(SUM(reading_time_minutes), 0)
+        FROM reading_progress
+        GROUP BY user_id
+        """
+    )
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(POSTGRES_STATS_FUNCTION)
+        op.execute(POSTGRES_STATS_TRIGGER)
+    else:
+        for trigger in SQLITE_STATS_TRIGGERS:
+            op.execute(trigger)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP TRIGGER IF EXISTS reading_progress_stats ON reading_progress')
+        op.execute('DROP FUNCTION IF EXISTS user_reading_stats_delta()')
+    else:
+        for action in ('insert', 'update', 'delete'):
+            op.execute(f'DROP TRIGGER IF EXISTS reading_progress_stats_{action}')
+    op.drop_table('user_reading_stats')
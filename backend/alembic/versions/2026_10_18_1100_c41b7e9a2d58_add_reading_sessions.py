@@ -0,0 +1,109 @@
+"""Add reading_sessions event log and daily/weekly rollup tables
+
+Revision ID: c41b7e9a2d58
+Revises: 8a2e5c7d9f13
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from datetime import date, timedelta
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c41b7e9a2d58'
+down_revision = '8a2e5c7d9f13'
+branch_labels = None
+depends_on = None
+
+# Monthly partitions created up front; scripts/rollup_reading_sessions.py
+# keeps creating the following months
+PARTITION_MONTHS_AHEAD = 2
+
+
+def _create_postgres_sessions() -> None:
+    # Partitioned by month on read_at; the partition key must be part of the
+    # primary key, so it is (id, read_at)
+    op.execute(
+        """
+        CREATE TABLE reading_sessions (
+            id BIGINT GENERATED BY DEFAULT AS IDENTITY,
+            user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            book_id INTEGER NOT NULL REFERENCES books (id) ON DELETE CASCADE,
+            start_page INTEGER NOT NULL DEFAULT 0,
+            end_page INTEGER NOT NULL DEFAULT 0,
+            duration_seconds INTEGER NOT NULL DEFAULT 0,
+            read_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, read_at)
+        ) PARTITION BY RANGE (read_at)
+        """
+    )
+    # Catches events outside the pre-created months instead of failing inserts
+    op.execute(
+        'CREATE TABLE reading_sessions_default PARTITION OF reading_sessions DEFAULT'
+    )
+
+    month = date.today().replace(day=1)
+    for _ in range(PARTITION_MONTHS_AHEAD + 1):
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        op.execute(
+            f"CREATE TABLE reading_sessions_{month:%Y_%m} PARTITION OF reading_sessions "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        _create_postgres_sessions()
+    else:
+        op.create_table(
+            'reading_sessions',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('book_id', sa.Integer(), nullable=False),
+            sa.Column('start_page', sa.Integer(), server_default='0', nullable=False),
+            sa.Column('end_page', sa.Integer(), server_default='0', nullable=False),
+            sa.Column('duration_seconds', sa.Integer(), server_default='0', nullable=False),
+            sa.Column('read_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+            sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+        )
+    op.create_index('ix_reading_sessions_user_read_at', 'reading_sessions', ['user_id', 'read_at'], unique=False)
+    op.create_index('ix_reading_sessions_book_read_at', 'reading_sessions', ['book_id', 'read_at'], unique=False)
+    op.create_index('ix_reading_sessions_read_at', 'reading_sessions', ['read_at'], unique=False)
+
+    op.create_table(
+        'user_reading_rollups',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.String(length=10), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('sessions', sa.Integer(), nullable=False),
+        sa.Column('reading_seconds', sa.BigInteger(), nullable=False),
+        sa.Column('pages_read', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'period', 'period_start'),
+    )
+    op.create_table(
+        'book_reading_rollups',
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.String(length=10), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('sessions', sa.Integer(), nullable=False),
+        sa.Column('readers', sa.Integer(), nullable=False),
+        sa.Column('reading_seconds', sa.BigInteger(), nullable=False),
+        sa.Column('pages_read', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('book_id', 'period', 'period_start'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('book_reading_rollups')
+    op.drop_table('user_reading_rollups')
+    op.drop_index('ix_reading_sessions_read_at', table_name='reading_sessions')
+    op.drop_index('ix_reading_sessions_book_read_at', table_name='reading_sessions')
+    op.drop_index('ix_reading_sessions_user_read_at', table_name='reading_sessions')
+    # Dropping the partitioned parent drops its partitions as well
+    op.drop_table('reading_sessions')
@@ -0,0 +1,53 @@
+"""Add composite and partial indexes for hot listing queries
+
+Revision ID: 5d8f3a1c6e27
+Revises: c41b7e9a2d58
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '5d8f3a1c6e27'
+down_revision = 'c41b7e9a2d58'
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_books_active_created_at', 'books', ['created_at'], 'is_active'),
+    ('ix_books_category_active_created_at', 'books', ['category_id', 'created_at'], 'is_active'),
+    ('ix_chapters_public_book_number', 'chapters', ['book_id', 'chapter_number'], 'is_published AND is_active'),
+    ('ix_favorites_user_created_at', 'favorites', ['user_id', 'created_at'], None),
+    ('ix_reading_lists_public_id', 'reading_lists', ['id'], 'is_public AND is_active'),
+    ('ix_reading_progress_user_status', 'reading_progress', ['user_id', 'status'], None),
+    ('ix_reading_progress_user_completed_at', 'reading_progress', ['user_id', 'completed_at'], 'is_completed'),
+]
+
+
+def upgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    # Build concurrently on Postgres so large tables stay writable; that
+    # cannot run inside the migration transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            predicate = sa.text(where) if where else None
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_where=predicate,
+                postgresql_concurrently=is_postgres,
+                sqlite_where=predicate,
+            )
+
+
+def downgrade() -> None:
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=is_postgres)
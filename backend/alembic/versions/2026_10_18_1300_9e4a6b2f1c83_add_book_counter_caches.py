@@ -0,0 +1,41 @@
+"""Add book_count/active_book_count counter caches to authors and categories
+
+Revision ID: 9e4a6b2f1c83
+Revises: 5d8f3a1c6e27
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '9e4a6b2f1c83'
+down_revision = '5d8f3a1c6e27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table, fk in (('authors', 'author_id'), ('categories', 'category_id')):
+        op.add_column(table, sa.Column('book_count', sa.Integer(), server_default='0', nullable=False))
+        op.add_column(table, sa.Column('active_book_count', sa.Integer(), server_default='0', nullable=False))
+
+        # Backfill; CRUDBook keeps the counters current from here on
+        op.execute(
+            f"""
+            UPDATE {table} SET
+                book_count = (
+                    SELECT COUNT(*) FROM books WHERE books.{fk} = {table}.id
+                ),
+                active_book_count = (
+                    SELECT COUNT(*) FROM books
+                    WHERE books.{fk} = {table}.id AND books.is_active
+                )
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in ('categories', 'authors'):
+        op.drop_column(table, 'active_book_count')
+        op.drop_column(table, 'book_count')
@@ -0,0 +1,112 @@
+"""Move chapter bodies into chapter_contents
+
+Revision ID: e7c3a9d1b5f2
+Revises: 9e4a6b2f1c83
+Create Date: 2026-10-18 14:00:00.000000
+
+Existing bodies are copied uncompressed; they are compressed according to
+CHAPTER_CONTENT_COMPRESSION the next time they are written.
+
+"""
+import gzip
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e7c3a9d1b5f2'
+down_revision = '9e4a6b2f1c83'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    """Decode a compressed body; a copy of app.core.compression.decompress."""
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    if encoding == 'br':
+        import brotli
+
+        return brotli.decompress(data)
+    raise ValueError(f'Unsupported encoding: {encoding}')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'chapter_contents',
+        sa.Column('chapter_id', sa.Integer(), nullable=False),
+        sa.Column('encoding', sa.String(length=10), nullable=False),
+        sa.Column('body', sa.Text(), nullable=True),
+        sa.Column('compressed_body', sa.LargeBinary(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['chapter_id'], ['chapters.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('chapter_id'),
+    )
+    op.add_column('chapters', sa.Column('content_size', sa.Integer(), nullable=True))
+    op.add_column('chapters', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    op.execute(
+        """
+        INSERT INTO chapter_contents (chapter_id, encoding, body)
+        SELECT id, 'identity', content FROM chapters WHERE content IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        UPDATE chapters SET
+            content_size = octet_length(content),
+            content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex')
+        WHERE content IS NOT NULL
+        """
+    )
+    op.drop_column('chapters', 'content')
+
+
+def downgrade() -> None:
+    op.add_column('chapters', sa.Column('content', sa.Text(), nullable=True))
+    op.execute(
+        """
+        UPDATE chapters SET content = chapter_contents.body
+        FROM chapter_contents
+        WHERE chapter_contents.chapter_id = chapters.id
+          AND chapter_contents.encoding = 'identity'
+        """
+    )
+
+    # Compressed bodies have to be decoded in Python
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                """
+                SELECT chapter_id, encoding, compressed_body FROM chapter_contents
+                WHERE encoding <> 'identity' AND chapter_id > :last_id
+                ORDER BY chapter_id LIMIT :limit
+                """
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        conn.execute(
+            sa.text('UPDATE chapters SET content = :content WHERE id = :id'),
+            [
+                {
+                    'id': row.chapter_id,
+                    'content': _decompress(row.compressed_body, row.encoding).decode('utf-8'),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].chapter_id
+
+    op.drop_column('chapters', 'content_hash')
+    op.drop_column('chapters', 'content_size')
+    op.drop_table('chapter_contents')
@@ -0,0 +1,28 @@
+"""Add pre-compressed gzip/brotli variants to chapter_contents
+
+Revision ID: 4b8e2d6f0a19
+Revises: e7c3a9d1b5f2
+Create Date: 2026-10-18 15:00:00.000000
+
+Variants are built when a body is written; run
+scripts/rebuild_chapter_contents.py to build them for existing chapters.
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '4b8e2d6f0a19'
+down_revision = 'e7c3a9d1b5f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('chapter_contents', sa.Column('gzip_body', sa.LargeBinary(), nullable=True))
+    op.add_column('chapter_contents', sa.Column('brotli_body', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('chapter_contents', 'brotli_body')
+    op.drop_column('chapter_contents', 'gzip_body')
@@ -0,0 +1,120 @@
+"""Add the chapter_search full-text index
+
+Revision ID: a6d1f4c8e3b7
+Revises: 4b8e2d6f0a19
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+import gzip
+import os
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'a6d1f4c8e3b7'
+down_revision = '4b8e2d6f0a19'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# Text search configuration, as CHAPTER_SEARCH_CONFIG in the settings
+SEARCH_CONFIG = os.getenv('CHAPTER_SEARCH_CONFIG', 'simple')
+
+# Copied from app/models/chapter_search.py as of this revision
+POSTGRES_SEARCH_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS chapter_search (
+        chapter_id INTEGER PRIMARY KEY REFERENCES chapters (id) ON DELETE CASCADE,
+        book_id INTEGER NOT NULL,
+        title_vector TSVECTOR NOT NULL,
+        body_vector TSVECTOR NOT NULL,
+        document TSVECTOR GENERATED ALWAYS AS (
+            setweight(title_vector, 'A') || setweight(body_vector, 'B')
+        ) STORED
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chapter_search_document
+    ON chapter_search USING gin (document)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chapter_search_book_id
+    ON chapter_search (book_id)
+    """,
+]
+
+
+def _decompress(data: bytes, encoding: str) -> bytes:
+    """Decode a compressed body; a copy of app.core.compression.decompress."""
+    if encoding == 'gzip':
+        return gzip.decompress(data)
+    if encoding == 'zstd':
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+    if encoding == 'br':
+        import brotli
+
+        return brotli.decompress(data)
+    raise ValueError(f'Unsupported encoding: {encoding}')
+
+
+def upgrade() -> None:
+    for statement in POSTGRES_SEARCH_DDL:
+        op.execute(statement)
+
+    config = {'config': SEARCH_CONFIG}
+    op.get_bind().execute(
+        sa.text(
+            """
+            INSERT INTO chapter_search (chapter_id, book_id, title_vector, body_vector)
+            SELECT c.id, c.book_id,
+                   to_tsvector(CAST(:config AS regconfig), c.title),
+                   to_tsvector(CAST(:config AS regconfig), coalesce(cc.body, ''))
+            FROM chapters c
+            LEFT JOIN chapter_contents cc ON cc.chapter_id = c.id
+            """
+        ),
+        config,
+    )
+
+    # Compressed bodies have to be decoded in Python
+    conn = op.get_bind()
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.text(
+                """
+                SELECT chapter_id, encoding, compressed_body FROM chapter_contents
+                WHERE encoding <> 'identity' AND chapter_id > :last_id
+                ORDER BY chapter_id LIMIT :limit
+                """
+            ),
+            {'last_id': last_id, 'limit': BATCH_SIZE},
+        ).fetchall()
+        if not rows:
+            break
+        conn.execute(
+            sa.text(
+                """
+                UPDATE chapter_search
+                SET body_vector = to_tsvector(CAST(:config AS regconfig), :body)
+                WHERE chapter_id = :id
+                """
+            ),
+            [
+                {
+                    **config,
+                    'id': row.chapter_id,
+                    'body': _decompress(row.compressed_body, row.encoding).decode('utf-8'),
+                }
+                for row in rows
+            ],
+        )
+        last_id = rows[-1].chapter_id
+
+
+def downgrade() -> None:
+    op.execute('DROP TABLE IF EXISTS chapter_search')
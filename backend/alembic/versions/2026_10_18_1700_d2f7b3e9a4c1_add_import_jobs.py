@@ -0,0 +1,45 @@
+"""Add import_jobs for background chapter imports
+
+Revision ID: d2f7b3e9a4c1
+Revises: a6d1f4c8e3b7
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'd2f7b3e9a4c1'
+down_revision = 'a6d1f4c8e3b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'import_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=True),
+        sa.Column('source', sa.String(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('total_chapters', sa.Integer(), nullable=False),
+        sa.Column('processed_chapters', sa.Integer(), nullable=False),
+        sa.Column('imported_chapters', sa.Integer(), nullable=False),
+        sa.Column('skipped_chapters', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_import_jobs_id'), 'import_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_import_jobs_book_id'), 'import_jobs', ['book_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_import_jobs_book_id'), table_name='import_jobs')
+    op.drop_index(op.f('ix_import_jobs_id'), table_name='import_jobs')
+    op.drop_table('import_jobs')
@@ -0,0 +1,30 @@
+"""Add feed_snapshots for precomputed homepage and catalog feeds
+
+Revision ID: c5e8a2f1d7b4
+Revises: d2f7b3e9a4c1
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'c5e8a2f1d7b4'
+down_revision = 'd2f7b3e9a4c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'feed_snapshots',
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('payload', sa.Text(), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('feed_snapshots')
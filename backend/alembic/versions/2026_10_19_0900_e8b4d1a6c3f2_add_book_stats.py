@@ -0,0 +1,301 @@
+"""Add book_stats ranking table maintained by triggers
+
+Revision ID: e8b4d1a6c3f2
+Revises: c5e8a2f1d7b4
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'e8b4d1a6c3f2'
+down_revision = 'c5e8a2f1d7b4'
+branch_labels = None
+depends_on = None
+
+# Weights and trigger SQL as of this revision, copied from
+# app/models/book_stats.py so the migration does not change when the model does
+FAVORITE_WEIGHT = 3.0
+READER_WEIGHT = 1.0
+COMPLETION_WEIGHT = 2.0
+
+POSTGRES_BOOK_STATS_FUNCTIONS = [
+    """
+CREATE OR REPLACE FUNCTION book_stats_create() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO book_stats (book_id) VALUES (NEW.id)
+    ON CONFLICT (book_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    """
+CREATE OR REPLACE FUNCTION book_stats_favorite_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+
+        UPDATE book_stats SET
+            favorites_count = favorites_count - 1,
+            popularity_score = popularity_score - 3.0,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = OLD.book_id;
+    ELSE
+
+        UPDATE book_stats SET
+            favorites_count = favorites_count + 1,
+            popularity_score = popularity_score + 3.0,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = NEW.book_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    """
+CREATE OR REPLACE FUNCTION book_stats_progress_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NOT (
+            NEW.book_id IS DISTINCT FROM OLD.book_id
+            OR NEW.is_completed IS DISTINCT FROM OLD.is_completed
+        ) THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+
+        UPDATE book_stats SET
+            readers_count = readers_count - 1,
+            completions_count = completions_count -
+                (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score - (1.0
+                + CASE WHEN OLD.is_completed THEN 2.0 ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = OLD.book_id;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+
+        UPDATE book_stats SET
+            readers_count = readers_count + 1,
+            completions_count = completions_count +
+                (CASE WHEN NEW.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score + (1.0
+                + CASE WHEN NEW.is_completed THEN 2.0 ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = NEW.book_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+]
+
+# (statement, trigger name, table)
+POSTGRES_BOOK_STATS_TRIGGERS = [
+    (
+        """
+CREATE TRIGGER books_stats
+AFTER INSERT ON books
+FOR EACH ROW EXECUTE FUNCTION book_stats_create()
+""",
+        'books_stats',
+        'books',
+    ),
+    (
+        """
+CREATE TRIGGER favorites_book_stats
+AFTER INSERT OR DELETE ON favorites
+FOR EACH ROW EXECUTE FUNCTION book_stats_favorite_delta()
+""",
+        'favorites_book_stats',
+        'favorites',
+    ),
+    (
+        """
+CREATE TRIGGER reading_progress_book_stats
+AFTER INSERT OR UPDATE OR DELETE ON reading_progress
+FOR EACH ROW EXECUTE FUNCTION book_stats_progress_delta()
+""",
+        'reading_progress_book_stats',
+        'reading_progress',
+    ),
+]
+
+SQLITE_BOOK_STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS books_stats_insert
+    AFTER INSERT ON books
+    BEGIN
+        INSERT INTO book_stats (book_id)
+        SELECT NEW.id WHERE NOT EXISTS (
+            SELECT 1 FROM book_stats WHERE book_id = NEW.id
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS favorites_book_stats_insert
+    AFTER INSERT ON favorites
+    BEGIN
+
+        UPDATE book_stats SET
+            favorites_count = favorites_count + 1,
+            popularity_score = popularity_score + 3.0,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = NEW.book_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS favorites_book_stats_delete
+    AFTER DELETE ON favorites
+    BEGIN
+
+        UPDATE book_stats SET
+            favorites_count = favorites_count - 1,
+            popularity_score = popularity_score - 3.0,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = OLD.book_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reading_progress_book_stats_insert
+    AFTER INSERT ON reading_progress
+    BEGIN
+
+        UPDATE book_stats SET
+            readers_count = readers_count + 1,
+            completions_count = completions_count +
+                (CASE WHEN NEW.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score + (1.0
+                + CASE WHEN NEW.is_completed THEN 2.0 ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = NEW.book_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reading_progress_book_stats_update
+    AFTER UPDATE ON reading_progress
+    WHEN (
+            NEW.book_id IS NOT OLD.book_id
+            OR NEW.is_completed IS NOT OLD.is_completed
+        )
+    BEGIN
+
+        UPDATE book_stats SET
+            readers_count = readers_count - 1,
+            completions_count = completions_count -
+                (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score - (1.0
+                + CASE WHEN OLD.is_completed THEN 2.0 ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = OLD.book_id;
+
+        UPDATE book_stats SET
+            readers_count = readers_count + 1,
+            completions_count = completions_count +
+                (CASE WHEN NEW.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score + (1.0
+                + CASE WHEN NEW.is_completed THEN 2.0 ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = NEW.book_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS reading_progress_book_stats_delete
+    AFTER DELETE ON reading_progress
+    BEGIN
+
+        UPDATE book_stats SET
+            readers_count = readers_count - 1,
+            completions_count = completions_count -
+                (CASE WHEN OLD.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score - (1.0
+                + CASE WHEN OLD.is_completed THEN 2.0 ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = OLD.book_id;
+    END
+    """,
+]
+
+SQLITE_BOOK_STATS_TRIGGER_NAMES = [
+    'books_stats_insert',
+    'favorites_book_stats_insert',
+    'favorites_book_stats_delete',
+    'reading_progress_book_stats_insert',
+    'reading_progress_book_stats_update',
+    'reading_progress_book_stats_delete',
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'book_stats',
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('favorites_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('readers_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('completions_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('active_readers', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('popularity_score', sa.Float(), server_default='0', nullable=False),
+        sa.Column('trending_score', sa.Float(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('book_id'),
+    )
+    op.create_index('ix_book_stats_popularity', 'book_stats', ['popularity_score', 'book_id'])
+    op.create_index('ix_book_stats_trending', 'book_stats', ['trending_score', 'book_id'])
+
+    # Backfill every book before the triggers take over; active readers and
+    # trending scores follow at the first ranking refresh
+    op.execute(
+        f"""
+        INSERT INTO book_stats (
+            book_id, favorites_count, readers_count, completions_count,
+            popularity_score
+        )
+        SELECT
+            books.id,
+            COALESCE(favorites.total, 0),
+            COALESCE(progress.readers, 0),
+            COALESCE(progress.completions, 0),
+            COALESCE(favorites.total, 0) * {FAVORITE_WEIGHT}
+                + COALESCE(progress.readers, 0) * {READER_WEIGHT}
+                + COALESCE(progress.completions, 0) * {COMPLETION_WEIGHT}
+        FROM books
+        LEFT JOIN (
+            SELECT book_id, COUNT(*) AS total FROM favorites GROUP BY book_id
+        ) AS favorites ON favorites.book_id = books.id
+        LEFT JOIN (
+            SELECT
+                book_id,
+                COUNT(*) AS readers,
+                SUM(CASE WHEN is_completed THEN 1 ELSE 0 END) AS completions
+            FROM reading_progress
+            GROUP BY book_id
+        ) AS progress ON progress.book_id = books.id
+        """
+    )
+
+    if op.get_bind().dialect.name == 'postgresql':
+        for function in POSTGRES_BOOK_STATS_FUNCTIONS:
+            op.execute(function)
+        for trigger, _name, _table in POSTGRES_BOOK_STATS_TRIGGERS:
+            op.execute(trigger)
+    else:
+        for trigger in SQLITE_BOOK_STATS_TRIGGERS:
+            op.execute(trigger)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        for _trigger, name, table in POSTGRES_BOOK_STATS_TRIGGERS:
+            op.execute(f'DROP TRIGGER IF EXISTS {name} ON {table}')
+        for function in (
+            'book_stats_create',
+            'book_stats_favorite_delta',
+            'book_stats_progress_delta',
+        ):
+            op.execute(f'DROP FUNCTION IF EXISTS {function}()')
+    else:
+        for name in SQLITE_BOOK_STATS_TRIGGER_NAMES:
+            op.execute(f'DROP TRIGGER IF EXISTS {name}')
+    op.drop_index('ix_book_stats_trending', table_name='book_stats')
+    op.drop_index('ix_book_stats_popularity', table_name='book_stats')
+    op.drop_table('book_stats')
@@ -0,0 +1,40 @@
+"""Add book_similarities table for item-to-item recommendations
+
+Revision ID: f3a9c7e2b5d8
+Revises: e8b4d1a6c3f2
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'f3a9c7e2b5d8'
+down_revision = 'e8b4d1a6c3f2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'book_similarities',
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('similar_book_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['similar_book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('book_id', 'rank'),
+    )
+    op.create_index(
+        op.f('ix_book_similarities_similar_book_id'),
+        'book_similarities',
+        ['similar_book_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_book_similarities_similar_book_id'), table_name='book_similarities')
+    op.drop_table('book_similarities')
@@ -4,6 +4,7 @@ from typing import Any, Dict, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_admin_user, get_current_user
@@ -12,7 +13,19 @@ from app.core.exceptions import AuthorNotFound
 from app.crud.author import crud_author
 from app.models.book import Book
 from app.models.user import User
-from app.schemas.author import AuthorCreate, AuthorResponse, AuthorUpdate
+from app.schemas.author import (
+    AuthorBulkUpdate,
+    AuthorCreate,
+    AuthorResponse,
+    AuthorUpdate,
+)
+from app.schemas.bulk import (
+    BulkDeleteRequest,
+    BulkDeleteResult,
+    BulkRequest,
+    BulkResult,
+    bulk_message,
+)
 from app.schemas.response import (
     CreateResponse,
     DeleteResponse,
@@ -90,6 +103,7 @@ def read_authors(
             "created_at": author.created_at,
             "updated_at": author.updated_at,
             "book_count": book_count,
+            "active_book_count": author.active_book_count,
         }
         authors.append(author_data)
 
@@ -143,6 +157,94 @@ def create_author(
     return CreateResponse(message=Messages.AUTHOR_CREATED, data=author)
 
 
+@router.post("/bulk", response_model=SuccessResponse[BulkResult[AuthorResponse]])
+def bulk_create_authors(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest[AuthorCreate],
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Create authors in one transaction (Admin only).
+
+    Names are checked for duplicates for the whole batch at once.
+    Items that fail are reported in errors by index and the rest are created.
+    """
+    try:
+        authors, errors = crud_author.bulk_create(
+            db, objs_in=bulk_in.items, atomic=atomic
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to create authors due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkResult(items=authors, errors=errors),
+    )
+
+
+@router.put("/bulk", response_model=SuccessResponse[BulkResult[AuthorResponse]])
+def bulk_update_authors(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest[AuthorBulkUpdate],
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Update authors by ID in one transaction (Admin only).
+
+    Only the fields sent for an item are changed.
+    """
+    try:
+        authors, errors = crud_author.bulk_update(
+            db, objs_in=bulk_in.items, atomic=atomic
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to update authors due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkResult(items=authors, errors=errors),
+    )
+
+
+@router.post("/bulk/delete", response_model=SuccessResponse[BulkDeleteResult])
+def bulk_delete_authors(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkDeleteRequest,
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Delete authors by ID in one transaction (Admin only).
+
+    Authors that still have books are not deleted.
+    """
+    try:
+        deleted_ids, errors = crud_author.bulk_delete(
+            db, ids=bulk_in.ids, atomic=atomic
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to delete authors due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkDeleteResult(deleted_ids=deleted_ids, errors=errors),
+    )
+
+
 @router.get("/{author_id}", response_model=SuccessResponse[AuthorResponse])
 def read_author(
     *,
@@ -1,17 +1,33 @@
+import json
 import logging
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_admin_user, get_current_user
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.exceptions import BookNotFound
 from app.crud.author import crud_author
 from app.crud.book import crud_book
 from app.crud.category import crud_category
 from app.models.user import User
-from app.schemas.book import BookCreate, BookResponse, BookUpdate, BookWithDetails
+from app.schemas.book import (
+    BookBulkUpdate,
+    BookCreate,
+    BookResponse,
+    BookUpdate,
+    BookWithDetails,
+)
+from app.schemas.bulk import (
+    BulkDeleteRequest,
+    BulkDeleteResult,
+    BulkRequest,
+    BulkResult,
+    bulk_message,
+)
 from app.schemas.response import (
     CreateResponse,
     DeleteResponse,
@@ -20,12 +36,31 @@ from app.schemas.response import (
     SuccessResponse,
     UpdateResponse,
 )
+from app.services.feed_service import FEEDS, Feed, category_feed, feed_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+def _feed_response(
+    feed: Feed, *, message: str, skip: int, limit: int, total: Optional[int] = None
+) -> Response:
+    """A ListResponse body around a page of already serialized books."""
+    meta = {
+        "total": feed.total if total is None else total,
+        "skip": skip,
+        "limit": limit,
+        "generated_at": feed.generated_at.isoformat(),
+    }
+    body = '{"success":true,"message":%s,"data":%s,"errors":null,"meta":%s}' % (
+        json.dumps(message),
+        feed.page(skip, limit),
+        json.dumps(meta),
+    )
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/", response_model=ListResponse[BookWithDetails])
 def read_books(
     db: Session = Depends(get_db),
@@ -46,6 +81,10 @@ def read_books(
     publication_date_to: str = Query(
         None, description="Filter by publication date to (YYYY-MM-DD)"
     ),
+    # Ordering
+    sort: Optional[str] = Query(
+        None, pattern="^(popular|trending)$", description="Rank by popularity or trend"
+    ),
 ) -> Any:
     """
     Retrieve books with optional search and filtering.
@@ -62,7 +101,7 @@ def read_books(
     }
 
     books = crud_book.get_multi_with_filters(
-        db, skip=skip, limit=limit, **filter_params
+        db, skip=skip, limit=limit, sort=sort, **filter_params
     )
     total_count = crud_book.count_with_filters(db, **filter_params)
 
@@ -74,6 +113,7 @@ def read_books(
             "skip": skip,
             "limit": limit,
             "filters": filter_params,
+            "sort": sort,
         },
     )
 
@@ -230,6 +270,109 @@ def create_book(
     return CreateResponse(message=Messages.BOOK_CREATED, data=book)
 
 
+@router.post("/bulk", response_model=SuccessResponse[BulkResult[BookResponse]])
+def bulk_create_books(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest[BookCreate],
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Create books in one transaction (Admin only).
+
+    Authors, categories and ISBNs are checked for the whole batch at once.
+    Items that fail are reported in errors by index and the rest are created.
+    """
+    try:
+        books, errors = crud_book.bulk_create(db, objs_in=bulk_in.items, atomic=atomic)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to create books due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkResult(items=books, errors=errors),
+    )
+
+
+@router.put("/bulk", response_model=SuccessResponse[BulkResult[BookResponse]])
+def bulk_update_books(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest[BookBulkUpdate],
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Update books by ID in one transaction (Admin only).
+
+    Only the fields sent for an item are changed.
+    """
+    try:
+        books, errors = crud_book.bulk_update(db, objs_in=bulk_in.items, atomic=atomic)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to update books due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkResult(items=books, errors=errors),
+    )
+
+
+@router.post("/bulk/delete", response_model=SuccessResponse[BulkDeleteResult])
+def bulk_delete_books(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkDeleteRequest,
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Delete books by ID in one transaction (Admin only).
+
+    Books that still have chapters are not deleted.
+    """
+    try:
+        deleted_ids, errors = crud_book.bulk_delete(db, ids=bulk_in.ids, atomic=atomic)
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to delete books due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkDeleteResult(deleted_ids=deleted_ids, errors=errors),
+    )
+
+
+@router.get("/{book_id}/similar", response_model=ListResponse[BookWithDetails])
+def read_similar_books(
+    *,
+    db: Session = Depends(get_db),
+    book_id: int,
+    limit: int = Query(default=10, le=50),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get books that readers of this book also liked.
+    """
+    if not crud_book.get(db, id=book_id):
+        raise BookNotFound(book_id)
+    books = crud_book.get_similar_books(db, book_id=book_id, limit=limit)
+    return ListResponse(
+        message=Messages.BOOKS_RETRIEVED,
+        data=books,
+        meta={"book_id": book_id, "total": len(books), "limit": limit},
+    )
+
+
 @router.get("/{book_id}", response_model=SuccessResponse[BookWithDetails])
 def read_book(
     *,
@@ -314,11 +457,16 @@ def read_public_books(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = Query(default=100, le=100),
+    sort: Optional[str] = Query(
+        None, pattern="^(popular|trending)$", description="Rank by popularity or trend"
+    ),
 ) -> Any:
     """
     Get active books for public access (User Site).
     """
-    books = crud_book.get_active_books_with_details(db, skip=skip, limit=limit)
+    books = crud_book.get_active_books_with_details(
+        db, skip=skip, limit=limit, sort=sort
+    )
     total_count = crud_book.count_active_books(db)
     return ListResponse(
         message=Messages.BOOKS_RETRIEVED,
@@ -330,14 +478,24 @@ def read_public_books(
 @router.get("/public/free", response_model=ListResponse[BookWithDetails])
 def read_public_free_books(
     db: Session = Depends(get_db),
-    skip: int = 0,
-    limit: int = Query(default=100, le=100),
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    sort: Optional[str] = Query(
+        None, pattern="^(popular|trending)$", description="Rank by popularity or trend"
+    ),
 ) -> Any:
     """
     Get free books for public access (User Site).
     """
+    if settings.FEEDS_ENABLED and sort is None and skip + limit <= settings.FEED_SIZE:
+        return _feed_response(
+            feed_service.get(db, "free"),
+            message=Messages.BOOKS_RETRIEVED,
+            skip=skip,
+            limit=limit,
+        )
     try:
-        books = crud_book.get_public_free_books(db, skip=skip, limit=limit)
+        books = crud_book.get_public_free_books(db, skip=skip, limit=limit, sort=sort)
         total_count = crud_book.count_free_books(db)
 
         # Validate books data before returning
@@ -364,11 +522,20 @@ def read_public_free_books(
 @router.get("/public/featured", response_model=ListResponse[BookWithDetails])
 def read_public_featured_books(
     db: Session = Depends(get_db),
-    limit: int = Query(default=10, le=20),
+    limit: int = Query(default=10, ge=1, le=20),
 ) -> Any:
     """
     Get featured books for public access (User Site).
     """
+    if settings.FEEDS_ENABLED:
+        feed = feed_service.get(db, "featured")
+        return _feed_response(
+            feed,
+            message=Messages.BOOKS_RETRIEVED,
+            skip=0,
+            limit=limit,
+            total=len(feed.items[:limit]),
+        )
     try:
         books = crud_book.get_featured_books(db, limit=limit)
 
@@ -393,6 +560,52 @@ def read_public_featured_books(
         )
 
 
+@router.get("/public/home", response_model=SuccessResponse[dict])
+def read_public_home_feeds(
+    db: Session = Depends(get_db),
+    limit: int = Query(default=10, ge=1, le=20),
+) -> Any:
+    """
+    Get the homepage feeds in one response (User Site).
+    """
+    feeds = {name: feed_service.get(db, name) for name in FEEDS}
+    data = ",".join(
+        "%s:%s" % (json.dumps(name), feed.page(0, limit))
+        for name, feed in feeds.items()
+    )
+    meta = {
+        "limit": limit,
+        "generated_at": min(feed.generated_at for feed in feeds.values()).isoformat(),
+    }
+    body = '{"success":true,"message":%s,"data":{%s},"errors":null,"meta":%s}' % (
+        json.dumps(Messages.BOOKS_RETRIEVED),
+        data,
+        json.dumps(meta),
+    )
+    return Response(content=body, media_type="application/json")
+
+
+@router.get("/public/feeds/{name}", response_model=ListResponse[BookWithDetails])
+def read_public_feed(
+    *,
+    db: Session = Depends(get_db),
+    name: str,
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> Any:
+    """
+    Get a precomputed feed: featured, free, most_favorited or most_read (User Site).
+    """
+    if name not in FEEDS:
+        raise HTTPException(status_code=404, detail=Messages.FEED_NOT_FOUND)
+    return _feed_response(
+        feed_service.get(db, name),
+        message=Messages.BOOKS_RETRIEVED,
+        skip=skip,
+        limit=limit,
+    )
+
+
 @router.get("/public/search/", response_model=ListResponse[BookWithDetails])
 def search_public_books(
     *,
@@ -420,14 +633,27 @@ def read_public_books_by_category(
     *,
     db: Session = Depends(get_db),
     category_id: int,
-    skip: int = 0,
-    limit: int = Query(default=100, le=100),
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=100),
+    sort: Optional[str] = Query(
+        None, pattern="^(popular|trending)$", description="Rank by popularity or trend"
+    ),
 ) -> Any:
     """
     Get books by category for public access (User Site).
     """
+    if settings.FEEDS_ENABLED and sort is None and skip + limit <= settings.FEED_SIZE:
+        try:
+            feed = feed_service.get(db, category_feed(category_id))
+        except KeyError:
+            # No such category: the live query answers with an empty page
+            feed = None
+        if feed is not None:
+            return _feed_response(
+                feed, message=Messages.BOOKS_RETRIEVED, skip=skip, limit=limit
+            )
     books = crud_book.get_public_books_by_category(
-        db, category_id=category_id, skip=skip, limit=limit
+        db, category_id=category_id, skip=skip, limit=limit, sort=sort
     )
     total_count = crud_book.count_by_category(db, category_id=category_id)
     return ListResponse(
@@ -444,12 +670,15 @@ def read_public_books_by_author(
     author_id: int,
     skip: int = 0,
     limit: int = Query(default=100, le=100),
+    sort: Optional[str] = Query(
+        None, pattern="^(popular|trending)$", description="Rank by popularity or trend"
+    ),
 ) -> Any:
     """
     Get books by author for public access (User Site).
     """
     books = crud_book.get_public_books_by_author(
-        db, author_id=author_id, skip=skip, limit=limit
+        db, author_id=author_id, skip=skip, limit=limit, sort=sort
     )
     total_count = crud_book.count_by_author(db, author_id=author_id)
     return ListResponse(
@@ -459,6 +688,26 @@ def read_public_books_by_author(
     )
 
 
+@router.get("/public/{book_id}/similar", response_model=ListResponse[BookWithDetails])
+def read_public_similar_books(
+    *,
+    db: Session = Depends(get_db),
+    book_id: int,
+    limit: int = Query(default=10, le=50),
+) -> Any:
+    """
+    Get books that readers of this book also liked (User Site).
+    """
+    if not crud_book.get_public_book(db, id=book_id):
+        raise BookNotFound(book_id)
+    books = crud_book.get_similar_books(db, book_id=book_id, limit=limit)
+    return ListResponse(
+        message=Messages.BOOKS_RETRIEVED,
+        data=books,
+        meta={"book_id": book_id, "total": len(books), "limit": limit},
+    )
+
+
 @router.get("/public/{book_id}", response_model=SuccessResponse[BookWithDetails])
 def read_public_book(
     *,
@@ -10,7 +10,19 @@ from app.core.database import get_db
 from app.core.exceptions import CategoryNotFound
 from app.crud.category import crud_category
 from app.models.user import User
-from app.schemas.category import CategoryCreate, CategoryResponse, CategoryUpdate
+from app.schemas.category import (
+    CategoryBulkUpdate,
+    CategoryCreate,
+    CategoryResponse,
+    CategoryUpdate,
+)
+from app.schemas.bulk import (
+    BulkDeleteRequest,
+    BulkDeleteResult,
+    BulkRequest,
+    BulkResult,
+    bulk_message,
+)
 from app.schemas.response import (
     CreateResponse,
     DeleteResponse,
@@ -116,6 +128,94 @@ def create_category(
             )
 
 
+@router.post("/bulk", response_model=SuccessResponse[BulkResult[CategoryResponse]])
+def bulk_create_categories(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest[CategoryCreate],
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Create categories in one transaction (Admin only).
+
+    Names and slugs are checked for duplicates for the whole batch at once.
+    Items that fail are reported in errors by index and the rest are created.
+    """
+    try:
+        categories, errors = crud_category.bulk_create(
+            db, objs_in=bulk_in.items, atomic=atomic
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to create categories due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkResult(items=categories, errors=errors),
+    )
+
+
+@router.put("/bulk", response_model=SuccessResponse[BulkResult[CategoryResponse]])
+def bulk_update_categories(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest[CategoryBulkUpdate],
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Update categories by ID in one transaction (Admin only).
+
+    Only the fields sent for an item are changed.
+    """
+    try:
+        categories, errors = crud_category.bulk_update(
+            db, objs_in=bulk_in.items, atomic=atomic
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to update categories due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkResult(items=categories, errors=errors),
+    )
+
+
+@router.post("/bulk/delete", response_model=SuccessResponse[BulkDeleteResult])
+def bulk_delete_categories(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkDeleteRequest,
+    atomic: bool = Query(False, description="Reject the whole batch if any item fails"),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Delete categories by ID in one transaction (Admin only).
+
+    Categories that still have books are not deleted.
+    """
+    try:
+        deleted_ids, errors = crud_category.bulk_delete(
+            db, ids=bulk_in.ids, atomic=atomic
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to delete categories due to database constraint",
+        )
+    return SuccessResponse(
+        success=not errors,
+        message=bulk_message(errors, atomic),
+        data=BulkDeleteResult(deleted_ids=deleted_ids, errors=errors),
+    )
+
+
 @router.get("/{category_id}", response_model=SuccessResponse[CategoryResponse])
 def read_category(
     *,
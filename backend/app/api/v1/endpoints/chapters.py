@@ -1,16 +1,29 @@
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.core import compression
 from app.core.auth import get_current_admin_user, get_current_user
+from app.core.byte_ranges import RangeNotSatisfiable, parse_range
 from app.core.database import get_db
 from app.core.exceptions import BookNotFound, ChapterNotFound, DuplicateChapter
+from app.core.metrics import record_cache
+from app.core.settings import settings
 from app.crud.book import crud_book
 from app.crud.chapter import crud_chapter
+from app.models.chapter import Chapter
 from app.models.user import User
-from app.schemas.chapter import ChapterCreate, ChapterResponse, ChapterUpdate
+from app.schemas.chapter import (
+    ChapterContentResponse,
+    ChapterCreate,
+    ChapterPrefetchHint,
+    ChapterResponse,
+    ChapterSummary,
+    ChapterUpdate,
+)
 from app.schemas.response import (
     CreateResponse,
     DeleteResponse,
@@ -23,7 +36,100 @@ from app.schemas.response import (
 router = APIRouter()
 
 
-@router.get("/", response_model=ListResponse[ChapterResponse])
+def _content_data(
+    chapter: Chapter, next_chapter: Optional[Row]
+) -> ChapterContentResponse:
+    data = ChapterContentResponse.model_validate(chapter)
+    if next_chapter:
+        data.next_chapter = ChapterPrefetchHint.model_validate(next_chapter)
+    return data
+
+
+def _text_response(
+    request: Request, chapter: Chapter, next_chapter: Optional[Row], next_url: str
+) -> Response:
+    """
+    Serve a chapter body as text/plain or text/html.
+
+    Clients that accept a pre-compressed variant get it as stored; byte
+    ranges are always served from the uncompressed body.
+    """
+    content = chapter.content_data
+    body = content.text.encode("utf-8") if content else b""
+    media_type = (
+        "text/html; charset=utf-8"
+        if body.lstrip()[:1] == b"<"
+        else "text/plain; charset=utf-8"
+    )
+    headers = {"Accept-Ranges": "bytes", "Vary": "Accept-Encoding"}
+    if next_chapter:
+        headers["Link"] = f'<{next_url}>; rel="prefetch"'
+        headers["X-Next-Chapter-Id"] = str(next_chapter.id)
+        if next_chapter.content_hash:
+            headers["X-Next-Chapter-Hash"] = next_chapter.content_hash
+
+    identity_etag = f'"{chapter.content_hash}"' if chapter.content_hash else None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    use_range = range_header and (not if_range or if_range == identity_etag)
+
+    encoding = compression.IDENTITY
+    if content and not use_range:
+        offered = [
+            variant
+            for variant in settings.CHAPTER_CONTENT_VARIANTS
+            if content.variant(variant) is not None
+        ]
+        accept_encoding = request.headers.get("accept-encoding", "")
+        encoding = compression.negotiate(accept_encoding, offered)
+        if encoding != compression.IDENTITY:
+            record_cache("chapter_variant", True)
+        elif (
+            compression.negotiate(accept_encoding, settings.CHAPTER_CONTENT_VARIANTS)
+            != compression.IDENTITY
+        ):
+            # The client takes a variant this chapter does not have yet
+            record_cache("chapter_variant", False)
+
+    etag = identity_etag
+    if identity_etag and encoding != compression.IDENTITY:
+        etag = f'"{chapter.content_hash}-{encoding}"'
+    if etag:
+        headers["ETag"] = etag
+        if_none_match = request.headers.get("if-none-match", "")
+        tags = {tag.strip() for tag in if_none_match.split(",")}
+        tags = {tag[2:] if tag.startswith("W/") else tag for tag in tags}
+        if if_none_match:
+            record_cache("chapter_etag", etag in tags or "*" in tags)
+        if etag in tags or "*" in tags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if use_range:
+        try:
+            byte_range = parse_range(range_header, len(body))
+        except RangeNotSatisfiable as e:
+            headers["Content-Range"] = f"bytes */{e.size}"
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers=headers,
+            )
+        if byte_range:
+            start, end = byte_range
+            headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+            return Response(
+                content=body[start : end + 1],
+                status_code=status.HTTP_206_PARTIAL_CONTENT,
+                media_type=media_type,
+                headers=headers,
+            )
+
+    if encoding != compression.IDENTITY:
+        headers["Content-Encoding"] = encoding
+        body = content.variant(encoding)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@router.get("/", response_model=ListResponse[ChapterSummary])
 def read_chapters(
     db: Session = Depends(get_db),
     skip: int = 0,
@@ -70,7 +176,7 @@ def read_chapters(
     )
 
 
-@router.get("/published", response_model=ListResponse[ChapterResponse])
+@router.get("/published", response_model=ListResponse[ChapterSummary])
 def read_published_chapters(
     db: Session = Depends(get_db),
     skip: int = 0,
@@ -89,7 +195,7 @@ def read_published_chapters(
     )
 
 
-@router.get("/book/{book_id}", response_model=ListResponse[ChapterResponse])
+@router.get("/book/{book_id}", response_model=ListResponse[ChapterSummary])
 def read_chapters_by_book(
     *,
     db: Session = Depends(get_db),
@@ -115,7 +221,7 @@ def read_chapters_by_book(
     )
 
 
-@router.get("/published/book/{book_id}", response_model=ListResponse[ChapterResponse])
+@router.get("/published/book/{book_id}", response_model=ListResponse[ChapterSummary])
 def read_published_chapters_by_book(
     *,
     db: Session = Depends(get_db),
@@ -198,6 +304,50 @@ def read_chapter(
     return SuccessResponse(message=Messages.DATA_RETRIEVED, data=chapter)
 
 
+@router.get(
+    "/{chapter_id}/content", response_model=SuccessResponse[ChapterContentResponse]
+)
+def read_chapter_content(
+    *,
+    db: Session = Depends(get_db),
+    chapter_id: int,
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get the body of a chapter.
+    """
+    chapter = crud_chapter.get_content(db, id=chapter_id)
+    if not chapter:
+        raise ChapterNotFound(chapter_id)
+    next_chapter = crud_chapter.get_next_chapter(db, chapter=chapter)
+    return SuccessResponse(
+        message=Messages.DATA_RETRIEVED, data=_content_data(chapter, next_chapter)
+    )
+
+
+@router.get("/{chapter_id}/text", response_class=Response)
+def read_chapter_text(
+    *,
+    db: Session = Depends(get_db),
+    request: Request,
+    chapter_id: int,
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get the body of a chapter as text, with Range and compression support.
+    """
+    chapter = crud_chapter.get_content(db, id=chapter_id)
+    if not chapter:
+        raise ChapterNotFound(chapter_id)
+    next_chapter = crud_chapter.get_next_chapter(db, chapter=chapter)
+    next_url = (
+        str(request.url_for("read_chapter_text", chapter_id=next_chapter.id))
+        if next_chapter
+        else ""
+    )
+    return _text_response(request, chapter, next_chapter, next_url)
+
+
 @router.put("/{chapter_id}", response_model=UpdateResponse[ChapterResponse])
 def update_chapter(
     *,
@@ -277,7 +427,7 @@ def delete_chapter(
 
 
 # PUBLIC ENDPOINTS FOR USER SITE (No Authentication Required)
-@router.get("/public/book/{book_id}", response_model=ListResponse[ChapterResponse])
+@router.get("/public/book/{book_id}", response_model=ListResponse[ChapterSummary])
 def read_public_chapters_by_book(
     *,
     db: Session = Depends(get_db),
@@ -308,12 +458,58 @@ def read_public_chapter(
     """
     Get published chapter details for public access (User Site).
     """
-    chapter = crud_chapter.get_published_chapter_with_details(db, id=chapter_id)
+    chapter = crud_chapter.get_public_chapter(db, id=chapter_id)
     if not chapter:
         raise ChapterNotFound(chapter_id)
     return SuccessResponse(message=Messages.DATA_RETRIEVED, data=chapter)
 
 
+@router.get(
+    "/public/{chapter_id}/content",
+    response_model=SuccessResponse[ChapterContentResponse],
+)
+def read_public_chapter_content(
+    *,
+    db: Session = Depends(get_db),
+    chapter_id: int,
+) -> Any:
+    """
+    Get the body of a published chapter for public access (User Site).
+    """
+    chapter = crud_chapter.get_content(db, id=chapter_id, public=True)
+    if not chapter:
+        raise ChapterNotFound(chapter_id)
+    next_chapter = crud_chapter.get_next_chapter(db, chapter=chapter, public=True)
+    return SuccessResponse(
+        message=Messages.DATA_RETRIEVED, data=_content_data(chapter, next_chapter)
+    )
+
+
+@router.get("/public/{chapter_id}/text", response_class=Response)
+def read_public_chapter_text(
+    *,
+    db: Session = Depends(get_db),
+    request: Request,
+    chapter_id: int,
+) -> Any:
+    """
+    Get the body of a published chapter as text for public access (User Site).
+
+    Supports Range requests and pre-compressed variants; the Link and
+    X-Next-Chapter-* headers point at the next chapter for prefetching.
+    """
+    chapter = crud_chapter.get_content(db, id=chapter_id, public=True)
+    if not chapter:
+        raise ChapterNotFound(chapter_id)
+    next_chapter = crud_chapter.get_next_chapter(db, chapter=chapter, public=True)
+    next_url = (
+        str(request.url_for("read_public_chapter_text", chapter_id=next_chapter.id))
+        if next_chapter
+        else ""
+    )
+    return _text_response(request, chapter, next_chapter, next_url)
+
+
 try:
     ChapterWithDetails.model_rebuild()
 except Exception:
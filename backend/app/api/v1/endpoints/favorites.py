@@ -3,6 +3,7 @@ from datetime import datetime
 
 from app.core.auth import get_current_user, get_current_admin_user
 from app.core.database import get_db
+from app.crud.book import crud_book
 from app.crud.favorite import crud_favorite
 from app.models.user import User
 from app.schemas.favorite import FavoriteCreate, FavoriteResponse, FavoriteWithDetails
@@ -212,7 +213,9 @@ def add_favorite_books_path(
         )
     
     # Check if already favorited
-    existing_favorite = crud_favorite.get_user_book_favorite(db, user_id=current_user.id, book_id=book_id)
+    existing_favorite = crud_favorite.get_by_user_and_book(
+        db, user_id=current_user.id, book_id=book_id
+    )
     if existing_favorite:
         raise HTTPException(
             status_code=400,
@@ -251,7 +254,9 @@ def toggle_favorite(
         )
     
     # Check if already favorited
-    existing_favorite = crud_favorite.get_user_book_favorite(db, user_id=current_user.id, book_id=book_id)
+    existing_favorite = crud_favorite.get_by_user_and_book(
+        db, user_id=current_user.id, book_id=book_id
+    )
     
     if existing_favorite:
         # Remove from favorites
@@ -0,0 +1,116 @@
+import zipfile
+from io import BytesIO
+from typing import Any, Optional
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    UploadFile,
+    status,
+)
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api.v1.endpoints.upload import MAX_DOCUMENT_SIZE
+from app.core.auth import get_current_admin_user
+from app.core.database import get_db
+from app.core.exceptions import BookNotFound
+from app.core.tracing import with_trace_context
+from app.crud.book import crud_book
+from app.crud.import_job import crud_import_job
+from app.models.user import User
+from app.schemas.import_job import ImportJobCreate, ImportJobResponse
+from app.schemas.response import CreateResponse, Messages, SuccessResponse
+from app.services.epub_import_service import epub_import_service
+
+router = APIRouter()
+
+
+@router.post(
+    "/epub",
+    response_model=CreateResponse[ImportJobResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def import_epub_chapters(
+    *,
+    db: Session = Depends(get_db),
+    background_tasks: BackgroundTasks,
+    book_id: int = Form(...),
+    file: Optional[UploadFile] = File(None),
+    start_number: Optional[int] = Form(None, ge=1),
+    on_conflict: str = Form("fail", pattern="^(fail|skip)$"),
+    is_published: bool = Form(False),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Import a book's chapters from an EPUB in the background (Admin only).
+
+    Uses the uploaded file, or the book's epub_url when no file is sent.
+    Chapters are numbered from start_number (default: after the book's last
+    chapter); on_conflict=skip leaves out numbers the book already has.
+    Poll GET /imports/{job_id} for progress.
+    """
+    book = crud_book.get(db, id=book_id)
+    if not book:
+        raise BookNotFound(book_id)
+
+    epub = None
+    if file is not None:
+        if file.content_type != "application/epub+zip" and not (
+            file.filename or ""
+        ).lower().endswith(".epub"):
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid file type. Allowed types: application/epub+zip",
+            )
+        epub = file.file.read()
+        if len(epub) > MAX_DOCUMENT_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail="File size too large. Maximum allowed: "
+                f"{MAX_DOCUMENT_SIZE / (1024 * 1024):.1f}MB",
+            )
+        if not zipfile.is_zipfile(BytesIO(epub)):
+            raise HTTPException(status_code=400, detail="File is not a valid EPUB")
+    elif not book.epub_url:
+        raise HTTPException(
+            status_code=400, detail="No EPUB file provided and the book has no epub_url"
+        )
+
+    job = crud_import_job.create(
+        db,
+        obj_in=ImportJobCreate(
+            book_id=book_id,
+            created_by=current_user.id,
+            source=file.filename if file is not None else book.epub_url,
+        ),
+    )
+    background_tasks.add_task(
+        with_trace_context(epub_import_service.run),
+        sessionmaker(bind=db.get_bind(), autoflush=False),
+        job.id,
+        epub=epub,
+        start_number=start_number,
+        on_conflict=on_conflict,
+        is_published=is_published,
+    )
+    return CreateResponse(message=Messages.IMPORT_JOB_CREATED, data=job)
+
+
+@router.get("/{job_id}", response_model=SuccessResponse[ImportJobResponse])
+def read_import_job(
+    *,
+    db: Session = Depends(get_db),
+    job_id: int,
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Get the status and progress of an import job (Admin only).
+    """
+    job = crud_import_job.get(db, id=job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=Messages.IMPORT_JOB_NOT_FOUND)
+    return SuccessResponse(message=Messages.DATA_RETRIEVED, data=job)
@@ -0,0 +1,125 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.core.auth import get_current_admin_user
+from app.core.profiling import process_profiler, profile_store
+from app.core.settings import settings
+from app.models.user import User
+from app.schemas.profiling import ProfilerStatus, RequestProfileResponse
+from app.schemas.response import ListResponse, Messages, SuccessResponse
+
+router = APIRouter()
+
+
+def _collapsed_response(stacks: str, filename: str) -> PlainTextResponse:
+    return PlainTextResponse(
+        stacks, headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+def _profiler_status() -> ProfilerStatus:
+    sampler = process_profiler.sampler
+    if sampler is None:
+        return ProfilerStatus(running=False)
+    return ProfilerStatus(
+        running=process_profiler.running,
+        interval=sampler.interval,
+        samples=sampler.samples,
+        started_at=sampler.started_at,
+        stopped_at=sampler.stopped_at,
+    )
+
+
+@router.get("/requests", response_model=ListResponse[RequestProfileResponse])
+def read_request_profiles(
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    List the stored request profiles, newest first (Admin only).
+
+    Requests are profiled when sampled or when an admin sends the
+    profiling header; the response's X-Profile-Id names the profile.
+    """
+    profiles = profile_store.recent()
+    return ListResponse(
+        message=Messages.DATA_RETRIEVED,
+        data=[RequestProfileResponse.model_validate(p) for p in profiles],
+        meta={"total": len(profiles), "max_profiles": profile_store.max_size},
+    )
+
+
+@router.get("/requests/{profile_id}", response_class=PlainTextResponse)
+def download_request_profile(
+    profile_id: str,
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Download a request profile as collapsed stacks (Admin only).
+
+    Render it with flamegraph.pl or load it into speedscope.
+    """
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail=Messages.PROFILE_NOT_FOUND)
+    return _collapsed_response(profile.sampler.collapsed(), f"{profile_id}.folded")
+
+
+@router.get("/sampler", response_model=SuccessResponse[ProfilerStatus])
+def read_profiler_status(
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Get the state of the process-wide sampling profiler (Admin only).
+    """
+    return SuccessResponse(message=Messages.DATA_RETRIEVED, data=_profiler_status())
+
+
+@router.post("/sampler/start", response_model=SuccessResponse[ProfilerStatus])
+def start_profiler(
+    interval: float = Query(
+        settings.PROFILING_INTERVAL, gt=0, le=1, description="Seconds between samples"
+    ),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Start sampling every thread of this process (Admin only).
+
+    Starting discards the stacks of the previous run.
+    """
+    if not process_profiler.start(interval):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=Messages.PROFILER_ALREADY_RUNNING,
+        )
+    return SuccessResponse(message=Messages.PROFILER_STARTED, data=_profiler_status())
+
+
+@router.post("/sampler/stop", response_model=SuccessResponse[ProfilerStatus])
+def stop_profiler(
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Stop the process-wide profiler, keeping its stacks for download (Admin only).
+    """
+    if not process_profiler.stop():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=Messages.PROFILER_NOT_RUNNING
+        )
+    return SuccessResponse(message=Messages.PROFILER_STOPPED, data=_profiler_status())
+
+
+@router.get("/sampler/stacks", response_class=PlainTextResponse)
+def download_profiler_stacks(
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Download the process-wide profile as collapsed stacks (Admin only).
+
+    Can be fetched while the profiler runs, for a snapshot so far.
+    """
+    sampler = process_profiler.sampler
+    if sampler is None:
+        raise HTTPException(status_code=404, detail=Messages.PROFILER_NO_PROFILE)
+    return _collapsed_response(sampler.collapsed(), "process.folded")
@@ -168,27 +168,16 @@ def create_progress(
     if not progress_in.book_id:
         raise HTTPException(status_code=422, detail="book_id is required")
 
-    # Check if progress already exists for this user and book
-    existing_progress = crud_reading_progress.get_by_user_and_book(
-        db, user_id=current_user.id, book_id=progress_in.book_id
+    # Insert or update atomically on the (user_id, book_id) unique constraint
+    progress, created = crud_reading_progress.upsert_progress(
+        db, user_id=current_user.id, book_id=progress_in.book_id, obj_in=progress_in
     )
-
-    if existing_progress:
-        # Update existing progress
-        progress = crud_reading_progress.update(
-            db, db_obj=existing_progress, obj_in=progress_in
-        )
-        return CreateResponse(message=Messages.READING_PROGRESS_UPDATED, data=progress)
-    else:
-        # Create new progress
-        progress_data = progress_in.model_dump(exclude_unset=True)
-        progress_data["user_id"] = current_user.id
-
-        from app.schemas.reading_progress import ReadingProgressCreate
-
-        create_data = ReadingProgressCreate(**progress_data)
-        progress = crud_reading_progress.create(db, obj_in=create_data)
-        return CreateResponse(message=Messages.READING_PROGRESS_CREATED, data=progress)
+    message = (
+        Messages.READING_PROGRESS_CREATED
+        if created
+        else Messages.READING_PROGRESS_UPDATED
+    )
+    return CreateResponse(message=message, data=progress)
 
 
 @router.get("/book/{book_id}")
@@ -224,26 +213,15 @@ def update_progress_for_book(
     """
     Update reading progress for a specific book.
     """
-    progress = crud_reading_progress.get_by_user_and_book(
-        db, user_id=current_user.id, book_id=book_id
+    progress, created = crud_reading_progress.upsert_progress(
+        db, user_id=current_user.id, book_id=book_id, obj_in=progress_in
     )
-
-    if not progress:
-        # Create new progress if it doesn't exist
-        progress_data = progress_in.model_dump(exclude_unset=True)
-        progress_data["user_id"] = current_user.id
-        progress_data["book_id"] = book_id
-
-        from app.schemas.reading_progress import ReadingProgressCreate
-
-        create_data = ReadingProgressCreate(**progress_data)
-        progress = crud_reading_progress.create(db, obj_in=create_data)
-
-        return UpdateResponse(message=Messages.READING_PROGRESS_CREATED, data=progress)
-    else:
-        # Update existing progress
-        progress = crud_reading_progress.update(db, db_obj=progress, obj_in=progress_in)
-        return UpdateResponse(message=Messages.READING_PROGRESS_UPDATED, data=progress)
+    message = (
+        Messages.READING_PROGRESS_CREATED
+        if created
+        else Messages.READING_PROGRESS_UPDATED
+    )
+    return UpdateResponse(message=message, data=progress)
 
 
 @router.delete("/book/{book_id}", response_model=DeleteResponse)
@@ -0,0 +1,89 @@
+from datetime import date, timedelta
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from app.core.auth import get_current_user
+from app.core.database import get_db
+from app.crud.book import crud_book
+from app.crud.reading_session import crud_reading_session
+from app.models.user import User
+from app.schemas.reading_session import (
+    BookReadingRollupResponse,
+    ReadingSessionCreate,
+    ReadingSessionResponse,
+    UserReadingRollupResponse,
+)
+from app.schemas.response import CreateResponse, ListResponse, Messages
+
+router = APIRouter()
+
+
+@router.post(
+    "/",
+    response_model=CreateResponse[ReadingSessionResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+def record_session(
+    *,
+    db: Session = Depends(get_db),
+    session_in: ReadingSessionCreate,
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Record a reading session for the current user.
+    """
+    if not crud_book.get(db, id=session_in.book_id):
+        raise HTTPException(status_code=404, detail=Messages.BOOK_NOT_FOUND)
+
+    session = crud_reading_session.create_session(
+        db, user_id=current_user.id, obj_in=session_in
+    )
+    return CreateResponse(message=Messages.READING_SESSION_RECORDED, data=session)
+
+
+@router.get("/stats", response_model=ListResponse[UserReadingRollupResponse])
+def read_my_reading_stats(
+    db: Session = Depends(get_db),
+    period: str = Query("day", pattern="^(day|week)$"),
+    days: int = Query(30, ge=1, le=366, description="How far back to look"),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get the current user's daily or weekly reading activity.
+    """
+    since = date.today() - timedelta(days=days)
+    rollups = crud_reading_session.get_user_rollups(
+        db, user_id=current_user.id, period=period, since=since
+    )
+    return ListResponse(
+        message=Messages.READING_STATS_RETRIEVED,
+        data=rollups,
+        meta={"period": period, "since": since.isoformat()},
+    )
+
+
+@router.get(
+    "/books/{book_id}/stats", response_model=ListResponse[BookReadingRollupResponse]
+)
+def read_book_reading_stats(
+    *,
+    db: Session = Depends(get_db),
+    book_id: int,
+    period: str = Query("day", pattern="^(day|week)$"),
+    days: int = Query(30, ge=1, le=366, description="How far back to look"),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get daily or weekly reading activity for a book.
+    """
+    since = date.today() - timedelta(days=days)
+    rollups = crud_reading_session.get_book_rollups(
+        db, book_id=book_id, period=period, since=since
+    )
+    return ListResponse(
+        message=Messages.READING_STATS_RETRIEVED,
+        data=rollups,
+        meta={"period": period, "since": since.isoformat()},
+    )
@@ -5,13 +5,16 @@ from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
 from app.core.database import get_db
+from app.core.exceptions import BookNotFound
 from app.crud.author import crud_author
 from app.crud.book import crud_book
 from app.crud.category import crud_category
+from app.crud.chapter import crud_chapter
 from app.models.user import User
 from app.schemas.author import AuthorResponse
 from app.schemas.book import BookWithDetails
 from app.schemas.category import CategoryResponse
+from app.schemas.chapter import ChapterSearchHit
 from app.schemas.response import ListResponse, Messages, SuccessResponse
 
 router = APIRouter()
@@ -119,3 +122,37 @@ def search_all(
     }
 
     return SuccessResponse(message=Messages.SEARCH_COMPLETED, data=search_results)
+
+
+@router.get("/books/{book_id}/chapters", response_model=ListResponse[ChapterSearchHit])
+def search_book_chapters(
+    *,
+    db: Session = Depends(get_db),
+    book_id: int,
+    q: str = Query(..., min_length=1),
+    skip: int = 0,
+    limit: int = Query(default=20, le=50),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Search inside a book: full-text search over its published chapters,
+    ranked by relevance with highlighted snippets.
+    """
+    if not crud_book.get(db, id=book_id):
+        raise BookNotFound(book_id)
+
+    hits = crud_chapter.search_in_book(
+        db, book_id=book_id, query=q, skip=skip, limit=limit
+    )
+    total_count = crud_chapter.count_search_in_book(db, book_id=book_id, query=q)
+    return ListResponse(
+        message=Messages.SEARCH_COMPLETED,
+        data=hits,
+        meta={
+            "query": q,
+            "book_id": book_id,
+            "total": total_count,
+            "skip": skip,
+            "limit": limit,
+        },
+    )
@@ -0,0 +1,54 @@
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.auth import get_current_admin_user
+from app.core.slow_queries import slow_query_log
+from app.models.user import User
+from app.schemas.response import DeleteResponse, ListResponse, Messages
+from app.schemas.slow_query import SlowQueryResponse
+
+router = APIRouter()
+
+
+@router.get("/", response_model=ListResponse[SlowQueryResponse])
+def read_slow_queries(
+    route: Optional[str] = Query(None, description="Route, e.g. GET /api/v1/books/"),
+    crud_method: Optional[str] = Query(None, description="e.g. CRUDBook.get"),
+    min_duration_ms: float = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=1000),
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    List the captured slow queries, newest first (Admin only).
+
+    Only statements slower than SLOW_QUERY_THRESHOLD_MS are kept, and only
+    the last SLOW_QUERY_LOG_SIZE of them.
+    """
+    entries = [
+        entry
+        for entry in slow_query_log.entries()
+        if (route is None or entry.route == route)
+        and (crud_method is None or entry.crud_method == crud_method)
+        and entry.duration_ms >= min_duration_ms
+    ]
+    return ListResponse(
+        message=Messages.DATA_RETRIEVED,
+        data=[SlowQueryResponse.model_validate(entry) for entry in entries[:limit]],
+        meta={
+            "total": len(entries),
+            "limit": limit,
+            "threshold_ms": slow_query_log.threshold_ms,
+        },
+    )
+
+
+@router.delete("/", response_model=DeleteResponse)
+def clear_slow_queries(
+    current_user: User = Depends(get_current_admin_user),
+) -> Any:
+    """
+    Empty the slow query log (Admin only).
+    """
+    slow_query_log.clear()
+    return DeleteResponse(message=Messages.SLOW_QUERIES_CLEARED)
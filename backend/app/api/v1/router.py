@@ -7,12 +7,17 @@ from app.api.v1.endpoints import (
     categories,
     chapters,
     favorites,
+    imports,
+    profiling,
     reading_lists,
     reading_progress,
+    reading_sessions,
     search,
+    slow_queries,
     upload,
     users,
 )
+from app.core.settings import settings
 
 api_router = APIRouter()
 
@@ -25,9 +30,19 @@ api_router.include_router(chapters.router, prefix="/chapters", tags=["chapters"]
 api_router.include_router(
     reading_progress.router, prefix="/reading-progress", tags=["reading-progress"]
 )
+api_router.include_router(
+    reading_sessions.router, prefix="/reading-sessions", tags=["reading-sessions"]
+)
 api_router.include_router(favorites.router, prefix="/favorites", tags=["favorites"])
 api_router.include_router(
     reading_lists.router, prefix="/reading-lists", tags=["reading-lists"]
 )
 api_router.include_router(search.router, prefix="/search", tags=["search"])
 api_router.include_router(upload.router, prefix="/upload", tags=["upload"])
+api_router.include_router(imports.router, prefix="/imports", tags=["imports"])
+api_router.include_router(
+    slow_queries.router, prefix="/slow-queries", tags=["slow-queries"]
+)
+
+if settings.PROFILING_ENABLED:
+    api_router.include_router(profiling.router, prefix="/profiling", tags=["profiling"])
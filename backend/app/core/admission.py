@@ -0,0 +1,232 @@
+"""
+Admission control, on when ADMISSION_CONTROL_ENABLED is set.
+
+Requests are sorted into route classes: by path prefix through
+ADMISSION_ROUTE_CLASSES (auth, search, upload), otherwise "read" for GET
+and HEAD and "write" for the rest. Each class runs at most its
+ADMISSION_LIMITS requests at a time, so a slow database fills a bounded
+number of threadpool threads and pool connections instead of all of them.
+
+Requests over the limit wait in a queue of at most ADMISSION_QUEUE_SIZE,
+signed-in readers first, anonymous requests next and bulk listings
+(``?limit=`` of ADMISSION_BULK_LIMIT rows or more) last. A request is
+refused with a 503 at once when the queue is full of requests that go
+before it, or when the recent service time of its class says it would
+wait longer than ADMISSION_QUEUE_TIMEOUT seconds; it is refused when it
+has waited that long. A full queue makes room for a request that goes
+first by refusing its last request.
+
+The limits apply per process and event loop.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import record_admission
+from app.core.rate_limit import client_key
+from app.schemas.response import Messages
+
+logger = logging.getLogger(__name__)
+
+# Queue priorities, lowest first
+PRIORITY_USER = 0
+PRIORITY_ANONYMOUS = 1
+PRIORITY_BULK = 2
+
+
+class ConcurrencyLimiter:
+    """At most ``limit`` holders, with a bounded priority queue of waiters."""
+
+    def __init__(self, limit: int, queue_size: int):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        # Moving average of how long holders keep their slot
+        self.service_time: Optional[float] = None
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def estimated_wait(self, priority: int) -> float:
+        """Seconds until a request queued now with ``priority`` gets a slot."""
+        if self.service_time is None:
+            return 0.0
+        ahead = sum(1 for waiter in self._waiters if waiter[0] <= priority)
+        return (ahead + 1) / self.limit * self.service_time
+
+    async def acquire(self, priority: int, timeout: float) -> Optional[str]:
+        """
+        Take a slot, waiting at most ``timeout`` seconds.
+
+        Returns None once the slot is taken, or why it was not: "queue_full",
+        "deadline" (it would wait too long), "timeout" or "evicted" (dropped
+        from a full queue for a request that goes first).
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return None
+
+        if self.estimated_wait(priority) > timeout:
+            return "deadline"
+        if len(self._waiters) >= self.queue_size:
+            last = max(self._waiters)
+            if last[0] <= priority:
+                return "queue_full"
+            self._remove(last)
+            last[2].set_result(False)
+
+        future = asyncio.get_running_loop().create_future()
+        waiter = (priority, next(self._sequence), future)
+        heapq.heappush(self._waiters, waiter)
+        try:
+            admitted = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._remove(waiter)
+            if future.done() and not future.cancelled() and future.result():
+                return None
+            return "timeout"
+        except BaseException:
+            # Cancelled, e.g. by a disconnect, maybe after being handed a slot
+            self._remove(waiter)
+            if future.done() and not future.cancelled() and future.result():
+                self.release()
+            raise
+        return None if admitted else "evicted"
+
+    def release(self, service_time: Optional[float] = None) -> None:
+        """Give up a slot, handing it to the first waiter if there is one."""
+        if service_time is not None:
+            self.service_time = (
+                service_time
+                if self.service_time is None
+                else 0.8 * self.service_time + 0.2 * service_time
+            )
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[2]
+            if not future.done():
+                future.set_result(True)
+                return
+        self.active -= 1
+
+    def _remove(self, waiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            return
+        heapq.heapify(self._waiters)
+
+
+class AdmissionMiddleware:
+    """
+    Limit the requests of each route class running at once.
+
+    Refused requests are answered with a 503 and Retry-After, counted in
+    ``shed`` by (route class, reason) and in the admission_shed_total metric.
+    Register it before (inside) CORSMiddleware, so that browsers can read
+    the 503 and back off.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limits: Dict[str, int],
+        route_classes: Optional[Dict[str, str]] = None,
+        queue_size: int = 100,
+        queue_timeout: float = 2.0,
+        bulk_limit: int = 1000,
+        exempt_paths: Iterable[str] = (),
+        prefix: str = "",
+    ):
+        self.app = app
+        self.limiters = {
+            name: ConcurrencyLimiter(limit, queue_size)
+            for name, limit in limits.items()
+        }
+        # Longest prefix first, so "/search/books" wins over "/search"
+        self.route_classes = sorted(
+            (route_classes or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.queue_timeout = queue_timeout
+        self.bulk_limit = bulk_limit
+        self.exempt_paths = tuple(exempt_paths)
+        self.prefix = prefix
+        self.shed: Counter = Counter()
+
+    def route_class(self, method: str, path: str) -> str:
+        if self.prefix and path.startswith(self.prefix):
+            path = path[len(self.prefix) :]
+        for route, name in self.route_classes:
+            route = route.rstrip("/")
+            if path == route or path.startswith(route + "/"):
+                return name
+        return "read" if method in ("GET", "HEAD") else "write"
+
+    def priority(self, scope: Scope) -> int:
+        limit = parse_qs(scope["query_string"].decode("latin-1")).get("limit")
+        try:
+            if limit and int(limit[-1]) >= self.bulk_limit:
+                return PRIORITY_BULK
+        except ValueError:
+            pass
+        if client_key(scope).startswith("user:"):
+            return PRIORITY_USER
+        return PRIORITY_ANONYMOUS
+
+    def _exempt(self, scope: Scope) -> bool:
+        return any(
+            scope["path"] == path or scope["path"].startswith(path.rstrip("/") + "/")
+            for path in self.exempt_paths
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._exempt(scope):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.route_class(scope["method"], scope["path"])
+        limiter = self.limiters.get(route_class)
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        queued_at = time.perf_counter()
+        reason = await limiter.acquire(self.priority(scope), self.queue_timeout)
+        started = time.perf_counter()
+        record_admission(route_class, started - queued_at, reason)
+
+        if reason is not None:
+            self.shed[route_class, reason] += 1
+            logger.info(
+                "Shed %s %s (%s): %s, %d running, %d waiting",
+                scope["method"],
+                scope["path"],
+                route_class,
+                reason,
+                limiter.active,
+                limiter.waiting,
+            )
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": Messages.SERVICE_OVERLOADED},
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(time.perf_counter() - started)
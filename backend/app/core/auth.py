@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.tracing import traced
 from app.models.user import User
 from app.schemas.token import TokenPayload
 
@@ -16,10 +17,12 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
+@traced("password.verify")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+@traced("password.hash")
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
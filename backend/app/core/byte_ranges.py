@@ -0,0 +1,50 @@
+"""
+HTTP Range header parsing (RFC 9110, single byte ranges only).
+"""
+
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested range does not overlap the representation."""
+
+    def __init__(self, size: int):
+        self.size = size
+        super().__init__(f"Range not satisfiable for {size} bytes")
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header into an inclusive (start, end) byte pair.
+
+    Returns None when the header is absent, malformed or asks for several
+    ranges, in which case the whole representation should be sent.
+    Raises RangeNotSatisfiable when the range lies outside the content.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(last)
+            if suffix == 0:
+                raise RangeNotSatisfiable(size)
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise RangeNotSatisfiable(size)
+    if start < 0 or end < start:
+        return None
+    return start, min(end, size - 1)
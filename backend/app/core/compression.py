@@ -0,0 +1,95 @@
+"""
+Compression helpers for stored and served text.
+
+gzip ships with Python; zstd and brotli need the optional ``zstandard`` and
+``brotli`` packages and are reported as unavailable when missing.
+"""
+
+import gzip
+import hashlib
+from typing import Iterable, Tuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+ZSTD = "zstd"
+BROTLI = "br"
+
+
+def is_available(encoding: str) -> bool:
+    """Check whether an encoding can be used in this environment."""
+    if encoding == ZSTD:
+        return zstandard is not None
+    if encoding == BROTLI:
+        return brotli is not None
+    return encoding in (IDENTITY, GZIP)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress data with the given encoding."""
+    if encoding == IDENTITY:
+        return data
+    if encoding == GZIP:
+        # mtime=0 keeps the output deterministic for identical input
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if encoding == ZSTD and zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.compress(data, quality=9)
+    raise ValueError(f"Unsupported or unavailable encoding: {encoding}")
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Reverse compress()."""
+    if encoding == IDENTITY:
+        return data
+    if encoding == GZIP:
+        return gzip.decompress(data)
+    if encoding == ZSTD and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.decompress(data)
+    raise ValueError(f"Unsupported or unavailable encoding: {encoding}")
+
+
+def negotiate(accept_encoding: str, offered: Iterable[str]) -> str:
+    """
+    Pick the best offered encoding for an Accept-Encoding header.
+
+    Offered encodings are in order of preference; falls back to identity.
+    """
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+
+    best, best_q = IDENTITY, 0.0
+    for encoding in offered:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def text_digest(text: str) -> Tuple[int, str]:
+    """Get the UTF-8 size in bytes and SHA-256 hex digest of a text."""
+    data = text.encode("utf-8")
+    return len(data), hashlib.sha256(data).hexdigest()
@@ -4,8 +4,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.core.config import settings
+from app.core.slow_queries import slow_query_log
 
 engine = create_engine(settings.DATABASE_URL)
+if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+    slow_query_log.install(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
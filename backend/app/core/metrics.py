@@ -0,0 +1,199 @@
+"""
+Prometheus metrics, served at /metrics when MONITORING_ENABLED is on.
+
+Request latency histograms per route template and in-flight gauges come
+from prometheus-fastapi-instrumentator; this module adds database pool
+gauges, query durations per CRUD method, cache hits, storage call latency,
+email sends and admission control waits and refusals. Both packages belong
+to the ``prod`` extra: without them, or with monitoring off, the recording
+helpers do nothing.
+
+With several uvicorn workers, set PROMETHEUS_MULTIPROC_DIR so the workers
+share their samples.
+"""
+
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.query_stats import crud_caller, query_duration
+
+try:
+    from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+    from prometheus_client.core import GaugeMetricFamily
+    from prometheus_fastapi_instrumentator import Instrumentator
+except ImportError:  # pragma: no cover - optional dependency
+    Instrumentator = None
+
+logger = logging.getLogger(__name__)
+
+METRICS_PATH = "/metrics"
+
+_enabled = False
+_pool_collector: Optional["_PoolCollector"] = None
+
+if Instrumentator is not None:
+    DB_QUERY_DURATION = Histogram(
+        "db_query_duration_seconds",
+        "SQL statement duration by calling CRUD method",
+        ["crud_method"],
+        buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+    )
+    CACHE_REQUESTS = Counter(
+        "cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]
+    )
+    STORAGE_CALL_DURATION = Histogram(
+        "storage_call_duration_seconds",
+        "File storage call duration",
+        ["backend", "operation", "result"],
+    )
+    EMAIL_SEND_DURATION = Histogram(
+        "email_send_duration_seconds", "Email send duration", ["result"]
+    )
+    # Emails are sent inline by request handlers, so sends in progress are
+    # the backlog of mail waiting on SMTP
+    EMAIL_SENDS_IN_PROGRESS = Gauge(
+        "email_sends_in_progress", "Emails currently being sent"
+    )
+    ADMISSION_QUEUE_WAIT = Histogram(
+        "admission_queue_wait_seconds",
+        "Time requests waited for admission by route class",
+        ["route_class"],
+        buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
+    )
+    ADMISSION_SHED = Counter(
+        "admission_shed_total",
+        "Requests refused by admission control",
+        ["route_class", "reason"],
+    )
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+class _PoolCollector:
+    """Report connection pool usage when scraped."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def collect(self):
+        pool = self.engine.pool
+        for name, documentation, attribute in (
+            ("db_pool_size", "Connections kept in the pool", "size"),
+            ("db_pool_checked_out", "Connections in use", "checkedout"),
+            ("db_pool_checked_in", "Idle connections in the pool", "checkedin"),
+            ("db_pool_overflow", "Connections opened beyond the pool size", "overflow"),
+        ):
+            # Only QueuePool keeps these counts
+            value = getattr(pool, attribute, None)
+            if callable(value):
+                yield GaugeMetricFamily(name, documentation, value=value())
+
+
+def _observe_query(conn, cursor, statement, parameters, context, executemany):
+    DB_QUERY_DURATION.labels(crud_method=crud_caller() or "other").observe(
+        query_duration(context)
+    )
+
+
+def setup_metrics(app: FastAPI, engine: Engine) -> bool:
+    """
+    Instrument the app and engine and expose METRICS_PATH.
+
+    Returns False when the Prometheus packages are not installed.
+    """
+    global _enabled, _pool_collector
+    if Instrumentator is None:
+        logger.warning(
+            "MONITORING_ENABLED is set but prometheus-fastapi-instrumentator "
+            "is not installed; metrics are disabled"
+        )
+        return False
+
+    Instrumentator(
+        should_group_status_codes=False,
+        should_instrument_requests_inprogress=True,
+        inprogress_labels=True,
+        excluded_handlers=[METRICS_PATH],
+    ).instrument(app).expose(app, endpoint=METRICS_PATH, include_in_schema=False)
+
+    if not _enabled:
+        _pool_collector = _PoolCollector(engine)
+        REGISTRY.register(_pool_collector)
+        event.listen(Engine, "after_cursor_execute", _observe_query)
+        _enabled = True
+    return True
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup; hit ratios are computed from these at query time."""
+    if _enabled:
+        CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def observe_storage(operation: str) -> Callable:
+    """
+    Time a storage client method.
+
+    A None or False return value counts as a failure, as the clients report
+    errors that way.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _enabled:
+                return method(self, *args, **kwargs)
+            started = time.perf_counter()
+            result = None
+            try:
+                result = method(self, *args, **kwargs)
+                return result
+            finally:
+                STORAGE_CALL_DURATION.labels(
+                    backend=type(self).__name__,
+                    operation=operation,
+                    result="error" if result in (None, False) else "ok",
+                ).observe(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def track_email() -> Iterator[dict]:
+    """
+    Time an email send; set "sent" in the yielded dict to record the outcome.
+    """
+    outcome = {"sent": False}
+    if not _enabled:
+        yield outcome
+        return
+    started = time.perf_counter()
+    EMAIL_SENDS_IN_PROGRESS.inc()
+    try:
+        yield outcome
+    finally:
+        EMAIL_SENDS_IN_PROGRESS.dec()
+        EMAIL_SEND_DURATION.labels(
+            result="sent" if outcome["sent"] else "failed"
+        ).observe(time.perf_counter() - started)
+
+
+def record_admission(route_class: str, waited: float, shed: Optional[str]) -> None:
+    """Record the wait of an admitted request, or why it was refused."""
+    if not _enabled:
+        return
+    if shed is None:
+        ADMISSION_QUEUE_WAIT.labels(route_class=route_class).observe(waited)
+    else:
+        ADMISSION_SHED.labels(route_class=route_class, reason=shed).inc()
@@ -0,0 +1,323 @@
+"""
+Sampling profiler for single requests and for the whole process.
+
+A background thread reads every thread's stack with sys._current_frames()
+at a fixed interval, so profiled code runs unmodified and the overhead is
+paid by the sampler thread only. Profiles are kept as collapsed stacks
+("outer;inner;leaf count" per line), the input format of flamegraph.pl and
+speedscope. Threads blocked waiting for work are left out.
+
+ProfilingMiddleware profiles a PROFILING_SAMPLE_RATE fraction of requests,
+and requests from admins that send the PROFILING_HEADER, keeping the last
+PROFILING_MAX_PROFILES by request id. A request's samples are taken from
+the event loop while its middleware frame is on the stack and from worker
+threads running in its context (sync endpoints and dependencies), so
+concurrent requests do not show up in each other's profiles.
+"""
+
+import logging
+import queue
+import random
+import selectors
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from contextvars import Context, ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Callable, List, Optional
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.auth import verify_token
+from app.core.database import SessionLocal
+from app.core.logging_config import current_request_id
+from app.core.settings import settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Leaf frames in these modules mean the thread is waiting, not working
+_IDLE_FILES = {module.__file__ for module in (threading, queue, selectors)}
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar(
+    "request_profile", default=None
+)
+
+
+@lru_cache(maxsize=4096)
+def _short_path(filename: str) -> str:
+    """A file name relative to the longest sys.path entry containing it."""
+    path = str(Path(filename).resolve())
+    roots = [str(Path(entry).resolve()) for entry in sys.path if entry]
+    for root in sorted(roots, key=len, reverse=True):
+        if path.startswith(root + "/"):
+            return path[len(root) + 1 :]
+    return path
+
+
+def _collapse(frame: FrameType) -> str:
+    """A stack as "outer;inner;leaf", each frame named function (file)."""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        name = getattr(code, "co_qualname", code.co_name)
+        names.append(f"{name} ({_short_path(code.co_filename)})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """Count the stacks of the selected threads at a fixed interval."""
+
+    def __init__(
+        self,
+        interval: float,
+        select: Optional[Callable[[FrameType], bool]] = None,
+    ):
+        self.interval = interval
+        self.select = select
+        self.samples = 0
+        self.started_at: Optional[datetime] = None
+        self.stopped_at: Optional[datetime] = None
+        self._stacks: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        self.started_at = datetime.now(timezone.utc)
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.stopped_at = datetime.now(timezone.utc)
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.sample(skip=own_id)
+
+    def sample(self, skip: Optional[int] = None) -> None:
+        """Record the current stack of every selected, busy thread."""
+        stacks = [
+            _collapse(frame)
+            for thread_id, frame in sys._current_frames().items()
+            if thread_id != skip
+            and frame.f_code.co_filename not in _IDLE_FILES
+            and (self.select is None or self.select(frame))
+        ]
+        with self._lock:
+            self._stacks.update(stacks)
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """The sampled stacks in collapsed format, most frequent first."""
+        with self._lock:
+            stacks = self._stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in stacks)
+
+
+@dataclass
+class RequestProfile:
+    """The samples taken while one request was handled."""
+
+    id: str
+    method: str
+    path: str
+    sampler: Optional[StackSampler] = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    duration: float = 0.0  # seconds
+    status_code: Optional[int] = None
+
+    @property
+    def samples(self) -> int:
+        return self.sampler.samples if self.sampler else 0
+
+    def owns(self, frame: FrameType) -> bool:
+        """Whether a thread's stack is working on this request."""
+        while frame is not None:
+            code = frame.f_code
+            if code is _MIDDLEWARE_CODE:
+                if frame.f_locals.get("profile") is self:
+                    return True
+            elif "context" in code.co_varnames:
+                # Worker threads run sync code with Context.run(func)
+                context = frame.f_locals.get("context")
+                if (
+                    isinstance(context, Context)
+                    and context.get(_current_profile) is self
+                ):
+                    return True
+            frame = frame.f_back
+        return False
+
+
+class ProfileStore:
+    """The most recent request profiles, by request id."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.pop(profile.id, None)
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def recent(self) -> List[RequestProfile]:
+        """Stored profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+
+
+class ProcessProfiler:
+    """
+    The process-wide sampler started and stopped by admins.
+
+    Each worker process has its own; with several workers, the one that
+    serves the start request is profiled.
+    """
+
+    def __init__(self):
+        self.sampler: Optional[StackSampler] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.sampler is not None and self.sampler.running
+
+    def start(self, interval: float) -> bool:
+        """Start a new profile; False if one is already running."""
+        with self._lock:
+            if self.running:
+                return False
+            self.sampler = StackSampler(interval)
+            self.sampler.start()
+            return True
+
+    def stop(self) -> bool:
+        """Stop the running profile, keeping its stacks; False if none runs."""
+        with self._lock:
+            if not self.running:
+                return False
+            self.sampler.stop()
+            return True
+
+
+def _is_admin(authorization: Optional[str]) -> bool:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        user_id = verify_token(token).user_id
+    except HTTPException:
+        return False
+    db = SessionLocal()
+    try:
+        user = db.get(User, user_id)
+        return bool(user and user.is_active and user.is_admin)
+    finally:
+        db.close()
+
+
+class ProfilingMiddleware:
+    """Profile sampled requests and admin requests sending the header."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        header: str = "X-Profile",
+        interval: float = 0.001,
+    ):
+        self.app = app
+        self.store = store
+        self.sample_rate = sample_rate
+        self.header = header
+        self.interval = interval
+
+    async def _should_profile(self, scope: Scope) -> bool:
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+        headers = Headers(scope=scope)
+        if self.header and headers.get(self.header):
+            return await run_in_threadpool(_is_admin, headers.get("authorization"))
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not await self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile(
+            id=current_request_id()
+            or Headers(scope=scope).get("x-request-id")
+            or uuid.uuid4().hex,
+            method=scope["method"],
+            path=scope["path"],
+        )
+        profile.sampler = StackSampler(self.interval, select=profile.owns)
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Profile-Id", profile.id)
+            await send(message)
+
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+        profile.sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.sampler.stop()
+            profile.duration = time.perf_counter() - started
+            _current_profile.reset(token)
+            self.store.add(profile)
+            logger.info(
+                "Profiled %s %s as %s (%d samples)",
+                profile.method,
+                profile.path,
+                profile.id,
+                profile.sampler.samples,
+            )
+
+
+_MIDDLEWARE_CODE = ProfilingMiddleware.__call__.__code__
+
+# Create singleton instances
+profile_store = ProfileStore(settings.PROFILING_MAX_PROFILES)
+process_profiler = ProcessProfiler()
@@ -0,0 +1,189 @@
+"""
+SQL query counting per request.
+
+Cursor events on every engine add each statement and its duration to the
+QueryStats of the current request, held in a context variable (sync
+endpoints run in worker threads that inherit it). QueryStatsMiddleware
+reports them as Server-Timing and X-DB-Queries headers when
+QUERY_STATS_HEADERS is on, and logs requests that run more than
+QUERY_BUDGET queries along with their most repeated statement, which is
+usually an N+1 relationship load.
+
+crud_caller() and current_route() attribute a statement to the CRUD method
+and the request running it, for the metrics and the slow-query log.
+"""
+
+import logging
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+_CRUD_DIR = str(Path(__file__).resolve().parent.parent / "crud")
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar(
+    "query_stats", default=None
+)
+_current_scope: ContextVar[Optional[Scope]] = ContextVar("request_scope", default=None)
+
+
+@dataclass
+class QueryStats:
+    """Queries run and time spent in the database."""
+
+    count: int = 0
+    duration: float = 0.0  # seconds
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def most_repeated(self) -> Optional[Tuple[str, int]]:
+        """The statement run most often, with its count."""
+        return self.statements.most_common(1)[0] if self.statements else None
+
+    def summary(self) -> str:
+        """Statements with their counts, most frequent first."""
+        return "\n".join(
+            f"{count:>4}x {' '.join(statement.split())}"
+            for statement, count in self.statements.most_common()
+        )
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect the queries run by this context (and threads it starts)."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryStats]:
+    """Collect every query run on an engine, from any thread or context."""
+    stats = QueryStats()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        stats.record(statement, query_duration(context))
+
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def query_duration(context) -> float:
+    """Seconds since the cursor execute of a statement context started."""
+    started = getattr(context, "_query_started", None)
+    return time.perf_counter() - started if started is not None else 0.0
+
+
+def crud_caller() -> Optional[str]:
+    """
+    Name the CRUD method running the current statement, e.g. "CRUDBook.get".
+
+    Walks the stack for the outermost frame in app/crud, so base class
+    helpers are attributed to the method the endpoint called.
+    """
+    caller = None
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(_CRUD_DIR):
+            owner = frame.f_locals.get("self")
+            caller = (
+                f"{type(owner).__name__}.{frame.f_code.co_name}"
+                if owner is not None
+                else frame.f_code.co_name
+            )
+        frame = frame.f_back
+    return caller
+
+
+def current_route() -> Optional[str]:
+    """
+    The request running the current statement, e.g. "GET /api/v1/books/{book_id}".
+
+    Uses the route template once routing has matched, the raw path before.
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return None
+    route = scope.get("route")
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, query_duration(context))
+
+
+class QueryStatsMiddleware:
+    """Count the queries of each HTTP request, report and budget them."""
+
+    def __init__(self, app: ASGIApp, *, headers: bool = False, budget: int = 0):
+        self.app = app
+        self.headers = headers
+        self.budget = budget
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        scope_token = _current_scope.set(scope)
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.headers:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-DB-Queries", str(stats.count))
+                    headers.append(
+                        "Server-Timing",
+                        f"db;dur={stats.duration * 1000:.1f};"
+                        f'desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                _current_scope.reset(scope_token)
+
+        if self.budget and stats.count > self.budget:
+            statement, repeats = stats.most_repeated()
+            logger.warning(
+                "%s %s ran %d queries (budget %d) in %.1f ms; "
+                "most repeated (%dx): %s",
+                scope["method"],
+                scope["path"],
+                stats.count,
+                self.budget,
+                stats.duration * 1000,
+                repeats,
+                " ".join(statement.split())[:300],
+            )
@@ -0,0 +1,259 @@
+"""
+Rate limiting, on when RATE_LIMIT_ENABLED is set.
+
+Every client has a token bucket of RATE_LIMIT_REQUESTS tokens, refilled
+evenly over RATE_LIMIT_PERIOD seconds: signed-in users by their user id,
+everyone else by IP address. A request takes one token, or the cost of the
+longest matching prefix in RATE_LIMIT_ROUTE_COSTS, plus one token per
+RATE_LIMIT_LISTING_UNIT rows of an explicit ``?limit=``, so searches and
+large listings run out sooner. A request finding too few tokens gets a 429
+with Retry-After.
+
+Buckets live in Redis when REDIS_URL is set and the ``redis`` package is
+installed, so all workers share them; otherwise, or while Redis is down,
+each process keeps the buckets of its most recently seen clients in
+memory. A Redis call that fails or takes longer than REDIS_TIMEOUT seconds
+switches to the in-memory buckets, and Redis is tried again only after
+REDIS_RETRY_AFTER seconds.
+
+Anonymous clients are told apart by the connection's client address. Behind
+a reverse proxy or load balancer that is the proxy's, unless uvicorn is
+started with ``--proxy-headers --forwarded-allow-ips=<proxy addresses>`` so
+that it takes the address from X-Forwarded-For; only list proxies you
+trust, as anyone else can put any address in that header.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.auth import verify_token
+from app.core.config import settings
+from app.schemas.response import Messages
+
+try:
+    import redis
+    import redis.asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+REDIS_TIMEOUT = 0.25  # seconds
+REDIS_RETRY_AFTER = 30.0  # seconds
+
+# Refill and take atomically, timed by the Redis clock so that workers
+# with drifting clocks agree. Returns {allowed, tokens left}; the tokens are
+# returned as a string, as Lua numbers are truncated to integers.
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil(capacity / rate * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+
+class MemoryBucketStore:
+    """Token buckets in this process, dropping the least recently used."""
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def take(
+        self, key: str, cost: float, capacity: float, rate: float
+    ) -> Tuple[bool, float]:
+        """Take ``cost`` tokens if there are enough; returns (taken, tokens left)."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, tokens
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class RedisBucketStore:
+    """Token buckets shared by all workers through Redis."""
+
+    def __init__(self, url: str, fallback: Optional[MemoryBucketStore] = None):
+        self._client = redis_asyncio.from_url(
+            url, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT
+        )
+        self._take = self._client.register_script(_TAKE_SCRIPT)
+        self.fallback = fallback or MemoryBucketStore()
+        self._available = True
+        self._retry_at = 0.0
+
+    async def take(
+        self, key: str, cost: float, capacity: float, rate: float
+    ) -> Tuple[bool, float]:
+        if not self._available and time.monotonic() < self._retry_at:
+            return await self.fallback.take(key, cost, capacity, rate)
+        try:
+            allowed, tokens = await self._take(
+                keys=[f"rate_limit:{key}"], args=[capacity, rate, cost]
+            )
+        except redis.RedisError as e:
+            self._retry_at = time.monotonic() + REDIS_RETRY_AFTER
+            if self._available:
+                logger.warning(
+                    "Rate limit store unavailable, using in-memory buckets: %s", e
+                )
+                self._available = False
+            return await self.fallback.take(key, cost, capacity, rate)
+
+        if not self._available:
+            logger.info("Rate limit store available again")
+            self._available = True
+        return bool(allowed), float(tokens)
+
+
+def create_bucket_store():
+    """The Redis store when REDIS_URL is set and redis is installed."""
+    if not settings.REDIS_URL:
+        return MemoryBucketStore()
+    if redis is None:
+        logger.warning(
+            "REDIS_URL is set but the redis package is not installed; "
+            "rate limits are kept per process"
+        )
+        return MemoryBucketStore()
+    return RedisBucketStore(settings.REDIS_URL)
+
+
+def client_key(scope: Scope) -> str:
+    """The user id from a valid bearer token, otherwise the client address."""
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            return f"user:{verify_token(token).user_id}"
+        except HTTPException:
+            pass
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """
+    Charge each request to its client's token bucket.
+
+    Responses carry X-RateLimit-Limit and X-RateLimit-Remaining; requests
+    without enough tokens are answered with a 429 and a Retry-After of the
+    seconds until they would have them.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        store,
+        requests: int,
+        period: float,
+        route_costs: Optional[Dict[str, int]] = None,
+        listing_unit: int = 0,
+        exempt_paths: Iterable[str] = (),
+        prefix: str = "",
+    ):
+        self.app = app
+        self.store = store
+        self.capacity = requests
+        self.rate = requests / period
+        # Longest prefix first, so "/search/books" wins over "/search"
+        self.route_costs = sorted(
+            (route_costs or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.listing_unit = listing_unit
+        self.exempt_paths = tuple(exempt_paths)
+        self.prefix = prefix
+
+    def request_cost(self, path: str, query_string: str) -> int:
+        if self.prefix and path.startswith(self.prefix):
+            path = path[len(self.prefix) :]
+        cost = 1
+        for route, route_cost in self.route_costs:
+            route = route.rstrip("/")
+            if path == route or path.startswith(route + "/"):
+                cost = route_cost
+                break
+
+        limit = parse_qs(query_string).get("limit")
+        if self.listing_unit and limit:
+            try:
+                cost += max(0, int(limit[-1])) // self.listing_unit
+            except ValueError:
+                pass
+        # A request costing more than a full bucket could never be served
+        return min(cost, self.capacity)
+
+    def _exempt(self, scope: Scope) -> bool:
+        return scope["method"] == "OPTIONS" or any(
+            scope["path"] == path or scope["path"].startswith(path.rstrip("/") + "/")
+            for path in self.exempt_paths
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._exempt(scope):
+            await self.app(scope, receive, send)
+            return
+
+        cost = self.request_cost(scope["path"], scope["query_string"].decode("latin-1"))
+        allowed, tokens = await self.store.take(
+            client_key(scope), cost, self.capacity, self.rate
+        )
+
+        if not allowed:
+            retry_after = math.ceil((cost - tokens) / self.rate)
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": Messages.TOO_MANY_REQUESTS},
+                headers={
+                    "Retry-After": str(retry_after),
+                    "X-RateLimit-Limit": str(self.capacity),
+                    "X-RateLimit-Remaining": str(int(tokens)),
+                },
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_limits(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(self.capacity)
+                headers["X-RateLimit-Remaining"] = str(int(tokens))
+            await send(message)
+
+        await self.app(scope, receive, send_with_limits)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings as PydanticBaseSettings
@@ -36,6 +36,9 @@ class BaseSettings(PydanticBaseSettings):
     UPLOAD_FOLDER: str = "static/uploads"
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif", "pdf", "epub"]
+    # "supabase", or "local" to keep uploads in UPLOAD_FOLDER and serve them
+    # from the app (offline development and load tests)
+    STORAGE_BACKEND: str = "supabase"
 
     # ===============================
     # SMTP SETTINGS
@@ -46,13 +49,149 @@ class BaseSettings(PydanticBaseSettings):
     # ===============================
     # REDIS SETTINGS
     # ===============================
+    REDIS_URL: Optional[str] = None
     REDIS_EXPIRE: int = 3600  # 1 hour
 
     # ===============================
     # RATE LIMITING
     # ===============================
     RATE_LIMIT_ENABLED: bool = True
-    RATE_LIMIT_REQUESTS: int = 100
+    RATE_LIMIT_REQUESTS: int = 100  # Bucket size, refilled over the period
+    RATE_LIMIT_PERIOD: int = 60  # seconds
+    # Tokens taken by requests under these path prefixes (after API_V1_STR)
+    RATE_LIMIT_ROUTE_COSTS: Dict[str, int] = {"/search": 5}
+    # An explicit ?limit= takes one more token per this many rows
+    RATE_LIMIT_LISTING_UNIT: int = 1000
+    RATE_LIMIT_EXEMPT_PATHS: List[str] = ["/health", "/metrics"]
+
+    # ===============================
+    # REQUEST COALESCING
+    # ===============================
+    # Identical concurrent catalog reads share one query
+    SINGLE_FLIGHT_ENABLED: bool = True
+    SINGLE_FLIGHT_TIMEOUT: float = 5.0  # seconds before waiters query themselves
+
+    # ===============================
+    # PUBLIC FEEDS
+    # ===============================
+    # Homepage and catalog feeds served from precomputed snapshots
+    FEEDS_ENABLED: bool = True
+    FEED_SIZE: int = 100  # books kept per feed
+    FEED_REFRESH_INTERVAL: int = 300  # seconds
+    FEED_REFRESH_DELAY: float = 2.0  # seconds after a catalog change
+    FEED_CACHE_TTL: float = 10.0  # seconds a process serves a feed it has read
+    FEED_MOST_READ_DAYS: int = 30
+
+    # ===============================
+    # BOOK RANKINGS
+    # ===============================
+    # Popular and trending sort orders, backed by the book_stats table
+    RANKINGS_ENABLED: bool = True  # recompute book_stats in the background
+    RANKINGS_REFRESH_INTERVAL: int = 600  # seconds
+    ACTIVE_READER_DAYS: int = 7
+    TRENDING_HALF_LIFE_DAYS: float = 3.0
+    TRENDING_WINDOW_DAYS: int = 30
+
+    # ===============================
+    # RECOMMENDATIONS
+    # ===============================
+    # "Readers who liked this also liked", built by scripts/build_recommendations.py
+    RECOMMENDATIONS_TOP_K: int = 20  # similar books kept per book
+    RECOMMENDATIONS_MIN_SCORE: float = 0.0  # cosine similarity
+    RECOMMENDATIONS_BLOCK_CELLS: int = 20_000_000  # ~80 MB of scores at a time
+
+    # ===============================
+    # ADMISSION CONTROL
+    # ===============================
+    ADMISSION_CONTROL_ENABLED: bool = False
+    # Requests of each route class running at once; keep the total near
+    # the database pool size (5 + 10 overflow by default)
+    ADMISSION_LIMITS: Dict[str, int] = {
+        "read": 8,
+        "write": 3,
+        "search": 2,
+        "upload": 1,
+        "auth": 4,
+    }
+    # Route classes by path prefix (after API_V1_STR); other requests are
+    # "read" (GET, HEAD) or "write"
+    ADMISSION_ROUTE_CLASSES: Dict[str, str] = {
+        "/auth": "auth",
+        "/search": "search",
+        "/upload": "upload",
+        "/imports": "upload",
+    }
+    ADMISSION_QUEUE_SIZE: int = 100
+    ADMISSION_QUEUE_TIMEOUT: float = 2.0  # seconds
+    # Listings asking for this many rows queue behind other requests
+    ADMISSION_BULK_LIMIT: int = 1000
+
+    # ===============================
+    # CHAPTER CONTENT STORAGE
+    # ===============================
+    # "identity" (plain text), "gzip" or "zstd" (needs the zstandard package)
+    CHAPTER_CONTENT_COMPRESSION: str = "identity"
+    CHAPTER_CONTENT_COMPRESSION_MIN_SIZE: int = 1024  # bytes
+    # Pre-compressed variants built on write and served as-is to clients
+    # that accept them ("br" needs the brotli package)
+    CHAPTER_CONTENT_VARIANTS: List[str] = ["br", "gzip"]
+    # Postgres text search configuration for the chapter search index
+    CHAPTER_SEARCH_CONFIG: str = "simple"
+
+    # ===============================
+    # IMPORTS
+    # ===============================
+    # Processes splitting EPUBs into chapters (0 = one per CPU, 1 = inline)
+    EPUB_IMPORT_WORKERS: int = 0
+
+    # ===============================
+    # QUERY INSTRUMENTATION
+    # ===============================
+    # Server-Timing and X-DB-Queries headers with each request's SQL stats
+    QUERY_STATS_HEADERS: bool = False
+    # Log requests running more queries than this (0 = off)
+    QUERY_BUDGET: int = 50
+    # Log and keep statements slower than this (0 = off)
+    SLOW_QUERY_THRESHOLD_MS: float = 200
+    # Fraction of slow SELECTs re-run under EXPLAIN ANALYZE (PostgreSQL only)
+    SLOW_QUERY_EXPLAIN_RATE: float = 0.0
+    SLOW_QUERY_LOG_SIZE: int = 200  # slow statements kept for /slow-queries
+
+    # ===============================
+    # LOGGING
+    # ===============================
+    # "json" (one object per line) or "text"
+    LOG_FORMAT: str = "json"
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024  # rotate LOG_FILE at this size
+    LOG_BACKUP_COUNT: int = 5
+    # Fraction of DEBUG/INFO records kept per logger, e.g. {"app.crud": 0.1}
+    LOG_SAMPLING: Dict[str, float] = {}
+
+    # ===============================
+    # MONITORING
+    # ===============================
+    # Prometheus metrics at /metrics (needs the prod extra)
+    MONITORING_ENABLED: bool = False
+    # OpenTelemetry spans (needs the tracing extra)
+    TRACING_ENABLED: bool = False
+    TRACING_SERVICE_NAME: str = "book-reading-api"
+    # "otlp" (a collector) or "file" (JSON lines at TRACING_FILE_PATH)
+    TRACING_EXPORTER: str = "otlp"
+    # Defaults to the OTEL_EXPORTER_OTLP_* environment variables
+    TRACING_OTLP_ENDPOINT: Optional[str] = None
+    TRACING_FILE_PATH: str = "logs/traces.jsonl"
+    TRACING_SAMPLE_RATE: float = 1.0  # fraction of traces started here
+
+    # ===============================
+    # PROFILING
+    # ===============================
+    # Stack sampling of requests and the admin /profiling endpoints
+    PROFILING_ENABLED: bool = False
+    # Fraction of requests profiled; admins can also send PROFILING_HEADER
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_HEADER: str = "X-Profile"
+    PROFILING_INTERVAL: float = 0.001  # seconds between stack samples
+    PROFILING_MAX_PROFILES: int = 100  # request profiles kept in memory
 
     # ===============================
     # COMPUTED PROPERTIES
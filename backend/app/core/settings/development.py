@@ -88,6 +88,17 @@ class DevelopmentSettings(BaseSettings):
     # ===============================
     LOG_LEVEL: str = "DEBUG"
     LOG_FILE: Optional[str] = "logs/app.log"
+    LOG_FORMAT: str = "text"
+
+    # ===============================
+    # PUBLIC FEEDS
+    # ===============================
+    FEEDS_ENABLED: bool = False  # Always query live data in development
+
+    # ===============================
+    # BOOK RANKINGS
+    # ===============================
+    RANKINGS_ENABLED: bool = False  # Run scripts/rebuild_book_stats.py instead
 
     # ===============================
     # RATE LIMITING
@@ -108,6 +119,7 @@ class DevelopmentSettings(BaseSettings):
     RELOAD_ON_CHANGE: bool = True
     SHOW_DOCS: bool = True
     PROFILING_ENABLED: bool = True
+    QUERY_STATS_HEADERS: bool = True
 
     model_config = {
         "case_sensitive": True,
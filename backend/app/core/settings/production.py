@@ -71,6 +71,13 @@ class ProductionSettings(BaseSettings):
     )
     MONITORING_ENABLED: bool = Field(default=True, description="Enable monitoring")
 
+    # ===============================
+    # CHAPTER CONTENT STORAGE
+    # ===============================
+    CHAPTER_CONTENT_COMPRESSION: str = Field(
+        default="gzip", description="Compression for stored chapter bodies"
+    )
+
     # ===============================
     # SSL/TLS SETTINGS
     # ===============================
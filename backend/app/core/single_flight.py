@@ -0,0 +1,173 @@
+"""
+Request coalescing for hot catalog reads.
+
+CRUD read methods decorated with ``@coalesced`` run once for all identical
+calls (same method and arguments) that arrive while one is in flight in
+this process: the first caller runs the query and the others wait for its
+result instead of sending the same query to the database. A burst of
+homepage loads then costs one featured-books query, not hundreds.
+
+The leader's objects never leave its thread: once the query is done, and
+only if anyone is waiting, it copies what was loaded into detached objects,
+and each waiter merges those into its own session without loading
+anything, so the objects behave as if they had queried them themselves.
+Calls from a session with unflushed changes, or whose ``info`` has
+``coalesce`` set to False (background refreshers that run right after
+writes), never join, as the query in flight may not see those writes; a
+waiter that waits longer than SINGLE_FLIGHT_TIMEOUT seconds runs the query
+itself.
+
+Only reads whose result does not depend on the caller belong here.
+"""
+
+import functools
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run a function once for concurrent calls with the same key."""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        timeout: Optional[float] = None,
+        share: Optional[Callable[[Any], Any]] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        Run ``func``, or wait for the call with ``key`` already in flight.
+
+        Returns the result and whether it came from another caller. Waiters
+        get ``share(result)``, computed once by the caller that ran ``func``,
+        if given. Errors are raised in every caller; a caller that waited
+        ``timeout`` seconds in vain runs ``func`` itself.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                return func(), False
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            # Nobody can join once the call is gone, so waiters is final
+            with self._lock:
+                del self._calls[key]
+            try:
+                if share is not None and call.waiters:
+                    call.result = share(result)
+                else:
+                    call.result = result
+            except Exception as e:
+                call.error = e
+            return result, False
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+
+
+def _detach(result: Any, copies: Optional[Dict[int, Any]] = None) -> Any:
+    """Detached copies of ORM objects, with the attributes loaded so far."""
+    if copies is None:
+        copies = {}
+    if isinstance(result, list):
+        return [_detach(item, copies) for item in result]
+    if result is None or not hasattr(result, "_sa_instance_state"):
+        return result
+    if id(result) in copies:
+        return copies[id(result)]
+
+    state = inspect(result)
+    copy = state.mapper.class_manager.new_instance()
+    copies[id(result)] = copy
+    for key in state.mapper.attrs.keys():
+        if key in state.dict:
+            set_committed_value(copy, key, _detach(state.dict[key], copies))
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _adopt(db: Session, result: Any) -> Any:
+    """Merge detached copies made by another session into ``db``."""
+    if isinstance(result, list):
+        return [_adopt(db, item) for item in result]
+    if result is None or not hasattr(result, "_sa_instance_state"):
+        return result
+    return db.merge(result, load=False)
+
+
+def coalesced(method: Callable) -> Callable:
+    """Coalesce concurrent identical calls of a CRUD read method."""
+    name = method.__qualname__
+
+    @functools.wraps(method)
+    def wrapper(self, db: Session, *args, **kwargs):
+        if (
+            not settings.SINGLE_FLIGHT_ENABLED
+            or not db.info.get("coalesce", True)
+            or db.new
+            or db.dirty
+            or db.deleted
+        ):
+            return method(self, db, *args, **kwargs)
+
+        key = (name, args, tuple(sorted(kwargs.items())))
+        result, shared = single_flight.do(
+            key,
+            lambda: method(self, db, *args, **kwargs),
+            timeout=settings.SINGLE_FLIGHT_TIMEOUT,
+            share=_detach,
+        )
+        record_cache("single_flight", shared)
+        if shared:
+            logger.debug("Joined in-flight %s%s", name, key[1:])
+            result = _adopt(db, result)
+        return result
+
+    return wrapper
+
+
+# Create a singleton instance
+single_flight = SingleFlight()
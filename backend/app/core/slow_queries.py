@@ -0,0 +1,169 @@
+"""
+Slow-query log.
+
+Statements taking longer than SLOW_QUERY_THRESHOLD_MS are logged and kept
+in a ring buffer of the last SLOW_QUERY_LOG_SIZE, readable by admins at
+/slow-queries. Each entry has the statement with literals replaced by
+placeholders, the types of its parameters (never their values), the CRUD
+method and the route that ran it.
+
+On PostgreSQL a SLOW_QUERY_EXPLAIN_RATE fraction of slow SELECTs is re-run
+under EXPLAIN (ANALYZE, BUFFERS) on the same connection and transaction,
+inside a savepoint, and the plan is stored with the entry. This runs the
+query a second time, so keep the rate low.
+"""
+
+import logging
+import random
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.core.query_stats import crud_caller, current_route, query_duration
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAMETER = re.compile(r"%\(\w+\)s|%s|:\w+|\$\d+|\?")
+# "IN (?, ?, ?)" and multi-row VALUES differ only in their length
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def normalize_sql(statement: str) -> str:
+    """A statement on one line with literals and parameters replaced by ?."""
+    statement = " ".join(statement.split())
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _BIND_PARAMETER.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    return _PLACEHOLDER_LIST.sub("?, ...", statement)
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, (str, bytes, list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def parameter_shapes(parameters: Any, executemany: bool = False) -> Any:
+    """The types (and lengths) of bound parameters, without their values."""
+    if executemany:
+        rows = list(parameters)
+        return {"rows": len(rows), "row": parameter_shapes(rows[0]) if rows else None}
+    if isinstance(parameters, dict):
+        return {name: _value_shape(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_value_shape(value) for value in parameters]
+    return None
+
+
+@dataclass
+class SlowQuery:
+    """A statement that ran longer than the threshold."""
+
+    statement: str
+    duration_ms: float
+    parameters: Any = None
+    crud_method: Optional[str] = None
+    route: Optional[str] = None
+    plan: Optional[str] = None
+    recorded_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class SlowQueryLog:
+    """Capture slow statements of an engine into a ring buffer."""
+
+    def __init__(self, threshold_ms: float, explain_rate: float = 0.0, size: int = 200):
+        self.threshold_ms = threshold_ms
+        self.explain_rate = explain_rate
+        self._entries: deque = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def remove(self, engine: Engine) -> None:
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def entries(self) -> List[SlowQuery]:
+        """Captured statements, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        duration_ms = query_duration(context) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        entry = SlowQuery(
+            statement=normalize_sql(statement),
+            duration_ms=round(duration_ms, 3),
+            parameters=parameter_shapes(parameters, executemany),
+            crud_method=crud_caller(),
+            route=current_route(),
+        )
+        if self._should_explain(conn, statement, executemany):
+            entry.plan = self._explain(conn, statement, parameters)
+
+        with self._lock:
+            self._entries.append(entry)
+        logger.warning(
+            "Slow query (%.1f ms) from %s in %s: %s; parameters: %s",
+            entry.duration_ms,
+            entry.crud_method or "-",
+            entry.route or "-",
+            entry.statement[:500],
+            entry.parameters,
+        )
+
+    def _should_explain(self, conn, statement: str, executemany: bool) -> bool:
+        return (
+            not executemany
+            and conn.dialect.name == "postgresql"
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < self.explain_rate
+        )
+
+    def _explain(self, conn, statement: str, parameters: Any) -> Optional[str]:
+        # A separate DBAPI cursor keeps the results of the slow statement,
+        # and the savepoint keeps a failed EXPLAIN from aborting the
+        # transaction; no SQLAlchemy events fire for either
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                cursor.execute(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters or None
+                )
+            except Exception:
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                raise
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        except Exception as e:
+            logger.warning(f"Could not explain slow query: {str(e)}")
+            return None
+        finally:
+            cursor.close()
+
+
+# Create a singleton instance
+slow_query_log = SlowQueryLog(
+    settings.SLOW_QUERY_THRESHOLD_MS,
+    explain_rate=settings.SLOW_QUERY_EXPLAIN_RATE,
+    size=settings.SLOW_QUERY_LOG_SIZE,
+)
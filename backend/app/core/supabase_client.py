@@ -1,14 +1,20 @@
 import logging
 import uuid
+from pathlib import Path
 from typing import Optional
 from urllib.parse import unquote, urlparse
 
 from supabase import Client, create_client
 
+from app.core.metrics import observe_storage
 from app.core.settings import settings
+from app.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
+# Where app.main serves files kept by LocalStorageClient
+LOCAL_STORAGE_PATH = "/static/uploads"
+
 
 class SupabaseClient:
     def __init__(self):
@@ -23,6 +29,8 @@ class SupabaseClient:
 
         self.client: Client = create_client(self.url, self.key)
 
+    @traced("storage.upload")
+    @observe_storage("upload")
     def upload_file(
         self,
         file_content: bytes,
@@ -56,6 +64,26 @@ class SupabaseClient:
             logger.error(f"Error uploading file {file_name}: {str(e)}")
             return None
 
+    @traced("storage.download")
+    @observe_storage("download")
+    def download_file(self, file_url: str) -> Optional[bytes]:
+        if not file_url:
+            return None
+
+        try:
+            file_path = self._extract_file_path(file_url)
+            if not file_path:
+                logger.warning(f"Could not extract file path from URL: {file_url}")
+                return None
+
+            return self.client.storage.from_(self.bucket_name).download(file_path)
+
+        except Exception as e:
+            logger.error(f"Error downloading file {file_url}: {str(e)}")
+            return None
+
+    @traced("storage.delete")
+    @observe_storage("delete")
     def delete_file(self, file_url: str) -> bool:
         if not file_url:
             return False
@@ -148,5 +176,76 @@ class SupabaseClient:
             return None
 
 
+class LocalStorageClient:
+    """
+    Filesystem stand-in for SupabaseClient, used when STORAGE_BACKEND is
+    "local". Files are kept under UPLOAD_FOLDER and served by the app at
+    LOCAL_STORAGE_PATH, so uploads work without network access.
+    """
+
+    def __init__(self):
+        self.root = Path(settings.UPLOAD_FOLDER).resolve()
+
+    @traced("storage.upload")
+    @observe_storage("upload")
+    def upload_file(
+        self,
+        file_content: bytes,
+        file_name: str,
+        content_type: str = "image/jpeg",
+        folder: str = "covers",
+    ) -> Optional[str]:
+        try:
+            file_extension = file_name.split(".")[-1] if "." in file_name else "jpg"
+            full_path = f"{folder}/{uuid.uuid4()}.{file_extension}"
+
+            target = self.root / full_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(file_content)
+            logger.info(f"Successfully stored file at: {target}")
+            return f"{LOCAL_STORAGE_PATH}/{full_path}"
+
+        except Exception as e:
+            logger.error(f"Error storing file {file_name}: {str(e)}")
+            return None
+
+    @traced("storage.download")
+    @observe_storage("download")
+    def download_file(self, file_url: str) -> Optional[bytes]:
+        target = self._resolve(file_url)
+        if target is None or not target.is_file():
+            return None
+        return target.read_bytes()
+
+    @traced("storage.delete")
+    @observe_storage("delete")
+    def delete_file(self, file_url: str) -> bool:
+        target = self._resolve(file_url)
+        if target is None:
+            return False
+        # Like Supabase, a file that is already gone counts as deleted
+        target.unlink(missing_ok=True)
+        return True
+
+    def _resolve(self, file_url: str) -> Optional[Path]:
+        """Map a URL from upload_file() to its file, refusing paths outside root."""
+        if not file_url:
+            return None
+        path = unquote(urlparse(file_url).path)
+        prefix = f"{LOCAL_STORAGE_PATH}/"
+        if not path.startswith(prefix):
+            logger.warning(f"Not a local storage URL: {file_url}")
+            return None
+        target = (self.root / path[len(prefix) :]).resolve()
+        try:
+            target.relative_to(self.root)
+        except ValueError:
+            logger.warning(f"Refusing path outside local storage: {file_url}")
+            return None
+        return target
+
+
 # Singleton instance
-supabase_client = SupabaseClient()
+supabase_client = (
+    LocalStorageClient() if settings.STORAGE_BACKEND == "local" else SupabaseClient()
+)
@@ -0,0 +1,137 @@
+"""
+OpenTelemetry tracing, on when TRACING_ENABLED is set.
+
+Each request gets a server span named after its route, with child spans
+for every SQL statement, storage call, email send and password hash or
+check, so a slow trace shows where its time went. Spans go to an OTLP
+collector (TRACING_EXPORTER="otlp", endpoint from TRACING_OTLP_ENDPOINT or
+the standard OTEL_EXPORTER_OTLP_* variables) or are appended as JSON lines
+to TRACING_FILE_PATH ("file") for offline use.
+
+The opentelemetry packages belong to the ``tracing`` extra. Without them
+the decorators here leave functions unchanged; with them but tracing off,
+spans are no-ops.
+"""
+
+import functools
+import logging
+from pathlib import Path
+from typing import Callable
+
+from fastapi import FastAPI
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+
+logger = logging.getLogger(__name__)
+
+_tracer = trace.get_tracer("app") if trace is not None else None
+
+
+def traced(name: str) -> Callable:
+    """Run a function in a span named ``name``."""
+
+    def decorator(func):
+        if _tracer is None:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _tracer.start_as_current_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def with_trace_context(func: Callable) -> Callable:
+    """
+    Bind a background job to the trace of the request scheduling it.
+
+    The returned function runs ``func`` in a span that is a child of the
+    span current at the time of this call, wherever it is run later.
+    """
+    if _tracer is None:
+        return func
+    parent = otel_context.get_current()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = otel_context.attach(parent)
+        try:
+            with _tracer.start_as_current_span(f"background {func.__qualname__}"):
+                return func(*args, **kwargs)
+        finally:
+            otel_context.detach(token)
+
+    return wrapper
+
+
+def _exporter():
+    if settings.TRACING_EXPORTER == "file":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+        path = Path(settings.TRACING_FILE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return ConsoleSpanExporter(
+            out=path.open("a", encoding="utf-8"),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import (
+        OTLPSpanExporter,
+    )
+
+    return OTLPSpanExporter(endpoint=settings.TRACING_OTLP_ENDPOINT)
+
+
+def setup_tracing(app: FastAPI, engine: Engine, tracer_provider=None) -> bool:
+    """
+    Trace the app's requests and the engine's statements.
+
+    Builds a tracer provider from the TRACING_* settings unless one is
+    given, and installs it globally. Returns False when the packages are
+    not installed.
+    """
+    try:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    except ImportError:
+        logger.warning(
+            "TRACING_ENABLED is set but the opentelemetry packages are not "
+            "installed; tracing is disabled"
+        )
+        return False
+
+    if tracer_provider is None:
+        tracer_provider = TracerProvider(
+            resource=Resource.create(
+                {
+                    "service.name": settings.TRACING_SERVICE_NAME,
+                    "service.version": settings.VERSION,
+                    "deployment.environment": settings.ENVIRONMENT,
+                }
+            ),
+            sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATE)),
+        )
+        tracer_provider.add_span_processor(BatchSpanProcessor(_exporter()))
+    trace.set_tracer_provider(tracer_provider)
+
+    FastAPIInstrumentor.instrument_app(
+        app, tracer_provider=tracer_provider, excluded_urls="/metrics"
+    )
+    SQLAlchemyInstrumentor().instrument(
+        engine=engine, tracer_provider=tracer_provider, enable_commenter=False
+    )
+    return True
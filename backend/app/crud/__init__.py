@@ -3,8 +3,10 @@ from .book import crud_book
 from .category import crud_category
 from .chapter import crud_chapter
 from .favorite import crud_favorite
+from .import_job import crud_import_job
 from .reading_list import crud_reading_list, crud_reading_list_item
 from .reading_progress import crud_reading_progress
+from .reading_session import crud_reading_session
 from .user import crud_user
 
 __all__ = [
@@ -13,7 +15,9 @@ __all__ = [
     "crud_category",
     "crud_book",
     "crud_chapter",
+    "crud_import_job",
     "crud_reading_progress",
+    "crud_reading_session",
     "crud_favorite",
     "crud_reading_list",
     "crud_reading_list_item",
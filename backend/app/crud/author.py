@@ -1,7 +1,7 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.supabase_client import supabase_client
@@ -14,21 +14,27 @@ logger = logging.getLogger(__name__)
 
 
 class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
-    def create(self, db: Session, *, obj_in: AuthorCreate) -> Author:
-        """Create author with proper handling of empty strings to NULL."""
-        obj_in_data = obj_in.model_dump()
+    # Author names are kept unique by the API, not by a constraint
+    unique_fields = ("name",)
 
+    def _prepare_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert empty strings in optional fields to NULL."""
         # Convert empty strings to None for optional fields
         optional_string_fields = ["bio", "nationality", "website", "image_url"]
         for field in optional_string_fields:
-            if field in obj_in_data and obj_in_data[field] == "":
-                obj_in_data[field] = None
+            if field in data and data[field] == "":
+                data[field] = None
 
         # Convert empty date strings to None
         optional_date_fields = ["birth_date", "death_date"]
         for field in optional_date_fields:
-            if field in obj_in_data and obj_in_data[field] == "":
-                obj_in_data[field] = None
+            if field in data and data[field] == "":
+                data[field] = None
+        return data
+
+    def create(self, db: Session, *, obj_in: AuthorCreate) -> Author:
+        """Create author with proper handling of empty strings to NULL."""
+        obj_in_data = self._prepare_data(obj_in.model_dump())
 
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
@@ -77,8 +83,6 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
         """
         Get authors with their book count
         """
-        from app.models.book import Book
-
         return (
             db.query(
                 Author.id,
@@ -89,10 +93,8 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
                 Author.image_url,
                 Author.created_at,
                 Author.updated_at,
-                func.count(Book.id).label("book_count"),
+                Author.book_count,
             )
-            .outerjoin(Book)
-            .group_by(Author.id)
             .order_by(Author.id.desc())
             .offset(skip)
             .limit(limit)
@@ -105,26 +107,28 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
         """
         try:
             if not author.image_url:
-                logger.info(f"No image to delete for author: {author.name}")
+                logger.debug("No image to delete for author: %s", author.name)
                 return
 
-            logger.info(f"Deleting image for author: {author.name}")
+            logger.info("Deleting image for author: %s", author.name)
 
             try:
                 success = supabase_client.delete_file(author.image_url)
                 if success:
                     logger.info(
-                        f"Author image deleted successfully: {author.image_url}"
+                        "Author image deleted successfully: %s", author.image_url
                     )
                 else:
-                    logger.warning(f"Failed to delete author image: {author.image_url}")
+                    logger.warning(
+                        "Failed to delete author image: %s", author.image_url
+                    )
             except Exception as file_error:
                 logger.error(
-                    f"Error deleting author image {author.image_url}: {str(file_error)}"
+                    "Error deleting author image %s: %s", author.image_url, file_error
                 )
 
         except Exception as e:
-            logger.error(f"Error cleaning up author files for {author.name}: {str(e)}")
+            logger.error("Error cleaning up author files for %s: %s", author.name, e)
 
     def _cleanup_old_files_on_update(
         self, old_author: Author, update_data: Dict[str, Any]
@@ -133,7 +137,7 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
         Delete old image when it is being replaced with a new one or removed.
         """
         try:
-            logger.info(f"Checking file changes for author: {old_author.name}")
+            logger.debug("Checking file changes for author: %s", old_author.name)
 
             # Check image_url update
             if "image_url" in update_data:
@@ -143,25 +147,45 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
                 # If URLs are different AND old URL exists, delete old file
                 if new_image_url != old_image_url and old_image_url:
                     logger.info(
-                        f"Image URL changed, deleting old image: {old_image_url}"
+                        "Image URL changed, deleting old image: %s", old_image_url
                     )
                     try:
                         success = supabase_client.delete_file(old_image_url)
                         if success:
                             logger.info(
-                                f"Successfully deleted old author image: {old_image_url}"
+                                "Successfully deleted old author image: %s",
+                                old_image_url,
                             )
                         else:
                             logger.warning(
-                                f"Failed to delete old author image: {old_image_url}"
+                                "Failed to delete old author image: %s", old_image_url
                             )
                     except Exception as e:
                         logger.error(
-                            f"Error deleting old author image {old_image_url}: {str(e)}"
+                            "Error deleting old author image %s: %s", old_image_url, e
                         )
 
         except Exception as e:
-            logger.error(f"Error cleaning up old files for {old_author.name}: {str(e)}")
+            logger.error("Error cleaning up old files for %s: %s", old_author.name, e)
+
+    def _before_bulk_update(
+        self, db: Session, changes: List[Tuple[Author, Dict[str, Any]]]
+    ) -> None:
+        for author, update_data in changes:
+            self._cleanup_old_files_on_update(author, update_data)
+
+    def _validate_bulk_delete(self, db: Session, objs: List[Author]) -> Dict[int, str]:
+        """Authors with books are kept, as in remove()."""
+        book_counts = db.execute(
+            select(Book.author_id, func.count(Book.id))
+            .where(Book.author_id.in_([author.id for author in objs]))
+            .group_by(Book.author_id)
+        ).all()
+        return {
+            author_id: f"Cannot delete author. {count} books are still "
+            "associated with this author."
+            for author_id, count in book_counts
+        }
 
     def remove(self, db: Session, *, id: int) -> Author:
         """
@@ -198,20 +222,9 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = self._prepare_data(update_data)
 
-        # Convert empty strings to None for optional fields
-        optional_string_fields = ["bio", "nationality", "website", "image_url"]
-        for field in optional_string_fields:
-            if field in update_data and update_data[field] == "":
-                update_data[field] = None
-
-        # Convert empty date strings to None
-        optional_date_fields = ["birth_date", "death_date"]
-        for field in optional_date_fields:
-            if field in update_data and update_data[field] == "":
-                update_data[field] = None
-
-        logger.info(f"Updating author: {db_obj.name} (ID: {db_obj.id})")
+        logger.debug("Updating author: %s (ID: %s)", db_obj.name, db_obj.id)
 
         # Cleanup old files that are being replaced
         self._cleanup_old_files_on_update(db_obj, update_data)
@@ -219,10 +232,10 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
         # Perform the update
         try:
             updated_author = super().update(db, db_obj=db_obj, obj_in=update_data)
-            logger.info(f"Author updated successfully: {updated_author.name}")
+            logger.debug("Author updated successfully: %s", updated_author.name)
             return updated_author
         except Exception as e:
-            logger.error(f"Error updating author {db_obj.id}: {str(e)}")
+            logger.error("Error updating author %s: %s", db_obj.id, e)
             raise e
 
     def get_authors_with_book_count_filtered(
@@ -236,11 +249,7 @@ class CRUDAuthor(CRUDBase[Author, AuthorCreate, AuthorUpdate]):
         """
         Get authors with book count and filtering capabilities.
         """
-        query = (
-            db.query(Author, func.count(Book.id).label("book_count"))
-            .outerjoin(Book, Author.id == Book.author_id)
-            .group_by(Author.id)
-        )
+        query = db.query(Author, Author.book_count)
 
         if filters:
             conditions = []
@@ -1,6 +1,19 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
 from app.core.database import Base
@@ -11,12 +24,26 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    # Columns checked for duplicates by the bulk operations besides the
+    # table's own unique columns
+    unique_fields: Tuple[str, ...] = ()
+
     def __init__(self, model: Type[ModelType]):
         self.model = model
 
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         return db.query(self.model).filter(self.model.id == id).first()
 
+    def get_by_ids(self, db: Session, ids: Sequence[int]) -> List[ModelType]:
+        """Get records by ID with one query, in the order of ids."""
+        if not ids:
+            return []
+        objs = {
+            obj.id: obj
+            for obj in db.query(self.model).filter(self.model.id.in_(set(ids)))
+        }
+        return [objs[id] for id in dict.fromkeys(ids) if id in objs]
+
     def get_multi(
         self, db: Session, *, skip: int = 0, limit: int = 10000
     ) -> List[ModelType]:
@@ -65,3 +92,222 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def count(self, db: Session) -> int:
         """Get total count of all records."""
         return db.query(self.model).count()
+
+    # Bulk operations validate a whole batch with one query per foreign key or
+    # unique column, write the valid items in a single transaction and report
+    # the rest per item as {"index", "id", "detail"}. With atomic=True any
+    # item error rejects the batch and nothing is written.
+
+    def bulk_create(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[CreateSchemaType],
+        atomic: bool = False,
+    ) -> Tuple[List[ModelType], List[Dict[str, Any]]]:
+        """Create many records with one executemany INSERT ... RETURNING."""
+        rows = [self._prepare_data(obj_in.model_dump()) for obj_in in objs_in]
+        errors = self._validate_bulk_rows(db, rows)
+        valid = [row for index, row in enumerate(rows) if index not in errors]
+        if not valid or (errors and atomic):
+            return [], self._bulk_errors(errors)
+
+        try:
+            ids = db.scalars(
+                insert(self.model).returning(
+                    self.model.id, sort_by_parameter_order=True
+                ),
+                valid,
+            ).all()
+            self._after_bulk_create(db, valid)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return self.get_by_ids(db, ids), self._bulk_errors(errors)
+
+    def bulk_update(
+        self,
+        db: Session,
+        *,
+        objs_in: Sequence[BaseModel],
+        atomic: bool = False,
+    ) -> Tuple[List[ModelType], List[Dict[str, Any]]]:
+        """
+        Update many records by primary key with one executemany UPDATE.
+
+        Each item is an update schema with an ``id``; only the fields set on
+        it are written.
+        """
+        rows = [
+            self._prepare_data(obj_in.model_dump(exclude_unset=True))
+            for obj_in in objs_in
+        ]
+        ids = [row["id"] for row in rows]
+        current = {obj.id: obj for obj in self.get_by_ids(db, ids)}
+        errors = self._validate_bulk_ids(ids, current)
+        for index, detail in self._validate_bulk_rows(db, rows).items():
+            errors.setdefault(index, detail)
+        valid = [row for index, row in enumerate(rows) if index not in errors]
+        if not valid or (errors and atomic):
+            return [], self._bulk_errors(errors, ids)
+
+        try:
+            self._before_bulk_update(db, [(current[row["id"]], row) for row in valid])
+            changed = [row for row in valid if len(row) > 1]
+            if changed:
+                db.execute(update(self.model), changed)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return (
+            self.get_by_ids(db, [row["id"] for row in valid]),
+            self._bulk_errors(errors, ids),
+        )
+
+    def bulk_delete(
+        self, db: Session, *, ids: Sequence[int], atomic: bool = False
+    ) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """Delete many records with one DELETE ... RETURNING."""
+        ids = list(ids)
+        current = {obj.id: obj for obj in self.get_by_ids(db, ids)}
+        errors = self._validate_bulk_ids(ids, current)
+        blocked = self._validate_bulk_delete(db, list(current.values()))
+        for index, id in enumerate(ids):
+            if id in blocked:
+                errors.setdefault(index, blocked[id])
+        valid = [id for index, id in enumerate(ids) if index not in errors]
+        if not valid or (errors and atomic):
+            return [], self._bulk_errors(errors, ids)
+
+        try:
+            self._before_bulk_delete(db, [current[id] for id in valid])
+            deleted = set(
+                db.scalars(
+                    delete(self.model)
+                    .where(self.model.id.in_(valid))
+                    .returning(self.model.id)
+                ).all()
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return [id for id in valid if id in deleted], self._bulk_errors(errors, ids)
+
+    def _prepare_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize incoming field values before they are written."""
+        return data
+
+    def _after_bulk_create(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        """Hook run in the bulk_create transaction after the INSERT."""
+
+    def _before_bulk_update(
+        self, db: Session, changes: List[Tuple[ModelType, Dict[str, Any]]]
+    ) -> None:
+        """Hook run in the bulk_update transaction, with the old values loaded."""
+
+    def _validate_bulk_delete(
+        self, db: Session, objs: List[ModelType]
+    ) -> Dict[int, str]:
+        """Get {id: reason} for records that must not be deleted."""
+        return {}
+
+    def _before_bulk_delete(self, db: Session, objs: List[ModelType]) -> None:
+        """Hook run in the bulk_delete transaction before the DELETE."""
+
+    def _validate_bulk_ids(
+        self, ids: List[int], current: Dict[int, ModelType]
+    ) -> Dict[int, str]:
+        """Get {index: error} for missing or repeated IDs in a batch."""
+        errors = {}
+        seen = set()
+        for index, id in enumerate(ids):
+            if id not in current:
+                errors[index] = f"{self.model.__name__} with id {id} not found"
+            elif id in seen:
+                errors[index] = f"Duplicate id {id} in batch"
+            seen.add(id)
+        return errors
+
+    def _validate_bulk_rows(
+        self, db: Session, rows: List[Dict[str, Any]]
+    ) -> Dict[int, str]:
+        """
+        Get {index: error} for rows with a missing foreign key target or a
+        duplicate unique value, using one IN query per column.
+        """
+        errors = {}
+        table = self.model.__table__
+        for column in table.columns:
+            for foreign_key in column.foreign_keys:
+                values = {
+                    row[column.key] for row in rows if row.get(column.key) is not None
+                }
+                if not values:
+                    continue
+                target = foreign_key.column
+                existing = set(db.scalars(select(target).where(target.in_(values))))
+                name = self._model_name(target.table)
+                for index, row in enumerate(rows):
+                    value = row.get(column.key)
+                    if value is not None and value not in existing:
+                        errors.setdefault(index, f"{name} with id {value} not found")
+
+        unique_columns = [column for column in table.columns if column.unique]
+        unique_columns += [table.c[name] for name in self.unique_fields]
+        for column in unique_columns:
+            values = {
+                row[column.key] for row in rows if row.get(column.key) is not None
+            }
+            if not values:
+                continue
+            owners = dict(
+                db.execute(
+                    select(column, self.model.id).where(column.in_(values))
+                ).all()
+            )
+            seen = set()
+            for index, row in enumerate(rows):
+                value = row.get(column.key)
+                if value is None:
+                    continue
+                owner = owners.get(value)
+                if owner is not None and owner != row.get("id"):
+                    errors.setdefault(
+                        index,
+                        f"{self.model.__name__} with {column.key} '{value}' "
+                        "already exists",
+                    )
+                elif value in seen:
+                    errors.setdefault(
+                        index, f"Duplicate {column.key} '{value}' in batch"
+                    )
+                seen.add(value)
+        return errors
+
+    def _model_name(self, table) -> str:
+        """Get the mapped class name for a table, for error messages."""
+        for mapper in self.model.registry.mappers:
+            if mapper.local_table is table:
+                return mapper.class_.__name__
+        return table.name
+
+    @staticmethod
+    def _bulk_errors(
+        errors: Dict[int, str], ids: Optional[List[int]] = None
+    ) -> List[Dict[str, Any]]:
+        return [
+            {"index": index, "id": ids[index] if ids else None, "detail": detail}
+            for index, detail in sorted(errors.items())
+        ]
+
+    def _dialect_insert(self, db: Session):
+        """Get an INSERT for the session's dialect that supports ON CONFLICT."""
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert(self.model)
+        if dialect == "sqlite":
+            return sqlite.insert(self.model)
+        raise NotImplementedError(f"ON CONFLICT is not supported on {dialect}")
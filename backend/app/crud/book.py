@@ -1,22 +1,42 @@
 import logging
-from typing import Any, Dict, List, Optional, Union
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import Date, and_, case, cast, func, insert, or_, select, update
+from sqlalchemy.orm import Query, Session, joinedload
 
+from app.core.config import settings
+from app.core.single_flight import coalesced
 from app.core.supabase_client import supabase_client
 from app.crud.base import CRUDBase
+from app.models.author import Author
 from app.models.book import Book
+from app.models.book_similarity import BookSimilarity
+from app.models.book_stats import (
+    COMPLETION_WEIGHT,
+    FAVORITE_WEIGHT,
+    READER_WEIGHT,
+    BookStats,
+)
+from app.models.category import Category
+from app.models.favorite import Favorite
+from app.models.reading_progress import ReadingProgress
+from app.models.reading_session import BookReadingRollup
 from app.schemas.book import BookCreate, BookUpdate
 
 logger = logging.getLogger(__name__)
 
+# Scores behind the ``sort`` option of the book listings
+BOOK_SORTS = {
+    "popular": BookStats.popularity_score,
+    "trending": BookStats.trending_score,
+}
 
-class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
-    def create(self, db: Session, *, obj_in: BookCreate) -> Book:
-        """Create book with proper handling of empty strings to NULL."""
-        obj_in_data = obj_in.model_dump()
 
+class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
+    def _prepare_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert empty strings and zeros in optional fields to NULL."""
         # Convert empty strings to None for optional fields
         optional_string_fields = [
             "isbn",
@@ -27,21 +47,149 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
             "epub_url",
         ]
         for field in optional_string_fields:
-            if field in obj_in_data and obj_in_data[field] == "":
-                obj_in_data[field] = None
+            if field in data and data[field] == "":
+                data[field] = None
 
-        # Convert 0 to None for optional numeric fields
+        # Convert 0 to None for optional numeric fields (but only if explicitly set)
         optional_numeric_fields = ["pages", "price"]
         for field in optional_numeric_fields:
-            if field in obj_in_data and obj_in_data[field] == 0:
-                obj_in_data[field] = None
+            if field in data and data[field] == 0:
+                data[field] = None
+        return data
+
+    def _sorted(self, query: Query, sort: Optional[str], *default) -> Query:
+        """Order by a ranking score from book_stats, or by ``default``."""
+        if sort is None:
+            return query.order_by(*default)
+        return query.join(BookStats, BookStats.book_id == Book.id).order_by(
+            BOOK_SORTS[sort].desc(), BookStats.book_id.desc()
+        )
+
+    def create(self, db: Session, *, obj_in: BookCreate) -> Book:
+        """Create book with proper handling of empty strings to NULL."""
+        obj_in_data = self._prepare_data(obj_in.model_dump())
 
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
+        self._adjust_book_counts(
+            db,
+            author_id=db_obj.author_id,
+            category_id=db_obj.category_id,
+            is_active=db_obj.is_active is not False,
+            delta=1,
+        )
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def _adjust_book_counts(
+        self,
+        db: Session,
+        *,
+        author_id: int,
+        category_id: int,
+        is_active: bool,
+        delta: int,
+    ) -> None:
+        """
+        Apply a book being added (delta=1) or removed (delta=-1) to the
+        author/category counter caches in the current transaction.
+        """
+        for model, id in ((Author, author_id), (Category, category_id)):
+            db.execute(
+                update(model)
+                .where(model.id == id)
+                .values(
+                    book_count=model.book_count + delta,
+                    active_book_count=model.active_book_count
+                    + (delta if is_active else 0),
+                )
+                .execution_options(synchronize_session=False)
+            )
+
+    def _apply_book_count_changes(
+        self, db: Session, changes: Dict[Tuple[int, int, bool], int]
+    ) -> None:
+        """Apply net counter changes keyed by (author_id, category_id, is_active)."""
+        for (author_id, category_id, is_active), delta in changes.items():
+            if delta:
+                self._adjust_book_counts(
+                    db,
+                    author_id=author_id,
+                    category_id=category_id,
+                    is_active=is_active,
+                    delta=delta,
+                )
+
+    def _after_bulk_create(self, db: Session, rows: List[Dict[str, Any]]) -> None:
+        self._apply_book_count_changes(
+            db,
+            Counter(
+                (
+                    row["author_id"],
+                    row["category_id"],
+                    row.get("is_active") is not False,
+                )
+                for row in rows
+            ),
+        )
+
+    def _before_bulk_update(
+        self, db: Session, changes: List[Tuple[Book, Dict[str, Any]]]
+    ) -> None:
+        counts = Counter()
+        for book, update_data in changes:
+            self._cleanup_old_files_on_update(book, update_data)
+            old_counts = (book.author_id, book.category_id, book.is_active is not False)
+            new_counts = (
+                update_data.get("author_id", book.author_id),
+                update_data.get("category_id", book.category_id),
+                update_data.get("is_active", book.is_active) is not False,
+            )
+            if new_counts != old_counts:
+                counts[old_counts] -= 1
+                counts[new_counts] += 1
+        self._apply_book_count_changes(db, counts)
+
+    def _validate_bulk_delete(self, db: Session, objs: List[Book]) -> Dict[int, str]:
+        """Books with chapters are kept, as in remove() without force."""
+        from app.models.chapter import Chapter
+
+        chapter_counts = db.execute(
+            select(Chapter.book_id, func.count(Chapter.id))
+            .where(Chapter.book_id.in_([book.id for book in objs]))
+            .group_by(Chapter.book_id)
+        ).all()
+        return {
+            book_id: f"Cannot delete book. There are {count} chapters associated "
+            "with this book. Please delete the chapters first or use force delete."
+            for book_id, count in chapter_counts
+        }
+
+    def _before_bulk_delete(self, db: Session, objs: List[Book]) -> None:
+        counts = Counter()
+        for book in objs:
+            self._cleanup_book_files(book)
+            counts[(book.author_id, book.category_id, book.is_active is not False)] -= 1
+        self._apply_book_count_changes(db, counts)
+
+    def rebuild_book_counts(self, db: Session) -> None:
+        """Recompute the author/category book counter caches from books."""
+        for model, fk in ((Author, Book.author_id), (Category, Book.category_id)):
+            total = select(func.count(Book.id)).where(fk == model.id).scalar_subquery()
+            active = (
+                select(func.count(Book.id))
+                .where(fk == model.id, Book.is_active == True)
+                .scalar_subquery()
+            )
+            db.execute(
+                update(model)
+                .values(book_count=total, active_book_count=active)
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+
+    @coalesced
     def get_with_details(self, db: Session, id: int) -> Optional[Book]:
         return (
             db.query(Book)
@@ -151,10 +299,12 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                 files_to_delete.append(("EPUB", book.epub_url))
 
             if not files_to_delete:
-                logger.info(f"No files to delete for book: {book.title}")
+                logger.debug("No files to delete for book: %s", book.title)
                 return
 
-            logger.info(f"Deleting {len(files_to_delete)} files for book: {book.title}")
+            logger.info(
+                "Deleting %s files for book: %s", len(files_to_delete), book.title
+            )
 
             # Delete each file
             for file_type, file_url in files_to_delete:
@@ -162,17 +312,19 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                     success = supabase_client.delete_file(file_url)
                     if success:
                         logger.info(
-                            f"{file_type} file deleted successfully: {file_url}"
+                            "%s file deleted successfully: %s", file_type, file_url
                         )
                     else:
-                        logger.warning(f"Failed to delete {file_type} file: {file_url}")
+                        logger.warning(
+                            "Failed to delete %s file: %s", file_type, file_url
+                        )
                 except Exception as file_error:
                     logger.error(
-                        f"Error deleting {file_type} file {file_url}: {str(file_error)}"
+                        "Error deleting %s file %s: %s", file_type, file_url, file_error
                     )
 
         except Exception as e:
-            logger.error(f"Error cleaning up book files for {book.title}: {str(e)}")
+            logger.error("Error cleaning up book files for %s: %s", book.title, e)
 
     def _cleanup_old_files_on_update(
         self, old_book: Book, update_data: Dict[str, Any]
@@ -181,7 +333,7 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
         Delete old files when they are being replaced with new ones or removed.
         """
         try:
-            logger.info(f"Checking file changes for book: {old_book.title}")
+            logger.debug("Checking file changes for book: %s", old_book.title)
 
             # Check cover_url update
             if "cover_url" in update_data:
@@ -191,21 +343,21 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                 # If URLs are different AND old URL exists, delete old file
                 if new_cover_url != old_cover_url and old_cover_url:
                     logger.info(
-                        f"Cover URL changed, deleting old cover: {old_cover_url}"
+                        "Cover URL changed, deleting old cover: %s", old_cover_url
                     )
                     try:
                         success = supabase_client.delete_file(old_cover_url)
                         if success:
                             logger.info(
-                                f"Successfully deleted old cover: {old_cover_url}"
+                                "Successfully deleted old cover: %s", old_cover_url
                             )
                         else:
                             logger.warning(
-                                f"Failed to delete old cover: {old_cover_url}"
+                                "Failed to delete old cover: %s", old_cover_url
                             )
                     except Exception as e:
                         logger.error(
-                            f"Error deleting old cover {old_cover_url}: {str(e)}"
+                            "Error deleting old cover %s: %s", old_cover_url, e
                         )
 
             # Check pdf_url update
@@ -215,15 +367,15 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
 
                 # If URLs are different AND old URL exists, delete old file
                 if new_pdf_url != old_pdf_url and old_pdf_url:
-                    logger.info(f"PDF URL changed, deleting old PDF: {old_pdf_url}")
+                    logger.info("PDF URL changed, deleting old PDF: %s", old_pdf_url)
                     try:
                         success = supabase_client.delete_file(old_pdf_url)
                         if success:
-                            logger.info(f"Successfully deleted old PDF: {old_pdf_url}")
+                            logger.info("Successfully deleted old PDF: %s", old_pdf_url)
                         else:
-                            logger.warning(f"Failed to delete old PDF: {old_pdf_url}")
+                            logger.warning("Failed to delete old PDF: %s", old_pdf_url)
                     except Exception as e:
-                        logger.error(f"Error deleting old PDF {old_pdf_url}: {str(e)}")
+                        logger.error("Error deleting old PDF %s: %s", old_pdf_url, e)
 
             # Check epub_url update
             if "epub_url" in update_data:
@@ -232,22 +384,22 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
 
                 # If URLs are different AND old URL exists, delete old file
                 if new_epub_url != old_epub_url and old_epub_url:
-                    logger.info(f"EPUB URL changed, deleting old EPUB: {old_epub_url}")
+                    logger.info("EPUB URL changed, deleting old EPUB: %s", old_epub_url)
                     try:
                         success = supabase_client.delete_file(old_epub_url)
                         if success:
                             logger.info(
-                                f"Successfully deleted old EPUB: {old_epub_url}"
+                                "Successfully deleted old EPUB: %s", old_epub_url
                             )
                         else:
-                            logger.warning(f"Failed to delete old EPUB: {old_epub_url}")
+                            logger.warning(
+                                "Failed to delete old EPUB: %s", old_epub_url
+                            )
                     except Exception as e:
-                        logger.error(
-                            f"Error deleting old EPUB {old_epub_url}: {str(e)}"
-                        )
+                        logger.error("Error deleting old EPUB %s: %s", old_epub_url, e)
 
         except Exception as e:
-            logger.error(f"Error cleaning up old files for {old_book.title}: {str(e)}")
+            logger.error("Error cleaning up old files for %s: %s", old_book.title, e)
 
     def remove(self, db: Session, *, id: int, force: bool = False) -> Book:
         """
@@ -264,10 +416,10 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
         # Get the book first to access file URLs
         book = self.get(db, id=id)
         if not book:
-            logger.warning(f"Book with ID {id} not found for deletion")
+            logger.warning("Book with ID %s not found for deletion", id)
             return None
 
-        logger.info(f"Deleting book: {book.title} (ID: {id})")
+        logger.info("Deleting book: %s (ID: %s)", book.title, id)
 
         try:
             # Check constraints if not forcing
@@ -278,7 +430,9 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
 
             if not force and chapter_count > 0:
                 logger.warning(
-                    f"Cannot delete book {book.title}: {chapter_count} chapters are associated with this book"
+                    "Cannot delete book %s: %s chapters are associated with this book",
+                    book.title,
+                    chapter_count,
                 )
                 raise ValueError(
                     f"Cannot delete book. There are {chapter_count} chapters associated with this book. Please delete the chapters first or use force delete."
@@ -289,23 +443,30 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
 
             # Manually delete related records first to avoid foreign key constraint issues
             if progress_count > 0:
-                logger.info(f"Deleting {progress_count} reading progress records")
+                logger.info("Deleting %s reading progress records", progress_count)
                 db.query(ReadingProgress).filter(ReadingProgress.book_id == id).delete()
 
             if chapter_count > 0:
-                logger.info(f"Deleting {chapter_count} chapter records")
+                logger.info("Deleting %s chapter records", chapter_count)
                 db.query(Chapter).filter(Chapter.book_id == id).delete()
 
             # Delete the book record
+            self._adjust_book_counts(
+                db,
+                author_id=book.author_id,
+                category_id=book.category_id,
+                is_active=book.is_active is not False,
+                delta=-1,
+            )
             db.delete(book)
             db.commit()
 
-            logger.info(f"Book deleted successfully: {book.title}")
+            logger.info("Book deleted successfully: %s", book.title)
             return book
         except Exception as e:
             # Rollback the transaction if deletion fails
             db.rollback()
-            logger.error(f"Error deleting book {id}: {str(e)}")
+            logger.error("Error deleting book %s: %s", id, e)
             raise e
 
     def update(
@@ -316,69 +477,92 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = self._prepare_data(update_data)
 
-        # Convert empty strings to None for optional fields
-        optional_string_fields = [
-            "isbn",
-            "description",
-            "language",
-            "cover_url",
-            "pdf_url",
-            "epub_url",
-        ]
-        for field in optional_string_fields:
-            if field in update_data and update_data[field] == "":
-                update_data[field] = None
-
-        # Convert 0 to None for optional numeric fields (but only if explicitly set)
-        optional_numeric_fields = ["pages", "price"]
-        for field in optional_numeric_fields:
-            if field in update_data and update_data[field] == 0:
-                update_data[field] = None
-
-        logger.info(f"Updating book: {db_obj.title} (ID: {db_obj.id})")
+        logger.debug("Updating book: %s (ID: %s)", db_obj.title, db_obj.id)
 
         # Cleanup old files that are being replaced
         self._cleanup_old_files_on_update(db_obj, update_data)
 
+        # Move the book between counter caches when its author, category or
+        # active flag changes; committed together with the update below
+        old_counts = (
+            db_obj.author_id,
+            db_obj.category_id,
+            db_obj.is_active is not False,
+        )
+        new_counts = (
+            update_data.get("author_id", db_obj.author_id),
+            update_data.get("category_id", db_obj.category_id),
+            update_data.get("is_active", db_obj.is_active) is not False,
+        )
+
         # Perform the update
         try:
+            if new_counts != old_counts:
+                for (author_id, category_id, is_active), delta in (
+                    (old_counts, -1),
+                    (new_counts, 1),
+                ):
+                    self._adjust_book_counts(
+                        db,
+                        author_id=author_id,
+                        category_id=category_id,
+                        is_active=is_active,
+                        delta=delta,
+                    )
             updated_book = super().update(db, db_obj=db_obj, obj_in=update_data)
-            logger.info(f"Book updated successfully: {updated_book.title}")
+            logger.debug("Book updated successfully: %s", updated_book.title)
             return updated_book
         except Exception as e:
-            logger.error(f"Error updating book {db_obj.id}: {str(e)}")
+            db.rollback()
+            logger.error("Error updating book %s: %s", db_obj.id, e)
             raise e
 
     # PUBLIC METHODS FOR USER SITE
     def get_active_books_with_details(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
     ) -> List[Book]:
         """Get active books with author and category details for public access."""
-        return (
+        query = (
             db.query(Book)
             .options(joinedload(Book.author), joinedload(Book.category))
             .filter(Book.is_active == True)
-            .order_by(Book.created_at.desc())
+        )
+        return (
+            self._sorted(query, sort, Book.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
     def get_public_free_books(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
     ) -> List[Book]:
         """Get free and active books with details for public access."""
-        return (
+        query = (
             db.query(Book)
             .options(joinedload(Book.author), joinedload(Book.category))
             .filter(Book.is_free == True, Book.is_active == True)
-            .order_by(Book.created_at.desc())
+        )
+        return (
+            self._sorted(query, sort, Book.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    @coalesced
     def get_featured_books(self, db: Session, *, limit: int = 10) -> List[Book]:
         """Get featured books (most recent active books) for homepage."""
         return (
@@ -390,34 +574,133 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
             .all()
         )
 
+    @coalesced
     def get_public_books_by_category(
-        self, db: Session, *, category_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        category_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
     ) -> List[Book]:
         """Get active books by category with details for public access."""
-        return (
+        query = (
             db.query(Book)
             .options(joinedload(Book.author), joinedload(Book.category))
             .filter(Book.category_id == category_id, Book.is_active == True)
-            .order_by(Book.created_at.desc())
+        )
+        return (
+            self._sorted(query, sort, Book.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def get_newest_books_per_category(
+        self, db: Session, *, per_category: int = 100
+    ) -> Dict[int, List[Book]]:
+        """Get the newest active books of every category in one query."""
+        ranked = (
+            select(
+                Book.id,
+                func.row_number()
+                .over(
+                    partition_by=Book.category_id,
+                    order_by=(Book.created_at.desc(), Book.id.desc()),
+                )
+                .label("position"),
+            )
+            .where(Book.is_active == True)
+            .subquery()
+        )
+        books = (
+            db.query(Book)
+            .join(ranked, ranked.c.id == Book.id)
+            .options(joinedload(Book.author), joinedload(Book.category))
+            .filter(ranked.c.position <= per_category)
+            .order_by(Book.category_id, ranked.c.position)
+            .all()
+        )
+        by_category = defaultdict(list)
+        for book in books:
+            by_category[book.category_id].append(book)
+        return by_category
+
+    def get_most_favorited_books(self, db: Session, *, limit: int = 10) -> List[Book]:
+        """Get active books with the most favorites, most favorited first."""
+        return (
+            db.query(Book)
+            .join(BookStats, BookStats.book_id == Book.id)
+            .options(joinedload(Book.author), joinedload(Book.category))
+            .filter(Book.is_active == True, BookStats.favorites_count > 0)
+            .order_by(BookStats.favorites_count.desc(), Book.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_most_read_books(
+        self, db: Session, *, since: date, limit: int = 10
+    ) -> List[Book]:
+        """Get active books with the most reading time since a day (daily rollups)."""
+        reading = (
+            select(
+                BookReadingRollup.book_id,
+                func.sum(BookReadingRollup.reading_seconds).label("seconds"),
+            )
+            .where(
+                BookReadingRollup.period == "day",
+                BookReadingRollup.period_start >= since,
+            )
+            .group_by(BookReadingRollup.book_id)
+            .subquery()
+        )
+        return (
+            db.query(Book)
+            .join(reading, reading.c.book_id == Book.id)
+            .options(joinedload(Book.author), joinedload(Book.category))
+            .filter(Book.is_active == True)
+            .order_by(reading.c.seconds.desc(), Book.id.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_public_books_by_author(
-        self, db: Session, *, author_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        author_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        sort: Optional[str] = None,
     ) -> List[Book]:
         """Get active books by author with details for public access."""
-        return (
+        query = (
             db.query(Book)
             .options(joinedload(Book.author), joinedload(Book.category))
             .filter(Book.author_id == author_id, Book.is_active == True)
-            .order_by(Book.created_at.desc())
+        )
+        return (
+            self._sorted(query, sort, Book.created_at.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def get_similar_books(
+        self, db: Session, *, book_id: int, limit: int = 10
+    ) -> List[Book]:
+        """Get active books most similar to a book (precomputed similarities)."""
+        return (
+            db.query(Book)
+            .join(BookSimilarity, BookSimilarity.similar_book_id == Book.id)
+            .options(joinedload(Book.author), joinedload(Book.category))
+            .filter(BookSimilarity.book_id == book_id, Book.is_active == True)
+            .order_by(BookSimilarity.rank)
+            .limit(limit)
+            .all()
+        )
+
     def search_public_books(
         self, db: Session, *, query: str, skip: int = 0, limit: int = 100
     ) -> List[Book]:
@@ -449,12 +732,15 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
         return db.query(Book).filter(Book.is_active == True).count()
 
     def count_by_author(self, db: Session, *, author_id: int) -> int:
-        """Get total count of books by author."""
-        return db.query(Book).filter(Book.author_id == author_id).count()
+        """Get total count of books by author from the author's counter cache."""
+        return db.query(Author.book_count).filter(Author.id == author_id).scalar() or 0
 
     def count_by_category(self, db: Session, *, category_id: int) -> int:
-        """Get total count of books by category."""
-        return db.query(Book).filter(Book.category_id == category_id).count()
+        """Get total count of books by category from the category's counter cache."""
+        return (
+            db.query(Category.book_count).filter(Category.id == category_id).scalar()
+            or 0
+        )
 
     def count_free_books(self, db: Session) -> int:
         """Get total count of free books."""
@@ -501,6 +787,7 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
         is_free: Optional[bool] = None,
         publication_date_from: Optional[str] = None,
         publication_date_to: Optional[str] = None,
+        sort: Optional[str] = None,
     ) -> List[Book]:
         """Get books with comprehensive filtering and search."""
         from datetime import datetime
@@ -536,7 +823,7 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                 query = query.filter(Book.publication_date >= date_from)
             except ValueError:
                 logger.warning(
-                    f"Invalid publication_date_from format: {publication_date_from}"
+                    "Invalid publication_date_from format: %s", publication_date_from
                 )
 
         if publication_date_to:
@@ -545,10 +832,10 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                 query = query.filter(Book.publication_date <= date_to)
             except ValueError:
                 logger.warning(
-                    f"Invalid publication_date_to format: {publication_date_to}"
+                    "Invalid publication_date_to format: %s", publication_date_to
                 )
 
-        return query.order_by(Book.id.desc()).offset(skip).limit(limit).all()
+        return self._sorted(query, sort, Book.id.desc()).offset(skip).limit(limit).all()
 
     def count_with_filters(
         self,
@@ -594,7 +881,7 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                 query = query.filter(Book.publication_date >= date_from)
             except ValueError:
                 logger.warning(
-                    f"Invalid publication_date_from format: {publication_date_from}"
+                    "Invalid publication_date_from format: %s", publication_date_from
                 )
 
         if publication_date_to:
@@ -603,10 +890,153 @@ class CRUDBook(CRUDBase[Book, BookCreate, BookUpdate]):
                 query = query.filter(Book.publication_date <= date_to)
             except ValueError:
                 logger.warning(
-                    f"Invalid publication_date_to format: {publication_date_to}"
+                    "Invalid publication_date_to format: %s", publication_date_to
                 )
 
         return query.count()
 
+    # RANKINGS
+    def rebuild_book_stats(
+        self, db: Session, *, now: Optional[datetime] = None, batch_size: int = 500
+    ) -> int:
+        """
+        Recompute book_stats for every book from favorites and reading_progress.
+
+        Triggers keep the counts and popularity scores current between runs;
+        this adds what depends on the clock: readers active in the last
+        ACTIVE_READER_DAYS days and the trending score, where each favorite,
+        recent read and completion of the last TRENDING_WINDOW_DAYS days
+        counts its popularity weight halved every TRENDING_HALF_LIFE_DAYS.
+
+        Counts are reconciled by a single UPDATE ... FROM over the
+        aggregates, so trigger updates committed while the trending scores
+        are computed are not overwritten with older values. It only touches
+        rows whose values changed and commits before the trending scores are
+        written, which are also limited to changed rows and committed in
+        batches of batch_size, so row locks are short and unchanged rows are
+        not rewritten. Returns the number of books ranked.
+        """
+        now = now or datetime.now(timezone.utc)
+        active_since = now - timedelta(days=settings.ACTIVE_READER_DAYS)
+        trending_since = now - timedelta(days=settings.TRENDING_WINDOW_DAYS)
+
+        # Events are bucketed by day so the window is a few rows per book
+        trending: Dict[int, float] = defaultdict(float)
+        for weight, book_id, occurred_at in (
+            (FAVORITE_WEIGHT, Favorite.book_id, Favorite.created_at),
+            (READER_WEIGHT, ReadingProgress.book_id, ReadingProgress.last_read_at),
+            (COMPLETION_WEIGHT, ReadingProgress.book_id, ReadingProgress.completed_at),
+        ):
+            day = self._day(db, occurred_at)
+            for event_book_id, event_day, events in db.execute(
+                select(book_id, day, func.count())
+                .where(occurred_at >= trending_since)
+                .group_by(book_id, day)
+            ):
+                if isinstance(event_day, str):
+                    event_day = date.fromisoformat(event_day)
+                age = max((now.date() - event_day).days, 0)
+                trending[event_book_id] += (
+                    weight * events * 0.5 ** (age / settings.TRENDING_HALF_LIFE_DAYS)
+                )
+
+        # Books whose trigger row is missing (bulk loads, manual imports)
+        db.execute(
+            insert(BookStats).from_select(
+                ["book_id"],
+                select(Book.id).where(
+                    ~select(BookStats.book_id)
+                    .where(BookStats.book_id == Book.id)
+                    .exists()
+                ),
+            )
+        )
+
+        favorites = (
+            select(Favorite.book_id, func.count(Favorite.id).label("favorites"))
+            .group_by(Favorite.book_id)
+            .subquery()
+        )
+        progress = (
+            select(
+                ReadingProgress.book_id,
+                func.count(ReadingProgress.id).label("readers"),
+                func.sum(
+                    case((ReadingProgress.is_completed == True, 1), else_=0)
+                ).label("completions"),
+                func.sum(
+                    case((ReadingProgress.last_read_at >= active_since, 1), else_=0)
+                ).label("active"),
+            )
+            .group_by(ReadingProgress.book_id)
+            .subquery()
+        )
+        counts = (
+            select(
+                Book.id.label("book_id"),
+                func.coalesce(favorites.c.favorites, 0).label("favorites"),
+                func.coalesce(progress.c.readers, 0).label("readers"),
+                func.coalesce(progress.c.completions, 0).label("completions"),
+                func.coalesce(progress.c.active, 0).label("active"),
+            )
+            .outerjoin(favorites, favorites.c.book_id == Book.id)
+            .outerjoin(progress, progress.c.book_id == Book.id)
+            .subquery()
+        )
+        popularity = (
+            counts.c.favorites * FAVORITE_WEIGHT
+            + counts.c.readers * READER_WEIGHT
+            + counts.c.completions * COMPLETION_WEIGHT
+        )
+        db.execute(
+            update(BookStats)
+            .where(
+                BookStats.book_id == counts.c.book_id,
+                or_(
+                    BookStats.favorites_count.is_distinct_from(counts.c.favorites),
+                    BookStats.readers_count.is_distinct_from(counts.c.readers),
+                    BookStats.completions_count.is_distinct_from(counts.c.completions),
+                    BookStats.active_readers.is_distinct_from(counts.c.active),
+                    BookStats.popularity_score.is_distinct_from(popularity),
+                ),
+            )
+            .values(
+                favorites_count=counts.c.favorites,
+                readers_count=counts.c.readers,
+                completions_count=counts.c.completions,
+                active_readers=counts.c.active,
+                popularity_score=popularity,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        # Books that left the trending window drop back to zero
+        scores = {book_id: round(score, 6) for book_id, score in trending.items()}
+        for book_id, score in db.execute(
+            select(BookStats.book_id, BookStats.trending_score).where(
+                BookStats.trending_score != 0
+            )
+        ):
+            if scores.get(book_id, 0.0) == score:
+                scores.pop(book_id, None)
+            else:
+                scores.setdefault(book_id, 0.0)
+        changed = [
+            {"book_id": book_id, "trending_score": score}
+            for book_id, score in scores.items()
+        ]
+        for start in range(0, len(changed), batch_size):
+            db.execute(update(BookStats), changed[start : start + batch_size])
+            db.commit()
+
+        return db.scalar(select(func.count()).select_from(BookStats))
+
+    def _day(self, db: Session, column):
+        """SQL expression truncating a timestamp column to its UTC day."""
+        if db.get_bind().dialect.name == "postgresql":
+            return cast(func.timezone("UTC", column), Date)
+        return func.date(column)
+
 
 crud_book = CRUDBook(Book)
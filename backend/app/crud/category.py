@@ -1,8 +1,10 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
+from app.core.single_flight import coalesced
 from app.crud.base import CRUDBase
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
@@ -49,6 +51,23 @@ class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
         """Get total count of categories matching search term."""
         return db.query(Category).filter(Category.name.ilike(f"%{name}%")).count()
 
+    def _validate_bulk_delete(
+        self, db: Session, objs: List[Category]
+    ) -> Dict[int, str]:
+        """Categories with books are kept, as in remove()."""
+        from app.models.book import Book
+
+        book_counts = db.execute(
+            select(Book.category_id, func.count(Book.id))
+            .where(Book.category_id.in_([category.id for category in objs]))
+            .group_by(Book.category_id)
+        ).all()
+        return {
+            category_id: f"Cannot delete category. {count} books are still "
+            "associated with this category."
+            for category_id, count in book_counts
+        }
+
     def remove(self, db: Session, *, id: int) -> Category:
         """
         Delete a category with constraint validation.
@@ -72,6 +91,7 @@ class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
         db.commit()
         return category
 
+    @coalesced
     def get_active_categories(
         self, db: Session, *, skip: int = 0, limit: int = 100
     ) -> List[Category]:
@@ -87,6 +107,7 @@ class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
             .all()
         )
 
+    @coalesced
     def get_active_category(self, db: Session, *, id: int) -> Optional[Category]:
         """
         Get an active category by ID for public endpoints.
@@ -1,18 +1,306 @@
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
 
-from sqlalchemy import and_, func
+from sqlalchemy import Integer, Row, and_, column, func, insert, text
 from sqlalchemy.orm import Session, joinedload
 
+from app.core.settings import settings
 from app.crud.base import CRUDBase
-from app.models.chapter import Chapter
+from app.models.chapter import Chapter, ChapterContent
+from app.models.chapter_search import index_chapters, unindex_chapter_range
 from app.schemas.chapter import ChapterCreate, ChapterUpdate
 
 logger = logging.getLogger(__name__)
 
+# ts_headline options for in-book search snippets
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, "
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+
+def _fts5_query(term: str) -> str:
+    """Quote each word so user input is never parsed as FTS5 syntax."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in term.split())
+
+
+def _search_clause(db: Session, term: str):
+    """Match chapter titles (substring) or the full-text index against a term."""
+    if db.get_bind().dialect.name == "postgresql":
+        matches = text(
+            "SELECT chapter_id FROM chapter_search WHERE document @@ "
+            "websearch_to_tsquery(CAST(:fts_config AS regconfig), :fts_query)"
+        ).bindparams(fts_config=settings.CHAPTER_SEARCH_CONFIG, fts_query=term)
+    else:
+        matches = text(
+            "SELECT rowid FROM chapter_search WHERE chapter_search MATCH :fts_query"
+        ).bindparams(fts_query=_fts5_query(term))
+    return Chapter.title.ilike(f"%{term}%") | Chapter.id.in_(
+        matches.columns(column("chapter_id", Integer))
+    )
+
 
 class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Chapter,
+        obj_in: Union[ChapterUpdate, Dict[str, Any]],
+    ) -> Chapter:
+        """Update a chapter, writing content through to chapter_contents."""
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+
+        if "content" in update_data:
+            db_obj.content = update_data.pop("content")
+        return super().update(db, db_obj=db_obj, obj_in=update_data)
+
+    def get_content(
+        self, db: Session, *, id: int, public: bool = False
+    ) -> Optional[Chapter]:
+        """
+        Get a chapter together with its body.
+
+        With public=True only published, active chapters are returned.
+        """
+        query = (
+            db.query(Chapter)
+            .options(joinedload(Chapter.content_data))
+            .filter(Chapter.id == id)
+        )
+        if public:
+            query = query.filter(
+                Chapter.is_published == True, Chapter.is_active == True
+            )
+        return query.first()
+
+    def get_next_chapter(
+        self, db: Session, *, chapter: Chapter, public: bool = False
+    ) -> Optional[Row]:
+        """
+        Get (id, chapter_number, content_hash) of the chapter after this one.
+
+        Used as a prefetch hint; with public=True unpublished and inactive
+        chapters are skipped.
+        """
+        query = db.query(
+            Chapter.id, Chapter.chapter_number, Chapter.content_hash
+        ).filter(
+            Chapter.book_id == chapter.book_id,
+            Chapter.chapter_number > chapter.chapter_number,
+        )
+        if public:
+            query = query.filter(
+                Chapter.is_published == True, Chapter.is_active == True
+            )
+        return query.order_by(Chapter.chapter_number).first()
+
+    def rebuild_contents(self, db: Session, *, batch_size: int = 500) -> int:
+        """
+        Re-encode every stored chapter body with the current settings.
+
+        Applies CHAPTER_CONTENT_COMPRESSION and rebuilds the pre-compressed
+        variants, committing per batch. Returns the number of bodies written.
+        """
+        written = 0
+        last_id = 0
+        while True:
+            contents = (
+                db.query(ChapterContent)
+                .filter(ChapterContent.chapter_id > last_id)
+                .order_by(ChapterContent.chapter_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not contents:
+                break
+            for content in contents:
+                content.text = content.text
+            db.commit()
+            written += len(contents)
+            last_id = contents[-1].chapter_id
+            db.expunge_all()
+
+        logger.info("Re-encoded %d chapter bodies", written)
+        return written
+
+    def search_in_book(
+        self,
+        db: Session,
+        *,
+        book_id: int,
+        query: str,
+        skip: int = 0,
+        limit: int = 20,
+        public: bool = True,
+    ) -> List[dict]:
+        """
+        Full-text search the chapters of one book, best matches first.
+
+        Each hit carries the chapter metadata, a relevance rank (higher is
+        better) and a snippet with matches wrapped in <mark> tags.
+        """
+        if not query.split():
+            return []
+
+        visible = "AND c.is_published AND c.is_active" if public else ""
+        params = {"book_id": book_id, "skip": skip, "limit": limit}
+
+        if db.get_bind().dialect.name == "postgresql":
+            params.update(query=query, config=settings.CHAPTER_SEARCH_CONFIG)
+            rows = (
+                db.execute(
+                    text(f"""
+                    SELECT c.id, c.book_id, c.chapter_number, c.title,
+                           ts_rank_cd(s.document, q) AS rank
+                    FROM chapter_search s
+                    JOIN chapters c ON c.id = s.chapter_id,
+                         websearch_to_tsquery(CAST(:config AS regconfig), :query) q
+                    WHERE s.book_id = :book_id AND s.document @@ q {visible}
+                    ORDER BY rank DESC, c.chapter_number
+                    LIMIT :limit OFFSET :skip
+                    """),
+                    params,
+                )
+                .mappings()
+                .all()
+            )
+            hits = [dict(row) for row in rows]
+            if hits:
+                snippets = self._headlines(
+                    db, ids=[hit["id"] for hit in hits], query=query
+                )
+                for hit in hits:
+                    hit["snippet"] = snippets.get(hit["id"], "")
+            return hits
+
+        params["query"] = _fts5_query(query)
+        rows = (
+            db.execute(
+                text(f"""
+                SELECT c.id, c.book_id, c.chapter_number, c.title,
+                       -bm25(chapter_search, 10.0, 1.0) AS rank,
+                       snippet(chapter_search, 1, '<mark>', '</mark>', ' … ', 24)
+                           AS snippet
+                FROM chapter_search
+                JOIN chapters c ON c.id = chapter_search.rowid
+                WHERE chapter_search MATCH :query
+                  AND chapter_search.book_id = :book_id {visible}
+                ORDER BY rank DESC, c.chapter_number
+                LIMIT :limit OFFSET :skip
+                """),
+                params,
+            )
+            .mappings()
+            .all()
+        )
+        return [dict(row) for row in rows]
+
+    def count_search_in_book(
+        self, db: Session, *, book_id: int, query: str, public: bool = True
+    ) -> int:
+        """Get total count of chapters in a book matching a full-text query."""
+        if not query.split():
+            return 0
+
+        visible = "AND c.is_published AND c.is_active" if public else ""
+        if db.get_bind().dialect.name == "postgresql":
+            statement = f"""
+                SELECT count(*) FROM chapter_search s
+                JOIN chapters c ON c.id = s.chapter_id
+                WHERE s.book_id = :book_id {visible} AND s.document @@
+                      websearch_to_tsquery(CAST(:config AS regconfig), :query)
+                """
+            params = {"query": query, "config": settings.CHAPTER_SEARCH_CONFIG}
+        else:
+            statement = f"""
+                SELECT count(*) FROM chapter_search
+                JOIN chapters c ON c.id = chapter_search.rowid
+                WHERE chapter_search MATCH :query
+                  AND chapter_search.book_id = :book_id {visible}
+                """
+            params = {"query": _fts5_query(query)}
+        return db.execute(text(statement), {**params, "book_id": book_id}).scalar()
+
+    def _headlines(self, db: Session, *, ids: List[int], query: str) -> Dict[int, str]:
+        """Build ts_headline snippets for a page of hits in one round trip."""
+        contents = (
+            db.query(ChapterContent).filter(ChapterContent.chapter_id.in_(ids)).all()
+        )
+        if not contents:
+            return {}
+        rows = db.execute(
+            text("""
+                SELECT t.id, ts_headline(
+                    CAST(:config AS regconfig), t.body,
+                    websearch_to_tsquery(CAST(:config AS regconfig), :query),
+                    :options
+                )
+                FROM unnest(CAST(:ids AS integer[]), CAST(:bodies AS text[]))
+                    AS t(id, body)
+                """),
+            {
+                "config": settings.CHAPTER_SEARCH_CONFIG,
+                "query": query,
+                "options": HEADLINE_OPTIONS,
+                "ids": [content.chapter_id for content in contents],
+                "bodies": [content.text for content in contents],
+            },
+        ).all()
+        return {row[0]: row[1] for row in rows}
+
+    def rebuild_search_index(self, db: Session, *, batch_size: int = 500) -> int:
+        """
+        Rebuild the chapter full-text index from chapters and their bodies.
+
+        Each batch replaces the documents of its chapter id range in one
+        transaction, so searches keep finding every chapter while the index
+        is rebuilt. Returns the number of chapters indexed.
+        """
+        indexed = 0
+        last_id = 0
+        while True:
+            chapters = (
+                db.query(Chapter)
+                .options(joinedload(Chapter.content_data))
+                .filter(Chapter.id > last_id)
+                .order_by(Chapter.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not chapters:
+                break
+            unindex_chapter_range(
+                db.connection(), after_id=last_id, up_to_id=chapters[-1].id
+            )
+            index_chapters(
+                db.connection(),
+                [
+                    {
+                        "id": chapter.id,
+                        "book_id": chapter.book_id,
+                        "title": chapter.title,
+                        "body": chapter.content or "",
+                    }
+                    for chapter in chapters
+                ],
+            )
+            db.commit()
+            indexed += len(chapters)
+            last_id = chapters[-1].id
+            db.expunge_all()
+
+        # Documents of chapters past the last one
+        unindex_chapter_range(db.connection(), after_id=last_id)
+        db.commit()
+
+        logger.info("Indexed %d chapters for full-text search", indexed)
+        return indexed
+
     def get_with_details(self, db: Session, *, id: int) -> Optional[Chapter]:
         """Get chapter with book details."""
         return (
@@ -49,16 +337,13 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
         created_to: Optional[str] = None,
     ) -> List[Chapter]:
         """Get chapters with comprehensive filtering."""
-        query = db.query(Chapter).options(joinedload(Chapter.book))
+        query = db.query(Chapter)
 
         filters = []
 
         # Search filter
         if search:
-            filters.append(
-                Chapter.title.ilike(f"%{search}%")
-                | Chapter.content.ilike(f"%{search}%")
-            )
+            filters.append(_search_clause(db, search))
 
         # Status filters
         if is_published is not None:
@@ -109,10 +394,7 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
 
         # Search filter
         if search:
-            filters.append(
-                Chapter.title.ilike(f"%{search}%")
-                | Chapter.content.ilike(f"%{search}%")
-            )
+            filters.append(_search_clause(db, search))
 
         # Status filters
         if is_published is not None:
@@ -151,7 +433,6 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
         """Get chapters by book ID ordered by chapter number."""
         return (
             db.query(Chapter)
-            .options(joinedload(Chapter.book))
             .filter(Chapter.book_id == book_id)
             .order_by(Chapter.chapter_number)
             .offset(skip)
@@ -169,7 +450,6 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
         """Get published chapters for a book."""
         return (
             db.query(Chapter)
-            .options(joinedload(Chapter.book))
             .filter(Chapter.book_id == book_id, Chapter.is_published == True)
             .order_by(Chapter.chapter_number)
             .offset(skip)
@@ -197,6 +477,83 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
             .first()
         )
 
+    def get_max_chapter_number(self, db: Session, *, book_id: int) -> int:
+        """Get the highest chapter number of a book (0 when it has none)."""
+        return (
+            db.query(func.coalesce(func.max(Chapter.chapter_number), 0))
+            .filter(Chapter.book_id == book_id)
+            .scalar()
+        )
+
+    def get_existing_chapter_numbers(
+        self, db: Session, *, book_id: int, numbers: Iterable[int]
+    ) -> Set[int]:
+        """Get which of the given chapter numbers a book already uses."""
+        numbers = list(numbers)
+        if not numbers:
+            return set()
+        rows = (
+            db.query(Chapter.chapter_number)
+            .filter(Chapter.book_id == book_id, Chapter.chapter_number.in_(numbers))
+            .all()
+        )
+        return {row.chapter_number for row in rows}
+
+    def bulk_create_with_content(
+        self,
+        db: Session,
+        *,
+        book_id: int,
+        chapters: List[Dict[str, Any]],
+        is_published: bool = False,
+    ) -> List[int]:
+        """
+        Insert chapters with their bodies and search documents in bulk.
+
+        Each chapter dict holds chapter_number, title, content, content_size,
+        content_hash and storage (the chapter_contents values from
+        encode_chapter_text). Chapters, bodies and search documents each go
+        in one executemany; the caller commits. Returns the new chapter ids.
+        """
+        if not chapters:
+            return []
+
+        ids = db.scalars(
+            insert(Chapter).returning(Chapter.id, sort_by_parameter_order=True),
+            [
+                {
+                    "book_id": book_id,
+                    "title": chapter["title"],
+                    "chapter_number": chapter["chapter_number"],
+                    "is_published": is_published,
+                    "is_active": True,
+                    "content_size": chapter["content_size"],
+                    "content_hash": chapter["content_hash"],
+                }
+                for chapter in chapters
+            ],
+        ).all()
+        db.execute(
+            insert(ChapterContent),
+            [
+                {"chapter_id": chapter_id, **chapter["storage"]}
+                for chapter_id, chapter in zip(ids, chapters)
+            ],
+        )
+        index_chapters(
+            db.connection(),
+            [
+                {
+                    "id": chapter_id,
+                    "book_id": book_id,
+                    "title": chapter["title"],
+                    "body": chapter["content"],
+                }
+                for chapter_id, chapter in zip(ids, chapters)
+            ],
+        )
+        return ids
+
     def get_active_chapters(
         self, db: Session, *, skip: int = 0, limit: int = 10000
     ) -> List[Chapter]:
@@ -220,10 +577,7 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
         """Search chapters by title or content."""
         return (
             db.query(Chapter)
-            .options(joinedload(Chapter.book))
-            .filter(
-                Chapter.title.ilike(f"%{query}%") | Chapter.content.ilike(f"%{query}%")
-            )
+            .filter(_search_clause(db, query))
             .order_by(Chapter.created_at.desc())
             .offset(skip)
             .limit(limit)
@@ -232,13 +586,7 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
 
     def count_search_chapters(self, db: Session, *, query: str) -> int:
         """Get total count of chapters matching search query."""
-        return (
-            db.query(Chapter)
-            .filter(
-                Chapter.title.ilike(f"%{query}%") | Chapter.content.ilike(f"%{query}%")
-            )
-            .count()
-        )
+        return db.query(Chapter).filter(_search_clause(db, query)).count()
 
     def remove(self, db: Session, *, id: int) -> Chapter:
         """
@@ -277,7 +625,6 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
         """Get published chapters for public access."""
         return (
             db.query(Chapter)
-            .options(joinedload(Chapter.book))
             .filter(
                 Chapter.book_id == book_id,
                 Chapter.is_published == True,
@@ -320,7 +667,6 @@ class CRUDChapter(CRUDBase[Chapter, ChapterCreate, ChapterUpdate]):
         """Get all published chapters from all books."""
         return (
             db.query(Chapter)
-            .options(joinedload(Chapter.book))
             .filter(Chapter.is_published == True)
             .order_by(Chapter.created_at.desc())
             .offset(skip)
@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.import_job import ImportJob
+from app.schemas.import_job import ImportJobCreate, ImportJobUpdate
+
+
+class CRUDImportJob(CRUDBase[ImportJob, ImportJobCreate, ImportJobUpdate]):
+    def start(self, db: Session, *, job: ImportJob) -> ImportJob:
+        job.status = "running"
+        job.started_at = datetime.now(timezone.utc)
+        db.commit()
+        return job
+
+    def set_progress(self, db: Session, *, job_id: int, **progress: int) -> None:
+        """Record progress counters and commit, without loading the job."""
+        db.execute(
+            update(ImportJob)
+            .where(ImportJob.id == job_id)
+            .values(**progress)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+    def finish(
+        self, db: Session, *, job: ImportJob, imported: int, skipped: int
+    ) -> ImportJob:
+        """Mark a job completed, committing any work pending in the session."""
+        job.status = "completed"
+        job.imported_chapters = imported
+        job.skipped_chapters = skipped
+        job.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        return job
+
+    def fail(self, db: Session, *, job_id: int, error: str) -> Optional[ImportJob]:
+        job = self.get(db, id=job_id)
+        if not job:
+            return None
+        job.status = "failed"
+        job.error = error
+        job.finished_at = datetime.now(timezone.utc)
+        db.commit()
+        return job
+
+
+crud_import_job = CRUDImportJob(ImportJob)
@@ -1,11 +1,13 @@
 import logging
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from sqlalchemy import func
+from sqlalchemy import and_, case, delete, func, insert, literal, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.crud.base import CRUDBase
 from app.models.reading_progress import ReadingProgress
+from app.models.user_reading_stats import UserReadingStats
 from app.schemas.reading_progress import ReadingProgressCreate, ReadingProgressUpdate
 
 logger = logging.getLogger(__name__)
@@ -147,41 +149,186 @@ class CRUDReadingProgress(
         db.refresh(db_obj)
         return db_obj
 
-    def get_user_stats(self, db: Session, *, user_id: int) -> Dict[str, Any]:
-        """Get reading statistics for a user."""
-        total_books = (
-            db.query(ReadingProgress).filter(ReadingProgress.user_id == user_id).count()
+    def upsert_progress(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        book_id: int,
+        obj_in: Union[ReadingProgressUpdate, Dict[str, Any]],
+    ) -> Tuple[ReadingProgress, bool]:
+        """
+        Create or update a user's progress for a book in a single statement.
+
+        Uses INSERT ... ON CONFLICT (user_id, book_id) DO UPDATE ... RETURNING,
+        so concurrent requests cannot create duplicates. Returns the row and
+        whether it was newly created.
+        """
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data.pop("user_id", None)
+        update_data.pop("book_id", None)
+        provided = set(update_data)
+
+        table = ReadingProgress.__table__
+        now = datetime.utcnow()
+
+        # INSERT branch: the new row starts from the schema defaults
+        create_data = ReadingProgressCreate(
+            user_id=user_id, book_id=book_id, **update_data
+        ).model_dump()
+        row = {
+            field: literal(value, table.c[field].type)
+            for field, value in create_data.items()
+        }
+        row.update(
+            {
+                field: literal(None, table.c[field].type)
+                for field in ("started_at", "completed_at", "last_read_at")
+            }
+        )
+        insert_values = self._apply_transitions(
+            dict(row), current=row, provided=provided, now=now
         )
 
-        completed_books = (
-            db.query(ReadingProgress)
-            .filter(
-                ReadingProgress.user_id == user_id, ReadingProgress.is_completed == True
-            )
-            .count()
+        stmt = self._dialect_insert(db).values(**insert_values)
+
+        # ON CONFLICT branch: provided fields overwrite the existing row
+        update_values = {field: stmt.excluded[field] for field in provided}
+        update_values = self._apply_transitions(
+            update_values, current=table.c, provided=provided, now=now
         )
+        update_values["updated_at"] = func.now()
 
-        currently_reading = (
-            db.query(ReadingProgress)
-            .filter(
-                ReadingProgress.user_id == user_id, ReadingProgress.status == "reading"
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReadingProgress.user_id, ReadingProgress.book_id],
+            set_=update_values,
+        ).returning(ReadingProgress)
+
+        progress = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+        # updated_at is only ever set by the ON CONFLICT branch
+        created = progress.updated_at is None
+        db.commit()
+        return progress, created
+
+    def _apply_transitions(
+        self, values: Dict[str, Any], *, current: Any, provided: set, now: datetime
+    ) -> Dict[str, Any]:
+        """
+        Add the columns derived from a page change to ``values`` as SQL
+        expressions.
+
+        ``current`` maps column names to the row's existing values, so the same
+        rules serve the INSERT and the ON CONFLICT branches of the upsert.
+        Explicitly provided fields always win over derived ones.
+        """
+        if not provided & {"current_page", "total_pages"}:
+            return values
+
+        page = values.get("current_page", current["current_page"])
+        total = values.get("total_pages", current["total_pages"])
+        finished = and_(total > 0, page >= total)
+
+        if "progress_percentage" not in provided:
+            values["progress_percentage"] = case(
+                (finished, 100.0),
+                (total > 0, page * 100.0 / total),
+                else_=current["progress_percentage"],
             )
-            .count()
-        )
 
-        total_reading_time = (
-            db.query(func.sum(ReadingProgress.reading_time_minutes))
-            .filter(ReadingProgress.user_id == user_id)
-            .scalar()
-            or 0
+        if "status" not in provided:
+            values["status"] = case(
+                (finished, "completed"),
+                (
+                    and_(current["status"] == "not_started", page > 0),
+                    "reading",
+                ),
+                else_=current["status"],
+            )
+            values["started_at"] = case(
+                (
+                    and_(current["started_at"].is_(None), page > 0),
+                    literal(now, current["started_at"].type),
+                ),
+                else_=current["started_at"],
+            )
+
+        if "is_completed" not in provided:
+            values["is_completed"] = case(
+                (finished, True), else_=current["is_completed"]
+            )
+            values["completed_at"] = case(
+                (
+                    and_(finished, current["completed_at"].is_(None)),
+                    literal(now, current["completed_at"].type),
+                ),
+                else_=current["completed_at"],
+            )
+
+        values["last_read_at"] = literal(now, current["last_read_at"].type)
+        return values
+
+    def get_user_stats(self, db: Session, *, user_id: int) -> Dict[str, Any]:
+        """Get reading statistics for a user from the per-user summary row."""
+        stats = (
+            db.query(
+                UserReadingStats.total_books,
+                UserReadingStats.completed_books,
+                UserReadingStats.currently_reading,
+                UserReadingStats.total_reading_time_minutes,
+            )
+            .filter(UserReadingStats.user_id == user_id)
+            .first()
         )
 
-        return {
-            "total_books": total_books,
-            "completed_books": completed_books,
-            "currently_reading": currently_reading,
-            "total_reading_time_minutes": total_reading_time,
-        }
+        # Users without any progress have no summary row yet
+        if not stats:
+            return {
+                "total_books": 0,
+                "completed_books": 0,
+                "currently_reading": 0,
+                "total_reading_time_minutes": 0,
+            }
+
+        return stats._asdict()
+
+    def rebuild_user_stats(self, db: Session, *, user_id: Optional[int] = None) -> int:
+        """
+        Recompute the reading stats summary from reading_progress.
+
+        Rebuilds a single user when user_id is given, otherwise every user.
+        Returns the number of summary rows written.
+        """
+        summary = select(
+            ReadingProgress.user_id,
+            func.count(ReadingProgress.id),
+            func.sum(case((ReadingProgress.is_completed == True, 1), else_=0)),
+            func.sum(case((ReadingProgress.status == "reading", 1), else_=0)),
+            func.coalesce(func.sum(ReadingProgress.reading_time_minutes), 0),
+        ).group_by(ReadingProgress.user_id)
+        stale = delete(UserReadingStats)
+
+        if user_id is not None:
+            summary = summary.where(ReadingProgress.user_id == user_id)
+            stale = stale.where(UserReadingStats.user_id == user_id)
+
+        db.execute(stale)
+        result = db.execute(
+            insert(UserReadingStats).from_select(
+                [
+                    "user_id",
+                    "total_books",
+                    "completed_books",
+                    "currently_reading",
+                    "total_reading_time_minutes",
+                ],
+                summary,
+            )
+        )
+        db.commit()
+        return result.rowcount
 
     def get_multi_with_filters(
         self,
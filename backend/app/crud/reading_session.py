@@ -0,0 +1,249 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional
+
+from sqlalchemy import (
+    Date,
+    String,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from app.crud.base import CRUDBase
+from app.models.reading_session import (
+    BookReadingRollup,
+    ReadingSession,
+    UserReadingRollup,
+)
+from app.schemas.reading_session import ReadingSessionCreate, ReadingSessionUpdate
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_PERIODS = ("day", "week")
+
+# Catches rows outside the monthly partitions (created by the migration)
+DEFAULT_PARTITION = "reading_sessions_default"
+
+
+class CRUDReadingSession(
+    CRUDBase[ReadingSession, ReadingSessionCreate, ReadingSessionUpdate]
+):
+    def create_session(
+        self, db: Session, *, user_id: int, obj_in: ReadingSessionCreate
+    ) -> ReadingSession:
+        """Append a reading session event."""
+        db_obj = ReadingSession(user_id=user_id, **obj_in.model_dump(exclude_none=True))
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def get_user_rollups(
+        self, db: Session, *, user_id: int, period: str = "day", since: date
+    ) -> List[UserReadingRollup]:
+        return (
+            db.query(UserReadingRollup)
+            .filter(
+                UserReadingRollup.user_id == user_id,
+                UserReadingRollup.period == period,
+                UserReadingRollup.period_start >= since,
+            )
+            .order_by(UserReadingRollup.period_start)
+            .all()
+        )
+
+    def get_book_rollups(
+        self, db: Session, *, book_id: int, period: str = "day", since: date
+    ) -> List[BookReadingRollup]:
+        return (
+            db.query(BookReadingRollup)
+            .filter(
+                BookReadingRollup.book_id == book_id,
+                BookReadingRollup.period == period,
+                BookReadingRollup.period_start >= since,
+            )
+            .order_by(BookReadingRollup.period_start)
+            .all()
+        )
+
+    def rollup(self, db: Session, *, start: date, end: Optional[date] = None) -> int:
+        """
+        Recompute daily and weekly rollups for sessions read in [start, end).
+
+        Buckets touching the window are rebuilt whole (weeks start on Monday,
+        UTC), so the job is idempotent and safe to re-run over late events.
+        Returns the number of rollup rows written.
+        """
+        end = end or datetime.now(timezone.utc).date() + timedelta(days=1)
+        written = 0
+
+        for period in ROLLUP_PERIODS:
+            bucket_start, bucket_end = start, end
+            if period == "week":
+                # Widen to whole weeks: the Monday on or before start, up to
+                # the Monday after the window's last day
+                bucket_start = start - timedelta(days=start.weekday())
+                last_day = end - timedelta(days=1)
+                bucket_end = last_day + timedelta(days=7 - last_day.weekday())
+
+            window_start = datetime.combine(bucket_start, time.min, tzinfo=timezone.utc)
+            window_end = datetime.combine(bucket_end, time.min, tzinfo=timezone.utc)
+            bucket = self._period_start(db, period)
+            pages = case(
+                (
+                    ReadingSession.end_page > ReadingSession.start_page,
+                    ReadingSession.end_page - ReadingSession.start_page,
+                ),
+                else_=0,
+            )
+            in_window = (
+                ReadingSession.read_at >= window_start,
+                ReadingSession.read_at < window_end,
+            )
+
+            for rollup_model, key, extra in (
+                (UserReadingRollup, ReadingSession.user_id, []),
+                (
+                    BookReadingRollup,
+                    ReadingSession.book_id,
+                    [func.count(func.distinct(ReadingSession.user_id))],
+                ),
+            ):
+                db.execute(
+                    delete(rollup_model).where(
+                        rollup_model.period == period,
+                        rollup_model.period_start >= bucket_start,
+                        rollup_model.period_start < bucket_end,
+                    )
+                )
+
+                columns = [key.key, "period", "period_start", "sessions"]
+                if extra:
+                    columns.append("readers")
+                columns += ["reading_seconds", "pages_read"]
+
+                summary = (
+                    select(
+                        key,
+                        literal(period, String),
+                        bucket,
+                        func.count(ReadingSession.id),
+                        *extra,
+                        func.coalesce(func.sum(ReadingSession.duration_seconds), 0),
+                        func.coalesce(func.sum(pages), 0),
+                    )
+                    .where(*in_window)
+                    .group_by(key, bucket)
+                )
+                result = db.execute(insert(rollup_model).from_select(columns, summary))
+                written += result.rowcount
+
+        db.commit()
+        logger.info(
+            "Rolled up reading sessions from %s to %s (%d rows)", start, end, written
+        )
+        return written
+
+    def ensure_partitions(
+        self, db: Session, *, months_ahead: int = 2, today: Optional[date] = None
+    ) -> List[str]:
+        """
+        Create monthly reading_sessions partitions up to months_ahead (Postgres).
+
+        Creating a partition scans the default partition under an exclusive
+        lock, and fails if it holds rows of the new month, so partitions are
+        created ahead of time while the default is still empty. Rows that
+        reached the default anyway are moved into the new partition with the
+        default detached. Returns the partitions that were checked; a no-op
+        on other dialects where the table is not partitioned.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return []
+
+        month = (today or datetime.now(timezone.utc).date()).replace(day=1)
+        partitions = []
+        for _ in range(months_ahead + 1):
+            next_month = (month + timedelta(days=32)).replace(day=1)
+            name = f"reading_sessions_{month:%Y_%m}"
+            if not db.execute(
+                text("SELECT to_regclass(:name)"), {"name": name}
+            ).scalar():
+                self._create_partition(db, name=name, start=month, end=next_month)
+                # One transaction per partition keeps the exclusive locks short
+                db.commit()
+            partitions.append(name)
+            month = next_month
+
+        return partitions
+
+    def _create_partition(
+        self, db: Session, *, name: str, start: date, end: date
+    ) -> None:
+        """Create the reading_sessions partition for [start, end)."""
+        bounds = {"start": start, "end": end}
+        in_range = "read_at >= :start AND read_at < :end"
+        stranded = db.execute(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                f"WHERE {in_range})"
+            ),
+            bounds,
+        ).scalar()
+        if stranded:
+            logger.warning(
+                "Moving %s rows out of %s",
+                start.strftime("%Y-%m"),
+                DEFAULT_PARTITION,
+            )
+            db.execute(
+                text(
+                    f"ALTER TABLE reading_sessions "
+                    f"DETACH PARTITION {DEFAULT_PARTITION}"
+                )
+            )
+        db.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF reading_sessions "
+                f"FOR VALUES FROM ('{start.isoformat()}') "
+                f"TO ('{end.isoformat()}')"
+            )
+        )
+        if stranded:
+            db.execute(
+                text(
+                    f"INSERT INTO {name} "
+                    f"SELECT * FROM {DEFAULT_PARTITION} WHERE {in_range}"
+                ),
+                bounds,
+            )
+            db.execute(
+                text(f"DELETE FROM {DEFAULT_PARTITION} WHERE {in_range}"), bounds
+            )
+            db.execute(
+                text(
+                    f"ALTER TABLE reading_sessions "
+                    f"ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"
+                )
+            )
+
+    def _period_start(self, db: Session, period: str):
+        """SQL expression truncating read_at to the start of its day/week."""
+        if db.get_bind().dialect.name == "postgresql":
+            return cast(
+                func.date_trunc(period, func.timezone("UTC", ReadingSession.read_at)),
+                Date,
+            )
+        if period == "week":
+            # SQLite: roll forward to Sunday, then back to that week's Monday
+            return func.date(ReadingSession.read_at, "weekday 0", "-6 days")
+        return func.date(ReadingSession.read_at)
+
+
+crud_reading_session = CRUDReadingSession(ReadingSession)
@@ -1,5 +1,4 @@
 import logging
-import sys
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
@@ -13,39 +12,25 @@ from pydantic import ValidationError
 from sqlalchemy import text
 
 from app.api.v1.router import api_router
+from app.core.admission import AdmissionMiddleware
 from app.core.config import settings
-from app.core.database import SessionLocal
-
-
-# Configure logging
-def setup_logging():
-    """Configure logging for the application"""
-    log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
-
-    # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    # Configure root logger
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_dir / "app.log", encoding="utf-8"),
-        ],
-    )
-
-    # Set specific loggers to appropriate levels
-    logging.getLogger("uvicorn").setLevel(logging.WARNING)
-    logging.getLogger("fastapi").setLevel(logging.WARNING)
-
-    logger = logging.getLogger(__name__)
-    logger.info(f"Logging configured with level: {settings.LOG_LEVEL}")
-
+from app.core.database import SessionLocal, engine
+from app.core.logging_config import RequestIdMiddleware, setup_logging
+from app.core.metrics import setup_metrics
+from app.core.profiling import ProfilingMiddleware, profile_store
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.rate_limit import RateLimitMiddleware, create_bucket_store
+from app.core.supabase_client import LOCAL_STORAGE_PATH
+from app.core.tracing import setup_tracing
+from app.services.epub_import_service import epub_import_service
+from app.services.feed_service import feed_service
+from app.services.ranking_service import ranking_service
 
 # Setup logging before creating the app
 setup_logging()
+logging.getLogger(__name__).info(
+    "Logging configured with level: %s", settings.LOG_LEVEL
+)
 
 
 @asynccontextmanager
@@ -65,9 +50,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to rebuild schemas: {e}")
 
+    # Precomputed homepage and catalog feeds
+    if settings.FEEDS_ENABLED:
+        feed_service.start()
+
+    # Trending scores and active readers behind the ranked listings
+    if settings.RANKINGS_ENABLED:
+        ranking_service.start()
+
     yield
 
     # Shutdown
+    feed_service.stop()
+    ranking_service.stop()
+    epub_import_service.shutdown()
     logger.info("FastAPI Book Reading application shutting down...")
 
 
@@ -79,24 +75,92 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Set up CORS middleware
+# Count SQL queries per request: headers in development, budget warnings
+app.add_middleware(
+    QueryStatsMiddleware,
+    headers=settings.QUERY_STATS_HEADERS,
+    budget=settings.QUERY_BUDGET,
+)
+
+# Per-request stack sampling for sampled requests and admins asking for it
+if settings.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        sample_rate=settings.PROFILING_SAMPLE_RATE,
+        header=settings.PROFILING_HEADER,
+        interval=settings.PROFILING_INTERVAL,
+    )
+
+# Prometheus metrics at /metrics
+if settings.MONITORING_ENABLED:
+    setup_metrics(app, engine)
+
+# OpenTelemetry spans for requests, SQL, storage, email and password hashing
+if settings.TRACING_ENABLED:
+    setup_tracing(app, engine)
+
+# Bounded concurrency per route class; 503 instead of piling up on overload
+# (inside CORS, which is registered below)
+if settings.ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(
+        AdmissionMiddleware,
+        limits=settings.ADMISSION_LIMITS,
+        route_classes=settings.ADMISSION_ROUTE_CLASSES,
+        queue_size=settings.ADMISSION_QUEUE_SIZE,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+        bulk_limit=settings.ADMISSION_BULK_LIMIT,
+        exempt_paths=settings.RATE_LIMIT_EXEMPT_PATHS,
+        prefix=settings.API_V1_STR,
+    )
+
+# Token buckets per user or IP, before any work is done for the request
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        store=create_bucket_store(),
+        requests=settings.RATE_LIMIT_REQUESTS,
+        period=settings.RATE_LIMIT_PERIOD,
+        route_costs=settings.RATE_LIMIT_ROUTE_COSTS,
+        listing_unit=settings.RATE_LIMIT_LISTING_UNIT,
+        exempt_paths=settings.RATE_LIMIT_EXEMPT_PATHS,
+        prefix=settings.API_V1_STR,
+    )
+
+# CORS outside the rate limiter and admission control, so browsers can read
+# their 429 and 503 responses and back off
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After", "X-RateLimit-Limit", "X-RateLimit-Remaining"],
 )
 
+# Request ids for log records and the X-Request-ID header (outermost)
+app.add_middleware(RequestIdMiddleware)
+
 
 # Exception handlers để debug lỗi 422
+def _loggable_errors(exc) -> list:
+    """Validation errors without the rejected input, which may be a password."""
+    return [
+        {key: value for key, value in error.items() if key != "input"}
+        for error in exc.errors()
+    ]
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     logger = logging.getLogger(__name__)
-    logger.error(f"422 Validation Error on {request.method} {request.url}")
-    logger.error(f"Request headers: {dict(request.headers)}")
-    logger.error(f"Query params: {dict(request.query_params)}")
-    logger.error(f"Validation errors: {exc.errors()}")
+    # Headers and query strings can carry tokens, so only the path is logged
+    logger.warning(
+        "422 Validation Error on %s %s: %s",
+        request.method,
+        request.url.path,
+        _loggable_errors(exc),
+    )
 
     return JSONResponse(
         status_code=422,
@@ -112,8 +176,12 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(ValidationError)
 async def pydantic_validation_exception_handler(request: Request, exc: ValidationError):
     logger = logging.getLogger(__name__)
-    logger.error(f"Pydantic Validation Error on {request.method} {request.url}")
-    logger.error(f"Validation errors: {exc.errors()}")
+    logger.error(
+        "Pydantic Validation Error on %s %s: %s",
+        request.method,
+        request.url.path,
+        _loggable_errors(exc),
+    )
 
     return JSONResponse(
         status_code=422,
@@ -128,6 +196,15 @@ async def pydantic_validation_exception_handler(request: Request, exc: Validatio
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# Serve uploads kept by the local storage stand-in
+if settings.STORAGE_BACKEND == "local":
+    Path(settings.UPLOAD_FOLDER).mkdir(parents=True, exist_ok=True)
+    app.mount(
+        LOCAL_STORAGE_PATH,
+        StaticFiles(directory=settings.UPLOAD_FOLDER),
+        name="local_storage",
+    )
+
 
 # Health check endpoint
 @app.get("/health")
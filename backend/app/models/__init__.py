@@ -1,20 +1,38 @@
 from .author import Author
 from .book import Book
+from .book_similarity import BookSimilarity
+from .book_stats import BookStats
 from .category import Category
-from .chapter import Chapter
+from .chapter import Chapter, ChapterContent
 from .favorite import Favorite
+from .feed_snapshot import FeedSnapshot
+from .import_job import ImportJob
 from .reading_list import ReadingList, ReadingListItem
 from .reading_progress import ReadingProgress
+from .reading_session import BookReadingRollup, ReadingSession, UserReadingRollup
 from .user import User
+from .user_reading_stats import UserReadingStats
+
+# Registers the chapter search index DDL and mapper events
+from . import chapter_search  # noqa: F401
 
 __all__ = [
     "User",
     "Author",
     "Category",
     "Book",
+    "BookStats",
+    "BookSimilarity",
     "ReadingProgress",
     "Chapter",
+    "ChapterContent",
     "Favorite",
+    "FeedSnapshot",
+    "ImportJob",
     "ReadingList",
     "ReadingListItem",
+    "UserReadingStats",
+    "ReadingSession",
+    "UserReadingRollup",
+    "BookReadingRollup",
 ]
@@ -17,6 +17,10 @@ class Author(Base):
     website = Column(String, nullable=True)
     image_url = Column(String, nullable=True)
 
+    # Counter caches maintained by CRUDBook create/update/remove
+    book_count = Column(Integer, nullable=False, default=0, server_default="0")
+    active_book_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
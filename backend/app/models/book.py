@@ -5,9 +5,11 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -55,5 +57,22 @@ class Book(Base):
         "ReadingListItem", back_populates="book", cascade="all, delete-orphan"
     )
 
+    # Indexes - Public listings only ever read active books, newest first
+    __table_args__ = (
+        Index(
+            "ix_books_active_created_at",
+            "created_at",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        Index(
+            "ix_books_category_active_created_at",
+            "category_id",
+            "created_at",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Book(id={self.id}, title='{self.title}')>"
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+
+from app.core.database import Base
+
+
+class BookSimilarity(Base):
+    """
+    A book's most similar books, ranked ("readers who liked this also liked").
+
+    Written in bulk by the offline recommendation job
+    (``scripts/build_recommendations.py``); the primary key makes a book's
+    recommendations one index range scan in rank order.
+    """
+
+    __tablename__ = "book_similarities"
+
+    book_id = Column(
+        Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank = Column(Integer, primary_key=True)  # 1 = most similar
+    similar_book_id = Column(
+        Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    score = Column(Float, nullable=False)  # cosine similarity, 0..1
+    generated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<BookSimilarity(book_id={self.book_id}, rank={self.rank}, "
+            f"similar_book_id={self.similar_book_id})>"
+        )
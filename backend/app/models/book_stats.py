@@ -0,0 +1,236 @@
+from sqlalchemy import DDL, Column, DateTime, Float, ForeignKey, Index, Integer, event
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# Popularity score weights; the triggers below bake them into their SQL, so
+# run scripts/rebuild_book_stats.py after changing them
+FAVORITE_WEIGHT = 3.0
+READER_WEIGHT = 1.0
+COMPLETION_WEIGHT = 2.0
+
+
+class BookStats(Base):
+    """
+    Per-book ranking statistics.
+
+    Counts and the popularity score are maintained incrementally by database
+    triggers on books, favorites and reading_progress. Active readers and the
+    time-decayed trending score depend on the clock, so the ranking service
+    recomputes them (and repairs any drift in the rest) every
+    RANKINGS_REFRESH_INTERVAL seconds through ``crud_book.rebuild_book_stats``
+    (or ``scripts/rebuild_book_stats.py``).
+    """
+
+    __tablename__ = "book_stats"
+
+    book_id = Column(
+        Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    favorites_count = Column(Integer, nullable=False, default=0, server_default="0")
+    readers_count = Column(Integer, nullable=False, default=0, server_default="0")
+    completions_count = Column(Integer, nullable=False, default=0, server_default="0")
+    active_readers = Column(Integer, nullable=False, default=0, server_default="0")
+
+    popularity_score = Column(Float, nullable=False, default=0, server_default="0")
+    trending_score = Column(Float, nullable=False, default=0, server_default="0")
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    # Ranked listings walk these indexes and stop at the page limit
+    __table_args__ = (
+        Index("ix_book_stats_popularity", "popularity_score", "book_id"),
+        Index("ix_book_stats_trending", "trending_score", "book_id"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<BookStats(book_id={self.book_id}, "
+            f"popularity_score={self.popularity_score})>"
+        )
+
+
+def _favorite_delta_sql(row: str, sign: str) -> str:
+    """UPDATE applying one favorites row (OLD or NEW) to the book's stats."""
+    return f"""
+        UPDATE book_stats SET
+            favorites_count = favorites_count {sign} 1,
+            popularity_score = popularity_score {sign} {FAVORITE_WEIGHT},
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = {row}.book_id;"""
+
+
+def _progress_delta_sql(row: str, sign: str) -> str:
+    """UPDATE applying one reading_progress row (OLD or NEW) to the book's stats."""
+    return f"""
+        UPDATE book_stats SET
+            readers_count = readers_count {sign} 1,
+            completions_count = completions_count {sign}
+                (CASE WHEN {row}.is_completed THEN 1 ELSE 0 END),
+            popularity_score = popularity_score {sign} ({READER_WEIGHT}
+                + CASE WHEN {row}.is_completed THEN {COMPLETION_WEIGHT} ELSE 0 END),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE book_id = {row}.book_id;"""
+
+
+# Only these columns feed the stats; other progress updates skip the trigger work
+_PROGRESS_CHANGED = """(
+            NEW.book_id IS NOT OLD.book_id
+            OR NEW.is_completed IS NOT OLD.is_completed
+        )"""
+_PROGRESS_CHANGED_POSTGRES = _PROGRESS_CHANGED.replace(" IS NOT ", " IS DISTINCT FROM ")
+
+POSTGRES_BOOK_STATS_FUNCTIONS = [
+    """
+CREATE OR REPLACE FUNCTION book_stats_create() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO book_stats (book_id) VALUES (NEW.id)
+    ON CONFLICT (book_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    f"""
+CREATE OR REPLACE FUNCTION book_stats_favorite_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        {_favorite_delta_sql("OLD", "-")}
+    ELSE
+        {_favorite_delta_sql("NEW", "+")}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    f"""
+CREATE OR REPLACE FUNCTION book_stats_progress_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NOT {_PROGRESS_CHANGED_POSTGRES} THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        {_progress_delta_sql("OLD", "-")}
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        {_progress_delta_sql("NEW", "+")}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+]
+
+# (statement, trigger name, table), so existing triggers can be dropped first
+POSTGRES_BOOK_STATS_TRIGGERS = [
+    (
+        """
+CREATE TRIGGER books_stats
+AFTER INSERT ON books
+FOR EACH ROW EXECUTE FUNCTION book_stats_create()
+""",
+        "books_stats",
+        "books",
+    ),
+    (
+        """
+CREATE TRIGGER favorites_book_stats
+AFTER INSERT OR DELETE ON favorites
+FOR EACH ROW EXECUTE FUNCTION book_stats_favorite_delta()
+""",
+        "favorites_book_stats",
+        "favorites",
+    ),
+    (
+        """
+CREATE TRIGGER reading_progress_book_stats
+AFTER INSERT OR UPDATE OR DELETE ON reading_progress
+FOR EACH ROW EXECUTE FUNCTION book_stats_progress_delta()
+""",
+        "reading_progress_book_stats",
+        "reading_progress",
+    ),
+]
+
+SQLITE_BOOK_STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS books_stats_insert
+    AFTER INSERT ON books
+    BEGIN
+        INSERT INTO book_stats (book_id)
+        SELECT NEW.id WHERE NOT EXISTS (
+            SELECT 1 FROM book_stats WHERE book_id = NEW.id
+        );
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS favorites_book_stats_insert
+    AFTER INSERT ON favorites
+    BEGIN
+        {_favorite_delta_sql("NEW", "+")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS favorites_book_stats_delete
+    AFTER DELETE ON favorites
+    BEGIN
+        {_favorite_delta_sql("OLD", "-")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS reading_progress_book_stats_insert
+    AFTER INSERT ON reading_progress
+    BEGIN
+        {_progress_delta_sql("NEW", "+")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS reading_progress_book_stats_update
+    AFTER UPDATE ON reading_progress
+    WHEN {_PROGRESS_CHANGED}
+    BEGIN
+        {_progress_delta_sql("OLD", "-")}
+        {_progress_delta_sql("NEW", "+")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS reading_progress_book_stats_delete
+    AFTER DELETE ON reading_progress
+    BEGIN
+        {_progress_delta_sql("OLD", "-")}
+    END
+    """,
+]
+
+SQLITE_BOOK_STATS_TRIGGER_NAMES = [
+    "books_stats_insert",
+    "favorites_book_stats_insert",
+    "favorites_book_stats_delete",
+    "reading_progress_book_stats_insert",
+    "reading_progress_book_stats_update",
+    "reading_progress_book_stats_delete",
+]
+
+# Install the triggers whenever the schema is created through metadata
+# (scripts/create_tables.py, tests); Alembic installs them for migrations.
+for _function in POSTGRES_BOOK_STATS_FUNCTIONS:
+    event.listen(
+        Base.metadata, "after_create", DDL(_function).execute_if(dialect="postgresql")
+    )
+for _trigger, _name, _table in POSTGRES_BOOK_STATS_TRIGGERS:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(f"DROP TRIGGER IF EXISTS {_name} ON {_table}").execute_if(
+            dialect="postgresql"
+        ),
+    )
+    event.listen(
+        Base.metadata, "after_create", DDL(_trigger).execute_if(dialect="postgresql")
+    )
+for _trigger in SQLITE_BOOK_STATS_TRIGGERS:
+    event.listen(
+        Base.metadata, "after_create", DDL(_trigger).execute_if(dialect="sqlite")
+    )
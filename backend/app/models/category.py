@@ -14,6 +14,10 @@ class Category(Base):
     slug = Column(String, nullable=False, unique=True, index=True)
     is_active = Column(Boolean, default=True)
 
+    # Counter caches maintained by CRUDBook create/update/remove
+    book_count = Column(Integer, nullable=False, default=0, server_default="0")
+    active_book_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
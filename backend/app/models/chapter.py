@@ -1,17 +1,24 @@
+from typing import Any, Dict, Optional
+
 from sqlalchemy import (
     Boolean,
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
+from app.core import compression
 from app.core.database import Base
+from app.core.settings import settings
 
 
 class Chapter(Base):
@@ -19,12 +26,15 @@ class Chapter(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False, index=True)
-    content = Column(Text, nullable=True)
     chapter_number = Column(Integer, nullable=False, index=True)
     image_url = Column(String, nullable=True)
     is_published = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
 
+    # Content metadata; the body itself lives in chapter_contents
+    content_size = Column(Integer, nullable=True)  # UTF-8 bytes
+    content_hash = Column(String(64), nullable=True)  # SHA-256 hex
+
     # Foreign Keys with proper cascade deletion
     book_id = Column(
         Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True
@@ -35,13 +45,146 @@ class Chapter(Base):
 
     # Relationships
     book = relationship("Book", back_populates="chapters")
+    content_data = relationship(
+        "ChapterContent",
+        back_populates="chapter",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
     # Constraints
     __table_args__ = (
         UniqueConstraint(
             "book_id", "chapter_number", name="unique_chapter_number_per_book"
         ),
+        # Public chapter listings of a book, in reading order
+        Index(
+            "ix_chapters_public_book_number",
+            "book_id",
+            "chapter_number",
+            postgresql_where=text("is_published AND is_active"),
+            sqlite_where=text("is_published AND is_active"),
+        ),
     )
 
+    @property
+    def content(self) -> Optional[str]:
+        """Chapter body, loaded from chapter_contents on first access."""
+        return self.content_data.text if self.content_data else None
+
+    @content.setter
+    def content(self, value: Optional[str]) -> None:
+        if value is None:
+            self.content_data = None
+            self.content_size = None
+            self.content_hash = None
+            return
+
+        if self.content_data is None:
+            self.content_data = ChapterContent()
+        self.content_data.text = value
+        self.content_size, self.content_hash = compression.text_digest(value)
+
     def __repr__(self):
         return f"<Chapter(id={self.id}, title='{self.title}', chapter_number={self.chapter_number})>"
+
+
+# Pre-compressed variant encodings and the columns holding them
+_VARIANT_COLUMNS = {compression.GZIP: "gzip_body", compression.BROTLI: "brotli_body"}
+
+
+def encode_chapter_text(value: str) -> Dict[str, Any]:
+    """
+    Get the chapter_contents column values storing a body.
+
+    Applies the compression and variant settings; also used to prepare rows
+    for bulk inserts that bypass the ORM.
+    """
+    data = value.encode("utf-8")
+    large = len(data) >= settings.CHAPTER_CONTENT_COMPRESSION_MIN_SIZE
+    encoding = settings.CHAPTER_CONTENT_COMPRESSION
+    if (
+        encoding == compression.IDENTITY
+        or not compression.is_available(encoding)
+        or not large
+    ):
+        values = {
+            "encoding": compression.IDENTITY,
+            "body": value,
+            "compressed_body": None,
+        }
+    else:
+        values = {
+            "encoding": encoding,
+            "body": None,
+            "compressed_body": compression.compress(data, encoding),
+        }
+
+    for variant, column in _VARIANT_COLUMNS.items():
+        build = (
+            large
+            and variant in settings.CHAPTER_CONTENT_VARIANTS
+            and variant != values["encoding"]
+            and compression.is_available(variant)
+        )
+        values[column] = compression.compress(data, variant) if build else None
+    return values
+
+
+class ChapterContent(Base):
+    """
+    Chapter body, kept apart from chapters so listings never read it.
+
+    Bodies of at least CHAPTER_CONTENT_COMPRESSION_MIN_SIZE bytes are stored
+    compressed in compressed_body; smaller ones (and everything when
+    compression is "identity" or its library is missing) stay plain in body.
+    The same bodies also get the CHAPTER_CONTENT_VARIANTS encodings built on
+    write, so they can be served without compressing per request.
+    """
+
+    __tablename__ = "chapter_contents"
+
+    chapter_id = Column(
+        Integer, ForeignKey("chapters.id", ondelete="CASCADE"), primary_key=True
+    )
+    encoding = Column(String(10), nullable=False, default=compression.IDENTITY)
+    body = Column(Text, nullable=True)
+    compressed_body = Column(LargeBinary, nullable=True)
+
+    # Pre-compressed variants for HTTP delivery
+    gzip_body = Column(LargeBinary, nullable=True)
+    brotli_body = Column(LargeBinary, nullable=True)
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    # Relationships
+    chapter = relationship("Chapter", back_populates="content_data")
+
+    @property
+    def text(self) -> str:
+        if self.encoding == compression.IDENTITY:
+            return self.body or ""
+        return compression.decompress(self.compressed_body, self.encoding).decode(
+            "utf-8"
+        )
+
+    @text.setter
+    def text(self, value: str) -> None:
+        for column, column_value in encode_chapter_text(value).items():
+            setattr(self, column, column_value)
+
+    def variant(self, encoding: str) -> Optional[bytes]:
+        """Get the body pre-compressed with an encoding, if one was built."""
+        if encoding == self.encoding and encoding != compression.IDENTITY:
+            return self.compressed_body
+        column = _VARIANT_COLUMNS.get(encoding)
+        return getattr(self, column) if column else None
+
+    def __repr__(self):
+        return (
+            f"<ChapterContent(chapter_id={self.chapter_id}, "
+            f"encoding='{self.encoding}')>"
+        )
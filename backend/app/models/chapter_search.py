@@ -0,0 +1,216 @@
+"""
+Full-text index over chapter titles and bodies.
+
+Postgres keeps weighted tsvectors in chapter_search with a GIN index;
+SQLite uses an FTS5 virtual table (rowid = chapter id). Bodies may be stored
+compressed, so the database cannot index them itself: the index is written
+from mapper events on Chapter and ChapterContent, in the same transaction as
+the chapter. Bulk UPDATE/DELETE statements bypass those events; use
+``crud_chapter.rebuild_search_index`` (or
+``scripts/rebuild_chapter_search.py``) to repair the index afterwards.
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import DDL, event, inspect, text
+from sqlalchemy.engine import Connection
+
+from app.core.database import Base
+from app.core.settings import settings
+from app.models.chapter import Chapter, ChapterContent
+
+POSTGRES_SEARCH_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS chapter_search (
+        chapter_id INTEGER PRIMARY KEY REFERENCES chapters (id) ON DELETE CASCADE,
+        book_id INTEGER NOT NULL,
+        title_vector TSVECTOR NOT NULL,
+        body_vector TSVECTOR NOT NULL,
+        document TSVECTOR GENERATED ALWAYS AS (
+            setweight(title_vector, 'A') || setweight(body_vector, 'B')
+        ) STORED
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chapter_search_document
+    ON chapter_search USING gin (document)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_chapter_search_book_id
+    ON chapter_search (book_id)
+    """,
+]
+
+SQLITE_SEARCH_DDL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS chapter_search USING fts5(
+    title, body, book_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+_TSVECTOR = "to_tsvector(CAST(:config AS regconfig), {})"
+
+
+def index_chapters(connection: Connection, documents: List[Dict]) -> None:
+    """
+    Insert or replace search documents in one executemany.
+
+    Each document is a dict with id, book_id, title and body.
+    """
+    if not documents:
+        return
+    if connection.dialect.name == "postgresql":
+        config = settings.CHAPTER_SEARCH_CONFIG
+        connection.execute(
+            text(f"""
+                INSERT INTO chapter_search
+                    (chapter_id, book_id, title_vector, body_vector)
+                VALUES (
+                    :id, :book_id,
+                    {_TSVECTOR.format(":title")}, {_TSVECTOR.format(":body")}
+                )
+                ON CONFLICT (chapter_id) DO UPDATE SET
+                    book_id = EXCLUDED.book_id,
+                    title_vector = EXCLUDED.title_vector,
+                    body_vector = EXCLUDED.body_vector
+                """),
+            [{**document, "config": config} for document in documents],
+        )
+    elif connection.dialect.name == "sqlite":
+        connection.execute(
+            text("DELETE FROM chapter_search WHERE rowid = :id"), documents
+        )
+        connection.execute(
+            text(
+                "INSERT INTO chapter_search (rowid, title, body, book_id) "
+                "VALUES (:id, :title, :body, :book_id)"
+            ),
+            documents,
+        )
+
+
+def unindex_chapter_range(
+    connection: Connection, *, after_id: int, up_to_id: Optional[int] = None
+) -> None:
+    """Delete the search documents of chapter ids in (after_id, up_to_id]."""
+    column = "chapter_id" if connection.dialect.name == "postgresql" else "rowid"
+    params = {"after_id": after_id}
+    query = f"DELETE FROM chapter_search WHERE {column} > :after_id"
+    if up_to_id is not None:
+        query += f" AND {column} <= :up_to_id"
+        params["up_to_id"] = up_to_id
+    connection.execute(text(query), params)
+
+
+def index_chapter(
+    connection: Connection, *, chapter_id: int, book_id: int, title: str, body: str
+) -> None:
+    """Insert or replace a chapter's search document."""
+    index_chapters(
+        connection,
+        [{"id": chapter_id, "book_id": book_id, "title": title, "body": body}],
+    )
+
+
+def _set_title(
+    connection: Connection, *, chapter_id: int, book_id: int, title: str
+) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text(f"""
+                UPDATE chapter_search
+                SET book_id = :book_id, title_vector = {_TSVECTOR.format(":title")}
+                WHERE chapter_id = :id
+                """),
+            {
+                "id": chapter_id,
+                "book_id": book_id,
+                "title": title,
+                "config": settings.CHAPTER_SEARCH_CONFIG,
+            },
+        )
+    elif connection.dialect.name == "sqlite":
+        connection.execute(
+            text(
+                "UPDATE chapter_search SET book_id = :book_id, title = :title "
+                "WHERE rowid = :id"
+            ),
+            {"id": chapter_id, "book_id": book_id, "title": title},
+        )
+
+
+def _set_body(connection: Connection, *, chapter_id: int, body: str) -> None:
+    if connection.dialect.name == "postgresql":
+        connection.execute(
+            text(f"""
+                UPDATE chapter_search SET body_vector = {_TSVECTOR.format(":body")}
+                WHERE chapter_id = :id
+                """),
+            {"id": chapter_id, "body": body, "config": settings.CHAPTER_SEARCH_CONFIG},
+        )
+    elif connection.dialect.name == "sqlite":
+        connection.execute(
+            text("UPDATE chapter_search SET body = :body WHERE rowid = :id"),
+            {"id": chapter_id, "body": body},
+        )
+
+
+# Chapters are flushed before their content, so the document is created with
+# the title here and the body filled in by the ChapterContent events below.
+@event.listens_for(Chapter, "after_insert")
+def _index_new_chapter(mapper, connection, target):
+    index_chapter(
+        connection,
+        chapter_id=target.id,
+        book_id=target.book_id,
+        title=target.title,
+        body="",
+    )
+
+
+@event.listens_for(Chapter, "after_update")
+def _reindex_chapter_title(mapper, connection, target):
+    state = inspect(target)
+    if (
+        state.attrs.title.history.has_changes()
+        or state.attrs.book_id.history.has_changes()
+    ):
+        _set_title(
+            connection, chapter_id=target.id, book_id=target.book_id, title=target.title
+        )
+
+
+@event.listens_for(Chapter, "after_delete")
+def _unindex_chapter(mapper, connection, target):
+    # Postgres cascades through the foreign key; FTS5 tables have none
+    if connection.dialect.name == "sqlite":
+        connection.execute(
+            text("DELETE FROM chapter_search WHERE rowid = :id"), {"id": target.id}
+        )
+
+
+@event.listens_for(ChapterContent, "after_insert")
+@event.listens_for(ChapterContent, "after_update")
+def _index_chapter_body(mapper, connection, target):
+    _set_body(connection, chapter_id=target.chapter_id, body=target.text)
+
+
+@event.listens_for(ChapterContent, "after_delete")
+def _unindex_chapter_body(mapper, connection, target):
+    _set_body(connection, chapter_id=target.chapter_id, body="")
+
+
+# Create the index with the schema (scripts/create_tables.py, tests); Alembic
+# creates it for migrations. It is not part of the metadata, so drop it first.
+for _statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(SQLITE_SEARCH_DDL).execute_if(dialect="sqlite"),
+)
+event.listen(Base.metadata, "before_drop", DDL("DROP TABLE IF EXISTS chapter_search"))
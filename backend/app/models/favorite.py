@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -28,6 +28,7 @@ class Favorite(Base):
     # Constraints - One favorite per user per book
     __table_args__ = (
         UniqueConstraint("user_id", "book_id", name="unique_user_book_favorite"),
+        Index("ix_favorites_user_created_at", "user_id", "created_at"),
     )
 
     def __repr__(self):
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.core.database import Base
+
+
+class FeedSnapshot(Base):
+    """
+    A precomputed book feed (featured, free, newest per category, ...).
+
+    ``payload`` is the feed's books serialized as a JSON array, written by
+    the feed refresher and served as is by the public listing endpoints.
+    """
+
+    __tablename__ = "feed_snapshots"
+
+    name = Column(String(100), primary_key=True)  # e.g. "featured", "category:3"
+    payload = Column(Text, nullable=False)
+    total = Column(Integer, nullable=False, default=0)  # rows matching the feed
+    generated_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self):
+        return f"<FeedSnapshot(name='{self.name}', generated_at={self.generated_at})>"
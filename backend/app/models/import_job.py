@@ -0,0 +1,48 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ImportJob(Base):
+    """
+    A background chapter import (e.g. from an EPUB) and its progress.
+
+    Written by the import worker and polled through the job-status endpoint.
+    """
+
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    book_id = Column(
+        Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    created_by = Column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+
+    source = Column(String, nullable=True)  # uploaded file name or storage URL
+
+    # Status
+    status = Column(
+        String(20), nullable=False, default="pending"
+    )  # pending, running, completed, failed
+
+    # Progress
+    total_chapters = Column(Integer, nullable=False, default=0)
+    processed_chapters = Column(Integer, nullable=False, default=0)
+    imported_chapters = Column(Integer, nullable=False, default=0)
+    skipped_chapters = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<ImportJob(id={self.id}, book_id={self.book_id}, status='{self.status}')>"
+        )
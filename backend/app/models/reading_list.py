@@ -3,10 +3,12 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -38,6 +40,16 @@ class ReadingList(Base):
         "ReadingListItem", back_populates="reading_list", cascade="all, delete-orphan"
     )
 
+    # Indexes - Public list browsing, newest (highest id) first
+    __table_args__ = (
+        Index(
+            "ix_reading_lists_public_id",
+            "id",
+            postgresql_where=text("is_public AND is_active"),
+            sqlite_where=text("is_public AND is_active"),
+        ),
+    )
+
     def __repr__(self):
         return (
             f"<ReadingList(id={self.id}, name='{self.name}', user_id={self.user_id})>"
@@ -4,9 +4,12 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -54,5 +57,18 @@ class ReadingProgress(Base):
     user = relationship("User", back_populates="reading_progress")
     book = relationship("Book", back_populates="reading_progress")
 
+    # Constraints - One progress record per user per book
+    __table_args__ = (
+        UniqueConstraint("user_id", "book_id", name="unique_user_book_progress"),
+        Index("ix_reading_progress_user_status", "user_id", "status"),
+        Index(
+            "ix_reading_progress_user_completed_at",
+            "user_id",
+            "completed_at",
+            postgresql_where=text("is_completed"),
+            sqlite_where=text("is_completed"),
+        ),
+    )
+
     def __repr__(self):
         return f"<ReadingProgress(id={self.id}, user_id={self.user_id}, book_id={self.book_id}, progress={self.progress_percentage}%)>"
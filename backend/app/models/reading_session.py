@@ -0,0 +1,98 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ReadingSession(Base):
+    """
+    Append-only log of reading sessions.
+
+    Rows are only ever inserted; per-day and per-week aggregates are produced
+    by the rollup job into UserReadingRollup/BookReadingRollup. On Postgres
+    the migration creates this table partitioned by month on read_at with a
+    (id, read_at) primary key.
+    """
+
+    __tablename__ = "reading_sessions"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    book_id = Column(
+        Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False
+    )
+
+    start_page = Column(Integer, nullable=False, default=0)
+    end_page = Column(Integer, nullable=False, default=0)
+    duration_seconds = Column(Integer, nullable=False, default=0)
+
+    read_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_reading_sessions_user_read_at", "user_id", "read_at"),
+        Index("ix_reading_sessions_book_read_at", "book_id", "read_at"),
+        Index("ix_reading_sessions_read_at", "read_at"),
+    )
+
+    def __repr__(self):
+        return (
+            f"<ReadingSession(id={self.id}, "
+            f"user_id={self.user_id}, book_id={self.book_id})>"
+        )
+
+
+class UserReadingRollup(Base):
+    """Reading activity per user per day or week (period = "day" | "week")."""
+
+    __tablename__ = "user_reading_rollups"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    period = Column(String(10), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+
+    sessions = Column(Integer, nullable=False, default=0)
+    reading_seconds = Column(BigInteger, nullable=False, default=0)
+    pages_read = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<UserReadingRollup(user_id={self.user_id}, "
+            f"period={self.period}, period_start={self.period_start})>"
+        )
+
+
+class BookReadingRollup(Base):
+    """Reading activity per book per day or week (period = "day" | "week")."""
+
+    __tablename__ = "book_reading_rollups"
+
+    book_id = Column(
+        Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True
+    )
+    period = Column(String(10), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+
+    sessions = Column(Integer, nullable=False, default=0)
+    readers = Column(Integer, nullable=False, default=0)
+    reading_seconds = Column(BigInteger, nullable=False, default=0)
+    pages_read = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<BookReadingRollup(book_id={self.book_id}, "
+            f"period={self.period}, period_start={self.period_start})>"
+        )
@@ -0,0 +1,147 @@
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Integer, event
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class UserReadingStats(Base):
+    """
+    Per-user reading statistics summary.
+
+    Maintained incrementally by database triggers on reading_progress so the
+    stats endpoint reads a single row instead of aggregating every progress
+    record. Use ``crud_reading_progress.rebuild_user_stats`` (or
+    ``scripts/rebuild_reading_stats.py``) to backfill or repair it.
+    """
+
+    __tablename__ = "user_reading_stats"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    total_books = Column(Integer, nullable=False, default=0, server_default="0")
+    completed_books = Column(Integer, nullable=False, default=0, server_default="0")
+    currently_reading = Column(Integer, nullable=False, default=0, server_default="0")
+    total_reading_time_minutes = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return (
+            f"<UserReadingStats(user_id={self.user_id}, "
+            f"total_books={self.total_books})>"
+        )
+
+
+def _stats_delta_sql(row: str, sign: str) -> str:
+    """UPDATE applying one reading_progress row (OLD or NEW) to the summary."""
+    return f"""
+        UPDATE user_reading_stats SET
+            total_books = total_books {sign} 1,
+            completed_books = completed_books {sign}
+                (CASE WHEN {row}.is_completed THEN 1 ELSE 0 END),
+            currently_reading = currently_reading {sign}
+                (CASE WHEN {row}.status = 'reading' THEN 1 ELSE 0 END),
+            total_reading_time_minutes = total_reading_time_minutes {sign}
+                COALESCE({row}.reading_time_minutes, 0),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE user_id = {row}.user_id;"""
+
+
+# Only these columns feed the summary; other updates skip the trigger work
+_STATS_CHANGED = """(
+            NEW.user_id IS NOT OLD.user_id
+            OR NEW.is_completed IS NOT OLD.is_completed
+            OR NEW.status IS NOT OLD.status
+            OR NEW.reading_time_minutes IS NOT OLD.reading_time_minutes
+        )"""
+_STATS_CHANGED_POSTGRES = _STATS_CHANGED.replace(" IS NOT ", " IS DISTINCT FROM ")
+
+POSTGRES_STATS_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION user_reading_stats_delta() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NOT {_STATS_CHANGED_POSTGRES} THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        {_stats_delta_sql("OLD", "-")}
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO user_reading_stats (user_id) VALUES (NEW.user_id)
+        ON CONFLICT (user_id) DO NOTHING;
+        {_stats_delta_sql("NEW", "+")}
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+POSTGRES_STATS_TRIGGER = """
+CREATE TRIGGER reading_progress_stats
+AFTER INSERT OR UPDATE OR DELETE ON reading_progress
+FOR EACH ROW EXECUTE FUNCTION user_reading_stats_delta()
+"""
+
+# Not INSERT OR IGNORE: an outer upsert's conflict policy overrides the
+# conflict clause of statements inside the trigger
+_SQLITE_ENSURE_ROW = """INSERT INTO user_reading_stats (user_id)
+        SELECT NEW.user_id WHERE NOT EXISTS (
+            SELECT 1 FROM user_reading_stats WHERE user_id = NEW.user_id
+        );"""
+
+SQLITE_STATS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS reading_progress_stats_insert
+    AFTER INSERT ON reading_progress
+    BEGIN
+        {_SQLITE_ENSURE_ROW}
+        {_stats_delta_sql("NEW", "+")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS reading_progress_stats_update
+    AFTER UPDATE ON reading_progress
+    WHEN {_STATS_CHANGED}
+    BEGIN
+        {_stats_delta_sql("OLD", "-")}
+        {_SQLITE_ENSURE_ROW}
+        {_stats_delta_sql("NEW", "+")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS reading_progress_stats_delete
+    AFTER DELETE ON reading_progress
+    BEGIN
+        {_stats_delta_sql("OLD", "-")}
+    END
+    """,
+]
+
+# Install the triggers whenever the schema is created through metadata
+# (scripts/create_tables.py, tests); Alembic installs them for migrations.
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(POSTGRES_STATS_FUNCTION).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL("DROP TRIGGER IF EXISTS reading_progress_stats ON reading_progress").execute_if(
+        dialect="postgresql"
+    ),
+)
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(POSTGRES_STATS_TRIGGER).execute_if(dialect="postgresql"),
+)
+for _trigger in SQLITE_STATS_TRIGGERS:
+    event.listen(
+        Base.metadata, "after_create", DDL(_trigger).execute_if(dialect="sqlite")
+    )
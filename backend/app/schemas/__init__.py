@@ -1,12 +1,17 @@
 # Import all schemas
 from app.schemas.author import *
 from app.schemas.book import *
+from app.schemas.bulk import *
 from app.schemas.category import *
 from app.schemas.chapter import *
 from app.schemas.favorite import *
+from app.schemas.import_job import *
+from app.schemas.profiling import *
 from app.schemas.reading_list import *
 from app.schemas.reading_progress import *
+from app.schemas.reading_session import *
 from app.schemas.response import *
+from app.schemas.slow_query import *
 from app.schemas.token import *
 from app.schemas.user import *
 
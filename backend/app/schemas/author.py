@@ -28,6 +28,10 @@ class AuthorUpdate(BaseModel):
     image_url: Optional[str] = None
 
 
+class AuthorBulkUpdate(AuthorUpdate):
+    id: int
+
+
 class AuthorInDB(AuthorBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -43,3 +47,4 @@ class AuthorResponse(AuthorBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     book_count: int = 0
+    active_book_count: int = 0
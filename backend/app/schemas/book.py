@@ -42,6 +42,10 @@ class BookUpdate(BaseModel):
     category_id: Optional[int] = None
 
 
+class BookBulkUpdate(BookUpdate):
+    id: int
+
+
 class BookInDB(BookBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,41 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.schemas.response import Messages
+
+T = TypeVar("T")
+
+# Upper bound on items per bulk request; larger feeds should be chunked
+MAX_BULK_ITEMS = 1000
+
+
+class BulkRequest(BaseModel, Generic[T]):
+    items: List[T] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[int] = None
+    detail: str
+
+
+class BulkResult(BaseModel, Generic[T]):
+    items: List[T] = []
+    errors: List[BulkItemError] = []
+
+
+class BulkDeleteResult(BaseModel):
+    deleted_ids: List[int] = []
+    errors: List[BulkItemError] = []
+
+
+def bulk_message(errors: List[dict], atomic: bool) -> str:
+    """Pick the response message for a bulk operation result."""
+    if not errors:
+        return Messages.BULK_COMPLETED
+    return Messages.BULK_REJECTED if atomic else Messages.BULK_COMPLETED_WITH_ERRORS
@@ -22,6 +22,10 @@ class CategoryUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class CategoryBulkUpdate(CategoryUpdate):
+    id: int
+
+
 class CategoryInDB(CategoryBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -36,3 +40,5 @@ class CategoryResponse(CategoryBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
+    book_count: int = 0
+    active_book_count: int = 0
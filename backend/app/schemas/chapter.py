@@ -43,10 +43,63 @@ class ChapterResponse(ChapterBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
+    content_size: Optional[int] = None
+    content_hash: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
 
 
+class ChapterSummary(BaseModel):
+    """Chapter metadata for listings; the body is served separately."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    chapter_number: int
+    image_url: Optional[str] = None
+    is_published: bool
+    is_active: bool
+    book_id: int
+    content_size: Optional[int] = None
+    content_hash: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+
+class ChapterPrefetchHint(BaseModel):
+    """The next chapter, so readers can fetch it in the background."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    chapter_number: int
+    content_hash: Optional[str] = None
+
+
+class ChapterContentResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    book_id: int
+    chapter_number: int
+    content: Optional[str] = None
+    content_size: Optional[int] = None
+    content_hash: Optional[str] = None
+    next_chapter: Optional[ChapterPrefetchHint] = None
+
+
+class ChapterSearchHit(BaseModel):
+    """A chapter matching an in-book search, with a highlighted snippet."""
+
+    id: int
+    book_id: int
+    chapter_number: int
+    title: str
+    rank: float
+    snippet: str = ""
+
+
 class ChapterWithDetails(ChapterResponse):
     model_config = ConfigDict(from_attributes=True)
 
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ImportJobCreate(BaseModel):
+    book_id: int
+    created_by: Optional[int] = None
+    source: Optional[str] = None
+
+
+class ImportJobUpdate(BaseModel):
+    status: Optional[str] = None
+    total_chapters: Optional[int] = None
+    processed_chapters: Optional[int] = None
+    imported_chapters: Optional[int] = None
+    skipped_chapters: Optional[int] = None
+    error: Optional[str] = None
+
+
+class ImportJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    book_id: int
+    created_by: Optional[int] = None
+    source: Optional[str] = None
+    status: str
+    total_chapters: int
+    processed_chapters: int
+    imported_chapters: int
+    skipped_chapters: int
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
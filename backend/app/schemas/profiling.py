@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RequestProfileResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    method: str
+    path: str
+    status_code: Optional[int] = None
+    started_at: datetime
+    duration: float
+    samples: int
+
+
+class ProfilerStatus(BaseModel):
+    running: bool
+    interval: Optional[float] = None
+    samples: int = 0
+    started_at: Optional[datetime] = None
+    stopped_at: Optional[datetime] = None
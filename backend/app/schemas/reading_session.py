@@ -0,0 +1,47 @@
+from datetime import date, datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ReadingSessionBase(BaseModel):
+    book_id: int
+    start_page: int = Field(0, ge=0)
+    end_page: int = Field(0, ge=0)
+    duration_seconds: int = Field(0, ge=0)
+
+
+class ReadingSessionCreate(ReadingSessionBase):
+    read_at: Optional[datetime] = None
+
+
+class ReadingSessionUpdate(BaseModel):
+    # Sessions are append-only; kept for CRUDBase typing
+    pass
+
+
+class ReadingSessionResponse(ReadingSessionBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    read_at: datetime
+
+
+class ReadingRollupBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    period: str
+    period_start: date
+    sessions: int
+    reading_seconds: int
+    pages_read: int
+
+
+class UserReadingRollupResponse(ReadingRollupBase):
+    user_id: int
+
+
+class BookReadingRollupResponse(ReadingRollupBase):
+    book_id: int
+    readers: int
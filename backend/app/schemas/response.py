@@ -98,6 +98,13 @@ class Messages:
     CATEGORY_ALREADY_EXISTS = "Category with this name already exists"
     CATEGORIES_RETRIEVED = "Categories retrieved successfully"
 
+    # Bulk operation messages
+    BULK_COMPLETED = "Bulk operation completed successfully"
+    BULK_COMPLETED_WITH_ERRORS = "Bulk operation completed with errors"
+    BULK_REJECTED = "Bulk operation rejected; no changes were made"
+
+    FEED_NOT_FOUND = "Feed not found"
+
     # Chapter messages
     CHAPTER_CREATED = "Chapter created successfully"
     CHAPTER_UPDATED = "Chapter updated successfully"
@@ -106,6 +113,19 @@ class Messages:
     CHAPTER_DUPLICATE = "Chapter with this number already exists for this book"
     CHAPTERS_RETRIEVED = "Chapters retrieved successfully"
 
+    # Import messages
+    IMPORT_JOB_CREATED = "Import job created successfully"
+    IMPORT_JOB_NOT_FOUND = "Import job not found"
+
+    # Profiling messages
+    PROFILE_NOT_FOUND = "Profile not found"
+    PROFILER_STARTED = "Profiler started successfully"
+    PROFILER_STOPPED = "Profiler stopped successfully"
+    PROFILER_ALREADY_RUNNING = "Profiler is already running"
+    PROFILER_NOT_RUNNING = "Profiler is not running"
+    PROFILER_NO_PROFILE = "No profile has been recorded"
+    SLOW_QUERIES_CLEARED = "Slow query log cleared successfully"
+
     # Reading Progress messages
     READING_PROGRESS_CREATED = "Reading progress created successfully"
     READING_PROGRESS_UPDATED = "Reading progress updated successfully"
@@ -113,6 +133,10 @@ class Messages:
     READING_PROGRESS_NOT_FOUND = "Reading progress not found"
     READING_PROGRESS_RETRIEVED = "Reading progress retrieved successfully"
 
+    # Reading Session messages
+    READING_SESSION_RECORDED = "Reading session recorded successfully"
+    READING_STATS_RETRIEVED = "Reading statistics retrieved successfully"
+
     # Favorite messages
     FAVORITE_ADDED = "Book added to favorites successfully"
     FAVORITE_REMOVED = "Book removed from favorites successfully"
@@ -160,3 +184,5 @@ class Messages:
     FORBIDDEN = "Access forbidden"
     NOT_FOUND = "Resource not found"
     INTERNAL_ERROR = "Internal server error occurred"
+    TOO_MANY_REQUESTS = "Too many requests, please retry later"
+    SERVICE_OVERLOADED = "Service is overloaded, please retry later"
@@ -0,0 +1,16 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SlowQueryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str
+    duration_ms: float
+    parameters: Any = None
+    crud_method: Optional[str] = None
+    route: Optional[str] = None
+    plan: Optional[str] = None
+    recorded_at: datetime
@@ -4,6 +4,8 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
 from app.core.config import settings
+from app.core.metrics import track_email
+from app.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -18,33 +20,36 @@ class EmailService:
         self.smtp_password = settings.SMTP_PASSWORD
         self.smtp_tls = settings.SMTP_TLS
 
+    @traced("email.send")
     def _send_email(self, to_email: str, subject: str, html_content: str) -> bool:
         """Send email using SMTP."""
         if not all([self.smtp_host, self.smtp_username, self.smtp_password]):
             logger.warning("Email configuration incomplete, skipping email send")
             return False
 
-        try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self.smtp_username
-            msg["To"] = to_email
-
-            html_part = MIMEText(html_content, "html")
-            msg.attach(html_part)
-
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                if self.smtp_tls:
-                    server.starttls()
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
-
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
-            return False
+        with track_email() as outcome:
+            try:
+                msg = MIMEMultipart("alternative")
+                msg["Subject"] = subject
+                msg["From"] = self.smtp_username
+                msg["To"] = to_email
+
+                html_part = MIMEText(html_content, "html")
+                msg.attach(html_part)
+
+                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+                    if self.smtp_tls:
+                        server.starttls()
+                    server.login(self.smtp_username, self.smtp_password)
+                    server.send_message(msg)
+
+                logger.info(f"Email sent successfully to {to_email}")
+                outcome["sent"] = True
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to send email to {to_email}: {str(e)}")
+                return False
 
     def send_password_reset_email(
         self, to_email: str, reset_token: str, user_name: str
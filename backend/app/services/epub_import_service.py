@@ -0,0 +1,255 @@
+import html
+import io
+import logging
+import multiprocessing
+import os
+import posixpath
+import re
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core import compression
+from app.core.settings import settings
+from app.core.supabase_client import supabase_client
+from app.crud.book import crud_book
+from app.crud.chapter import crud_chapter
+from app.crud.import_job import crud_import_job
+from app.models.chapter import encode_chapter_text
+
+logger = logging.getLogger(__name__)
+
+CONTAINER_PATH = "META-INF/container.xml"
+XHTML_MEDIA_TYPES = {"application/xhtml+xml", "text/html"}
+
+# Record parsing progress every this many documents
+PROGRESS_EVERY = 25
+
+_BODY_RE = re.compile(r"<body[^>]*>(.*)</body>", re.IGNORECASE | re.DOTALL)
+_DROP_RE = re.compile(
+    r"<(script|style)[^>]*>.*?</\1>|<!--.*?-->", re.IGNORECASE | re.DOTALL
+)
+_HEADING_RE = re.compile(r"<h([1-3])[^>]*>(.*?)</h\1>", re.IGNORECASE | re.DOTALL)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+class EpubError(ValueError):
+    """The uploaded file is not a readable EPUB."""
+
+
+def _local(tag: str) -> str:
+    """Strip the XML namespace from an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _plain_text(fragment: str) -> str:
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", fragment))).strip()
+
+
+def read_spine_documents(epub: bytes) -> List[bytes]:
+    """Get the raw XHTML documents of an EPUB in reading (spine) order."""
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(epub))
+        container = ET.fromstring(archive.read(CONTAINER_PATH))
+        rootfile = next(
+            element for element in container.iter() if _local(element.tag) == "rootfile"
+        )
+        opf_path = rootfile.attrib["full-path"]
+        package = ET.fromstring(archive.read(opf_path))
+    except (zipfile.BadZipFile, KeyError, StopIteration, ET.ParseError) as e:
+        raise EpubError(f"Not a valid EPUB: {e}") from e
+
+    base = posixpath.dirname(opf_path)
+    manifest = {}
+    spine = []
+    for element in package.iter():
+        tag = _local(element.tag)
+        if tag == "item":
+            manifest[element.attrib.get("id")] = element.attrib
+        elif tag == "itemref" and element.attrib.get("linear", "yes") != "no":
+            spine.append(element.attrib.get("idref"))
+
+    documents = []
+    for idref in spine:
+        item = manifest.get(idref)
+        if not item or item.get("media-type") not in XHTML_MEDIA_TYPES:
+            continue
+        path = posixpath.normpath(posixpath.join(base, item["href"].split("#")[0]))
+        try:
+            documents.append(archive.read(path))
+        except KeyError:
+            logger.warning("EPUB spine item %s is missing from the archive", path)
+    return documents
+
+
+def parse_chapter_document(raw: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Turn one XHTML document into chapter values, ready for a bulk insert.
+
+    Runs in the import process pool: besides splitting out the title and
+    body, it hashes and encodes (compresses) the body. Returns None for
+    documents without text, such as cover or image-only pages.
+    """
+    document = raw.decode("utf-8", errors="replace")
+    match = _BODY_RE.search(document)
+    body = _DROP_RE.sub("", match.group(1) if match else document).strip()
+    if not _plain_text(body):
+        return None
+
+    heading = _HEADING_RE.search(body) or _TITLE_RE.search(document)
+    title = _plain_text(heading.group(heading.lastindex)) if heading else None
+
+    size, digest = compression.text_digest(body)
+    return {
+        "title": title[:255] if title else None,
+        "content": body,
+        "content_size": size,
+        "content_hash": digest,
+        "storage": encode_chapter_text(body),
+    }
+
+
+class EpubImportService:
+    """
+    Split EPUBs into chapters and bulk insert them as tracked import jobs.
+
+    All jobs share one pool of EPUB_IMPORT_WORKERS parser processes, started
+    on first use. Workers are spawned rather than forked: the API process runs
+    logging, refresher and profiler threads whose locks a forked child could
+    inherit held.
+    """
+
+    def __init__(self):
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def run(
+        self,
+        session_factory: Callable[[], Session],
+        job_id: int,
+        *,
+        epub: Optional[bytes] = None,
+        start_number: Optional[int] = None,
+        on_conflict: str = "fail",
+        is_published: bool = False,
+    ) -> None:
+        """
+        Run an import job to completion; meant for a background task.
+
+        Without epub bytes the book's epub_url is downloaded from storage.
+        Conflicting chapter numbers fail the job, or are skipped when
+        on_conflict is "skip". Failures are recorded on the job.
+        """
+        db = session_factory()
+        try:
+            job = crud_import_job.get(db, id=job_id)
+            crud_import_job.start(db, job=job)
+
+            if epub is None:
+                book = crud_book.get(db, id=job.book_id)
+                epub = supabase_client.download_file(book.epub_url)
+                if epub is None:
+                    raise EpubError(f"Could not download {book.epub_url}")
+
+            documents = read_spine_documents(epub)
+            crud_import_job.set_progress(
+                db, job_id=job_id, total_chapters=len(documents)
+            )
+
+            chapters = []
+            for processed, chapter in enumerate(self._parse(documents), start=1):
+                if chapter:
+                    chapters.append(chapter)
+                if processed % PROGRESS_EVERY == 0:
+                    crud_import_job.set_progress(
+                        db, job_id=job_id, processed_chapters=processed
+                    )
+            crud_import_job.set_progress(
+                db, job_id=job_id, processed_chapters=len(documents)
+            )
+
+            if start_number is None:
+                start_number = (
+                    crud_chapter.get_max_chapter_number(db, book_id=job.book_id) + 1
+                )
+            for number, chapter in enumerate(chapters, start=start_number):
+                chapter["chapter_number"] = number
+                chapter["title"] = chapter["title"] or f"Chapter {number}"
+
+            # unique_chapter_number_per_book, checked for the whole batch at once
+            existing = crud_chapter.get_existing_chapter_numbers(
+                db,
+                book_id=job.book_id,
+                numbers=[chapter["chapter_number"] for chapter in chapters],
+            )
+            if existing and on_conflict != "skip":
+                raise ValueError(
+                    "Chapter numbers already exist: "
+                    + ", ".join(str(number) for number in sorted(existing))
+                )
+            new_chapters = [
+                chapter
+                for chapter in chapters
+                if chapter["chapter_number"] not in existing
+            ]
+
+            crud_chapter.bulk_create_with_content(
+                db,
+                book_id=job.book_id,
+                chapters=new_chapters,
+                is_published=is_published,
+            )
+            crud_import_job.finish(
+                db, job=job, imported=len(new_chapters), skipped=len(existing)
+            )
+            logger.info(
+                "Import job %s added %d chapters to book %s (%d skipped)",
+                job_id,
+                len(new_chapters),
+                job.book_id,
+                len(existing),
+            )
+        except Exception as e:
+            db.rollback()
+            logger.exception("Import job %s failed", job_id)
+            crud_import_job.fail(db, job_id=job_id, error=str(e))
+        finally:
+            db.close()
+
+    def shutdown(self) -> None:
+        """Stop the parser processes, if they were started."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _executor(self, workers: int) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _parse(self, documents: List[bytes]) -> Iterator[Optional[Dict[str, Any]]]:
+        """Parse documents in order, in the process pool when worthwhile."""
+        workers = settings.EPUB_IMPORT_WORKERS or os.cpu_count() or 1
+        if workers <= 1 or len(documents) <= 1:
+            yield from map(parse_chapter_document, documents)
+            return
+
+        chunksize = max(1, len(documents) // (workers * 4))
+        yield from self._executor(workers).map(
+            parse_chapter_document, documents, chunksize=chunksize
+        )
+
+
+# Create a singleton instance
+epub_import_service = EpubImportService()
@@ -0,0 +1,291 @@
+"""
+Precomputed public book feeds.
+
+The homepage and catalog feeds (featured, free, most favorited, most read
+and the newest books of each category) are built by a background thread,
+serialized once and stored in the feed_snapshots table. Public listings
+serve the stored JSON without touching the books tables; each process
+keeps the feeds it has read for FEED_CACHE_TTL seconds, so serving a feed
+usually costs no query at all.
+
+Feeds are rebuilt every FEED_REFRESH_INTERVAL seconds, and FEED_REFRESH_DELAY
+seconds after a commit that changes books, authors or categories in this
+process, through the ORM or bulk statements. Favorites and reading activity
+are user traffic, too frequent to rebuild on; they only show in the
+most-favorited and most-read feeds at the next periodic refresh.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session, load_only
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.crud.book import crud_book
+from app.models.author import Author
+from app.models.book import Book
+from app.models.category import Category
+from app.models.feed_snapshot import FeedSnapshot
+from app.schemas.book import BookWithDetails
+
+logger = logging.getLogger(__name__)
+
+FEEDS = ("featured", "free", "most_favorited", "most_read")
+CATEGORY_FEED = "category:"
+
+# Changes to these make the feeds stale
+_FEED_MODELS = (Book, Author, Category)
+
+
+@dataclass
+class Feed:
+    """A feed's books, each already serialized as JSON."""
+
+    items: List[str]
+    total: int
+    generated_at: datetime
+
+    @classmethod
+    def from_books(cls, books: List[Book], total: int) -> "Feed":
+        return cls(
+            items=[
+                BookWithDetails.model_validate(book).model_dump_json() for book in books
+            ],
+            total=total,
+            generated_at=datetime.now(timezone.utc),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: FeedSnapshot) -> "Feed":
+        generated_at = snapshot.generated_at
+        if generated_at.tzinfo is None:
+            # SQLite drops the time zone
+            generated_at = generated_at.replace(tzinfo=timezone.utc)
+        return cls(
+            items=[
+                json.dumps(item, separators=(",", ":"))
+                for item in json.loads(snapshot.payload)
+            ],
+            total=snapshot.total,
+            generated_at=generated_at,
+        )
+
+    def page(self, skip: int = 0, limit: int = 100) -> str:
+        """A JSON array of the books in [skip, skip + limit)."""
+        return "[" + ",".join(self.items[skip : skip + limit]) + "]"
+
+
+def category_feed(category_id: int) -> str:
+    return f"{CATEGORY_FEED}{category_id}"
+
+
+class FeedService:
+    """Build, store and serve the public feeds."""
+
+    def __init__(self):
+        self._feeds: Dict[str, Tuple[Feed, float]] = {}
+        self._lock = threading.Lock()
+        self._stale = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def build_feed(self, db: Session, name: str) -> Feed:
+        """Build one feed from the books tables."""
+        size = settings.FEED_SIZE
+        if name.startswith(CATEGORY_FEED):
+            category_id = int(name[len(CATEGORY_FEED) :])
+            if db.get(Category, category_id) is None:
+                raise KeyError(name)
+            books = crud_book.get_public_books_by_category(
+                db, category_id=category_id, limit=size
+            )
+            return Feed.from_books(
+                books, crud_book.count_by_category(db, category_id=category_id)
+            )
+        if name == "featured":
+            books = crud_book.get_featured_books(db, limit=size)
+            return Feed.from_books(books, len(books))
+        if name == "free":
+            books = crud_book.get_public_free_books(db, limit=size)
+            return Feed.from_books(books, crud_book.count_free_books(db))
+        if name == "most_favorited":
+            books = crud_book.get_most_favorited_books(db, limit=size)
+            return Feed.from_books(books, len(books))
+        if name == "most_read":
+            since = datetime.now(timezone.utc).date() - timedelta(
+                days=settings.FEED_MOST_READ_DAYS
+            )
+            books = crud_book.get_most_read_books(db, since=since, limit=size)
+            return Feed.from_books(books, len(books))
+        raise KeyError(name)
+
+    def build_all(self, db: Session) -> Dict[str, Feed]:
+        """Build every feed, the category feeds with a single query."""
+        feeds = {name: self.build_feed(db, name) for name in FEEDS}
+        newest = crud_book.get_newest_books_per_category(
+            db, per_category=settings.FEED_SIZE
+        )
+        for category_id, book_count in db.query(Category.id, Category.book_count):
+            feeds[category_feed(category_id)] = Feed.from_books(
+                newest.get(category_id, []), book_count or 0
+            )
+        return feeds
+
+    def refresh(self, db: Session) -> int:
+        """Rebuild and store every feed; returns the number of feeds."""
+        feeds = self.build_all(db)
+        snapshots = {
+            snapshot.name: snapshot
+            for snapshot in db.query(FeedSnapshot).options(load_only(FeedSnapshot.name))
+        }
+        for name, feed in feeds.items():
+            snapshot = snapshots.pop(name, None) or FeedSnapshot(name=name)
+            snapshot.payload = "[" + ",".join(feed.items) + "]"
+            snapshot.total = feed.total
+            snapshot.generated_at = feed.generated_at
+            db.add(snapshot)
+        # Feeds of deleted categories
+        for snapshot in snapshots.values():
+            if snapshot.name.startswith(CATEGORY_FEED):
+                db.delete(snapshot)
+        db.commit()
+
+        loaded = time.monotonic()
+        with self._lock:
+            self._feeds = {name: (feed, loaded) for name, feed in feeds.items()}
+        return len(feeds)
+
+    def get(self, db: Session, name: str) -> Feed:
+        """
+        The stored feed ``name``.
+
+        Built on the spot when feeds are disabled or it has not been stored
+        yet. Raises KeyError for unknown feeds and missing categories.
+        """
+        if not settings.FEEDS_ENABLED:
+            return self.build_feed(db, name)
+
+        with self._lock:
+            cached = self._feeds.get(name)
+        if (
+            cached is not None
+            and time.monotonic() - cached[1] < settings.FEED_CACHE_TTL
+        ):
+            return cached[0]
+
+        snapshot = db.get(FeedSnapshot, name)
+        feed = (
+            Feed.from_snapshot(snapshot)
+            if snapshot is not None
+            else self.build_feed(db, name)
+        )
+        with self._lock:
+            self._feeds[name] = (feed, time.monotonic())
+        return feed
+
+    def mark_stale(self) -> None:
+        """Rebuild the feeds soon."""
+        self._stale.set()
+
+    def start(self) -> None:
+        """Start the refresher thread and watch commits for feed changes."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        event.listen(Session, "after_flush", _note_changes)
+        event.listen(Session, "do_orm_execute", _note_statement)
+        event.listen(Session, "after_commit", _after_commit)
+        event.listen(Session, "after_rollback", _after_rollback)
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="feed-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._stale.set()
+        self._thread.join()
+        self._thread = None
+        event.remove(Session, "after_flush", _note_changes)
+        event.remove(Session, "do_orm_execute", _note_statement)
+        event.remove(Session, "after_commit", _after_commit)
+        event.remove(Session, "after_rollback", _after_rollback)
+
+    def _run(self) -> None:
+        force = False
+        while not self._stop.is_set():
+            self._refresh_quietly(force)
+            force = self._stale.wait(settings.FEED_REFRESH_INTERVAL)
+            if force:
+                # Let a burst of writes settle before rebuilding
+                self._stop.wait(settings.FEED_REFRESH_DELAY)
+                self._stale.clear()
+
+    def _refresh_quietly(self, force: bool) -> None:
+        # Runs right after writes: never reuse a read already in flight
+        db = SessionLocal(info={"coalesce": False})
+        try:
+            if not force:
+                # Another worker may have just refreshed the feeds
+                newest = db.query(func.max(FeedSnapshot.generated_at)).scalar()
+                if newest is not None:
+                    if newest.tzinfo is None:
+                        newest = newest.replace(tzinfo=timezone.utc)
+                    age = datetime.now(timezone.utc) - newest
+                    if age.total_seconds() < settings.FEED_REFRESH_INTERVAL / 2:
+                        return
+            started = time.perf_counter()
+            count = self.refresh(db)
+            logger.info(
+                "Refreshed %d feeds in %.0f ms",
+                count,
+                (time.perf_counter() - started) * 1000,
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error refreshing feeds: {str(e)}")
+        finally:
+            db.close()
+
+
+def _note_changes(session: Session, flush_context) -> None:
+    if any(
+        isinstance(obj, _FEED_MODELS)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info["feeds_stale"] = True
+
+
+def _note_statement(orm_execute_state) -> None:
+    # Bulk INSERT/UPDATE/DELETE statements bypass the flush
+    if (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, _FEED_MODELS):
+            orm_execute_state.session.info["feeds_stale"] = True
+
+
+def _after_commit(session: Session) -> None:
+    if session.info.pop("feeds_stale", False):
+        feed_service.mark_stale()
+
+
+def _after_rollback(session: Session) -> None:
+    session.info.pop("feeds_stale", None)
+
+
+# Create a singleton instance
+feed_service = FeedService()
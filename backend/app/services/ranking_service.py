@@ -0,0 +1,94 @@
+"""
+Background recomputation of the book rankings.
+
+Triggers keep book_stats counts and popularity scores current as favorites
+and reading progress are written; this service recomputes the parts that
+decay with time (active readers, trending scores) every
+RANKINGS_REFRESH_INTERVAL seconds.
+
+Every API worker starts the service, but only one of them ranks at a time:
+on PostgreSQL each run first takes a transaction-level advisory lock, held by
+a transaction that lasts as long as the run. A worker that finds the lock
+taken skips its run. The lock is released when that transaction ends or its
+connection drops, so it is safe behind a transaction pooler.
+"""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.crud.book import crud_book
+
+logger = logging.getLogger(__name__)
+
+# pg_try_advisory_xact_lock key shared by every worker running the ranking job
+RANKING_LOCK_KEY = 0x626F6F6B  # "book"
+
+
+class RankingService:
+    """Periodically rebuild book_stats."""
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ranking-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.rebuild()
+            self._stop.wait(settings.RANKINGS_REFRESH_INTERVAL)
+
+    def rebuild(self) -> None:
+        db = SessionLocal(info={"coalesce": False})
+        lock = None
+        try:
+            if engine.dialect.name == "postgresql":
+                # rebuild_book_stats commits in batches, so the lock lives in
+                # a transaction of its own that spans the whole run
+                lock = engine.connect()
+                acquired = lock.execute(
+                    text("SELECT pg_try_advisory_xact_lock(:key)"),
+                    {"key": RANKING_LOCK_KEY},
+                ).scalar()
+                if not acquired:
+                    logger.debug("Another worker is ranking books")
+                    return
+            started = time.perf_counter()
+            count = crud_book.rebuild_book_stats(db)
+            logger.info(
+                "Ranked %d books in %.0f ms",
+                count,
+                (time.perf_counter() - started) * 1000,
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error ranking books: {str(e)}")
+        finally:
+            if lock is not None:
+                # Rolls back the lock transaction, releasing the lock
+                lock.close()
+            db.close()
+
+
+# Create a singleton instance
+ranking_service = RankingService()
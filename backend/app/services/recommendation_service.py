@@ -0,0 +1,197 @@
+"""
+Offline item-to-item recommendations ("readers who liked this also liked").
+
+Favorites, reading list entries and completed books are read in bulk into a
+sparse user x book matrix, each interaction weighted by how strong a signal
+it is (weights of the same user and book add up). Two books are as similar
+as the cosine of their columns: the matrix columns are normalized once, and
+the similarities of a block of books to every other book are one sparse
+matrix product. Blocks are sized to RECOMMENDATIONS_BLOCK_CELLS scores, so
+memory stays bounded however many books there are, and the top
+RECOMMENDATIONS_TOP_K of each row are picked with vectorized partial sorts.
+
+The results replace the book_similarities table in one transaction; the
+/books/{id}/similar endpoints read them with a single index lookup. Run the
+job with scripts/build_recommendations.py. It needs the ``recommendations``
+extra (numpy and scipy).
+"""
+
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Iterator, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.book_similarity import BookSimilarity
+from app.models.favorite import Favorite
+from app.models.reading_list import ReadingList, ReadingListItem
+from app.models.reading_progress import ReadingProgress
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+logger = logging.getLogger(__name__)
+
+FAVORITE_WEIGHT = 2.0
+READING_LIST_WEIGHT = 1.0
+COMPLETION_WEIGHT = 3.0
+
+# Rows fetched from the database at a time
+_FETCH_SIZE = 50_000
+# Similarity rows written per INSERT batch
+_WRITE_SIZE = 10_000
+
+
+class RecommendationService:
+    """Build the book_similarities table from user interactions."""
+
+    def load_interactions(self, db: Session) -> Tuple["np.ndarray", ...]:
+        """All (user ids, book ids, weights) interactions as parallel arrays."""
+        self._require_numpy()
+        sources = (
+            (select(Favorite.user_id, Favorite.book_id), FAVORITE_WEIGHT),
+            (
+                select(ReadingList.user_id, ReadingListItem.book_id).join(
+                    ReadingList, ReadingList.id == ReadingListItem.reading_list_id
+                ),
+                READING_LIST_WEIGHT,
+            ),
+            (
+                select(ReadingProgress.user_id, ReadingProgress.book_id).where(
+                    ReadingProgress.is_completed == True
+                ),
+                COMPLETION_WEIGHT,
+            ),
+        )
+
+        pairs, weights = [], []
+        for statement, weight in sources:
+            result = db.execute(statement.execution_options(yield_per=_FETCH_SIZE))
+            for chunk in result.partitions():
+                chunk = np.array(chunk, dtype=np.int64).reshape(-1, 2)
+                pairs.append(chunk)
+                weights.append(np.full(len(chunk), weight, dtype=np.float32))
+
+        if not pairs:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float32)
+        pairs = np.concatenate(pairs)
+        return pairs[:, 0], pairs[:, 1], np.concatenate(weights)
+
+    def similar_books(
+        self,
+        user_ids: "np.ndarray",
+        book_ids: "np.ndarray",
+        weights: "np.ndarray",
+        *,
+        top_k: int,
+        block_cells: int,
+        min_score: float = 0.0,
+    ) -> Iterator[Tuple["np.ndarray", ...]]:
+        """
+        Yield (book ids, ranks, similar book ids, scores) arrays, block by block.
+
+        Each book gets up to ``top_k`` other books with a cosine similarity
+        above ``min_score``, ranked from 1; ties go to the lower book id.
+        """
+        self._require_numpy()
+        _, user_index = np.unique(user_ids, return_inverse=True)
+        books, book_index = np.unique(book_ids, return_inverse=True)
+        n_books = len(books)
+        k = min(top_k, n_books - 1)
+        if k <= 0:
+            return
+
+        # Duplicate (user, book) entries are summed
+        matrix = sparse.csr_matrix(
+            (weights, (user_index, book_index)),
+            shape=(int(user_index.max()) + 1, n_books),
+            dtype=np.float32,
+        )
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=0)).ravel())
+        matrix = (matrix @ sparse.diags(1 / norms)).tocsr()
+        by_book = matrix.T.tocsr()
+
+        block_size = max(1, block_cells // n_books)
+        for start in range(0, n_books, block_size):
+            stop = min(start + block_size, n_books)
+            scores = (by_book[start:stop] @ matrix).toarray()
+            rows = np.arange(stop - start)
+            scores[rows, rows + start] = 0  # a book is not its own neighbour
+
+            # Best k per row, then sorted by score (lower book id on ties)
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.lexsort((top, -top_scores), axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            keep = top_scores > min_score
+            ranks = np.broadcast_to(np.arange(1, k + 1), top.shape)
+            yield (
+                np.repeat(books[start:stop], k).reshape(-1, k)[keep],
+                ranks[keep],
+                books[top][keep],
+                top_scores[keep],
+            )
+
+    def build(self, db: Session) -> int:
+        """Recompute book_similarities; returns the number of rows written."""
+        started = time.perf_counter()
+        user_ids, book_ids, weights = self.load_interactions(db)
+        loaded = time.perf_counter()
+
+        generated_at = datetime.now(timezone.utc)
+        written = 0
+        db.execute(delete(BookSimilarity))
+        for block in self.similar_books(
+            user_ids,
+            book_ids,
+            weights,
+            top_k=settings.RECOMMENDATIONS_TOP_K,
+            block_cells=settings.RECOMMENDATIONS_BLOCK_CELLS,
+            min_score=settings.RECOMMENDATIONS_MIN_SCORE,
+        ):
+            rows = [
+                {
+                    "book_id": book_id,
+                    "rank": rank,
+                    "similar_book_id": similar_book_id,
+                    "score": round(score, 6),
+                    "generated_at": generated_at,
+                }
+                for book_id, rank, similar_book_id, score in zip(
+                    *(column.tolist() for column in block)
+                )
+            ]
+            for offset in range(0, len(rows), _WRITE_SIZE):
+                db.execute(insert(BookSimilarity), rows[offset : offset + _WRITE_SIZE])
+            written += len(rows)
+        db.commit()
+
+        logger.info(
+            "Built %d book similarities from %d interactions "
+            "(loaded in %.1f s, total %.1f s)",
+            written,
+            len(user_ids),
+            loaded - started,
+            time.perf_counter() - started,
+        )
+        return written
+
+    def _require_numpy(self) -> None:
+        if np is None:
+            raise RuntimeError(
+                "Recommendations need numpy and scipy; install the "
+                "'recommendations' extra"
+            )
+
+
+# Create a singleton instance
+recommendation_service = RecommendationService()
@@ -32,7 +32,7 @@ class TokenService:
 
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
-        logger.info(f"Created password reset token for email: {email}")
+        logger.info("Created password reset token for email: %s", email)
         return encoded_jwt
 
     def verify_password_reset_token(self, token: str) -> Optional[str]:
@@ -50,19 +50,19 @@ class TokenService:
             # Check if token is expired (jose already handles this, but let's be explicit)
             exp = payload.get("exp")
             if exp and datetime.utcnow().timestamp() > exp:
-                logger.warning(f"Expired token for email: {email}")
+                logger.warning("Expired token for email: %s", email)
                 return None
 
             logger.info(
-                f"Successfully verified password reset token for email: {email}"
+                "Successfully verified password reset token for email: %s", email
             )
             return email
 
         except JWTError as e:
-            logger.error(f"JWT error while verifying token: {str(e)}")
+            logger.error("JWT error while verifying token: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error while verifying token: {str(e)}")
+            logger.error("Unexpected error while verifying token: %s", e)
             return None
 
     def create_verification_token(self, email: str) -> str:
@@ -80,7 +80,7 @@ class TokenService:
 
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
-        logger.info(f"Created email verification token for email: {email}")
+        logger.info("Created email verification token for email: %s", email)
         return encoded_jwt
 
     def verify_verification_token(self, token: str) -> Optional[str]:
@@ -96,17 +96,15 @@ class TokenService:
                 return None
 
             logger.info(
-                f"Successfully verified email verification token for email: {email}"
+                "Successfully verified email verification token for email: %s", email
             )
             return email
 
         except JWTError as e:
-            logger.error(f"JWT error while verifying verification token: {str(e)}")
+            logger.error("JWT error while verifying verification token: %s", e)
             return None
         except Exception as e:
-            logger.error(
-                f"Unexpected error while verifying verification token: {str(e)}"
-            )
+            logger.error("Unexpected error while verifying verification token: %s", e)
             return None
 
     def generate_secure_token(self, length: int = 32) -> str:
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Build Recommendations Script
+
+This script rebuilds the book_similarities table behind the
+/books/{id}/similar endpoints ("readers who liked this also liked") from
+favorites, reading list entries and completed books. Schedule it (e.g.
+nightly); it needs the 'recommendations' extra (numpy, scipy).
+
+Usage:
+    python scripts/build_recommendations.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.services.recommendation_service import recommendation_service
+
+
+def build_recommendations():
+    """Recompute the similar books of every book."""
+    print("🤝 Building Recommendations")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print(f"Similar books per book: {settings.RECOMMENDATIONS_TOP_K}")
+    print()
+
+    db = SessionLocal()
+    try:
+        written = recommendation_service.build(db)
+        print(f"✅ Wrote {written} book similarities")
+        return True
+    except RuntimeError as e:
+        print(f"❌ {str(e)}")
+        return False
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+
+    if build_recommendations():
+        sys.exit(0)
+    print(f"\n❌ Recommendation build failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
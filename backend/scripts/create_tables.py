@@ -29,9 +29,19 @@ from app.models.user import User
 from app.models.author import Author
 from app.models.category import Category
 from app.models.book import Book
-from app.models.chapter import Chapter
+from app.models.book_stats import BookStats
+from app.models.book_similarity import BookSimilarity
+from app.models.chapter import Chapter, ChapterContent
 from app.models.favorite import Favorite
+from app.models.import_job import ImportJob
+from app.models.feed_snapshot import FeedSnapshot
 from app.models.reading_progress import ReadingProgress
+from app.models.user_reading_stats import UserReadingStats
+from app.models.reading_session import (
+    BookReadingRollup,
+    ReadingSession,
+    UserReadingRollup,
+)
 from app.models.reading_list import ReadingList, ReadingListItem
 
 def create_all_tables():
@@ -0,0 +1,869 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator
+
+This script fills an empty database with a large, realistically skewed
+dataset for load tests and benchmarks:
+- Book popularity follows a power law: a few books collect most favorites,
+  reading progress and reading-list entries; authors and categories too
+- Per-user activity, chapters per book and chapter lengths are log-normal
+- The same --seed and scale always produce the same rows, whatever the
+  number of workers (only the password hash salt differs between runs)
+
+Rows are generated in fixed-size chunks by a pool of worker processes. On
+Postgres each worker streams its chunks with COPY over its own connection;
+on SQLite the workers only generate and the main process writes with
+executemany. The triggers maintaining reading stats and book stats are
+dropped while loading, so concurrent workers do not contend on the rows of
+popular books; sequences, book counters and both stats tables are rebuilt
+in one pass at the end, followed by the feed snapshots and (with numpy and
+scipy installed) the book recommendations. Every user's password is
+--password; user 1 is an admin.
+
+Usage:
+    python scripts/generate_dataset.py --scale small
+    python scripts/generate_dataset.py --scale large --workers 8 --seed 7
+    python scripts/generate_dataset.py --database-url sqlite:///bench.db \
+        --create-tables --books 5000
+"""
+
+import argparse
+import csv
+import io
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+# Import settings and models
+from app.core import compression
+from app.core.auth import get_password_hash
+from app.core.database import Base
+from app.core.settings import settings
+from app.crud.book import crud_book
+from app.crud.reading_progress import crud_reading_progress
+from app.models import *  # noqa: F401,F403 - registers every table
+from app.models.chapter import encode_chapter_text
+from app.models.book_stats import (
+    POSTGRES_BOOK_STATS_TRIGGERS,
+    SQLITE_BOOK_STATS_TRIGGER_NAMES,
+    SQLITE_BOOK_STATS_TRIGGERS,
+)
+from app.models.chapter_search import index_chapters
+from app.models.user_reading_stats import POSTGRES_STATS_TRIGGER, SQLITE_STATS_TRIGGERS
+from app.services.feed_service import feed_service
+from app.services.recommendation_service import recommendation_service
+
+# Row counts and distribution parameters per scale. Per-user and per-book
+# values are means of log-normal distributions.
+SCALES = {
+    "tiny": {
+        "users": 200,
+        "authors": 40,
+        "categories": 12,
+        "books": 1_000,
+        "chaptered_books": 0.5,
+        "chapters_per_book": 8,
+        "chapter_words": 600,
+        "favorites_per_user": 6,
+        "progress_per_user": 4,
+        "reading_lists": 100,
+        "items_per_list": 8,
+    },
+    "small": {
+        "users": 5_000,
+        "authors": 500,
+        "categories": 30,
+        "books": 20_000,
+        "chaptered_books": 0.25,
+        "chapters_per_book": 12,
+        "chapter_words": 1_500,
+        "favorites_per_user": 10,
+        "progress_per_user": 6,
+        "reading_lists": 2_000,
+        "items_per_list": 12,
+    },
+    "medium": {
+        "users": 100_000,
+        "authors": 10_000,
+        "categories": 60,
+        "books": 500_000,
+        "chaptered_books": 0.05,
+        "chapters_per_book": 20,
+        "chapter_words": 2_500,
+        "favorites_per_user": 15,
+        "progress_per_user": 10,
+        "reading_lists": 40_000,
+        "items_per_list": 15,
+    },
+    "large": {
+        "users": 1_000_000,
+        "authors": 50_000,
+        "categories": 100,
+        "books": 2_000_000,
+        "chaptered_books": 0.02,
+        "chapters_per_book": 25,
+        "chapter_words": 3_000,
+        "favorites_per_user": 20,
+        "progress_per_user": 12,
+        "reading_lists": 300_000,
+        "items_per_list": 20,
+    },
+}
+
+# Power-law exponent for popularity: with 3.0 the top 1% of books receive
+# about a fifth of all favorites and progress rows
+DEFAULT_SKEW = 3.0
+
+# Timestamps are spread over a fixed window so datasets are reproducible
+EPOCH = datetime(2023, 1, 1, tzinfo=timezone.utc)
+SPAN_DAYS = 730
+
+FIRST_NAMES = (
+    "Ada Alan Amara Ben Carla Chen Dara Elena Farid Grace Hana Ivan Jonas Kemal "
+    "Lena Malik Nadia Omar Priya Quinn Rosa Sami Tara Uma Victor Wen Yara Zoe"
+).split()
+LAST_NAMES = (
+    "Abbott Baker Castillo Dubois Eriksen Fischer Garcia Haddad Ito Jensen Kowalski "
+    "Lindqvist Moreau Nguyen Okafor Petrov Quispe Rossi Sato Tanaka Usman Varga "
+    "Weber Xu Yilmaz Zhou"
+).split()
+NATIONALITIES = (
+    "American British Vietnamese French Japanese Nigerian Brazilian German "
+    "Indian Korean Mexican Swedish"
+).split()
+GENRES = (
+    "Fantasy;Science Fiction;Mystery;Thriller;Romance;Horror;Historical Fiction;"
+    "Biography;Poetry;Adventure;Young Adult;Classics;Philosophy;Travel;Humor;"
+    "Cooking;Science;History;Self Help;Graphic Novel"
+).split(";")
+TITLE_WORDS = (
+    "Silent Crimson Hidden Last Broken Golden Distant Forgotten Burning Hollow "
+    "River Crown Garden Shadow Empire Lantern Harbor Winter Mirror Storm Road "
+    "Kingdom Orchard Tide Ember Archive Compass Citadel"
+).split()
+VOCABULARY = (
+    "the a and of to in was it he she they that with for on at by from her his "
+    "their as but not had were said would could into over after before under "
+    "again night morning light dark road city river forest mountain sea ship "
+    "door window house street market letter voice silence memory dream storm "
+    "rain wind fire stone glass iron gold silver blood shadow secret promise "
+    "journey stranger friend enemy king queen soldier captain merchant scholar "
+    "child mother father brother sister dragon wyvern sword lantern map tower "
+    "bridge garden library archive whispered walked turned watched waited "
+    "remembered answered believed followed carried opened closed slowly quietly "
+    "suddenly finally never always almost perhaps beneath beyond across toward"
+).split()
+
+# Column order of the generated rows; ids are assigned here for tables that
+# other tables reference, and by the database for the rest
+COLUMNS = {
+    "users": (
+        "id",
+        "email",
+        "username",
+        "full_name",
+        "hashed_password",
+        "is_active",
+        "is_admin",
+        "created_at",
+    ),
+    "authors": ("id", "name", "nationality", "created_at"),
+    "categories": ("id", "name", "slug", "description", "is_active", "created_at"),
+    "books": (
+        "id",
+        "title",
+        "isbn",
+        "description",
+        "publication_date",
+        "pages",
+        "language",
+        "price",
+        "is_free",
+        "is_active",
+        "author_id",
+        "category_id",
+        "created_at",
+    ),
+    "chapters": (
+        "id",
+        "book_id",
+        "chapter_number",
+        "title",
+        "is_published",
+        "is_active",
+        "content_size",
+        "content_hash",
+        "created_at",
+    ),
+    "chapter_contents": (
+        "chapter_id",
+        "encoding",
+        "body",
+        "compressed_body",
+        "gzip_body",
+        "brotli_body",
+        "updated_at",
+    ),
+    "reading_lists": (
+        "id",
+        "name",
+        "description",
+        "is_public",
+        "is_active",
+        "user_id",
+        "created_at",
+    ),
+    "favorites": ("user_id", "book_id", "created_at"),
+    "reading_progress": (
+        "user_id",
+        "book_id",
+        "current_page",
+        "total_pages",
+        "progress_percentage",
+        "reading_time_minutes",
+        "status",
+        "is_completed",
+        "started_at",
+        "completed_at",
+        "last_read_at",
+        "created_at",
+    ),
+    "reading_list_items": ("reading_list_id", "book_id", "order_index", "created_at"),
+}
+
+# Tables whose ids are generated here and whose sequences need resetting
+EXPLICIT_ID_TABLES = (
+    "users",
+    "authors",
+    "categories",
+    "books",
+    "chapters",
+    "reading_lists",
+)
+
+# Generation stages; tables within a stage only reference earlier stages and
+# are generated concurrently
+STAGES = (
+    ("users", "authors", "categories"),
+    ("books",),
+    ("chapters", "reading_lists", "favorites", "reading_progress"),
+    ("reading_list_items",),
+)
+
+# Parent rows per chunk; the chunking, not the worker count, fixes the output
+CHUNK_SIZE = 2_000
+
+
+# ============================================================================
+# Distributions
+# ============================================================================
+
+
+def _rng(params, table, start):
+    """Random generator for one chunk, seeded independently of scheduling."""
+    return random.Random(f"{params['seed']}:{table}:{start}")
+
+
+def _coprime_stride(count):
+    """A stride that permutes 1..count, so popularity is not tied to id order."""
+    stride = 2654435761 % count or 1
+    while math.gcd(stride, count) != 1:
+        stride += 1
+    return stride
+
+
+def _skewed_id(rng, params, table):
+    """Pick an id of table with power-law popularity."""
+    count = params[table]
+    rank = int(count * rng.random() ** params["skew"])
+    return (rank * params["strides"][table]) % count + 1
+
+
+def _lognormal_count(rng, mean, cap, sigma=1.0):
+    """A log-normal count with the given mean, capped."""
+    if mean <= 0:
+        return 0
+    value = rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+    return min(int(value + 0.5), cap)
+
+
+def _timestamp(rng, fraction):
+    """A timestamp at fraction (0-1) of the dataset's time window."""
+    return EPOCH + timedelta(
+        days=SPAN_DAYS * min(fraction, 1.0), seconds=rng.randint(0, 86_399)
+    )
+
+
+def _distinct_ids(rng, params, table, count):
+    """Up to count distinct popularity-skewed ids of table."""
+    count = min(count, params[table])
+    picked = {}
+    for _ in range(count * 4):
+        if len(picked) == count:
+            break
+        picked.setdefault(_skewed_id(rng, params, table), None)
+    return list(picked)
+
+
+def _chapter_counts(params, start, end):
+    """Chapters of each book in [start, end); shared by the planner and workers."""
+    rng = _rng(params, "chapter_counts", start)
+    counts = []
+    for _ in range(start, end):
+        if rng.random() < params["chaptered_books"]:
+            counts.append(
+                max(1, _lognormal_count(rng, params["chapters_per_book"], 400))
+            )
+        else:
+            counts.append(0)
+    return counts
+
+
+def _chapter_body(rng, words):
+    paragraphs = []
+    while words > 0:
+        length = min(words, rng.randint(40, 160))
+        sentence = " ".join(rng.choices(VOCABULARY, k=length))
+        paragraphs.append(sentence[0].upper() + sentence[1:] + ".")
+        words -= length
+    return "\n\n".join(paragraphs)
+
+
+# ============================================================================
+# Row generators: (params, start, end, first_id) -> ({table: rows}, documents)
+# ============================================================================
+
+
+def _generate_users(params, start, end, first_id):
+    rng = _rng(params, "users", start)
+    rows = []
+    for id in range(start, end):
+        first = FIRST_NAMES[id % len(FIRST_NAMES)]
+        last = rng.choice(LAST_NAMES)
+        rows.append(
+            (
+                id,
+                f"user{id}@example.com",
+                "admin" if id == 1 else f"user{id}",
+                f"{first} {last}",
+                params["password_hash"],
+                id == 1 or rng.random() > 0.02,
+                id == 1,
+                _timestamp(rng, id / params["users"]),
+            )
+        )
+    return {"users": rows}, []
+
+
+def _generate_authors(params, start, end, first_id):
+    rng = _rng(params, "authors", start)
+    combinations = len(FIRST_NAMES) * len(LAST_NAMES)
+    rows = []
+    for id in range(start, end):
+        index = id - 1
+        name = (
+            f"{FIRST_NAMES[index % len(FIRST_NAMES)]} "
+            f"{LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]}"
+        )
+        if index >= combinations:
+            name += f" {index // combinations + 1}"
+        rows.append((id, name, rng.choice(NATIONALITIES), _timestamp(rng, 0)))
+    return {"authors": rows}, []
+
+
+def _generate_categories(params, start, end, first_id):
+    rng = _rng(params, "categories", start)
+    rows = []
+    for id in range(start, end):
+        index = id - 1
+        name = GENRES[index % len(GENRES)]
+        if index >= len(GENRES):
+            name += f" {index // len(GENRES) + 1}"
+        slug = name.lower().replace(" ", "-")
+        rows.append(
+            (id, name, slug, f"{name} books", rng.random() > 0.05, _timestamp(rng, 0))
+        )
+    return {"categories": rows}, []
+
+
+def _generate_books(params, start, end, first_id):
+    rng = _rng(params, "books", start)
+    rows = []
+    for id in range(start, end):
+        is_free = rng.random() < 0.2
+        rows.append(
+            (
+                id,
+                f"The {rng.choice(TITLE_WORDS)} {rng.choice(TITLE_WORDS)}",
+                f"978{id:010d}",
+                " ".join(rng.choices(VOCABULARY, k=rng.randint(20, 60))),
+                date(1950, 1, 1) + timedelta(days=rng.randint(0, 27_000)),
+                _lognormal_count(rng, 320, 2_000, sigma=0.5) or 1,
+                rng.choices(
+                    ("English", "Vietnamese", "French", "Spanish"), (70, 15, 8, 7)
+                )[0],
+                None if is_free else round(rng.uniform(1.99, 29.99), 2),
+                is_free,
+                rng.random() > 0.05,
+                _skewed_id(rng, params, "authors"),
+                _skewed_id(rng, params, "categories"),
+                _timestamp(rng, id / params["books"]),
+            )
+        )
+    return {"books": rows}, []
+
+
+def _generate_chapters(params, start, end, first_id):
+    rng = _rng(params, "chapters", start)
+    chapters, contents, documents = [], [], []
+    id = first_id
+    for book_id, count in zip(range(start, end), _chapter_counts(params, start, end)):
+        created_at = _timestamp(rng, book_id / params["books"])
+        for number in range(1, count + 1):
+            title = (
+                f"Chapter {number}: {rng.choice(TITLE_WORDS)} {rng.choice(TITLE_WORDS)}"
+            )
+            words = (
+                _lognormal_count(rng, params["chapter_words"], 50_000, sigma=0.6) or 1
+            )
+            body = _chapter_body(rng, words)
+            size, digest = compression.text_digest(body)
+            storage = encode_chapter_text(body)
+            written_at = created_at + timedelta(days=number)
+            chapters.append(
+                (
+                    id,
+                    book_id,
+                    number,
+                    title,
+                    rng.random() > 0.1,
+                    True,
+                    size,
+                    digest,
+                    written_at,
+                )
+            )
+            contents.append(
+                (
+                    id,
+                    *(storage[column] for column in COLUMNS["chapter_contents"][1:-1]),
+                    written_at,
+                )
+            )
+            documents.append(
+                {"id": id, "book_id": book_id, "title": title, "body": body}
+            )
+            id += 1
+    return {"chapters": chapters, "chapter_contents": contents}, documents
+
+
+def _generate_reading_lists(params, start, end, first_id):
+    rng = _rng(params, "reading_lists", start)
+    rows = []
+    for id in range(start, end):
+        rows.append(
+            (
+                id,
+                f"{rng.choice(TITLE_WORDS)} reads",
+                None,
+                rng.random() < 0.3,
+                True,
+                _skewed_id(rng, params, "users"),
+                _timestamp(rng, id / params["reading_lists"]),
+            )
+        )
+    return {"reading_lists": rows}, []
+
+
+def _generate_favorites(params, start, end, first_id):
+    rng = _rng(params, "favorites", start)
+    cap = max(1, min(500, params["books"] // 10))
+    rows = []
+    for user_id in range(start, end):
+        count = _lognormal_count(rng, params["favorites_per_user"], cap)
+        for book_id in _distinct_ids(rng, params, "books", count):
+            rows.append((user_id, book_id, _timestamp(rng, rng.random())))
+    return {"favorites": rows}, []
+
+
+def _generate_reading_progress(params, start, end, first_id):
+    rng = _rng(params, "reading_progress", start)
+    cap = max(1, min(300, params["books"] // 10))
+    statuses = ("reading", "completed", "not_started", "dropped")
+    rows = []
+    for user_id in range(start, end):
+        count = _lognormal_count(rng, params["progress_per_user"], cap)
+        for book_id in _distinct_ids(rng, params, "books", count):
+            status = rng.choices(statuses, (45, 30, 15, 10))[0]
+            total_pages = rng.randint(80, 800)
+            current_page = {
+                "completed": total_pages,
+                "not_started": 0,
+            }.get(status, rng.randint(1, total_pages - 1))
+            started_at = _timestamp(rng, rng.random())
+            last_read_at = started_at + timedelta(days=rng.randint(0, 120))
+            rows.append(
+                (
+                    user_id,
+                    book_id,
+                    current_page,
+                    total_pages,
+                    round(current_page / total_pages * 100, 2),
+                    int(current_page * rng.uniform(1.0, 3.0)),
+                    status,
+                    status == "completed",
+                    None if status == "not_started" else started_at,
+                    last_read_at if status == "completed" else None,
+                    None if status == "not_started" else last_read_at,
+                    started_at,
+                )
+            )
+    return {"reading_progress": rows}, []
+
+
+def _generate_reading_list_items(params, start, end, first_id):
+    rng = _rng(params, "reading_list_items", start)
+    cap = max(1, min(200, params["books"] // 10))
+    rows = []
+    for list_id in range(start, end):
+        count = _lognormal_count(rng, params["items_per_list"], cap)
+        for order, book_id in enumerate(_distinct_ids(rng, params, "books", count)):
+            rows.append((list_id, book_id, order, _timestamp(rng, rng.random())))
+    return {"reading_list_items": rows}, []
+
+
+GENERATORS = {
+    "users": _generate_users,
+    "authors": _generate_authors,
+    "categories": _generate_categories,
+    "books": _generate_books,
+    "chapters": _generate_chapters,
+    "reading_lists": _generate_reading_lists,
+    "favorites": _generate_favorites,
+    "reading_progress": _generate_reading_progress,
+    "reading_list_items": _generate_reading_list_items,
+}
+
+# Table whose id range each generator's chunks cover
+PARENT_TABLES = {
+    "chapters": "books",
+    "favorites": "users",
+    "reading_progress": "users",
+    "reading_list_items": "reading_lists",
+}
+
+
+# ============================================================================
+# Writing
+# ============================================================================
+
+_worker_engine = None
+
+
+def _init_worker(database_url):
+    """Give each Postgres worker its own engine; SQLite workers only generate."""
+    global _worker_engine
+    if database_url.startswith("postgresql"):
+        _worker_engine = create_engine(database_url, pool_size=1, max_overflow=0)
+
+
+def _copy_value(value):
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _copy_rows(connection, table, rows):
+    """Stream rows into a Postgres table with COPY ... FROM STDIN (CSV)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_copy_value(value) for value in row])
+    buffer.seek(0)
+    cursor = connection.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(COLUMNS[table])}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _insert_rows(connection, table, rows):
+    """Write rows with one executemany INSERT."""
+    if rows:
+        connection.execute(
+            Base.metadata.tables[table].insert(),
+            [dict(zip(COLUMNS[table], row)) for row in rows],
+        )
+
+
+def _run_chunk(task):
+    """Generate one chunk; on Postgres also write it and return only counts."""
+    table, start, end, first_id, params = task
+    tables, documents = GENERATORS[table](params, start, end, first_id)
+    counts = {name: len(rows) for name, rows in tables.items()}
+    if _worker_engine is None:
+        return counts, tables, documents
+
+    with _worker_engine.begin() as connection:
+        for name, rows in tables.items():
+            if rows:
+                _copy_rows(connection, name, rows)
+        index_chapters(connection, documents)
+    return counts, None, None
+
+
+def _plan(params, table, chunk_size):
+    """Split a table's parent id range into chunk tasks."""
+    total = params[PARENT_TABLES.get(table, table)]
+    chunk_size = max(1, chunk_size // 10) if table == "chapters" else chunk_size
+    tasks = []
+    first_id = 1
+    for start in range(1, total + 1, chunk_size):
+        end = min(start + chunk_size, total + 1)
+        tasks.append((table, start, end, first_id, params))
+        if table == "chapters":
+            first_id += sum(_chapter_counts(params, start, end))
+    return tasks
+
+
+def _drop_stats_triggers(engine):
+    """Drop the per-row stats triggers; _finish rebuilds the stats tables."""
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            triggers = [("reading_progress_stats", "reading_progress")] + [
+                (name, table) for _, name, table in POSTGRES_BOOK_STATS_TRIGGERS
+            ]
+            for name, table in triggers:
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {name} ON {table}"))
+        else:
+            names = [
+                f"reading_progress_stats_{action}"
+                for action in ("insert", "update", "delete")
+            ] + SQLITE_BOOK_STATS_TRIGGER_NAMES
+            for name in names:
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+
+
+def _create_stats_triggers(engine):
+    """Reinstall the triggers dropped by _drop_stats_triggers."""
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            statements = [POSTGRES_STATS_TRIGGER] + [
+                trigger for trigger, _, _ in POSTGRES_BOOK_STATS_TRIGGERS
+            ]
+        else:
+            statements = SQLITE_STATS_TRIGGERS + SQLITE_BOOK_STATS_TRIGGERS
+        for statement in statements:
+            connection.execute(text(statement))
+
+
+def _finish(engine):
+    """Reset sequences and rebuild the derived tables after loading."""
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            for table in EXPLICIT_ID_TABLES:
+                connection.execute(
+                    text(
+                        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                        f"COALESCE(MAX(id), 1)) FROM {table}"
+                    )
+                )
+
+    db = Session(bind=engine)
+    try:
+        crud_book.rebuild_book_counts(db)
+        crud_reading_progress.rebuild_user_stats(db)
+        crud_book.rebuild_book_stats(db)
+        db.commit()
+        feed_service.refresh(db)
+        try:
+            recommendation_service.build(db)
+        except RuntimeError as e:
+            print(f"⚠️  Skipped recommendations: {str(e)}")
+    finally:
+        db.close()
+
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as connection:
+            connection.execute(text("ANALYZE"))
+
+
+def build_params(
+    scale="small", seed=42, skew=DEFAULT_SKEW, password="password123", **overrides
+):
+    """Resolve a scale preset, overrides and seed into generator parameters."""
+    params = dict(SCALES[scale])
+    params.update({key: value for key, value in overrides.items() if value is not None})
+    params["seed"] = seed
+    params["skew"] = skew
+    params["password_hash"] = get_password_hash(password)
+    params["strides"] = {
+        table: _coprime_stride(params[table])
+        for table in ("users", "authors", "categories", "books", "reading_lists")
+    }
+    return params
+
+
+def generate_dataset(
+    database_url, params, *, workers=None, chunk_size=CHUNK_SIZE, create_tables=False
+):
+    """
+    Generate a dataset into an empty database.
+
+    Returns the number of rows written per table.
+    """
+    engine = create_engine(database_url)
+    if create_tables:
+        Base.metadata.create_all(bind=engine)
+    with engine.connect() as connection:
+        existing = connection.execute(text("SELECT COUNT(*) FROM users")).scalar()
+    if existing:
+        raise RuntimeError(
+            "The database already has data; run scripts/truncate_data.py first"
+        )
+
+    workers = workers or os.cpu_count() or 1
+    totals = {}
+    executor = (
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(database_url,)
+        )
+        if workers > 1
+        else None
+    )
+    if executor is None:
+        _init_worker(database_url)
+
+    _drop_stats_triggers(engine)
+    try:
+        for stage in STAGES:
+            tasks = [
+                task for table in stage for task in _plan(params, table, chunk_size)
+            ]
+            results = (
+                executor.map(_run_chunk, tasks) if executor else map(_run_chunk, tasks)
+            )
+            for counts, tables, documents in results:
+                for name, count in counts.items():
+                    totals[name] = totals.get(name, 0) + count
+                if tables is None:
+                    continue
+                # SQLite: a single writer, in chunk order
+                with engine.begin() as connection:
+                    for name, rows in tables.items():
+                        _insert_rows(connection, name, rows)
+                    index_chapters(connection, documents)
+    finally:
+        if executor:
+            executor.shutdown()
+        global _worker_engine
+        _worker_engine = None
+        _create_stats_triggers(engine)
+
+    _finish(engine)
+    engine.dispose()
+    return totals
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=settings.DATABASE_URL,
+        help="Target database (default: DATABASE_URL)",
+    )
+    parser.add_argument(
+        "--scale", choices=sorted(SCALES), default="small", help="Row count preset"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Random seed; the same seed gives the same data",
+    )
+    parser.add_argument(
+        "--skew", type=float, default=DEFAULT_SKEW, help="Popularity power-law exponent"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=CHUNK_SIZE, help="Parent rows per chunk"
+    )
+    parser.add_argument(
+        "--password", default="password123", help="Password of every generated user"
+    )
+    parser.add_argument(
+        "--create-tables",
+        action="store_true",
+        help="Create the schema first (fresh SQLite files)",
+    )
+    for name in ("users", "authors", "categories", "books", "reading_lists"):
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=int,
+            help=f"Override the number of {name.replace('_', ' ')}",
+        )
+    args = parser.parse_args()
+
+    params = build_params(
+        args.scale,
+        seed=args.seed,
+        skew=args.skew,
+        password=args.password,
+        users=args.users,
+        authors=args.authors,
+        categories=args.categories,
+        books=args.books,
+        reading_lists=args.reading_lists,
+    )
+
+    print("🧪 Generating Synthetic Dataset")
+    print("=" * 40)
+    print(f"Database: {args.database_url[:50]}...")
+    print(f"Scale: {args.scale} (seed {args.seed}, skew {args.skew})")
+    print()
+
+    started = time.perf_counter()
+    try:
+        totals = generate_dataset(
+            args.database_url,
+            params,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            create_tables=args.create_tables,
+        )
+    except Exception as e:
+        print(f"❌ Generation failed: {str(e)}")
+        sys.exit(1)
+
+    elapsed = time.perf_counter() - started
+    for table, count in totals.items():
+        print(f"  ✅ {table}: {count:,} rows")
+    rows = sum(totals.values())
+    print(f"\n🎉 Wrote {rows:,} rows in {elapsed:.1f}s ({rows / elapsed:,.0f} rows/s)")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Rebuild Book Counts Script
+
+This script recomputes the book_count and active_book_count counter caches
+on authors and categories from the books table. CRUDBook keeps them current;
+run this after importing or editing books outside the API.
+
+Usage:
+    python scripts/rebuild_book_counts.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.crud.book import crud_book
+
+
+def rebuild_book_counts():
+    """Rebuild the author and category book counters."""
+    print("🔢 Rebuilding Book Counts")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print()
+
+    db = SessionLocal()
+    try:
+        crud_book.rebuild_book_counts(db)
+        print("✅ Author and category book counts rebuilt")
+        return True
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    if rebuild_book_counts():
+        sys.exit(0)
+    print(f"\n❌ Book count rebuild failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rebuild Book Stats Script
+
+This script recomputes the book_stats ranking table from favorites and
+reading_progress: counts, popularity and trending scores, and active
+readers. Database triggers keep the counts current and the ranking service
+refreshes the rest in the background; run this to backfill the table, to
+repair drift, or in development where the ranking service is off.
+
+Usage:
+    python scripts/rebuild_book_stats.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.crud.book import crud_book
+
+
+def rebuild_book_stats():
+    """Rebuild the ranking stats of every book."""
+    print("🏆 Rebuilding Book Stats")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print(f"Trending half-life: {settings.TRENDING_HALF_LIFE_DAYS} days")
+    print()
+
+    db = SessionLocal()
+    try:
+        rebuilt = crud_book.rebuild_book_stats(db)
+        print(f"✅ Rebuilt stats for {rebuilt} books")
+        return True
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+
+    if rebuild_book_stats():
+        sys.exit(0)
+    print(f"\n❌ Book stats rebuild failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
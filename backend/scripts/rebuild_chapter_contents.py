@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Rebuild Chapter Contents Script
+
+This script re-encodes every stored chapter body with the current
+CHAPTER_CONTENT_COMPRESSION setting and rebuilds the pre-compressed
+gzip/brotli variants served by the chapter text endpoints. Run it after
+changing those settings or after migrating existing chapters.
+
+Usage:
+    python scripts/rebuild_chapter_contents.py [--batch-size N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.crud.chapter import crud_chapter
+
+
+def rebuild_chapter_contents(batch_size: int):
+    """Re-encode all chapter bodies."""
+    print("🗜️  Rebuilding Chapter Contents")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print(f"Compression: {settings.CHAPTER_CONTENT_COMPRESSION}")
+    print(f"Variants: {', '.join(settings.CHAPTER_CONTENT_VARIANTS)}")
+    print()
+
+    db = SessionLocal()
+    try:
+        written = crud_chapter.rebuild_contents(db, batch_size=batch_size)
+        print(f"✅ Re-encoded {written} chapter bodies")
+        return True
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500, help="Bodies per commit")
+    args = parser.parse_args()
+
+    if rebuild_chapter_contents(args.batch_size):
+        sys.exit(0)
+    print(f"\n❌ Chapter content rebuild failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rebuild Chapter Search Script
+
+This script rebuilds the chapter_search full-text index from chapters and
+their bodies. The index is kept current on every chapter write through the
+ORM; run this after importing or editing chapters with raw SQL.
+
+Usage:
+    python scripts/rebuild_chapter_search.py [--batch-size N]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.crud.chapter import crud_chapter
+
+
+def rebuild_chapter_search(batch_size: int):
+    """Rebuild the chapter full-text index."""
+    print("🔎 Rebuilding Chapter Search Index")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print()
+
+    db = SessionLocal()
+    try:
+        indexed = crud_chapter.rebuild_search_index(db, batch_size=batch_size)
+        print(f"✅ Indexed {indexed} chapters")
+        return True
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Chapters per commit"
+    )
+    args = parser.parse_args()
+
+    if rebuild_chapter_search(args.batch_size):
+        sys.exit(0)
+    print(f"\n❌ Chapter search rebuild failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Rebuild Reading Stats Script
+
+This script recomputes the user_reading_stats summary table from
+reading_progress. The table is kept current by database triggers; run this
+to backfill it or to repair drift (e.g. after a TRUNCATE or a manual import).
+
+Usage:
+    python scripts/rebuild_reading_stats.py
+    python scripts/rebuild_reading_stats.py --user-id 42
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.crud.reading_progress import crud_reading_progress
+
+
+def rebuild_reading_stats(user_id=None):
+    """Rebuild the reading stats summary for one user or everyone."""
+    print("📊 Rebuilding Reading Stats")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print(f"Scope: {'user ' + str(user_id) if user_id is not None else 'all users'}")
+    print()
+
+    db = SessionLocal()
+    try:
+        rebuilt = crud_reading_progress.rebuild_user_stats(db, user_id=user_id)
+        print(f"✅ Rebuilt stats for {rebuilt} users")
+        return True
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user-id", type=int, help="Only rebuild this user's stats")
+    args = parser.parse_args()
+
+    if rebuild_reading_stats(user_id=args.user_id):
+        sys.exit(0)
+    print(f"\n❌ Reading stats rebuild failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
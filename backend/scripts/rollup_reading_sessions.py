@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Roll Up Reading Sessions Script
+
+This script aggregates the reading_sessions event log into the daily and
+weekly user/book rollup tables read by the /reading-sessions stats
+endpoints, and on Postgres creates the upcoming monthly partitions.
+Schedule it (e.g. every 15 minutes); re-running over the same window is safe.
+
+Usage:
+    python scripts/rollup_reading_sessions.py
+    python scripts/rollup_reading_sessions.py --days 30
+"""
+
+import argparse
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy.exc import SQLAlchemyError
+
+# Import settings and database session
+from app.core.settings import settings
+from app.core.database import SessionLocal
+from app.crud.reading_session import crud_reading_session
+
+
+def rollup_reading_sessions(days=1, months_ahead=2):
+    """Create upcoming partitions and rebuild rollups for the last few days."""
+    print("📈 Rolling Up Reading Sessions")
+    print("=" * 40)
+    print(f"Environment: {settings.ENVIRONMENT}")
+    print()
+
+    db = SessionLocal()
+    try:
+        partitions = crud_reading_session.ensure_partitions(
+            db, months_ahead=months_ahead
+        )
+        for partition in partitions:
+            print(f"  ✅ Partition ready: {partition}")
+
+        start = date.today() - timedelta(days=days)
+        written = crud_reading_session.rollup(db, start=start)
+        print(f"✅ Wrote {written} rollup rows since {start.isoformat()}")
+        return True
+    except SQLAlchemyError as e:
+        db.rollback()
+        print(f"❌ Database error: {str(e)}")
+        return False
+    finally:
+        db.close()
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--days", type=int, default=1, help="Days back to recompute (default: 1)"
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=2,
+        help="Monthly partitions to create ahead of now (default: 2)",
+    )
+    args = parser.parse_args()
+
+    if rollup_reading_sessions(days=args.days, months_ahead=args.months_ahead):
+        sys.exit(0)
+    print(f"\n❌ Reading session rollup failed!")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
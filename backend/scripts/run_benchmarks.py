@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+Hot Path Benchmarks
+
+This script times the CRUD methods and endpoints that dominate real traffic
+against datasets from scripts/generate_dataset.py:
+- CRUD: search_books, get_multi_with_filters for books, reading progress
+  and favorites, get_current_user
+- HTTP (in-process TestClient): login, reading progress update, reading
+  list fetch and /search/all
+
+SQLite datasets are generated once per scale and seed into --cache-dir and
+reused afterwards. A --database-url may contain "{scale}" to point each
+scale at its own Postgres database; empty databases are filled, populated
+ones are reused as they are. Results are written as JSON keyed by
+"<dialect>/<scale>/<case>"; --compare checks them against an earlier run
+and exits with status 1 when a median got slower than --threshold allows.
+
+Usage:
+    python scripts/run_benchmarks.py --scales tiny small --output bench.json
+    python scripts/run_benchmarks.py --database-url postgresql://localhost/bench_{scale}
+    python scripts/run_benchmarks.py --compare main.json --threshold 0.2
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import sqlalchemy
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.auth import create_access_token, get_current_user
+from app.core.database import get_db
+from app.crud.book import crud_book
+from app.crud.favorite import crud_favorite
+from app.crud.reading_progress import crud_reading_progress
+from app.main import app
+from scripts.generate_dataset import (
+    SCALES,
+    TITLE_WORDS,
+    build_params,
+    generate_dataset,
+)
+
+API = "/api/v1"
+PASSWORD = "password123"
+DEFAULT_ROUNDS = 50
+DEFAULT_WARMUP = 5
+DEFAULT_THRESHOLD = 0.15
+
+# Differences below this are timer noise, whatever the relative change
+MIN_DELTA_MS = 0.05
+
+
+@dataclass
+class BenchContext:
+    """Database handles and sample rows shared by the cases of one dataset."""
+
+    session_factory: Callable
+    client: TestClient
+    user_id: int
+    username: str
+    book_id: int
+    reading_list_id: int
+    reading_list_owner_id: int
+    search_term: str
+
+    def headers(self, user_id: Optional[int] = None) -> Dict[str, str]:
+        token = create_access_token(user_id or self.user_id)
+        return {"Authorization": f"Bearer {token}"}
+
+
+@dataclass
+class Case:
+    """A benchmarked operation; setup returns the callable that is timed."""
+
+    name: str
+    setup: Callable[[BenchContext], Callable[[], None]]
+    # Password hashing makes some cases too slow for the full round count
+    max_rounds: Optional[int] = None
+
+
+def _crud(call):
+    def setup(ctx):
+        def run():
+            with ctx.session_factory() as db:
+                call(ctx, db)
+
+        return run
+
+    return setup
+
+
+def _http(method, path, *, body=None, owner=False):
+    def setup(ctx):
+        headers = ctx.headers(ctx.reading_list_owner_id if owner else None)
+        url = API + path.format(ctx=ctx)
+
+        def run():
+            response = ctx.client.request(
+                method, url, json=body(ctx) if body else None, headers=headers
+            )
+            response.raise_for_status()
+
+        return run
+
+    return setup
+
+
+def _get_current_user(ctx):
+    credentials = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=create_access_token(ctx.user_id)
+    )
+
+    def run():
+        with ctx.session_factory() as db:
+            get_current_user(credentials, db)
+
+    return run
+
+
+def _login(ctx):
+    body = {"username": ctx.username, "password": PASSWORD}
+
+    def run():
+        ctx.client.post(f"{API}/auth/login-json", json=body).raise_for_status()
+
+    return run
+
+
+def _progress_update(ctx):
+    pages = iter(range(1, 10**9))
+    return _http(
+        "PUT",
+        "/reading-progress/book/{ctx.book_id}",
+        body=lambda ctx: {"current_page": next(pages) % 300 + 1},
+    )(ctx)
+
+
+CASES = [
+    Case(
+        "crud.search_books",
+        _crud(
+            lambda ctx, db: crud_book.search_books(db, query=ctx.search_term, limit=20)
+        ),
+    ),
+    Case(
+        "crud.books.get_multi_with_filters",
+        _crud(
+            lambda ctx, db: crud_book.get_multi_with_filters(
+                db, search=ctx.search_term, is_active=True, limit=20
+            )
+        ),
+    ),
+    Case(
+        "crud.reading_progress.get_multi_with_filters",
+        _crud(
+            lambda ctx, db: crud_reading_progress.get_multi_with_filters(
+                db, user_id=ctx.user_id, limit=20
+            )
+        ),
+    ),
+    Case(
+        "crud.favorites.get_multi_with_filters",
+        _crud(
+            lambda ctx, db: crud_favorite.get_multi_with_filters(
+                db, user_id=ctx.user_id, limit=20
+            )
+        ),
+    ),
+    Case("auth.get_current_user", _get_current_user),
+    Case("http.login", _login, max_rounds=10),
+    Case("http.reading_progress.update", _progress_update),
+    Case(
+        "http.reading_lists.get",
+        _http("GET", "/reading-lists/{ctx.reading_list_id}", owner=True),
+    ),
+    Case("http.search.all", _http("GET", "/search/all?q={ctx.search_term}")),
+]
+
+
+def prepare_dataset(database_url, scale, seed):
+    """Make sure the database holds a generated dataset; generate it if empty."""
+    engine = create_engine(database_url)
+    try:
+        if inspect(engine).has_table("users"):
+            with engine.connect() as connection:
+                if connection.execute(text("SELECT COUNT(*) FROM users")).scalar():
+                    return False
+    finally:
+        engine.dispose()
+    generate_dataset(database_url, build_params(scale, seed=seed), create_tables=True)
+    return True
+
+
+def _load_context(engine, client):
+    with engine.connect() as connection:
+        # The busiest reader and their most recent book
+        user_id = connection.execute(
+            text(
+                "SELECT user_id FROM reading_progress "
+                "GROUP BY user_id ORDER BY COUNT(*) DESC, user_id LIMIT 1"
+            )
+        ).scalar()
+        username = connection.execute(
+            text("SELECT username FROM users WHERE id = :id"), {"id": user_id}
+        ).scalar()
+        book_id = connection.execute(
+            text(
+                "SELECT book_id FROM reading_progress WHERE user_id = :id "
+                "ORDER BY last_read_at DESC, book_id LIMIT 1"
+            ),
+            {"id": user_id},
+        ).scalar()
+        reading_list = connection.execute(
+            text(
+                "SELECT reading_list_id, reading_lists.user_id "
+                "FROM reading_list_items "
+                "JOIN reading_lists ON reading_lists.id = reading_list_id "
+                "GROUP BY reading_list_id, reading_lists.user_id "
+                "ORDER BY COUNT(*) DESC, reading_list_id LIMIT 1"
+            )
+        ).first()
+    return BenchContext(
+        session_factory=sessionmaker(bind=engine, autoflush=False),
+        client=client,
+        user_id=user_id,
+        username=username,
+        book_id=book_id,
+        reading_list_id=reading_list[0],
+        reading_list_owner_id=reading_list[1],
+        search_term=TITLE_WORDS[0],
+    )
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    mean = statistics.fmean(ordered)
+    return {
+        "rounds": len(ordered),
+        "min_ms": round(ordered[0], 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "mean_ms": round(mean, 4),
+        "p95_ms": round(p95, 4),
+        "stdev_ms": round(statistics.stdev(ordered), 4) if len(ordered) > 1 else 0.0,
+        "ops_per_sec": round(1000 / mean, 2) if mean else 0.0,
+    }
+
+
+def run_suite(
+    database_url,
+    *,
+    rounds=DEFAULT_ROUNDS,
+    warmup=DEFAULT_WARMUP,
+    only: Optional[List[str]] = None,
+):
+    """
+    Time every case against a populated database.
+
+    Returns per-case statistics in milliseconds, keyed by case name.
+    """
+    connect_args = (
+        {"check_same_thread": False} if database_url.startswith("sqlite") else {}
+    )
+    engine = create_engine(database_url, connect_args=connect_args)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    results = {}
+    try:
+        ctx = _load_context(engine, TestClient(app))
+        for case in CASES:
+            if only and not any(pattern in case.name for pattern in only):
+                continue
+            run = case.setup(ctx)
+            count = min(rounds, case.max_rounds or rounds)
+            for _ in range(min(warmup, count)):
+                run()
+            samples = []
+            for _ in range(count):
+                started = time.perf_counter()
+                run()
+                samples.append((time.perf_counter() - started) * 1000)
+            results[case.name] = _summarize(samples)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+    return results
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare the medians of two result files.
+
+    Returns one row per benchmark present in both; a row is a regression when
+    the median grew by more than threshold (a fraction) and MIN_DELTA_MS.
+    """
+    rows = []
+    for key, stats in current["results"].items():
+        previous = baseline["results"].get(key)
+        if not previous:
+            continue
+        before, after = previous["median_ms"], stats["median_ms"]
+        change = (after - before) / before if before else 0.0
+        rows.append(
+            {
+                "benchmark": key,
+                "baseline_ms": before,
+                "current_ms": after,
+                "change": round(change, 4),
+                "regression": change > threshold and after - before > MIN_DELTA_MS,
+            }
+        )
+    return rows
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=backend_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        help='Database to benchmark, may contain "{scale}" (default: SQLite files)',
+    )
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        choices=sorted(SCALES),
+        default=["tiny", "small"],
+        help="Dataset scales to run",
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Dataset seed")
+    parser.add_argument(
+        "--cache-dir",
+        default=str(Path(tempfile.gettempdir()) / "library_benchmarks"),
+        help="Where generated SQLite datasets are kept",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=DEFAULT_ROUNDS, help="Timed calls per case"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=DEFAULT_WARMUP, help="Untimed calls per case"
+    )
+    parser.add_argument(
+        "--only", nargs="+", help="Only run cases whose name contains one of these"
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed median slowdown as a fraction (default: 0.15)",
+    )
+    args = parser.parse_args()
+
+    # The app logs every request at INFO level
+    for name in ("httpx", "asyncio"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    print("⏱️  Running Benchmarks")
+    print("=" * 40)
+
+    output = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "rounds": args.rounds,
+        },
+        "results": {},
+    }
+
+    for scale in args.scales:
+        if args.database_url:
+            url = args.database_url.replace("{scale}", scale)
+        else:
+            Path(args.cache_dir).mkdir(parents=True, exist_ok=True)
+            url = f"sqlite:///{Path(args.cache_dir) / f'{scale}-{args.seed}.db'}"
+        dialect = url.split(":", 1)[0].split("+", 1)[0]
+        print(f"\n📦 {dialect}/{scale}")
+
+        try:
+            if prepare_dataset(url, scale, args.seed):
+                print("  ✅ Generated the dataset")
+            results = run_suite(
+                url, rounds=args.rounds, warmup=args.warmup, only=args.only
+            )
+        except Exception as e:
+            print(f"❌ Benchmark failed: {str(e)}")
+            sys.exit(1)
+
+        for name, stats in results.items():
+            output["results"][f"{dialect}/{scale}/{name}"] = stats
+            print(
+                f"  {name:<46} median {stats['median_ms']:>9.3f} ms"
+                f"  p95 {stats['p95_ms']:>9.3f} ms"
+            )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(output, indent=2) + "\n")
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        rows = compare_results(baseline, output, args.threshold)
+        print(f"\n📊 Compared with {baseline['meta'].get('commit') or args.compare}")
+        for row in rows:
+            icon = "❌" if row["regression"] else "✅"
+            print(
+                f"  {icon} {row['benchmark']:<60} {row['baseline_ms']:>9.3f} -> "
+                f"{row['current_ms']:>9.3f} ms ({row['change']:+.1%})"
+            )
+        regressions = [row for row in rows if row["regression"]]
+        if regressions:
+            print(f"\n❌ {len(regressions)} benchmark(s) regressed")
+            sys.exit(1)
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,7 @@ from app.models.chapter import Chapter
 from app.models.favorite import Favorite
 from app.models.reading_progress import ReadingProgress
 from app.models.reading_list import ReadingList, ReadingListItem
+from app.crud.book import crud_book
 
 def get_session():
     """Get database session."""
@@ -405,6 +406,9 @@ def main():
             print("❌ Failed to create books")
             return False
         
+        # Books are inserted directly, so refresh the author/category counters
+        crud_book.rebuild_book_counts(session)
+        
         seed_chapters(session, books, 100)
         seed_favorites(session, admin_user, books, 100)
         
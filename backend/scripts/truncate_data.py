@@ -83,8 +83,18 @@ def truncate_all_data():
             truncate_order = [
                 'reading_list_items',  # References reading_lists and books
                 'reading_lists',       # References users
+                'user_reading_rollups',  # References users
+                'book_reading_rollups',  # References books
+                'reading_sessions',    # References users and books
+                'user_reading_stats',  # References users
                 'reading_progress',    # References users and books
                 'favorites',           # References users and books
+                'import_jobs',         # References books and users
+                'book_stats',          # References books
+                'book_similarities',   # References books
+                'feed_snapshots',      # No foreign keys
+                'chapter_search',      # References chapters
+                'chapter_contents',    # References chapters
                 'chapters',            # References books
                 'books',               # References authors and categories
                 'authors',             # No foreign keys
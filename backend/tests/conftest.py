@@ -3,6 +3,7 @@ Test configuration and fixtures for Book Reading API tests.
 """
 import asyncio
 import sqlite3
+from contextlib import contextmanager
 from typing import Any, Dict, Generator
 
 import httpx
@@ -10,6 +11,7 @@ import pytest
 import pytest_asyncio
 from app.core.auth import create_access_token
 from app.core.database import Base, get_db
+from app.core.query_stats import count_queries
 from app.crud.author import crud_author
 from app.crud.book import crud_book
 from app.crud.category import crud_category
@@ -331,4 +333,49 @@ def multiple_test_data(db_session):
 @pytest.fixture
 def api_v1_prefix() -> str:
     """API v1 prefix."""
-    return "/api/v1" 
\ No newline at end of file
+    return "/api/v1" 
+
+
+def _query_budget_message(stats, limit: int) -> str:
+    return f"{stats.count} SQL queries, expected at most {limit}:\n{stats.summary()}"
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Fail when a block runs more SQL queries than allowed:
+
+        with max_queries(3):
+            client.get(...)
+    """
+
+    @contextmanager
+    def check(limit: int):
+        with count_queries(engine) as stats:
+            yield stats
+        assert stats.count <= limit, _query_budget_message(stats, limit)
+
+    return check
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "max_queries(n): fail when the test body runs more than n SQL queries",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Enforce @pytest.mark.max_queries(n); fixture setup is not counted."""
+    marker = item.get_closest_marker("max_queries")
+    if marker is None:
+        yield
+        return
+    limit = marker.args[0]
+    with count_queries(engine) as stats:
+        outcome = yield
+    # Re-raises a failure of the test body itself
+    outcome.get_result()
+    if stats.count > limit:
+        pytest.fail(_query_budget_message(stats, limit), pytrace=False)
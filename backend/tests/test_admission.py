@@ -0,0 +1,183 @@
+"""
+Test admission control and load shedding.
+"""
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.core.admission import (
+    PRIORITY_ANONYMOUS,
+    PRIORITY_BULK,
+    PRIORITY_USER,
+    AdmissionMiddleware,
+    ConcurrencyLimiter,
+)
+from app.core.auth import create_access_token
+
+
+class TestConcurrencyLimiter:
+    """Test slots are handed out in priority order and waiters are shed."""
+
+    def test_priority_order(self):
+        """Test freed slots go to signed-in users before bulk listings."""
+
+        async def scenario():
+            limiter = ConcurrencyLimiter(limit=1, queue_size=10)
+            admitted = []
+
+            async def request(name, priority):
+                assert await limiter.acquire(priority, timeout=1) is None
+                admitted.append(name)
+                limiter.release()
+
+            assert await limiter.acquire(PRIORITY_USER, timeout=1) is None
+            waiters = [
+                asyncio.create_task(request("bulk", PRIORITY_BULK)),
+                asyncio.create_task(request("anonymous", PRIORITY_ANONYMOUS)),
+                asyncio.create_task(request("user", PRIORITY_USER)),
+            ]
+            await asyncio.sleep(0)
+            limiter.release()
+            await asyncio.gather(*waiters)
+            return admitted, limiter.active
+
+        assert asyncio.run(scenario()) == (["user", "anonymous", "bulk"], 0)
+
+    def test_shedding(self):
+        """Test full queues, deadlines and timeouts refuse requests."""
+
+        async def scenario():
+            limiter = ConcurrencyLimiter(limit=1, queue_size=1)
+            await limiter.acquire(PRIORITY_USER, timeout=1)
+            bulk = asyncio.create_task(limiter.acquire(PRIORITY_BULK, timeout=1))
+            await asyncio.sleep(0)
+
+            # A request going first takes the bulk listing's place
+            user = asyncio.create_task(limiter.acquire(PRIORITY_USER, timeout=0.05))
+            await asyncio.sleep(0)
+            full = await limiter.acquire(PRIORITY_ANONYMOUS, timeout=1)
+
+            results = (await bulk, full, await user)
+            limiter.release(service_time=10)
+            limiter.active = 1
+            return results + (await limiter.acquire(PRIORITY_USER, timeout=1),)
+
+        assert asyncio.run(scenario()) == (
+            "evicted",
+            "queue_full",
+            "timeout",
+            "deadline",
+        )
+
+
+def _app(release: asyncio.Event) -> AdmissionMiddleware:
+    app = FastAPI()
+
+    @app.get("/api/v1/books/")
+    async def books():
+        await release.wait()
+        return []
+
+    @app.get("/api/v1/search/all")
+    async def search():
+        return {}
+
+    return AdmissionMiddleware(
+        app,
+        limits={"read": 1, "search": 1},
+        route_classes={"/search": "search"},
+        queue_size=1,
+        queue_timeout=1,
+        prefix="/api/v1",
+    )
+
+
+class TestAdmissionMiddleware:
+    """Test requests over the limits are refused with a 503."""
+
+    def test_shed(self):
+        """Test a full route class sheds requests but others still run."""
+
+        async def scenario():
+            release = asyncio.Event()
+            middleware = _app(release)
+            transport = httpx.ASGITransport(app=middleware)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                running = asyncio.create_task(client.get("/api/v1/books/"))
+                queued = asyncio.create_task(client.get("/api/v1/books/"))
+                await asyncio.sleep(0.05)
+
+                shed = await client.get("/api/v1/books/")
+                search = await client.get("/api/v1/search/all")
+                release.set()
+                responses = [await running, await queued, shed, search]
+            return middleware, responses
+
+        middleware, (running, queued, shed, search) = asyncio.run(scenario())
+
+        assert running.status_code == 200
+        assert queued.status_code == 200
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "1"
+        assert shed.json() == {"detail": "Service is overloaded, please retry later"}
+        assert search.status_code == 200
+        assert middleware.shed == {("read", "queue_full"): 1}
+
+    def test_shed_with_cors(self):
+        """Test browsers can read a 503 when CORS wraps admission control."""
+
+        async def scenario():
+            release = asyncio.Event()
+            app = CORSMiddleware(
+                _app(release),
+                allow_origins=["http://localhost:3000"],
+                expose_headers=["Retry-After"],
+            )
+            transport = httpx.ASGITransport(app=app)
+            headers = {"Origin": "http://localhost:3000"}
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                running = asyncio.create_task(
+                    client.get("/api/v1/books/", headers=headers)
+                )
+                queued = asyncio.create_task(
+                    client.get("/api/v1/books/", headers=headers)
+                )
+                await asyncio.sleep(0.05)
+                shed = await client.get("/api/v1/books/", headers=headers)
+                release.set()
+                await running
+                await queued
+            return shed
+
+        shed = asyncio.run(scenario())
+
+        assert shed.status_code == 503
+        assert shed.headers["Access-Control-Allow-Origin"] == "http://localhost:3000"
+        assert shed.headers["Access-Control-Expose-Headers"] == "Retry-After"
+
+    def test_classification(self):
+        """Test route classes and priorities."""
+        middleware = _app(asyncio.Event())
+        token = create_access_token(1)
+
+        def scope(query=b"", authorization=None):
+            headers = (
+                [(b"authorization", authorization.encode())] if authorization else []
+            )
+            return {"query_string": query, "headers": headers, "client": ("1.2.3.4", 1)}
+
+        assert middleware.route_class("GET", "/api/v1/search/all") == "search"
+        assert middleware.route_class("GET", "/api/v1/books/") == "read"
+        assert middleware.route_class("POST", "/api/v1/books/") == "write"
+        assert (
+            middleware.priority(scope(authorization=f"Bearer {token}")) == PRIORITY_USER
+        )
+        assert middleware.priority(scope()) == PRIORITY_ANONYMOUS
+        assert middleware.priority(scope(b"limit=10000")) == PRIORITY_BULK
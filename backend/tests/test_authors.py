@@ -408,6 +408,78 @@ class TestAuthorCRUD:
         assert final_count == initial_count + 3
 
 
+class TestAuthorBulkEndpoints:
+    """Test bulk author endpoints."""
+
+    def test_bulk_create_authors(self, client: TestClient, api_v1_prefix: str, admin_headers: dict, test_author: Author):
+        """Test duplicate names are reported per item."""
+        items = [
+            {"name": "Ursula K. Le Guin", "website": ""},
+            {"name": test_author.name},
+            {"name": "Terry Pratchett"},
+        ]
+
+        response = client.post(f"{api_v1_prefix}/authors/bulk", json={"items": items}, headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [author["name"] for author in data["items"]] == ["Ursula K. Le Guin", "Terry Pratchett"]
+        assert data["items"][0]["website"] is None
+        assert [error["index"] for error in data["errors"]] == [1]
+
+    def test_bulk_update_authors(self, client: TestClient, api_v1_prefix: str, admin_headers: dict, test_author: Author):
+        """Test only the sent fields are updated."""
+        response = client.put(
+            f"{api_v1_prefix}/authors/bulk",
+            json={"items": [{"id": test_author.id, "nationality": "Scottish"}]},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        author = data["data"]["items"][0]
+        assert author["nationality"] == "Scottish"
+        assert author["name"] == test_author.name
+
+    def test_bulk_delete_authors(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_author: Author, test_book
+    ):
+        """Test authors with books are kept."""
+        spare = crud_author.create(db_session, obj_in=AuthorCreate(name="Spare Author"))
+
+        response = client.post(
+            f"{api_v1_prefix}/authors/bulk/delete",
+            json={"ids": [test_author.id, spare.id]},
+            headers=admin_headers,
+        )
+
+        data = response.json()["data"]
+        assert data["deleted_ids"] == [spare.id]
+        assert data["errors"][0]["id"] == test_author.id
+        assert "books are still associated" in data["errors"][0]["detail"]
+
+    def test_bulk_delete_authors_integrity_error(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, test_author: Author
+    ):
+        """Test a constraint violation while deleting is a 400, not a 500."""
+        from unittest.mock import patch
+
+        from sqlalchemy.exc import IntegrityError
+
+        with patch.object(
+            crud_author, "bulk_delete", side_effect=IntegrityError("DELETE", {}, Exception("fk"))
+        ):
+            response = client.post(
+                f"{api_v1_prefix}/authors/bulk/delete",
+                json={"ids": [test_author.id]},
+                headers=admin_headers,
+            )
+
+        assert response.status_code == 400
+
+
 @pytest.mark.asyncio
 class TestAuthorEndpointsAsync:
     """Test author endpoints with async client."""
@@ -0,0 +1,44 @@
+"""
+Test the hot path benchmark runner.
+"""
+
+from scripts.generate_dataset import build_params, generate_dataset
+from scripts.run_benchmarks import CASES, compare_results, run_suite
+
+
+def _results(**medians):
+    return {"results": {key: {"median_ms": median} for key, median in medians.items()}}
+
+
+class TestRunBenchmarks:
+    """Test benchmark runs and comparisons."""
+
+    def test_run_suite(self, tmp_path):
+        """Test every case runs against a generated dataset."""
+        url = f"sqlite:///{tmp_path / 'bench.db'}"
+        params = build_params(
+            "tiny", seed=3, users=20, authors=4, categories=3, books=40, reading_lists=5
+        )
+        generate_dataset(url, params, workers=1, create_tables=True)
+
+        results = run_suite(url, rounds=2, warmup=0)
+
+        assert set(results) == {case.name for case in CASES}
+        for stats in results.values():
+            assert stats["rounds"] == 2
+            assert 0 < stats["min_ms"] <= stats["median_ms"] <= stats["p95_ms"]
+
+    def test_compare_results(self):
+        """Test regressions need both the relative and the absolute threshold."""
+        baseline = _results(slower=10.0, noise=0.01, faster=5.0, removed=1.0)
+        current = _results(slower=12.0, noise=0.03, faster=4.0, added=1.0)
+
+        rows = {
+            row["benchmark"]: row for row in compare_results(baseline, current, 0.15)
+        }
+
+        assert set(rows) == {"slower", "noise", "faster"}
+        assert rows["slower"]["regression"]
+        assert rows["slower"]["change"] == 0.2
+        assert not rows["noise"]["regression"]
+        assert not rows["faster"]["regression"]
@@ -0,0 +1,174 @@
+"""
+Test the book_stats rankings and the popular/trending sort orders.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.crud.book import crud_book
+from app.models.book_stats import BookStats
+from app.models.favorite import Favorite
+from app.models.reading_progress import ReadingProgress
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def _stats(db_session, book):
+    db_session.expire_all()
+    return db_session.get(BookStats, book.id)
+
+
+@pytest.fixture
+def ranked(db_session, test_book, test_book_2, test_user, test_user_2):
+    """
+    test_book: two readers long ago, one completion (popular, not trending).
+    test_book_2: one favorite today (trending).
+    """
+    long_ago = NOW - timedelta(days=20)
+    db_session.add_all(
+        [
+            ReadingProgress(
+                user_id=test_user.id,
+                book_id=test_book.id,
+                status="completed",
+                is_completed=True,
+                last_read_at=long_ago,
+                completed_at=long_ago,
+            ),
+            ReadingProgress(
+                user_id=test_user_2.id,
+                book_id=test_book.id,
+                status="reading",
+                last_read_at=long_ago,
+            ),
+            Favorite(user_id=test_user.id, book_id=test_book_2.id, created_at=NOW),
+        ]
+    )
+    db_session.commit()
+    return test_book, test_book_2
+
+
+class TestBookStatsTriggers:
+    """Test favorites and reading progress writes update book_stats."""
+
+    def test_new_book_gets_a_row(self, db_session, test_book):
+        stats = _stats(db_session, test_book)
+
+        assert stats.favorites_count == 0
+        assert stats.popularity_score == 0
+
+    def test_favorites(self, db_session, test_book, test_user, test_user_2):
+        favorites = [
+            Favorite(user_id=user.id, book_id=test_book.id)
+            for user in (test_user, test_user_2)
+        ]
+        db_session.add_all(favorites)
+        db_session.commit()
+        assert _stats(db_session, test_book).favorites_count == 2
+
+        db_session.delete(favorites[0])
+        db_session.commit()
+
+        stats = _stats(db_session, test_book)
+        assert stats.favorites_count == 1
+        assert stats.popularity_score == 3.0
+
+    def test_progress(self, db_session, test_book, test_user):
+        progress = ReadingProgress(user_id=test_user.id, book_id=test_book.id)
+        db_session.add(progress)
+        db_session.commit()
+        assert _stats(db_session, test_book).readers_count == 1
+
+        progress.is_completed = True
+        db_session.commit()
+        stats = _stats(db_session, test_book)
+        assert (stats.readers_count, stats.completions_count) == (1, 1)
+        assert stats.popularity_score == 3.0
+
+        db_session.delete(progress)
+        db_session.commit()
+        stats = _stats(db_session, test_book)
+        assert (stats.readers_count, stats.completions_count) == (0, 0)
+        assert stats.popularity_score == 0
+
+
+class TestRebuildBookStats:
+    """Test the periodic recomputation of book_stats."""
+
+    def test_rebuild(self, db_session, ranked):
+        test_book, test_book_2 = ranked
+
+        assert crud_book.rebuild_book_stats(db_session, now=NOW) == 2
+
+        popular = _stats(db_session, test_book)
+        assert popular.readers_count == 2
+        assert popular.completions_count == 1
+        assert popular.active_readers == 0
+        assert popular.popularity_score == 4.0
+        # Twenty days are several half-lives
+        assert 0 < popular.trending_score < 0.1
+        assert _stats(db_session, test_book_2).trending_score == 3.0
+
+    def test_rebuild_repairs_drift(self, db_session, test_book, test_user):
+        db_session.add(Favorite(user_id=test_user.id, book_id=test_book.id))
+        db_session.commit()
+        db_session.query(BookStats).delete()
+        db_session.commit()
+
+        crud_book.rebuild_book_stats(db_session, now=NOW)
+
+        assert _stats(db_session, test_book).favorites_count == 1
+
+    def test_rebuild_clears_stale_trending(self, db_session, ranked):
+        test_book, test_book_2 = ranked
+        crud_book.rebuild_book_stats(db_session, now=NOW)
+
+        crud_book.rebuild_book_stats(db_session, now=NOW + timedelta(days=365))
+
+        assert _stats(db_session, test_book).trending_score == 0
+        assert _stats(db_session, test_book_2).trending_score == 0
+
+
+class TestRankedListings:
+    """Test the sort option of the book listings."""
+
+    def test_sort(self, client, api_v1_prefix, db_session, ranked):
+        test_book, test_book_2 = ranked
+        crud_book.rebuild_book_stats(db_session, now=NOW)
+
+        def ids(sort):
+            response = client.get(f"{api_v1_prefix}/books/public/?sort={sort}")
+            assert response.status_code == 200
+            return [book["id"] for book in response.json()["data"]]
+
+        assert ids("popular") == [test_book.id, test_book_2.id]
+        assert ids("trending") == [test_book_2.id, test_book.id]
+
+    def test_sort_by_category(self, client, api_v1_prefix, db_session, ranked):
+        test_book, test_book_2 = ranked
+
+        response = client.get(
+            f"{api_v1_prefix}/books/public/category/{test_book.category_id}",
+            params={"sort": "popular", "limit": 1},
+        )
+
+        data = response.json()
+        assert [book["id"] for book in data["data"]] == [test_book.id]
+        assert data["meta"]["total"] == 2
+
+    def test_admin_listing(self, client, api_v1_prefix, auth_headers, ranked):
+        test_book, test_book_2 = ranked
+
+        response = client.get(
+            f"{api_v1_prefix}/books/?sort=popular", headers=auth_headers
+        )
+
+        data = response.json()
+        assert [book["id"] for book in data["data"]] == [test_book.id, test_book_2.id]
+        assert data["meta"]["sort"] == "popular"
+
+    def test_unknown_sort(self, client, api_v1_prefix):
+        response = client.get(f"{api_v1_prefix}/books/public/?sort=random")
+
+        assert response.status_code == 422
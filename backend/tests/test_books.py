@@ -525,6 +525,181 @@ class TestBookCRUD:
         for book in active_books:
             assert book.is_active is True
 
+    def test_book_counter_caches(self, db_session: Session, test_author: Author, test_category: Category, multiple_test_data: dict):
+        """Test author/category book counts follow create, update and remove."""
+        other_author = multiple_test_data["authors"][0]
+        other_category = multiple_test_data["categories"][0]
+        base_author_count = other_author.book_count
+        base_category_count = other_category.book_count
+
+        book = crud_book.create(
+            db_session,
+            obj_in=BookCreate(title="Counted Book", author_id=test_author.id, category_id=test_category.id),
+        )
+        db_session.refresh(test_author)
+        db_session.refresh(test_category)
+        assert test_author.book_count == 1
+        assert test_author.active_book_count == 1
+        assert test_category.book_count == 1
+
+        # Deactivating keeps the book counted but not as active
+        book = crud_book.update(db_session, db_obj=book, obj_in={"is_active": False})
+        db_session.refresh(test_author)
+        assert test_author.book_count == 1
+        assert test_author.active_book_count == 0
+
+        # Reassigning moves the book between counters
+        book = crud_book.update(
+            db_session,
+            db_obj=book,
+            obj_in={"author_id": other_author.id, "category_id": other_category.id},
+        )
+        for obj in (test_author, test_category, other_author, other_category):
+            db_session.refresh(obj)
+        assert test_author.book_count == 0
+        assert test_category.book_count == 0
+        assert other_author.book_count == base_author_count + 1
+        assert other_category.book_count == base_category_count + 1
+        assert crud_book.count_by_author(db_session, author_id=other_author.id) == base_author_count + 1
+
+        crud_book.remove(db_session, id=book.id)
+        db_session.refresh(other_author)
+        assert other_author.book_count == base_author_count
+
+    def test_rebuild_book_counts(self, db_session: Session, test_book: Book, test_author: Author, test_category: Category):
+        """Test rebuilding repairs drifted counter caches."""
+        test_author.book_count = 42
+        test_category.active_book_count = 0
+        db_session.commit()
+
+        crud_book.rebuild_book_counts(db_session)
+
+        db_session.refresh(test_author)
+        db_session.refresh(test_category)
+        assert test_author.book_count == 1
+        assert test_category.active_book_count == 1
+        assert crud_book.count_by_category(db_session, category_id=test_category.id) == 1
+
+
+class TestBookBulkEndpoints:
+    """Test bulk book endpoints."""
+
+    def test_bulk_create_books(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_author: Author, test_category: Category, test_book: Book
+    ):
+        """Test valid items are created and invalid ones reported by index."""
+        items = [
+            {"title": "Bulk One", "isbn": "1111", "author_id": test_author.id, "category_id": test_category.id},
+            {"title": "Bad Author", "author_id": 99999, "category_id": test_category.id},
+            {"title": "Taken ISBN", "isbn": test_book.isbn, "author_id": test_author.id, "category_id": test_category.id},
+            {"title": "Bulk Two", "isbn": "", "is_active": False, "author_id": test_author.id, "category_id": test_category.id},
+            {"title": "Repeated ISBN", "isbn": "1111", "author_id": test_author.id, "category_id": test_category.id},
+        ]
+
+        response = client.post(f"{api_v1_prefix}/books/bulk", json={"items": items}, headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is False
+        assert [book["title"] for book in data["data"]["items"]] == ["Bulk One", "Bulk Two"]
+        assert data["data"]["items"][1]["isbn"] is None
+        errors = {error["index"]: error["detail"] for error in data["data"]["errors"]}
+        assert set(errors) == {1, 2, 4}
+        assert "Author with id 99999 not found" in errors[1]
+        assert "already exists" in errors[2]
+        assert "Duplicate" in errors[4]
+
+        db_session.refresh(test_author)
+        db_session.refresh(test_category)
+        assert test_author.book_count == 3
+        assert test_author.active_book_count == 2
+        assert test_category.book_count == 3
+
+    def test_bulk_create_books_atomic(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_author: Author, test_category: Category
+    ):
+        """Test atomic batches are rejected as a whole."""
+        items = [
+            {"title": "Good", "author_id": test_author.id, "category_id": test_category.id},
+            {"title": "Bad Category", "author_id": test_author.id, "category_id": 99999},
+        ]
+
+        response = client.post(
+            f"{api_v1_prefix}/books/bulk?atomic=true", json={"items": items}, headers=admin_headers
+        )
+
+        data = response.json()
+        assert data["success"] is False
+        assert data["data"]["items"] == []
+        assert data["data"]["errors"][0]["index"] == 1
+        assert db_session.query(Book).count() == 0
+
+    def test_bulk_update_books(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_book: Book, test_book_2: Book, multiple_test_data: dict
+    ):
+        """Test bulk updates move books between counter caches."""
+        other_author = multiple_test_data["authors"][0]
+        base_count = other_author.book_count
+        items = [
+            {"id": test_book.id, "title": "Renamed", "author_id": other_author.id},
+            {"id": test_book_2.id, "is_active": False},
+            {"id": 99999, "title": "Missing"},
+        ]
+
+        response = client.put(f"{api_v1_prefix}/books/bulk", json={"items": items}, headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [book["id"] for book in data["data"]["items"]] == [test_book.id, test_book_2.id]
+        assert data["data"]["items"][0]["title"] == "Renamed"
+        assert data["data"]["items"][1]["is_active"] is False
+        assert data["data"]["errors"] == [{"index": 2, "id": 99999, "detail": "Book with id 99999 not found"}]
+
+        author = db_session.get(Author, test_book_2.author_id)
+        db_session.refresh(author)
+        db_session.refresh(other_author)
+        assert author.book_count == 1
+        assert author.active_book_count == 0
+        assert other_author.book_count == base_count + 1
+
+    def test_bulk_delete_books(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_book: Book, test_book_2: Book, test_author: Author
+    ):
+        """Test books with chapters are kept when deleting in bulk."""
+        from app.crud.chapter import crud_chapter
+        from app.schemas.chapter import ChapterCreate
+
+        crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(book_id=test_book_2.id, chapter_number=1, title="One", content="Text"),
+        )
+
+        response = client.post(
+            f"{api_v1_prefix}/books/bulk/delete",
+            json={"ids": [test_book.id, test_book_2.id, 99999]},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["deleted_ids"] == [test_book.id]
+        assert [error["id"] for error in data["errors"]] == [test_book_2.id, 99999]
+        assert "chapters" in data["errors"][0]["detail"]
+        assert crud_book.get(db_session, id=test_book.id) is None
+
+        db_session.refresh(test_author)
+        assert test_author.book_count == 1
+
+    def test_bulk_books_non_admin(self, client: TestClient, api_v1_prefix: str, auth_headers: dict):
+        """Test regular users cannot use bulk endpoints."""
+        response = client.post(f"{api_v1_prefix}/books/bulk/delete", json={"ids": [1]}, headers=auth_headers)
+
+        assert response.status_code == 403
+
 
 @pytest.mark.asyncio
 class TestBookEndpointsAsync:
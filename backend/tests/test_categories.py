@@ -456,6 +456,61 @@ class TestCategoryCRUD:
         assert final_count == initial_count + 3
 
 
+class TestCategoryBulkEndpoints:
+    """Test bulk category endpoints."""
+
+    def test_bulk_create_categories(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, test_category: Category
+    ):
+        """Test unique names and slugs are checked against the table and the batch."""
+        items = [
+            {"name": "Science Fiction", "slug": "science-fiction"},
+            {"name": "Fantasy Again", "slug": test_category.slug},
+            {"name": "Sci-Fi", "slug": "science-fiction"},
+        ]
+
+        response = client.post(f"{api_v1_prefix}/categories/bulk", json={"items": items}, headers=admin_headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert [category["slug"] for category in data["items"]] == ["science-fiction"]
+        assert [error["index"] for error in data["errors"]] == [1, 2]
+
+    def test_bulk_update_categories(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_category: Category
+    ):
+        """Test a category may keep its own unique values."""
+        response = client.put(
+            f"{api_v1_prefix}/categories/bulk",
+            json={"items": [{"id": test_category.id, "slug": test_category.slug, "is_active": False}]},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        assert response.json()["data"]["errors"] == []
+        db_session.refresh(test_category)
+        assert test_category.is_active is False
+
+    def test_bulk_delete_categories_atomic(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict, db_session: Session,
+        test_category: Category, test_book
+    ):
+        """Test a blocked category rejects an atomic batch."""
+        spare = crud_category.create(db_session, obj_in=CategoryCreate(name="Spare", slug="spare"))
+
+        response = client.post(
+            f"{api_v1_prefix}/categories/bulk/delete?atomic=true",
+            json={"ids": [spare.id, test_category.id]},
+            headers=admin_headers,
+        )
+
+        data = response.json()
+        assert data["success"] is False
+        assert data["data"]["deleted_ids"] == []
+        assert crud_category.get(db_session, id=spare.id) is not None
+
+
 @pytest.mark.asyncio
 class TestCategoryEndpointsAsync:
     """Test category endpoints with async client."""
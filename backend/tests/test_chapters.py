@@ -4,7 +4,7 @@ Test chapter management endpoints.
 import pytest
 from app.crud.chapter import crud_chapter
 from app.models.book import Book
-from app.models.chapter import Chapter
+from app.models.chapter import Chapter, ChapterContent
 from app.schemas.chapter import ChapterCreate
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
@@ -68,7 +68,8 @@ class TestChapterEndpoints:
         chapter_data = data["data"][0]
         assert "id" in chapter_data
         assert "title" in chapter_data
-        assert "content" in chapter_data
+        assert "content" not in chapter_data
+        assert "content_size" in chapter_data
         assert "chapter_number" in chapter_data
         assert "is_published" in chapter_data
         assert "is_active" in chapter_data
@@ -296,6 +297,102 @@ class TestChapterEndpoints:
         
         assert response.status_code == 404
 
+    def test_read_chapters_by_book_omits_content(self, client: TestClient, api_v1_prefix: str, auth_headers: dict, test_chapter: Chapter):
+        """Test chapter listings return metadata without the body."""
+        response = client.get(f"{api_v1_prefix}/chapters/book/{test_chapter.book_id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        chapter = response.json()["data"][0]
+        assert "content" not in chapter
+        assert chapter["content_size"] == len(test_chapter.content.encode("utf-8"))
+        assert chapter["content_hash"] == test_chapter.content_hash
+
+    def test_read_chapter_content(self, client: TestClient, api_v1_prefix: str, auth_headers: dict, test_chapter: Chapter):
+        """Test reading a chapter body from the content endpoint."""
+        response = client.get(f"{api_v1_prefix}/chapters/{test_chapter.id}/content", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()["data"]
+        assert data["id"] == test_chapter.id
+        assert data["content"] == test_chapter.content
+        assert data["content_hash"] == test_chapter.content_hash
+
+    def test_read_public_chapter_content(self, client: TestClient, api_v1_prefix: str, db_session: Session, test_chapter: Chapter):
+        """Test the public content endpoint only serves published chapters."""
+        response = client.get(f"{api_v1_prefix}/chapters/public/{test_chapter.id}/content")
+        assert response.status_code == 200
+        assert response.json()["data"]["content"] == test_chapter.content
+
+        crud_chapter.update(db_session, db_obj=test_chapter, obj_in={"is_published": False})
+        response = client.get(f"{api_v1_prefix}/chapters/public/{test_chapter.id}/content")
+        assert response.status_code == 404
+
+    def test_read_public_chapter_text_with_prefetch_hint(self, client: TestClient, api_v1_prefix: str, multiple_chapters: list):
+        """Test the text endpoint serves the body and points at the next published chapter."""
+        first, second = multiple_chapters[0], multiple_chapters[1]
+        response = client.get(f"{api_v1_prefix}/chapters/public/{first.id}/text")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == first.content
+        assert response.headers["etag"] == f'"{first.content_hash}"'
+        assert response.headers["x-next-chapter-id"] == str(second.id)
+        assert response.headers["x-next-chapter-hash"] == second.content_hash
+        assert f"/chapters/public/{second.id}/text" in response.headers["link"]
+
+        # Chapter 4 is unpublished, so the last published chapter has no hint
+        response = client.get(f"{api_v1_prefix}/chapters/public/{multiple_chapters[2].id}/text")
+        assert "x-next-chapter-id" not in response.headers
+
+        response = client.get(f"{api_v1_prefix}/chapters/public/{first.id}/content")
+        assert response.json()["data"]["next_chapter"]["id"] == second.id
+
+    def test_read_public_chapter_text_range(self, client: TestClient, api_v1_prefix: str, test_chapter: Chapter):
+        """Test byte ranges and conditional requests on the text endpoint."""
+        url = f"{api_v1_prefix}/chapters/public/{test_chapter.id}/text"
+        body = test_chapter.content.encode("utf-8")
+
+        response = client.get(url, headers={"Range": "bytes=0-9"})
+        assert response.status_code == 206
+        assert response.content == body[:10]
+        assert response.headers["content-range"] == f"bytes 0-9/{len(body)}"
+
+        response = client.get(url, headers={"Range": "bytes=-5"})
+        assert response.status_code == 206
+        assert response.content == body[-5:]
+
+        response = client.get(url, headers={"Range": f"bytes={len(body)}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(body)}"
+
+        response = client.get(url, headers={"If-None-Match": f'"{test_chapter.content_hash}"'})
+        assert response.status_code == 304
+
+    def test_read_public_chapter_text_precompressed(self, client: TestClient, api_v1_prefix: str, db_session: Session, test_book: Book, monkeypatch):
+        """Test clients accepting gzip get the variant built on write."""
+        from app.core.settings import settings
+
+        monkeypatch.setattr(settings, "CHAPTER_CONTENT_COMPRESSION_MIN_SIZE", 64)
+        monkeypatch.setattr(settings, "CHAPTER_CONTENT_VARIANTS", ["gzip"])
+        content = "<p>A long paragraph.</p>" * 100
+        chapter = crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(title="Long", content=content, chapter_number=9, book_id=test_book.id, is_published=True),
+        )
+        assert chapter.content_data.gzip_body is not None
+
+        url = f"{api_v1_prefix}/chapters/public/{chapter.id}/text"
+        response = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["etag"] == f'"{chapter.content_hash}-gzip"'
+        assert response.text == content
+
+        response = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text == content
+
 
 class TestChapterCRUD:
     """Test chapter CRUD operations."""
@@ -398,6 +495,40 @@ class TestChapterCRUD:
                 break
         assert found
 
+    def test_chapter_content_compressed_round_trip(self, db_session: Session, test_book: Book, monkeypatch):
+        """Test large bodies are stored compressed and read back unchanged."""
+        from app.core.settings import settings
+
+        monkeypatch.setattr(settings, "CHAPTER_CONTENT_COMPRESSION", "gzip")
+        monkeypatch.setattr(settings, "CHAPTER_CONTENT_COMPRESSION_MIN_SIZE", 64)
+        content = "Một chương rất dài. " * 200
+        chapter = crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(title="Long chapter", content=content, chapter_number=7, book_id=test_book.id),
+        )
+        db_session.expire_all()
+
+        chapter = crud_chapter.get_content(db_session, id=chapter.id)
+        assert chapter.content_data.encoding == "gzip"
+        assert chapter.content_data.body is None
+        assert len(chapter.content_data.compressed_body) < len(content.encode("utf-8"))
+        assert chapter.content == content
+        assert chapter.content_size == len(content.encode("utf-8"))
+
+    def test_update_chapter_content(self, db_session: Session, test_chapter: Chapter):
+        """Test updating content rewrites the stored body and its hash."""
+        old_hash = test_chapter.content_hash
+
+        chapter = crud_chapter.update(db_session, db_obj=test_chapter, obj_in={"content": "Rewritten"})
+        assert chapter.content == "Rewritten"
+        assert chapter.content_size == len("Rewritten")
+        assert chapter.content_hash != old_hash
+
+        chapter = crud_chapter.update(db_session, db_obj=chapter, obj_in={"content": None})
+        assert chapter.content is None
+        assert chapter.content_hash is None
+        assert db_session.query(ChapterContent).filter_by(chapter_id=chapter.id).count() == 0
+
     def test_search_chapters_no_results(self, db_session: Session):
         """Test searching chapters with no results."""
         chapters = crud_chapter.search_chapters(db_session, query="nonexistentkeyword")
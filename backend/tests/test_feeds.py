@@ -0,0 +1,206 @@
+"""
+Test the precomputed public feeds.
+"""
+
+import json
+import time
+
+import pytest
+
+from app.crud.book import crud_book
+from app.models.favorite import Favorite
+from app.models.feed_snapshot import FeedSnapshot
+from app.schemas.book import BookCreate
+from app.services.feed_service import FeedService, category_feed, feed_service
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def feeds_enabled(monkeypatch):
+    monkeypatch.setattr("app.services.feed_service.settings.FEEDS_ENABLED", True)
+    # Feeds are cached per process; start every test without them
+    monkeypatch.setattr(feed_service, "_feeds", {})
+
+
+@pytest.fixture
+def favorited(db_session, test_book, test_book_2, test_user, test_user_2):
+    """test_book_2 favorited twice, test_book once."""
+    db_session.add_all(
+        [
+            Favorite(user_id=test_user.id, book_id=test_book_2.id),
+            Favorite(user_id=test_user_2.id, book_id=test_book_2.id),
+            Favorite(user_id=test_user.id, book_id=test_book.id),
+        ]
+    )
+    db_session.commit()
+    return test_book_2
+
+
+class TestFeedService:
+    """Test feeds are built, stored and read back."""
+
+    def test_refresh(self, db_session, favorited, test_book, test_category):
+        """Test every feed is stored as a JSON snapshot."""
+        service = FeedService()
+
+        count = service.refresh(db_session)
+
+        names = {snapshot.name for snapshot in db_session.query(FeedSnapshot)}
+        assert names == {
+            "featured",
+            "free",
+            "most_favorited",
+            "most_read",
+            category_feed(test_category.id),
+        }
+        assert count == len(names)
+
+        most_favorited = service.get(db_session, "most_favorited")
+        assert json.loads(most_favorited.page(0, 1))[0]["id"] == favorited.id
+        assert len(most_favorited.items) == 2
+        assert service.get(db_session, "most_read").items == []
+        category = service.get(db_session, category_feed(test_category.id))
+        assert category.total == 2
+
+    def test_get_reads_snapshots(self, db_session, test_book, feeds_enabled):
+        """Test a process without the feed reads the stored snapshot."""
+        FeedService().refresh(db_session)
+        crud_book.update(db_session, db_obj=test_book, obj_in={"title": "Renamed"})
+
+        feed = FeedService().get(db_session, "featured")
+
+        # Still the snapshot, until the next refresh
+        assert "Renamed" not in feed.page()
+        assert "Philosopher" in feed.page()
+
+    def test_unknown_feed(self, db_session):
+        with pytest.raises(KeyError):
+            FeedService().build_feed(db_session, "unknown")
+
+    def test_missing_category(self, db_session, feeds_enabled):
+        """Test feeds of categories that do not exist are neither built nor cached."""
+        service = FeedService()
+
+        with pytest.raises(KeyError):
+            service.get(db_session, category_feed(999999))
+        assert service._feeds == {}
+
+
+class TestFeedEndpoints:
+    """Test public listings served from the feeds."""
+
+    def test_featured(
+        self, client, api_v1_prefix, db_session, test_book, feeds_enabled
+    ):
+        """Test the featured listing keeps its response shape."""
+        feed_service.refresh(db_session)
+
+        response = client.get(f"{api_v1_prefix}/books/public/featured?limit=5")
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["success"] is True
+        assert [book["id"] for book in data["data"]] == [test_book.id]
+        assert data["data"][0]["author"]["id"] == test_book.author_id
+        assert data["meta"]["total"] == 1
+        assert "generated_at" in data["meta"]
+
+    def test_category_page(
+        self, client, api_v1_prefix, db_session, test_book, test_book_2, feeds_enabled
+    ):
+        """Test pages of a category feed."""
+        feed_service.refresh(db_session)
+        url = f"{api_v1_prefix}/books/public/category/{test_book.category_id}"
+
+        data = client.get(url, params={"skip": 1, "limit": 1}).json()
+
+        assert len(data["data"]) == 1
+        assert data["meta"]["total"] == 2
+        assert data["meta"]["skip"] == 1
+
+    def test_home(self, client, api_v1_prefix, favorited, feeds_enabled):
+        """Test all homepage feeds come in one response."""
+        response = client.get(f"{api_v1_prefix}/books/public/home?limit=1")
+
+        data = response.json()["data"]
+        assert set(data) == {"featured", "free", "most_favorited", "most_read"}
+        assert [book["id"] for book in data["most_favorited"]] == [favorited.id]
+
+    def test_missing_category(self, client, api_v1_prefix, feeds_enabled):
+        response = client.get(f"{api_v1_prefix}/books/public/category/999999")
+
+        assert response.status_code == 200
+        assert response.json()["data"] == []
+
+    def test_negative_skip(self, client, api_v1_prefix, feeds_enabled):
+        response = client.get(f"{api_v1_prefix}/books/public/free?skip=-1")
+
+        assert response.status_code == 422
+
+    @pytest.mark.parametrize(
+        "path",
+        ["free", "featured", "home", "feeds/most_favorited", "category/1"],
+    )
+    def test_non_positive_limit(self, client, api_v1_prefix, feeds_enabled, path):
+        response = client.get(f"{api_v1_prefix}/books/public/{path}?limit=0")
+
+        assert response.status_code == 422
+
+    def test_feed(self, client, api_v1_prefix, favorited):
+        """Test single feeds are built live when feeds are disabled."""
+        response = client.get(f"{api_v1_prefix}/books/public/feeds/most_favorited")
+
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 2
+        assert (
+            client.get(f"{api_v1_prefix}/books/public/feeds/unknown").status_code == 404
+        )
+
+
+class TestFeedRefresher:
+    """Test the refresher thread rebuilds feeds after catalog changes."""
+
+    @pytest.fixture
+    def refresher(self, feeds_enabled, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.feed_service.SessionLocal", TestingSessionLocal
+        )
+        monkeypatch.setattr("app.services.feed_service.settings.FEED_REFRESH_DELAY", 0)
+        feed_service.start()
+        yield feed_service
+        feed_service.stop()
+
+    def _wait_for_featured(self, refresher, done):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            featured = refresher._feeds.get("featured")
+            if featured and done(featured[0]):
+                return featured[0]
+            time.sleep(0.01)
+        return featured[0]
+
+    def test_refresh_on_commit(self, db_session, test_book_data, refresher):
+        crud_book.create(db_session, obj_in=BookCreate(**test_book_data))
+
+        featured = self._wait_for_featured(refresher, lambda feed: feed.items)
+
+        assert "Philosopher" in featured.page()
+
+    def test_refresh_on_bulk_delete(self, db_session, test_book, refresher):
+        """Test bulk statements, which skip the flush, also refresh the feeds."""
+        self._wait_for_featured(refresher, lambda feed: feed.items)
+
+        crud_book.bulk_delete(db_session, ids=[test_book.id])
+
+        featured = self._wait_for_featured(refresher, lambda feed: not feed.items)
+        assert featured.items == []
+
+    def test_favorites_do_not_refresh(self, db_session, favorited, refresher):
+        """Test favorites wait for the periodic refresh."""
+        self._wait_for_featured(refresher, lambda feed: feed.items)
+        refresher._stale.clear()
+
+        db_session.query(Favorite).delete()
+        db_session.commit()
+
+        assert not refresher._stale.is_set()
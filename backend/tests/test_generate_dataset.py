@@ -0,0 +1,100 @@
+"""
+Test the synthetic dataset generator.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from scripts.generate_dataset import build_params, generate_dataset
+
+SIZES = {"users": 30, "authors": 6, "categories": 4, "books": 80, "reading_lists": 10}
+
+TABLES = [
+    "users",
+    "books",
+    "chapters",
+    "chapter_contents",
+    "favorites",
+    "reading_progress",
+    "reading_list_items",
+]
+
+
+@pytest.fixture(scope="module")
+def params():
+    return build_params("tiny", seed=7, **SIZES)
+
+
+def _snapshot(url: str) -> dict:
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        snapshot = {
+            table: conn.execute(text(f"SELECT * FROM {table} ORDER BY 1, 2")).fetchall()
+            for table in TABLES
+        }
+    engine.dispose()
+    return snapshot
+
+
+class TestGenerateDataset:
+    """Test dataset generation into SQLite."""
+
+    def test_generate_dataset(self, tmp_path, params):
+        """Test counts, derived tables and referential integrity."""
+        url = f"sqlite:///{tmp_path / 'dataset.db'}"
+
+        totals = generate_dataset(
+            url, params, workers=1, chunk_size=20, create_tables=True
+        )
+
+        assert totals["users"] == 30
+        assert totals["books"] == 80
+        assert totals["chapters"] == totals["chapter_contents"] > 0
+        assert totals["favorites"] > 0 and totals["reading_progress"] > 0
+
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            assert (
+                conn.execute(text("SELECT SUM(book_count) FROM authors")).scalar() == 80
+            )
+            assert (
+                conn.execute(text("SELECT COUNT(*) FROM chapter_search")).scalar()
+                == totals["chapters"]
+            )
+            assert conn.execute(text("PRAGMA foreign_key_check")).fetchall() == []
+            assert conn.execute(
+                text("SELECT is_admin FROM users WHERE username = 'admin'")
+            ).scalar()
+            assert conn.execute(text("SELECT COUNT(*) FROM feed_snapshots")).scalar()
+            # Stats rebuilt after the load, and their triggers back in place
+            assert (
+                conn.execute(
+                    text("SELECT SUM(favorites_count) FROM book_stats")
+                ).scalar()
+                == totals["favorites"]
+            )
+            assert conn.execute(
+                text(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' "
+                    "AND name = 'favorites_book_stats_insert'"
+                )
+            ).scalar()
+        engine.dispose()
+
+    def test_generate_dataset_deterministic(self, tmp_path, params):
+        """Test the same seed gives the same rows with any number of workers."""
+        first = f"sqlite:///{tmp_path / 'first.db'}"
+        second = f"sqlite:///{tmp_path / 'second.db'}"
+
+        generate_dataset(first, params, workers=1, chunk_size=20, create_tables=True)
+        generate_dataset(second, params, workers=2, chunk_size=20, create_tables=True)
+
+        assert _snapshot(first) == _snapshot(second)
+
+    def test_generate_dataset_refuses_existing_data(self, tmp_path, params):
+        """Test generating into a database that already has data fails."""
+        url = f"sqlite:///{tmp_path / 'dataset.db'}"
+        generate_dataset(url, params, workers=1, create_tables=True)
+
+        with pytest.raises(RuntimeError):
+            generate_dataset(url, params, workers=1)
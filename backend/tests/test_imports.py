@@ -0,0 +1,377 @@
+"""
+Test EPUB chapter import endpoints.
+"""
+
+import io
+import zipfile
+
+import pytest
+from app.crud.chapter import crud_chapter
+from app.models.book import Book
+from app.models.chapter import Chapter
+from app.schemas.chapter import ChapterCreate
+from app.services.epub_import_service import (
+    EpubError,
+    epub_import_service,
+    parse_chapter_document,
+    read_spine_documents,
+)
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+CONTAINER_XML = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>"""
+
+CHAPTER_XHTML = """<?xml version="1.0" encoding="utf-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml">
+<head><title>{title}</title><style>p {{ color: red; }}</style></head>
+<body><h1>{title}</h1><p>{body}</p></body>
+</html>"""
+
+
+def build_epub(chapters: list) -> bytes:
+    """Build an EPUB with a cover page followed by (title, body) chapters."""
+    items = ['<item id="cover" href="cover.xhtml" media-type="application/xhtml+xml"/>']
+    itemrefs = ['<itemref idref="cover"/>']
+    documents = {
+        "OEBPS/cover.xhtml": '<html><body><img src="cover.jpg"/></body></html>',
+    }
+    for index, (title, body) in enumerate(chapters, start=1):
+        items.append(
+            f'<item id="c{index}" href="text/c{index}.xhtml" media-type="application/xhtml+xml"/>'
+        )
+        itemrefs.append(f'<itemref idref="c{index}"/>')
+        documents[f"OEBPS/text/c{index}.xhtml"] = CHAPTER_XHTML.format(
+            title=title, body=body
+        )
+    opf = (
+        '<package xmlns="http://www.idpf.org/2007/opf" version="3.0">'
+        f"<manifest>{''.join(items)}</manifest>"
+        f"<spine>{''.join(itemrefs)}</spine>"
+        "</package>"
+    )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("mimetype", "application/epub+zip")
+        archive.writestr("META-INF/container.xml", CONTAINER_XML)
+        archive.writestr("OEBPS/content.opf", opf)
+        for path, document in documents.items():
+            archive.writestr(path, document)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def epub_file() -> bytes:
+    return build_epub(
+        [
+            ("The Gate", "Travellers gather at the northern gate."),
+            ("The Road", "The road winds through a wyvern&#39;s valley."),
+            ("The Keep", "At last the keep comes into view."),
+        ]
+    )
+
+
+def _import(
+    client: TestClient,
+    api_v1_prefix: str,
+    headers: dict,
+    book_id: int,
+    epub: bytes,
+    **data,
+):
+    return client.post(
+        f"{api_v1_prefix}/imports/epub",
+        headers=headers,
+        data={"book_id": book_id, **data},
+        files={"file": ("book.epub", epub, "application/epub+zip")},
+    )
+
+
+class TestEpubParsing:
+    """Test the EPUB parsing helpers."""
+
+    def test_read_spine_documents(self, epub_file: bytes):
+        """Test documents are returned in spine order."""
+        documents = read_spine_documents(epub_file)
+
+        assert len(documents) == 4
+        assert b"cover.jpg" in documents[0]
+        assert b"The Gate" in documents[1]
+        assert b"The Keep" in documents[3]
+
+    def test_read_spine_documents_invalid(self):
+        """Test a zip without an EPUB container is rejected."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("readme.txt", "not an epub")
+
+        with pytest.raises(EpubError):
+            read_spine_documents(buffer.getvalue())
+
+    def test_parse_chapter_document(self):
+        """Test title and body extraction; pages without text are skipped."""
+        raw = CHAPTER_XHTML.format(title="Opening", body="Hello there.").encode()
+
+        chapter = parse_chapter_document(raw)
+
+        assert chapter["title"] == "Opening"
+        assert "Hello there." in chapter["content"]
+        assert "color: red" not in chapter["content"]
+        assert chapter["content_size"] == len(chapter["content"].encode())
+        assert len(chapter["content_hash"]) == 64
+        assert (
+            parse_chapter_document(b"<html><body><img src='a.png'/></body></html>")
+            is None
+        )
+
+
+class TestImportEndpoints:
+    """Test EPUB import API endpoints."""
+
+    def test_import_epub_success(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        test_book: Book,
+        epub_file: bytes,
+        db_session: Session,
+    ):
+        """Test an import creates numbered chapters and completes the job."""
+        response = _import(
+            client, api_v1_prefix, admin_headers, test_book.id, epub_file
+        )
+
+        assert response.status_code == 202
+        job_id = response.json()["data"]["id"]
+
+        # TestClient runs background tasks before returning the response
+        response = client.get(
+            f"{api_v1_prefix}/imports/{job_id}", headers=admin_headers
+        )
+        assert response.status_code == 200
+        job = response.json()["data"]
+        assert job["status"] == "completed"
+        assert job["total_chapters"] == 4
+        assert job["processed_chapters"] == 4
+        assert job["imported_chapters"] == 3
+        assert job["skipped_chapters"] == 0
+
+        chapters = (
+            db_session.query(Chapter)
+            .filter(Chapter.book_id == test_book.id)
+            .order_by(Chapter.chapter_number)
+            .all()
+        )
+        assert [c.chapter_number for c in chapters] == [1, 2, 3]
+        assert [c.title for c in chapters] == ["The Gate", "The Road", "The Keep"]
+        assert all(not c.is_published for c in chapters)
+        assert "northern gate" in chapters[0].content
+        assert chapters[0].content_hash
+
+        hits = crud_chapter.search_in_book(
+            db_session, book_id=test_book.id, query="wyvern", public=False
+        )
+        assert [hit["id"] for hit in hits] == [chapters[1].id]
+
+    def test_import_epub_appends_after_last_chapter(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        test_book: Book,
+        epub_file: bytes,
+        db_session: Session,
+    ):
+        """Test chapters are numbered after the book's existing chapters by default."""
+        crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(
+                book_id=test_book.id,
+                chapter_number=5,
+                title="Prologue",
+                content="Before.",
+            ),
+        )
+
+        _import(
+            client,
+            api_v1_prefix,
+            admin_headers,
+            test_book.id,
+            epub_file,
+            is_published="true",
+        )
+
+        numbers = [
+            number
+            for (number,) in db_session.query(Chapter.chapter_number)
+            .filter(Chapter.book_id == test_book.id, Chapter.is_published.is_(True))
+            .order_by(Chapter.chapter_number)
+        ]
+        assert numbers == [6, 7, 8]
+
+    def test_import_epub_conflict_fails_job(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        test_book: Book,
+        epub_file: bytes,
+        db_session: Session,
+    ):
+        """Test conflicting chapter numbers fail the job without inserting anything."""
+        crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(
+                book_id=test_book.id,
+                chapter_number=2,
+                title="Existing",
+                content="Here first.",
+            ),
+        )
+
+        response = _import(
+            client,
+            api_v1_prefix,
+            admin_headers,
+            test_book.id,
+            epub_file,
+            start_number="1",
+        )
+        job_id = response.json()["data"]["id"]
+
+        job = client.get(
+            f"{api_v1_prefix}/imports/{job_id}", headers=admin_headers
+        ).json()["data"]
+        assert job["status"] == "failed"
+        assert "2" in job["error"]
+        assert (
+            db_session.query(Chapter).filter(Chapter.book_id == test_book.id).count()
+            == 1
+        )
+
+    def test_import_epub_conflict_skip(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        test_book: Book,
+        epub_file: bytes,
+        db_session: Session,
+    ):
+        """Test on_conflict=skip leaves out the existing chapter numbers."""
+        crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(
+                book_id=test_book.id,
+                chapter_number=2,
+                title="Existing",
+                content="Here first.",
+            ),
+        )
+
+        response = _import(
+            client,
+            api_v1_prefix,
+            admin_headers,
+            test_book.id,
+            epub_file,
+            start_number="1",
+            on_conflict="skip",
+        )
+        job_id = response.json()["data"]["id"]
+
+        job = client.get(
+            f"{api_v1_prefix}/imports/{job_id}", headers=admin_headers
+        ).json()["data"]
+        assert job["status"] == "completed"
+        assert job["imported_chapters"] == 2
+        assert job["skipped_chapters"] == 1
+        titles = [
+            title
+            for (title,) in db_session.query(Chapter.title)
+            .filter(Chapter.book_id == test_book.id)
+            .order_by(Chapter.chapter_number)
+        ]
+        assert titles == ["The Gate", "Existing", "The Keep"]
+
+    def test_import_epub_with_workers(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        test_book: Book,
+        epub_file: bytes,
+        monkeypatch,
+    ):
+        """Test parsing in a process pool gives the same result."""
+        from app.core.settings import settings
+
+        monkeypatch.setattr(settings, "EPUB_IMPORT_WORKERS", 2)
+
+        try:
+            response = _import(
+                client, api_v1_prefix, admin_headers, test_book.id, epub_file
+            )
+        finally:
+            epub_import_service.shutdown()
+        job_id = response.json()["data"]["id"]
+
+        job = client.get(
+            f"{api_v1_prefix}/imports/{job_id}", headers=admin_headers
+        ).json()["data"]
+        assert job["status"] == "completed"
+        assert job["imported_chapters"] == 3
+
+    def test_import_epub_invalid_file(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        test_book: Book,
+    ):
+        """Test a file that is not a zip archive is rejected."""
+        response = _import(
+            client, api_v1_prefix, admin_headers, test_book.id, b"plain text"
+        )
+
+        assert response.status_code == 400
+
+    def test_import_epub_book_not_found(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        admin_headers: dict,
+        epub_file: bytes,
+    ):
+        """Test importing into a missing book."""
+        response = _import(client, api_v1_prefix, admin_headers, 99999, epub_file)
+
+        assert response.status_code == 404
+
+    def test_import_epub_non_admin(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        auth_headers: dict,
+        test_book: Book,
+        epub_file: bytes,
+    ):
+        """Test regular users cannot import chapters."""
+        response = _import(client, api_v1_prefix, auth_headers, test_book.id, epub_file)
+
+        assert response.status_code == 403
+
+    def test_read_import_job_not_found(
+        self, client: TestClient, api_v1_prefix: str, admin_headers: dict
+    ):
+        """Test reading a missing import job."""
+        response = client.get(f"{api_v1_prefix}/imports/99999", headers=admin_headers)
+
+        assert response.status_code == 404
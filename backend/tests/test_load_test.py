@@ -0,0 +1,117 @@
+"""
+Test the HTTP load test driver.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import get_db
+from app.core.settings import settings
+from app.core.supabase_client import LocalStorageClient
+from app.main import app
+from scripts.generate_dataset import build_params, generate_dataset
+from scripts.load_test import LoadConfig, percentile, run_load_test
+
+
+@pytest.fixture(scope="module")
+def dataset_url(tmp_path_factory):
+    url = f"sqlite:///{tmp_path_factory.mktemp('load') / 'load.db'}"
+    params = build_params(
+        "tiny", seed=5, users=20, authors=4, categories=3, books=40, reading_lists=5
+    )
+    generate_dataset(url, params, workers=1, create_tables=True)
+    return url
+
+
+@pytest.fixture
+def dataset_app(dataset_url, tmp_path, monkeypatch):
+    engine = create_engine(dataset_url, connect_args={"check_same_thread": False})
+    session_factory = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path))
+    monkeypatch.setattr(
+        "app.api.v1.endpoints.upload.supabase_client", LocalStorageClient()
+    )
+    app.dependency_overrides[get_db] = override_get_db
+    yield app
+    app.dependency_overrides.clear()
+    engine.dispose()
+
+
+class TestLoadTest:
+    """Test load test runs against the app in-process."""
+
+    @pytest.mark.parametrize(
+        "profile, routes",
+        [
+            (
+                "readers",
+                {
+                    "POST /auth/login-json",
+                    "GET /books/public/",
+                    "GET /search/all",
+                    "GET /chapters/public/{chapter_id}/text",
+                    "PUT /reading-progress/book/{book_id}",
+                    "POST /favorites/books/{book_id}/toggle",
+                },
+            ),
+            (
+                "admins",
+                {
+                    "GET /users/",
+                    "GET /reading-progress/admin/all",
+                    "POST /upload/cover",
+                    "DELETE /upload/cover",
+                },
+            ),
+        ],
+    )
+    def test_run_load_test(self, dataset_app, tmp_path, profile, routes):
+        """Test every task of a profile runs without errors."""
+        config = LoadConfig(
+            users=3,
+            iterations=20,
+            ramp_up=0.1,
+            think_time=(0, 0),
+            profile=profile,
+            user_pool=20,
+        )
+
+        async def run():
+            transport = httpx.ASGITransport(app=dataset_app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                return await run_load_test(client, config)
+
+        report = asyncio.run(run())
+
+        assert routes <= set(report["routes"])
+        assert report["errors"] == 0
+        assert report["requests"] == sum(
+            route["requests"] for route in report["routes"].values()
+        )
+        for stats in report["routes"].values():
+            assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"]
+        # Uploaded covers are deleted again
+        assert not list(tmp_path.rglob("*.png"))
+
+    def test_percentile(self):
+        """Test nearest-rank percentiles."""
+        ordered = [float(n) for n in range(1, 101)]
+
+        assert percentile(ordered, 50) == 50.0
+        assert percentile(ordered, 99) == 99.0
+        assert percentile(ordered, 100) == 100.0
+        assert percentile([], 95) == 0.0
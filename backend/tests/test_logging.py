@@ -0,0 +1,154 @@
+"""
+Test the queued, structured logging pipeline.
+"""
+
+import json
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.logging_config import (
+    JsonFormatter,
+    RequestIdMiddleware,
+    SamplingFilter,
+    setup_logging,
+    stop_logging,
+)
+
+logger = logging.getLogger("app.tests.logging")
+
+
+@pytest.fixture
+def json_log_file(tmp_path, monkeypatch):
+    """Log as JSON to a temporary file; read it after stop_logging()."""
+    path = tmp_path / "logs" / "app.log"
+    monkeypatch.setattr("app.core.logging_config.settings.LOG_FILE", str(path))
+    monkeypatch.setattr("app.core.logging_config.settings.LOG_FORMAT", "json")
+    monkeypatch.setattr(
+        "app.core.logging_config.settings.LOG_SAMPLING", {"app.tests.sampled": 0.0}
+    )
+    setup_logging()
+    yield path
+    monkeypatch.undo()
+    setup_logging()
+
+
+def _records(path):
+    stop_logging()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestLoggingPipeline:
+    """Test records are written by the listener as JSON lines."""
+
+    def test_json_records(self, json_log_file):
+        """Test messages, extras and exceptions are structured."""
+        logger.info("Imported %d chapters", 3, extra={"book_id": 7})
+        try:
+            raise ValueError("broken")
+        except ValueError:
+            logger.exception("Import failed")
+
+        records = [
+            record
+            for record in _records(json_log_file)
+            if record["logger"] == "app.tests.logging"
+        ]
+        assert records[0]["message"] == "Imported 3 chapters"
+        assert records[0]["level"] == "INFO"
+        assert records[0]["book_id"] == 7
+        assert records[0]["request_id"] == "-"
+        assert records[1]["message"] == "Import failed"
+        assert "ValueError: broken" in records[1]["exception"]
+
+    def test_request_id(self, json_log_file):
+        """Test records logged while serving a request carry its id."""
+        app = FastAPI()
+        app.add_middleware(RequestIdMiddleware)
+
+        @app.get("/items")
+        def items():
+            logger.info("Listing items")
+            return []
+
+        client = TestClient(app)
+        generated = client.get("/items").headers["X-Request-ID"]
+        given = client.get("/items", headers={"X-Request-ID": "abc123"})
+
+        assert given.headers["X-Request-ID"] == "abc123"
+        ids = [
+            record["request_id"]
+            for record in _records(json_log_file)
+            if record["message"] == "Listing items"
+        ]
+        assert ids == [generated, "abc123"]
+
+    def test_sampling(self, json_log_file):
+        """Test sampled loggers drop INFO records but keep warnings."""
+        sampled = logging.getLogger("app.tests.sampled.module")
+        sampled.info("Dropped")
+        sampled.warning("Kept")
+
+        messages = [record["message"] for record in _records(json_log_file)]
+        assert "Kept" in messages
+        assert "Dropped" not in messages
+
+
+class TestFilters:
+    """Test the sampling filter and JSON formatter on their own."""
+
+    def test_sampling_prefixes(self):
+        """Test the longest matching logger prefix sets the rate."""
+        sampling = SamplingFilter({"app.crud": 0.0, "app.crud.book": 1.0})
+
+        def keeps(name, level=logging.INFO):
+            return sampling.filter(
+                logging.makeLogRecord({"name": name, "levelno": level})
+            )
+
+        assert keeps("app.crud.book")
+        assert not keeps("app.crud.author")
+        assert not keeps("app.crud")
+        assert keeps("app.crudités")
+        assert keeps("app.crud.author", logging.ERROR)
+
+    def test_json_formatter_is_single_line(self):
+        """Test multi-line messages stay on one line."""
+        record = logging.makeLogRecord({"name": "app", "msg": "line one\nline two"})
+
+        assert "\n" not in JsonFormatter().format(record)
+
+
+class TestValidationErrorLogging:
+    """Test the 422 handler does not leak credentials into the logs."""
+
+    def test_headers_not_logged(self, client, api_v1_prefix, user_token, caplog):
+        """Test the Authorization header and query string are left out."""
+        with caplog.at_level(logging.WARNING, logger="app.main"):
+            response = client.post(
+                f"{api_v1_prefix}/auth/login-json?secret=query-token",
+                json={"password": None},
+                headers={"Authorization": f"Bearer {user_token}"},
+            )
+
+        assert response.status_code == 422
+        assert (
+            f"422 Validation Error on POST {api_v1_prefix}/auth/login-json"
+            in caplog.text
+        )
+        assert user_token not in caplog.text
+        assert "query-token" not in caplog.text
+
+    def test_input_not_logged(self, client, api_v1_prefix, caplog):
+        """Test the rejected values, such as passwords, are left out."""
+        with caplog.at_level(logging.WARNING, logger="app.main"):
+            response = client.post(
+                f"{api_v1_prefix}/auth/login-json",
+                json={"password": "hunter2-secret"},
+            )
+
+        assert response.status_code == 422
+        assert "422 Validation Error" in caplog.text
+        assert "hunter2-secret" not in caplog.text
@@ -0,0 +1,117 @@
+"""
+Test the Prometheus metrics endpoint.
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core import metrics
+from app.core.database import get_db
+from app.core.metrics import (
+    record_admission,
+    record_cache,
+    setup_metrics,
+    track_email,
+)
+from app.core.supabase_client import LocalStorageClient
+from app.crud.book import crud_book
+from tests.conftest import engine
+
+pytest.importorskip("prometheus_fastapi_instrumentator")
+
+
+@pytest.fixture(scope="module")
+def metrics_app():
+    app = FastAPI()
+
+    @app.get("/books/{book_id}")
+    def read_book(book_id: int, db: Session = Depends(get_db)):
+        crud_book.get(db, id=book_id)
+        return {}
+
+    assert setup_metrics(app, engine)
+    yield app
+
+    # Recording is process-wide; switch it off again for the other tests
+    event.remove(Engine, "after_cursor_execute", metrics._observe_query)
+    metrics.REGISTRY.unregister(metrics._pool_collector)
+    metrics._pool_collector = None
+    metrics._enabled = False
+
+
+@pytest.fixture
+def metrics_client(metrics_app, db_session):
+    metrics_app.dependency_overrides[get_db] = lambda: db_session
+    yield TestClient(metrics_app)
+    metrics_app.dependency_overrides.clear()
+
+
+class TestMetrics:
+    """Test metrics collection and exposition."""
+
+    def test_request_metrics(self, metrics_client: TestClient):
+        """Test request latency is labelled with the route template."""
+        metrics_client.get("/books/1")
+        metrics_client.get("/books/2")
+
+        body = metrics_client.get("/metrics").text
+
+        assert (
+            'http_request_duration_seconds_count{handler="/books/{book_id}",'
+            'method="GET"} 2.0'
+        ) in body
+        assert "http_requests_inprogress" in body
+        assert 'handler="/metrics"' not in body
+
+    def test_query_metrics(self, metrics_client: TestClient):
+        """Test SQL statements are labelled with the CRUD method running them."""
+        metrics_client.get("/books/1")
+
+        body = metrics_client.get("/metrics").text
+
+        assert 'db_query_duration_seconds_count{crud_method="CRUDBook.get"}' in body
+
+    def test_cache_storage_and_email(self, metrics_client, tmp_path, monkeypatch):
+        """Test cache, storage and email helpers record once enabled."""
+        monkeypatch.setattr("app.core.settings.settings.UPLOAD_FOLDER", str(tmp_path))
+        storage = LocalStorageClient()
+        record_cache("chapter_etag", hit=True)
+        record_cache("chapter_etag", hit=False)
+        url = storage.upload_file(b"cover", "cover.png")
+        storage.download_file(url)
+        storage.download_file("/static/uploads/missing.png")
+        with track_email() as outcome:
+            outcome["sent"] = True
+
+        body = metrics_client.get("/metrics").text
+
+        assert 'cache_requests_total{cache="chapter_etag",result="hit"}' in body
+        assert 'cache_requests_total{cache="chapter_etag",result="miss"}' in body
+        for operation, result in (
+            ("upload", "ok"),
+            ("download", "ok"),
+            ("download", "error"),
+        ):
+            assert (
+                "storage_call_duration_seconds_count{"
+                f'backend="LocalStorageClient",operation="{operation}",'
+                f'result="{result}"}}'
+            ) in body
+        assert 'email_send_duration_seconds_count{result="sent"}' in body
+        assert "email_sends_in_progress 0.0" in body
+
+    def test_admission(self, metrics_client: TestClient):
+        """Test admission waits and refusals are recorded by route class."""
+        record_admission("search", 0.02, None)
+        record_admission("search", 1.0, "deadline")
+
+        body = metrics_client.get("/metrics").text
+
+        assert 'admission_queue_wait_seconds_count{route_class="search"} 1.0' in body
+        assert (
+            'admission_shed_total{reason="deadline",route_class="search"} 1.0'
+        ) in body
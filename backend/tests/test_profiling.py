@@ -0,0 +1,168 @@
+"""
+Test request profiling and the process-wide sampling profiler.
+"""
+
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.profiling import (
+    ProfileStore,
+    ProfilingMiddleware,
+    process_profiler,
+    profile_store,
+)
+from tests.conftest import TestingSessionLocal
+
+
+def busy_work(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def other_work(stop: threading.Event) -> None:
+    while not stop.is_set():
+        pass
+
+
+@pytest.fixture(autouse=True)
+def profiling_db(monkeypatch):
+    # Admin checks in the middleware open their own session
+    monkeypatch.setattr("app.core.profiling.SessionLocal", TestingSessionLocal)
+    yield
+    profile_store.clear()
+    process_profiler.stop()
+
+
+@pytest.fixture
+def busy_app():
+    app = FastAPI()
+    store = ProfileStore(max_size=2)
+    app.add_middleware(ProfilingMiddleware, store=store, sample_rate=1.0)
+
+    @app.get("/sync")
+    def sync_endpoint():
+        busy_work(0.1)
+        return {}
+
+    @app.get("/async")
+    async def async_endpoint():
+        busy_work(0.1)
+        return {}
+
+    return app, store
+
+
+class TestRequestProfiling:
+    """Test profiles of single requests."""
+
+    @pytest.mark.parametrize("path", ["/sync", "/async"])
+    def test_sampled_request(self, busy_app, path):
+        """Test sampled requests are profiled on the thread that runs them."""
+        app, store = busy_app
+        stop = threading.Event()
+        other = threading.Thread(target=other_work, args=(stop,))
+        other.start()
+        try:
+            response = TestClient(app).get(path)
+        finally:
+            stop.set()
+            other.join()
+
+        profile = store.get(response.headers["X-Profile-Id"])
+        stacks = profile.sampler.collapsed()
+        assert profile.path == path
+        assert profile.status_code == 200
+        assert profile.samples > 0
+        assert "busy_work (" in stacks
+        # Threads working on something else are left out
+        assert "other_work" not in stacks
+
+    def test_store_keeps_recent(self, busy_app):
+        """Test the oldest profiles are dropped and request ids are kept."""
+        app, store = busy_app
+        client = TestClient(app)
+        for request_id in ("a", "b", "c"):
+            response = client.get("/async", headers={"X-Request-ID": request_id})
+            assert response.headers["X-Profile-Id"] == request_id
+
+        assert [profile.id for profile in store.recent()] == ["c", "b"]
+
+    def test_admin_header(self, client, api_v1_prefix, admin_headers):
+        """Test admins sending the header get a downloadable profile."""
+        response = client.get(
+            f"{api_v1_prefix}/books/", headers={**admin_headers, "X-Profile": "1"}
+        )
+        profile_id = response.headers["X-Profile-Id"]
+
+        listed = client.get(
+            f"{api_v1_prefix}/profiling/requests", headers=admin_headers
+        )
+        assert listed.json()["data"][0]["id"] == profile_id
+        assert listed.json()["data"][0]["path"] == f"{api_v1_prefix}/books/"
+
+        download = client.get(
+            f"{api_v1_prefix}/profiling/requests/{profile_id}", headers=admin_headers
+        )
+        assert download.status_code == 200
+        assert download.headers["content-type"].startswith("text/plain")
+        assert (
+            f'filename="{profile_id}.folded"' in download.headers["content-disposition"]
+        )
+
+    def test_header_ignored_for_users(self, client, api_v1_prefix, auth_headers):
+        """Test the header does nothing for anonymous and regular users."""
+        for headers in ({}, auth_headers):
+            response = client.get(
+                f"{api_v1_prefix}/books/public/", headers={**headers, "X-Profile": "1"}
+            )
+            assert response.status_code == 200
+            assert "X-Profile-Id" not in response.headers
+
+    def test_unknown_profile(self, client, api_v1_prefix, admin_headers):
+        """Test downloading a profile that is not stored."""
+        response = client.get(
+            f"{api_v1_prefix}/profiling/requests/missing", headers=admin_headers
+        )
+
+        assert response.status_code == 404
+
+
+class TestProcessProfiler:
+    """Test the admin endpoints of the process-wide profiler."""
+
+    def test_start_stop_download(self, client, api_v1_prefix, admin_headers):
+        """Test a profile of the whole process can be recorded and downloaded."""
+        url = f"{api_v1_prefix}/profiling/sampler"
+
+        response = client.post(f"{url}/start?interval=0.001", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["running"] is True
+        assert client.post(f"{url}/start", headers=admin_headers).status_code == 409
+
+        busy_work(0.1)
+        response = client.post(f"{url}/stop", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json()["data"]["running"] is False
+        assert response.json()["data"]["samples"] > 0
+        assert client.post(f"{url}/stop", headers=admin_headers).status_code == 409
+
+        stacks = client.get(f"{url}/stacks", headers=admin_headers)
+        assert stacks.status_code == 200
+        assert "busy_work (" in stacks.text
+        for line in stacks.text.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+
+    def test_admin_only(self, client, api_v1_prefix, auth_headers):
+        """Test regular users cannot use the profiler."""
+        url = f"{api_v1_prefix}/profiling"
+
+        assert (
+            client.post(f"{url}/sampler/start", headers=auth_headers).status_code == 403
+        )
+        assert client.get(f"{url}/requests", headers=auth_headers).status_code == 403
@@ -0,0 +1,198 @@
+"""
+Query plan regression tests.
+
+Runs EXPLAIN on the hot CRUD queries against a seeded Postgres database and
+fails when a sequential scan shows up on one of the large tables. Set
+TEST_POSTGRES_URL to a throwaway database to run them; the schema in that
+database is dropped and recreated.
+"""
+
+import json
+import os
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.crud.book import crud_book
+from app.crud.chapter import crud_chapter
+from app.crud.favorite import crud_favorite
+from app.crud.reading_list import crud_reading_list
+from app.crud.reading_progress import crud_reading_progress
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+# Tables seeded large enough that a sequential scan is a regression
+LARGE_TABLES = {"books", "chapters", "favorites", "reading_lists", "reading_progress"}
+
+SEED_SQL = [
+    """
+    INSERT INTO users (email, username, full_name, hashed_password, is_active, is_admin)
+    SELECT 'user' || g || '@example.com', 'user' || g, 'User ' || g, 'x', true, false
+    FROM generate_series(1, 5000) g
+    """,
+    "INSERT INTO authors (name) SELECT 'Author ' || g FROM generate_series(1, 500) g",
+    """
+    INSERT INTO categories (name, slug, is_active)
+    SELECT 'Category ' || g, 'category-' || g, true FROM generate_series(1, 50) g
+    """,
+    """
+    INSERT INTO books (title, is_free, is_active, author_id, category_id, created_at)
+    SELECT 'Book ' || g, g % 10 = 0, g % 20 <> 0, 1 + g % 500, 1 + g % 50,
+           now() - (g || ' minutes')::interval
+    FROM generate_series(1, 50000) g
+    """,
+    """
+    INSERT INTO chapters (title, chapter_number, is_published, is_active, book_id)
+    SELECT 'Chapter ' || n, n, n % 7 <> 0, true, b
+    FROM generate_series(1, 5000) b, generate_series(1, 40) n
+    """,
+    """
+    INSERT INTO favorites (user_id, book_id, created_at)
+    SELECT 1 + g % 5000, 1 + (g * 7) % 50000, now() - (g || ' seconds')::interval
+    FROM generate_series(1, 200000) g
+    ON CONFLICT DO NOTHING
+    """,
+    """
+    INSERT INTO reading_lists (name, is_public, is_active, user_id)
+    SELECT 'List ' || g, g % 50 = 0, true, 1 + g % 5000
+    FROM generate_series(1, 50000) g
+    """,
+    """
+    INSERT INTO reading_progress (user_id, book_id, current_page, status, is_completed, completed_at)
+    SELECT 1 + g % 5000, 1 + (g * 13) % 50000, g % 300,
+           CASE g % 3 WHEN 0 THEN 'completed' WHEN 1 THEN 'reading' ELSE 'not_started' END,
+           g % 3 = 0, CASE WHEN g % 3 = 0 THEN now() END
+    FROM generate_series(1, 200000) g
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+# (label, CRUD call) pairs for the hot read paths
+HOT_QUERIES = [
+    ("featured books", lambda db: crud_book.get_featured_books(db, limit=10)),
+    (
+        "active books page",
+        lambda db: crud_book.get_active_books_with_details(db, limit=20),
+    ),
+    ("public free books", lambda db: crud_book.get_public_free_books(db, limit=20)),
+    (
+        "books by category",
+        lambda db: crud_book.get_public_books_by_category(db, category_id=7, limit=20),
+    ),
+    (
+        "public chapters of a book",
+        lambda db: crud_chapter.get_public_chapters_by_book(db, book_id=42, limit=50),
+    ),
+    (
+        "public chapter count",
+        lambda db: crud_chapter.count_public_chapters_by_book(db, book_id=42),
+    ),
+    (
+        "user favorites",
+        lambda db: crud_favorite.get_by_user_with_details(db, user_id=42, limit=20),
+    ),
+    ("public reading lists", lambda db: crud_reading_list.get_public(db, limit=20)),
+    (
+        "currently reading",
+        lambda db: crud_reading_progress.get_currently_reading(
+            db, user_id=42, limit=20
+        ),
+    ),
+    (
+        "completed books",
+        lambda db: crud_reading_progress.get_completed_by_user(
+            db, user_id=42, limit=20
+        ),
+    ),
+]
+
+
+def _seq_scans(plan: dict) -> list:
+    """Collect relations read by a Seq Scan anywhere in an EXPLAIN plan tree."""
+    scans = []
+    if plan.get("Node Type") == "Seq Scan":
+        scans.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        scans.extend(_seq_scans(child))
+    return scans
+
+
+@pytest.fixture(scope="module")
+def seeded_postgres():
+    """Create the schema in TEST_POSTGRES_URL and seed the large tables."""
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    engine = create_engine(POSTGRES_URL)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        for statement in SEED_SQL:
+            conn.execute(text(statement))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+    yield engine
+
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+class TestQueryPlans:
+    """Test the hot queries are served by indexes."""
+
+    def test_composite_indexes_created(self, db_session):
+        """Test the composite and partial indexes are part of the schema."""
+        inspector = inspect(db_session.get_bind())
+        expected = {
+            "books": {
+                "ix_books_active_created_at",
+                "ix_books_category_active_created_at",
+            },
+            "chapters": {"ix_chapters_public_book_number"},
+            "favorites": {"ix_favorites_user_created_at"},
+            "reading_lists": {"ix_reading_lists_public_id"},
+            "reading_progress": {
+                "ix_reading_progress_user_status",
+                "ix_reading_progress_user_completed_at",
+            },
+        }
+
+        for table, names in expected.items():
+            indexes = {index["name"] for index in inspector.get_indexes(table)}
+            assert names <= indexes, f"{table} is missing {names - indexes}"
+
+    @pytest.mark.parametrize(
+        "label,query", HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES]
+    )
+    def test_no_seq_scan_on_large_tables(self, seeded_postgres, label, query):
+        """Test a hot CRUD query plans without sequential scans on large tables."""
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(seeded_postgres, "before_cursor_execute", capture)
+        db = sessionmaker(bind=seeded_postgres)()
+        try:
+            query(db)
+        finally:
+            event.remove(seeded_postgres, "before_cursor_execute", capture)
+
+        assert statements, f"{label} issued no SQL"
+        try:
+            for statement, parameters in statements:
+                cursor = db.connection().connection.cursor()
+                cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+
+                scanned = set(_seq_scans(plan[0]["Plan"])) & LARGE_TABLES
+                assert (
+                    not scanned
+                ), f"{label}: sequential scan on {sorted(scanned)}\n{statement}"
+        finally:
+            db.close()
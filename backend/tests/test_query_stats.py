@@ -0,0 +1,169 @@
+"""
+Test per-request SQL query counting and the query budgets of list endpoints.
+"""
+
+import logging
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.query_stats import QueryStatsMiddleware, track_queries
+from app.crud.author import crud_author
+from app.crud.book import crud_book
+from app.crud.favorite import crud_favorite
+from app.crud.reading_list import crud_reading_list, crud_reading_list_item
+from app.crud.reading_progress import crud_reading_progress
+from app.schemas.author import AuthorCreate
+from app.schemas.book import BookCreate
+from app.schemas.reading_list import ReadingListCreate
+from app.schemas.reading_progress import ReadingProgressUpdate
+
+
+class TestQueryStats:
+    """Test query counting and reporting."""
+
+    def test_headers(self, client: TestClient, api_v1_prefix: str, auth_headers: dict):
+        """Test responses carry the query count and DB time."""
+        response = client.get(f"{api_v1_prefix}/books/", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Queries"]) > 0
+        assert response.headers["Server-Timing"].startswith("db;dur=")
+
+    def test_track_queries_is_scoped(self, db_session: Session):
+        """Test only queries inside the block are counted."""
+        db_session.execute(text("SELECT 1"))
+        with track_queries() as stats:
+            db_session.execute(text("SELECT 1"))
+            db_session.execute(text("SELECT 2"))
+        db_session.execute(text("SELECT 3"))
+
+        assert stats.count == 2
+        assert stats.most_repeated() == ("SELECT 1", 1)
+
+    def test_budget_warning(self, db_session: Session, caplog):
+        """Test requests over the query budget are logged with the repeated query."""
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware, headers=True, budget=2)
+
+        @app.get("/items")
+        def items(db: Session = Depends(get_db)):
+            for _ in range(3):
+                db.execute(text("SELECT 1"))
+            return []
+
+        app.dependency_overrides[get_db] = lambda: db_session
+        with caplog.at_level(logging.WARNING, logger="app.core.query_stats"):
+            response = TestClient(app).get("/items")
+
+        assert response.headers["X-DB-Queries"] == "3"
+        assert "GET /items ran 3 queries (budget 2)" in caplog.text
+        assert "most repeated (3x): SELECT 1" in caplog.text
+
+
+class TestQueryBudgets:
+    """Test list endpoints run a constant number of queries (no N+1)."""
+
+    def _count(self, client, max_queries, url, headers):
+        with max_queries(20) as stats:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        return stats.count
+
+    def _add_book(self, db, category, number):
+        author = crud_author.create(db, obj_in=AuthorCreate(name=f"Author {number}"))
+        return crud_book.create(
+            db,
+            obj_in=BookCreate(
+                title=f"Book {number}", author_id=author.id, category_id=category.id
+            ),
+        )
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/books/",
+            "/books/public/",
+            "/authors/",
+            "/categories/",
+            "/search/all?q=Book",
+        ],
+    )
+    def test_catalog_lists(
+        self,
+        client,
+        db_session,
+        api_v1_prefix,
+        admin_headers,
+        test_category,
+        max_queries,
+        path,
+    ):
+        """Test catalog listings do not load relationships per row."""
+        url = api_v1_prefix + path
+        self._add_book(db_session, test_category, 0)
+        single = self._count(client, max_queries, url, admin_headers)
+
+        for number in range(1, 6):
+            self._add_book(db_session, test_category, number)
+        many = self._count(client, max_queries, url, admin_headers)
+
+        assert many == single
+
+    def test_user_lists(
+        self,
+        client,
+        db_session,
+        api_v1_prefix,
+        auth_headers,
+        admin_headers,
+        test_user,
+        test_category,
+        max_queries,
+    ):
+        """Test favorites, progress and reading list reads with several books."""
+        reading_list = crud_reading_list.create(
+            db_session, obj_in=ReadingListCreate(name="List", user_id=test_user.id)
+        )
+        # The favorites and progress listings with user and book details
+        # are admin views
+        requests = [
+            ("/favorites/", admin_headers),
+            ("/reading-progress/", admin_headers),
+            (f"/reading-lists/{reading_list.id}", auth_headers),
+        ]
+        counts = []
+        for number in range(4):
+            book = self._add_book(db_session, test_category, number)
+            crud_favorite.create_favorite(
+                db_session, user_id=test_user.id, book_id=book.id
+            )
+            crud_reading_progress.upsert_progress(
+                db_session,
+                user_id=test_user.id,
+                book_id=book.id,
+                obj_in=ReadingProgressUpdate(current_page=1),
+            )
+            crud_reading_list_item.add_book_to_list(
+                db_session, reading_list_id=reading_list.id, book_id=book.id
+            )
+            if number in (0, 3):
+                counts.append(
+                    [
+                        self._count(client, max_queries, api_v1_prefix + path, headers)
+                        for path, headers in requests
+                    ]
+                )
+
+        assert counts[0] == counts[1]
+
+    @pytest.mark.max_queries(4)
+    def test_max_queries_marker(self, client, api_v1_prefix, auth_headers):
+        """Test the marker budget covers the test body only."""
+        response = client.get(f"{api_v1_prefix}/auth/me", headers=auth_headers)
+
+        assert response.status_code == 200
@@ -0,0 +1,180 @@
+"""
+Test the token-bucket rate limiter.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.auth import create_access_token
+from app.core.rate_limit import (
+    MemoryBucketStore,
+    RateLimitMiddleware,
+    RedisBucketStore,
+    client_key,
+)
+
+
+@pytest.fixture
+def limited_client():
+    app = FastAPI()
+    app.add_middleware(
+        RateLimitMiddleware,
+        store=MemoryBucketStore(),
+        requests=10,
+        period=60,
+        route_costs={"/search": 5},
+        listing_unit=100,
+        exempt_paths=["/health"],
+        prefix="/api/v1",
+    )
+
+    @app.get("/api/v1/books/")
+    def books(limit: int = 10):
+        return []
+
+    @app.get("/api/v1/search/all")
+    def search():
+        return {}
+
+    @app.get("/health")
+    def health():
+        return {"status": "healthy"}
+
+    return TestClient(app)
+
+
+class TestMemoryBucketStore:
+    """Test buckets are taken from and refilled."""
+
+    def test_take_and_refill(self, monkeypatch):
+        """Test a bucket empties and refills at its rate."""
+        store = MemoryBucketStore()
+        clock = [1000.0]
+        monkeypatch.setattr("app.core.rate_limit.time.monotonic", lambda: clock[0])
+
+        def take(cost):
+            return asyncio.run(store.take("ip:1", cost, capacity=3, rate=1))
+
+        assert take(2) == (True, 1)
+        assert take(2) == (False, 1)
+        clock[0] += 1.5
+        assert take(2) == (True, 0.5)
+
+    def test_evicts_least_recently_used(self):
+        """Test the store drops the bucket seen longest ago once full."""
+        store = MemoryBucketStore(max_keys=2)
+        for key in ("a", "b", "a", "c"):
+            asyncio.run(store.take(key, 1, capacity=10, rate=0.001))
+
+        assert list(store._buckets) == ["a", "c"]
+        # "a" kept the tokens it spent
+        assert store._buckets["a"][0] == pytest.approx(8, abs=0.01)
+
+
+class TestRedisBucketStore:
+    """Test the Redis store falls back to memory while Redis is down."""
+
+    def test_cooldown(self, monkeypatch):
+        """Test Redis is not called again until the retry delay has passed."""
+        redis = pytest.importorskip("redis")
+        store = RedisBucketStore("redis://127.0.0.1:1/0")
+        calls = []
+
+        async def down(**kwargs):
+            calls.append(kwargs)
+            raise redis.ConnectionError("refused")
+
+        monkeypatch.setattr(store, "_take", down)
+        clock = [1000.0]
+        monkeypatch.setattr("app.core.rate_limit.time.monotonic", lambda: clock[0])
+
+        def take():
+            return asyncio.run(store.take("ip:1", 1, capacity=3, rate=1))
+
+        assert take() == (True, 2)
+        assert take() == (True, 1)
+        assert len(calls) == 1
+        clock[0] += 31
+        take()
+        assert len(calls) == 2
+
+
+class TestRateLimitMiddleware:
+    """Test requests are charged and refused once a bucket is empty."""
+
+    def test_limits(self, limited_client):
+        """Test the 429 carries Retry-After and the bucket's headers."""
+        for remaining in range(9, -1, -1):
+            response = limited_client.get("/api/v1/books/")
+            assert response.status_code == 200
+            assert response.headers["X-RateLimit-Remaining"] == str(remaining)
+
+        response = limited_client.get("/api/v1/books/")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "6"
+        assert response.headers["X-RateLimit-Limit"] == "10"
+        assert response.json() == {"detail": "Too many requests, please retry later"}
+
+    def test_costs(self, limited_client):
+        """Test searches and large listings take more tokens."""
+        response = limited_client.get("/api/v1/search/all")
+        assert response.headers["X-RateLimit-Remaining"] == "5"
+
+        response = limited_client.get("/api/v1/books/", params={"limit": 250})
+        assert response.headers["X-RateLimit-Remaining"] == "2"
+
+        response = limited_client.get("/api/v1/search/all")
+        assert response.status_code == 429
+
+    def test_request_cost(self):
+        """Test cost rules without a request."""
+        middleware = RateLimitMiddleware(
+            None,
+            store=None,
+            requests=10,
+            period=60,
+            route_costs={"/search": 5, "/search/books": 2},
+            listing_unit=100,
+            prefix="/api/v1",
+        )
+
+        assert middleware.request_cost("/api/v1/search/all", "") == 5
+        assert middleware.request_cost("/api/v1/search/books", "") == 2
+        assert middleware.request_cost("/api/v1/searchers", "") == 1
+        assert middleware.request_cost("/api/v1/books/", "limit=abc") == 1
+        assert middleware.request_cost("/api/v1/books/", "limit=10000") == 10
+
+    def test_exempt(self, limited_client):
+        """Test health checks are not charged."""
+        for _ in range(20):
+            assert limited_client.get("/health").status_code == 200
+
+        assert limited_client.get("/api/v1/books/").status_code == 200
+
+    def test_buckets_per_client(self, limited_client):
+        """Test each signed-in user has a bucket apart from their IP's."""
+        headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+        limited_client.get("/api/v1/search/all", headers=headers)
+        limited_client.get("/api/v1/search/all", headers=headers)
+
+        assert limited_client.get("/api/v1/books/", headers=headers).status_code == 429
+        assert limited_client.get("/api/v1/books/").status_code == 200
+
+
+class TestClientKey:
+    """Test requests are keyed by user or address."""
+
+    def scope(self, authorization=None):
+        headers = [(b"authorization", authorization.encode())] if authorization else []
+        return {"type": "http", "headers": headers, "client": ("10.0.0.1", 5000)}
+
+    def test_user(self):
+        token = create_access_token(42)
+        assert client_key(self.scope(f"Bearer {token}")) == "user:42"
+
+    def test_invalid_token(self):
+        assert client_key(self.scope("Bearer not-a-token")) == "ip:10.0.0.1"
+        assert client_key(self.scope()) == "ip:10.0.0.1"
@@ -540,6 +540,157 @@ class TestReadingProgressCRUD:
         assert stats["currently_reading"] >= 5  # All have status "reading"
         assert stats["total_reading_time_minutes"] >= total_reading_time
 
+    def test_upsert_progress_creates_then_updates(self, db_session: Session, test_user: User, test_book: Book):
+        """Test upsert inserts once and then updates the same row."""
+        progress, created = crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=test_book.id,
+            obj_in={"current_page": 50, "total_pages": 200},
+        )
+
+        assert created is True
+        assert progress.progress_percentage == 25.0
+        assert progress.status == "reading"
+        assert progress.started_at is not None
+        assert progress.last_read_at is not None
+
+        updated, created = crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=test_book.id,
+            obj_in={"current_page": 100, "notes": "Halfway"},
+        )
+
+        assert created is False
+        assert updated.id == progress.id
+        assert updated.current_page == 100
+        assert updated.total_pages == 200
+        assert updated.progress_percentage == 50.0
+        assert updated.notes == "Halfway"
+        assert crud_reading_progress.count_by_user(db_session, user_id=test_user.id) == 1
+
+    def test_upsert_progress_completes_book(self, db_session: Session, test_user: User, test_book: Book):
+        """Test upsert marks the book completed when the last page is reached."""
+        crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=test_book.id,
+            obj_in={"current_page": 10, "total_pages": 100},
+        )
+        progress, _ = crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=test_book.id,
+            obj_in={"current_page": 100},
+        )
+
+        assert progress.status == "completed"
+        assert progress.is_completed is True
+        assert progress.completed_at is not None
+        assert progress.progress_percentage == 100.0
+
+    def test_upsert_progress_explicit_fields_win(self, db_session: Session, test_user: User, test_book: Book):
+        """Test explicitly provided fields are not overwritten by derived values."""
+        progress, _ = crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=test_book.id,
+            obj_in={"current_page": 50, "total_pages": 0, "status": "dropped"},
+        )
+
+        assert progress.status == "dropped"
+        assert progress.progress_percentage == 0.0
+        assert progress.is_completed is False
+
+    def test_duplicate_progress_rejected(self, db_session: Session, test_user: User, test_book: Book):
+        """Test the (user_id, book_id) unique constraint."""
+        from sqlalchemy.exc import IntegrityError
+
+        progress_data = {"user_id": test_user.id, "book_id": test_book.id}
+        crud_reading_progress.create(db_session, obj_in=ReadingProgressCreate(**progress_data))
+
+        with pytest.raises(IntegrityError):
+            crud_reading_progress.create(db_session, obj_in=ReadingProgressCreate(**progress_data))
+        db_session.rollback()
+
+    def test_user_stats_follow_progress_changes(self, db_session: Session, test_user: User, multiple_test_data: dict):
+        """Test the stats summary row tracks inserts, upserts and deletes."""
+        books = multiple_test_data["books"]
+
+        assert crud_reading_progress.get_user_stats(db_session, user_id=test_user.id) == {
+            "total_books": 0,
+            "completed_books": 0,
+            "currently_reading": 0,
+            "total_reading_time_minutes": 0,
+        }
+
+        first, _ = crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=books[0].id,
+            obj_in={"current_page": 10, "total_pages": 100, "reading_time_minutes": 30},
+        )
+        crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=books[1].id,
+            obj_in={"current_page": 20, "total_pages": 100, "reading_time_minutes": 15},
+        )
+
+        stats = crud_reading_progress.get_user_stats(db_session, user_id=test_user.id)
+        assert stats["total_books"] == 2
+        assert stats["currently_reading"] == 2
+        assert stats["completed_books"] == 0
+        assert stats["total_reading_time_minutes"] == 45
+
+        # Finishing a book moves it from reading to completed
+        crud_reading_progress.upsert_progress(
+            db_session,
+            user_id=test_user.id,
+            book_id=books[0].id,
+            obj_in={"current_page": 100, "reading_time_minutes": 90},
+        )
+
+        stats = crud_reading_progress.get_user_stats(db_session, user_id=test_user.id)
+        assert stats["total_books"] == 2
+        assert stats["currently_reading"] == 1
+        assert stats["completed_books"] == 1
+        assert stats["total_reading_time_minutes"] == 105
+
+        crud_reading_progress.remove(db_session, id=first.id)
+
+        stats = crud_reading_progress.get_user_stats(db_session, user_id=test_user.id)
+        assert stats["total_books"] == 1
+        assert stats["currently_reading"] == 1
+        assert stats["completed_books"] == 0
+        assert stats["total_reading_time_minutes"] == 15
+
+    def test_rebuild_user_stats(self, db_session: Session, test_user: User, multiple_test_data: dict):
+        """Test rebuilding repairs a drifted stats summary row."""
+        from app.models.user_reading_stats import UserReadingStats
+
+        for book in multiple_test_data["books"][:3]:
+            crud_reading_progress.upsert_progress(
+                db_session,
+                user_id=test_user.id,
+                book_id=book.id,
+                obj_in={"current_page": 5, "total_pages": 10, "reading_time_minutes": 20},
+            )
+
+        db_session.query(UserReadingStats).filter(
+            UserReadingStats.user_id == test_user.id
+        ).update({"total_books": 99, "total_reading_time_minutes": 0})
+        db_session.commit()
+
+        rebuilt = crud_reading_progress.rebuild_user_stats(db_session, user_id=test_user.id)
+
+        assert rebuilt == 1
+        stats = crud_reading_progress.get_user_stats(db_session, user_id=test_user.id)
+        assert stats["total_books"] == 3
+        assert stats["currently_reading"] == 3
+        assert stats["total_reading_time_minutes"] == 60
+
 
 @pytest.mark.asyncio
 class TestReadingProgressEndpointsAsync:
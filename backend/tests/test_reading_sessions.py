@@ -0,0 +1,240 @@
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.crud.reading_session import crud_reading_session
+from app.models.book import Book
+from app.models.user import User
+from app.schemas.reading_session import ReadingSessionCreate
+
+
+def _at(day: date, hour: int = 12) -> datetime:
+    return datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc) + timedelta(
+        hours=hour
+    )
+
+
+class TestReadingSessionEndpoints:
+    """Test reading session endpoints."""
+
+    def test_record_session(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        auth_headers: dict,
+        test_user: User,
+        test_book: Book,
+    ):
+        """Test recording a reading session."""
+        session_data = {
+            "book_id": test_book.id,
+            "start_page": 10,
+            "end_page": 25,
+            "duration_seconds": 900,
+        }
+        response = client.post(
+            f"{api_v1_prefix}/reading-sessions/",
+            json=session_data,
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 201
+        data = response.json()["data"]
+        assert data["user_id"] == test_user.id
+        assert data["book_id"] == test_book.id
+        assert data["end_page"] == 25
+        assert data["read_at"] is not None
+
+    def test_record_session_book_not_found(
+        self, client: TestClient, api_v1_prefix: str, auth_headers: dict
+    ):
+        """Test recording a session for a missing book."""
+        response = client.post(
+            f"{api_v1_prefix}/reading-sessions/",
+            json={"book_id": 99999},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 404
+
+    def test_record_session_negative_duration(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        auth_headers: dict,
+        test_book: Book,
+    ):
+        """Test session validation."""
+        response = client.post(
+            f"{api_v1_prefix}/reading-sessions/",
+            json={"book_id": test_book.id, "duration_seconds": -1},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
+    def test_read_stats_from_rollups(
+        self,
+        client: TestClient,
+        api_v1_prefix: str,
+        auth_headers: dict,
+        test_user: User,
+        test_book: Book,
+        db_session: Session,
+    ):
+        """Test the stats endpoints serve the rolled up aggregates."""
+        today = date.today()
+        crud_reading_session.create_session(
+            db_session,
+            user_id=test_user.id,
+            obj_in=ReadingSessionCreate(
+                book_id=test_book.id,
+                start_page=0,
+                end_page=20,
+                duration_seconds=600,
+                read_at=_at(today),
+            ),
+        )
+        crud_reading_session.rollup(db_session, start=today - timedelta(days=7))
+
+        response = client.get(
+            f"{api_v1_prefix}/reading-sessions/stats", headers=auth_headers
+        )
+        assert response.status_code == 200
+        rows = response.json()["data"]
+        assert len(rows) == 1
+        assert rows[0]["period_start"] == today.isoformat()
+        assert rows[0]["reading_seconds"] == 600
+        assert rows[0]["pages_read"] == 20
+
+        response = client.get(
+            f"{api_v1_prefix}/reading-sessions/books/{test_book.id}/stats",
+            params={"period": "week"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        rows = response.json()["data"]
+        assert len(rows) == 1
+        assert (
+            rows[0]["period_start"]
+            == (today - timedelta(days=today.weekday())).isoformat()
+        )
+        assert rows[0]["readers"] == 1
+
+    def test_read_stats_invalid_period(
+        self, client: TestClient, api_v1_prefix: str, auth_headers: dict
+    ):
+        """Test the period parameter is validated."""
+        response = client.get(
+            f"{api_v1_prefix}/reading-sessions/stats",
+            params={"period": "year"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 422
+
+
+class TestReadingSessionRollups:
+    """Test reading session rollup job."""
+
+    def test_rollup_daily_and_weekly(
+        self, db_session: Session, test_user: User, test_user_2: User, test_book: Book
+    ):
+        """Test sessions are aggregated per day and per Monday-based week."""
+        monday = date(2026, 10, 12)
+        sessions = [
+            (test_user, monday, 0, 10, 300),
+            (test_user, monday, 10, 30, 600),
+            (test_user, monday + timedelta(days=2), 30, 35, 120),
+            (test_user_2, monday + timedelta(days=6), 0, 50, 1800),
+            # Next week
+            (test_user, monday + timedelta(days=7), 35, 40, 60),
+        ]
+        for user, day, start_page, end_page, seconds in sessions:
+            crud_reading_session.create_session(
+                db_session,
+                user_id=user.id,
+                obj_in=ReadingSessionCreate(
+                    book_id=test_book.id,
+                    start_page=start_page,
+                    end_page=end_page,
+                    duration_seconds=seconds,
+                    read_at=_at(day),
+                ),
+            )
+
+        crud_reading_session.rollup(
+            db_session, start=monday, end=monday + timedelta(days=14)
+        )
+
+        daily = crud_reading_session.get_user_rollups(
+            db_session, user_id=test_user.id, period="day", since=monday
+        )
+        assert [
+            (r.period_start, r.sessions, r.reading_seconds, r.pages_read) for r in daily
+        ] == [
+            (monday, 2, 900, 30),
+            (monday + timedelta(days=2), 1, 120, 5),
+            (monday + timedelta(days=7), 1, 60, 5),
+        ]
+
+        weekly = crud_reading_session.get_book_rollups(
+            db_session, book_id=test_book.id, period="week", since=monday
+        )
+        assert [
+            (r.period_start, r.sessions, r.readers, r.reading_seconds) for r in weekly
+        ] == [
+            (monday, 4, 2, 2820),
+            (monday + timedelta(days=7), 1, 1, 60),
+        ]
+
+    def test_rollup_is_idempotent(
+        self, db_session: Session, test_user: User, test_book: Book
+    ):
+        """Test re-running the rollup replaces rather than adds to buckets."""
+        day = date(2026, 10, 14)
+        crud_reading_session.create_session(
+            db_session,
+            user_id=test_user.id,
+            obj_in=ReadingSessionCreate(
+                book_id=test_book.id, duration_seconds=100, read_at=_at(day)
+            ),
+        )
+
+        crud_reading_session.rollup(db_session, start=day, end=day + timedelta(days=1))
+        crud_reading_session.rollup(db_session, start=day, end=day + timedelta(days=1))
+
+        daily = crud_reading_session.get_user_rollups(
+            db_session, user_id=test_user.id, period="day", since=day
+        )
+        assert len(daily) == 1
+        assert daily[0].reading_seconds == 100
+
+    def test_rollup_mid_week_end_keeps_whole_week(
+        self, db_session: Session, test_user: User, test_book: Book
+    ):
+        """Test a window ending mid-week still rebuilds the week from all its sessions."""
+        monday = date(2026, 10, 12)
+        for day in (monday, monday + timedelta(days=3)):
+            crud_reading_session.create_session(
+                db_session,
+                user_id=test_user.id,
+                obj_in=ReadingSessionCreate(
+                    book_id=test_book.id, duration_seconds=100, read_at=_at(day)
+                ),
+            )
+
+        crud_reading_session.rollup(
+            db_session, start=monday, end=monday + timedelta(days=7)
+        )
+        crud_reading_session.rollup(
+            db_session, start=monday, end=monday + timedelta(days=1)
+        )
+
+        weekly = crud_reading_session.get_user_rollups(
+            db_session, user_id=test_user.id, period="week", since=monday
+        )
+        assert [(r.period_start, r.sessions, r.reading_seconds) for r in weekly] == [
+            (monday, 2, 200)
+        ]
@@ -0,0 +1,194 @@
+"""
+Test item-to-item recommendations and the similar books endpoints.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.crud.book import crud_book
+from app.models.book_similarity import BookSimilarity
+from app.models.favorite import Favorite
+from app.models.reading_list import ReadingList, ReadingListItem
+from app.models.reading_progress import ReadingProgress
+from app.schemas.book import BookCreate
+from app.services.recommendation_service import RecommendationService
+
+
+@pytest.fixture
+def numpy():
+    pytest.importorskip("scipy")
+    return pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def test_book_3(db_session, test_author, test_category):
+    return crud_book.create(
+        db_session,
+        obj_in=BookCreate(
+            title="The Prisoner of Azkaban",
+            author_id=test_author.id,
+            category_id=test_category.id,
+        ),
+    )
+
+
+class TestSimilarBooks:
+    """Test the vectorized similarity computation."""
+
+    def test_cosine_top_k(self, numpy):
+        # Users 1 and 2 read books 10 and 20; user 3 read 20 and 30
+        user_ids = numpy.array([1, 1, 2, 2, 3, 3])
+        book_ids = numpy.array([10, 20, 10, 20, 20, 30])
+        weights = numpy.ones(6, dtype=numpy.float32)
+
+        blocks = list(
+            RecommendationService().similar_books(
+                user_ids, book_ids, weights, top_k=5, block_cells=3
+            )
+        )
+
+        # One book per block
+        assert len(blocks) == 3
+        pairs = {
+            (book, rank): (similar, round(float(score), 3))
+            for block in blocks
+            for book, rank, similar, score in zip(*block)
+        }
+        assert pairs == {
+            (10, 1): (20, 0.816),
+            (20, 1): (10, 0.816),
+            (20, 2): (30, 0.577),
+            (30, 1): (20, 0.577),
+        }
+
+    def test_top_k_and_ties(self, numpy):
+        """Test only k neighbours are kept, ties going to the lower id."""
+        user_ids = numpy.array([1, 1, 1, 1])
+        book_ids = numpy.array([4, 3, 2, 1])
+        weights = numpy.ones(4, dtype=numpy.float32)
+
+        (block,) = RecommendationService().similar_books(
+            user_ids, book_ids, weights, top_k=2, block_cells=100
+        )
+
+        books, ranks, similar, _ = (column.tolist() for column in block)
+        assert list(zip(books, ranks, similar))[:4] == [
+            (1, 1, 2),
+            (1, 2, 3),
+            (2, 1, 1),
+            (2, 2, 3),
+        ]
+
+    def test_nothing_to_compare(self, numpy):
+        empty = numpy.empty(0, dtype=numpy.int64)
+
+        blocks = RecommendationService().similar_books(
+            empty, empty, empty.astype(numpy.float32), top_k=5, block_cells=100
+        )
+
+        assert list(blocks) == []
+
+
+class TestBuild:
+    """Test the job reads every interaction and writes book_similarities."""
+
+    def test_build(
+        self,
+        db_session,
+        numpy,
+        test_book,
+        test_book_2,
+        test_book_3,
+        test_user,
+        test_user_2,
+    ):
+        reading_list = ReadingList(name="Next", user_id=test_user_2.id)
+        db_session.add(reading_list)
+        db_session.flush()
+        db_session.add_all(
+            [
+                Favorite(user_id=test_user.id, book_id=test_book.id),
+                ReadingProgress(
+                    user_id=test_user.id, book_id=test_book_2.id, is_completed=True
+                ),
+                # Not completed: no signal
+                ReadingProgress(user_id=test_user.id, book_id=test_book_3.id),
+                ReadingListItem(reading_list_id=reading_list.id, book_id=test_book.id),
+                ReadingListItem(
+                    reading_list_id=reading_list.id, book_id=test_book_3.id
+                ),
+            ]
+        )
+        db_session.commit()
+
+        written = RecommendationService().build(db_session)
+
+        rows = db_session.query(BookSimilarity).order_by(
+            BookSimilarity.book_id, BookSimilarity.rank
+        )
+        pairs = [(row.book_id, row.similar_book_id) for row in rows]
+        assert written == len(pairs) == 4
+        # test_book's favorite and completion weigh more than a list entry
+        assert pairs[:2] == [
+            (test_book.id, test_book_2.id),
+            (test_book.id, test_book_3.id),
+        ]
+
+
+class TestSimilarEndpoints:
+    """Test the similar books endpoints read the stored similarities."""
+
+    @pytest.fixture
+    def similarities(self, db_session, test_book, test_book_2, test_book_3):
+        generated_at = datetime.now(timezone.utc)
+        db_session.add_all(
+            [
+                BookSimilarity(
+                    book_id=test_book.id,
+                    rank=rank,
+                    similar_book_id=similar.id,
+                    score=score,
+                    generated_at=generated_at,
+                )
+                for rank, similar, score in (
+                    (1, test_book_3, 0.9),
+                    (2, test_book_2, 0.5),
+                )
+            ]
+        )
+        db_session.commit()
+
+    def test_public_similar(
+        self, client, api_v1_prefix, test_book, test_book_2, test_book_3, similarities
+    ):
+        response = client.get(f"{api_v1_prefix}/books/public/{test_book.id}/similar")
+
+        data = response.json()
+        assert response.status_code == 200
+        assert [book["id"] for book in data["data"]] == [test_book_3.id, test_book_2.id]
+        assert data["data"][0]["author"]["id"] == test_book.author_id
+
+    def test_similar(
+        self, client, api_v1_prefix, auth_headers, test_book, test_book_3, similarities
+    ):
+        response = client.get(
+            f"{api_v1_prefix}/books/{test_book.id}/similar?limit=1",
+            headers=auth_headers,
+        )
+
+        assert [book["id"] for book in response.json()["data"]] == [test_book_3.id]
+
+    def test_inactive_books_hidden(
+        self, client, api_v1_prefix, db_session, test_book, test_book_3, similarities
+    ):
+        crud_book.update(db_session, db_obj=test_book_3, obj_in={"is_active": False})
+
+        response = client.get(f"{api_v1_prefix}/books/public/{test_book.id}/similar")
+
+        assert test_book_3.id not in [book["id"] for book in response.json()["data"]]
+
+    def test_book_not_found(self, client, api_v1_prefix):
+        response = client.get(f"{api_v1_prefix}/books/public/999999/similar")
+
+        assert response.status_code == 404
@@ -2,11 +2,38 @@
 Test search endpoints.
 """
 import pytest
+from app.crud.chapter import crud_chapter
 from app.models.author import Author
 from app.models.book import Book
 from app.models.category import Category
+from app.schemas.chapter import ChapterCreate
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def book_chapters(db_session: Session, test_book: Book, test_book_2: Book, monkeypatch) -> list:
+    """Create searchable chapters; the long one is stored compressed."""
+    from app.core.settings import settings
+
+    monkeypatch.setattr(settings, "CHAPTER_CONTENT_COMPRESSION", "gzip")
+    monkeypatch.setattr(settings, "CHAPTER_CONTENT_COMPRESSION_MIN_SIZE", 256)
+    chapters_data = [
+        (test_book, 1, "The Dragon Awakens", "A dragon stirs beneath the mountain.", True),
+        (test_book, 2, "Market Day", "Filler about the market. " * 40 + "Then a dragon flew over the square.", True),
+        (test_book, 3, "Unpublished Draft", "The dragon returns in a draft.", False),
+        (test_book_2, 1, "Another Book", "A dragon in another book.", True),
+    ]
+    return [
+        crud_chapter.create(
+            db_session,
+            obj_in=ChapterCreate(
+                book_id=book.id, chapter_number=number, title=title, content=content, is_published=published
+            ),
+        )
+        for book, number, title, content, published in chapters_data
+    ]
 
 
 class TestSearchEndpoints:
@@ -360,6 +387,79 @@ class TestSearchEndpoints:
             assert found_book_lower == found_book_upper
 
 
+class TestBookChapterSearch:
+    """Test full-text search inside a book."""
+
+    def test_search_book_chapters_ranked_with_snippets(self, client: TestClient, api_v1_prefix: str, auth_headers: dict, book_chapters: list):
+        """Test hits are scoped to the book's published chapters and ranked."""
+        book_id = book_chapters[0].book_id
+        assert book_chapters[1].content_data.encoding == "gzip"
+
+        response = client.get(f"{api_v1_prefix}/search/books/{book_id}/chapters?q=dragon", headers=auth_headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        hits = data["data"]
+        assert [hit["id"] for hit in hits] == [book_chapters[0].id, book_chapters[1].id]
+        assert data["meta"]["total"] == 2
+        assert hits[0]["rank"] > hits[1]["rank"]  # title match weighs more
+        assert "<mark>dragon</mark>" in hits[1]["snippet"].lower()
+
+    def test_search_book_chapters_follows_updates(self, client: TestClient, api_v1_prefix: str, auth_headers: dict, db_session: Session, book_chapters: list):
+        """Test the index is updated when chapters change or are deleted."""
+        first, second = book_chapters[0], book_chapters[1]
+        url = f"{api_v1_prefix}/search/books/{first.book_id}/chapters"
+
+        crud_chapter.update(db_session, db_obj=second, obj_in={"content": "A quiet chapter about a wyvern."})
+        db_session.refresh(first)  # CRUDBase.update only sets loaded attributes
+        crud_chapter.update(db_session, db_obj=first, obj_in={"title": "Wyvern Lore"})
+        hits = client.get(f"{url}?q=wyvern", headers=auth_headers).json()["data"]
+        assert {hit["id"] for hit in hits} == {first.id, second.id}
+
+        crud_chapter.remove(db_session, id=second.id)
+        hits = client.get(f"{url}?q=wyvern", headers=auth_headers).json()["data"]
+        assert [hit["id"] for hit in hits] == [first.id]
+
+    def test_search_book_chapters_special_characters(self, client: TestClient, api_v1_prefix: str, auth_headers: dict, book_chapters: list):
+        """Test query syntax characters are treated as plain words."""
+        url = f"{api_v1_prefix}/search/books/{book_chapters[0].book_id}/chapters"
+
+        response = client.get(url, params={"q": 'dragon" AND (NEAR'}, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["data"] == []
+
+    def test_search_book_chapters_book_not_found(self, client: TestClient, api_v1_prefix: str, auth_headers: dict):
+        """Test searching a non-existent book."""
+        response = client.get(f"{api_v1_prefix}/search/books/99999/chapters?q=dragon", headers=auth_headers)
+
+        assert response.status_code == 404
+
+    def test_admin_chapter_search_uses_index(self, db_session: Session, book_chapters: list):
+        """Test CRUD chapter search matches compressed bodies through the index."""
+        chapters = crud_chapter.search_chapters(db_session, query="square")
+
+        assert [chapter.id for chapter in chapters] == [book_chapters[1].id]
+
+    def test_rebuild_search_index(self, db_session: Session, book_chapters: list):
+        """Test a rebuild batch by batch restores the index and drops stale documents."""
+        from sqlalchemy import text
+
+        connection = db_session.connection()
+        connection.execute(text("DELETE FROM chapter_search WHERE rowid = :id"), {"id": book_chapters[1].id})
+        connection.execute(
+            text("INSERT INTO chapter_search (rowid, title, body, book_id) VALUES (99999, 'Ghost', 'square', 1)")
+        )
+        db_session.commit()
+
+        assert crud_chapter.rebuild_search_index(db_session, batch_size=2) == len(book_chapters)
+
+        chapters = crud_chapter.search_chapters(db_session, query="square")
+        assert [chapter.id for chapter in chapters] == [book_chapters[1].id]
+        count = db_session.execute(text("SELECT count(*) FROM chapter_search")).scalar()
+        assert count == len(book_chapters)
+
+
 @pytest.mark.asyncio
 class TestSearchEndpointsAsync:
     """Test search endpoints with async client."""
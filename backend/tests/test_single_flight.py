@@ -0,0 +1,259 @@
+"""
+Test request coalescing of identical concurrent CRUD reads.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload
+
+from app.core.single_flight import SingleFlight, coalesced, single_flight
+from app.crud.book import crud_book
+from app.models.book import Book
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(autouse=True)
+def _no_calls_left():
+    yield
+    assert single_flight.in_flight() == 0
+
+
+def _run_concurrently(leader, followers):
+    """Start ``leader``, then ``followers`` once it is in flight."""
+    threads = [threading.Thread(target=leader)]
+    threads[0].start()
+    while not single_flight.in_flight():
+        time.sleep(0.001)
+    threads += [threading.Thread(target=follower) for follower in followers]
+    for thread in threads[1:]:
+        thread.start()
+    # Let the followers join the call before it finishes
+    time.sleep(0.05)
+    return threads
+
+
+class _Catalog:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+
+    @coalesced
+    def featured(self, db, *, limit: int):
+        self.calls += 1
+        self.release.wait(5)
+        return db.query(Book).options(joinedload(Book.author)).limit(limit).all()
+
+
+class TestSingleFlight:
+    """Test concurrent calls with the same key share one run."""
+
+    def test_shared_result(self):
+        """Test waiters get the leader's result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def work():
+            calls.append(1)
+            release.wait(5)
+            return "result"
+
+        def call():
+            results.append(flight.do("key", work))
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        while not flight.in_flight():
+            time.sleep(0.001)
+        threads += [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert sorted(results) == [("result", False)] + [("result", True)] * 3
+        assert flight.in_flight() == 0
+
+    def test_waiters_get_shared_copy(self):
+        """Test waiters get what ``share`` made of the result, made once."""
+        flight = SingleFlight()
+        release = threading.Event()
+        shared = []
+        results = []
+
+        def work():
+            release.wait(5)
+            return ["result"]
+
+        def share(result):
+            shared.append(result)
+            return list(result)
+
+        def call():
+            results.append(flight.do("key", work, share=share))
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        while not flight.in_flight():
+            time.sleep(0.001)
+        threads += [threading.Thread(target=call) for _ in range(2)]
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        (original,) = shared
+        assert [result for result, joined in results if not joined] == [original]
+        copies = [result for result, joined in results if joined]
+        assert len(copies) == 2
+        assert all(copy == original and copy is not original for copy in copies)
+
+    def test_no_share_without_waiters(self):
+        """Test a call nobody joined skips ``share``."""
+        flight = SingleFlight()
+
+        assert flight.do("key", lambda: "result", share=pytest.fail) == (
+            "result",
+            False,
+        )
+
+    def test_errors_are_shared(self):
+        """Test waiters see the leader's error and later calls run again."""
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            release.wait(5)
+            raise ValueError("database is down")
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call)]
+        threads[0].start()
+        while not flight.in_flight():
+            time.sleep(0.001)
+        threads.append(threading.Thread(target=call))
+        threads[1].start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 2
+        assert flight.do("key", lambda: "recovered") == ("recovered", False)
+
+    def test_timeout(self):
+        """Test a waiter gives up on a stuck call and runs its own."""
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(
+            target=flight.do, args=("key", lambda: release.wait(5))
+        )
+        leader.start()
+        while not flight.in_flight():
+            time.sleep(0.001)
+
+        assert flight.do("key", lambda: "own", timeout=0.01) == ("own", False)
+        release.set()
+        leader.join()
+
+
+class TestCoalescedReads:
+    """Test decorated CRUD reads hand waiters objects of their own session."""
+
+    def test_objects_merged_into_session(self, db_session, test_book):
+        """Test one query serves all sessions, each with its own copies."""
+        catalog = _Catalog()
+        sessions = [TestingSessionLocal() for _ in range(3)]
+        results = {}
+
+        def read(session):
+            return lambda: results.__setitem__(
+                session, catalog.featured(session, limit=5)
+            )
+
+        try:
+            threads = _run_concurrently(
+                read(sessions[0]), [read(session) for session in sessions[1:]]
+            )
+            catalog.release.set()
+            for thread in threads:
+                thread.join()
+
+            assert catalog.calls == 1
+            for session in sessions:
+                (book,) = results[session]
+                assert book in session
+                assert book.author in session
+                assert book.title == test_book.title
+            assert len({id(books[0]) for books in results.values()}) == 3
+            # The leader's objects stay in the leader's session
+            assert not any(
+                inspect(results[session][0]).session is sessions[0]
+                for session in sessions[1:]
+            )
+        finally:
+            for session in sessions:
+                session.close()
+
+    def test_pending_changes_not_coalesced(self, db_session, test_book):
+        """Test sessions with unflushed changes run their own query."""
+        catalog = _Catalog()
+        other = TestingSessionLocal()
+        test_book.title = "Renamed"
+
+        try:
+            threads = _run_concurrently(
+                lambda: catalog.featured(other, limit=5),
+                [lambda: catalog.featured(db_session, limit=5)],
+            )
+            catalog.release.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            other.close()
+
+        assert catalog.calls == 2
+
+    def test_refresher_sessions_not_coalesced(self, db_session, test_book):
+        """Test sessions that opt out run their own query."""
+        catalog = _Catalog()
+        first = TestingSessionLocal()
+        refresher = TestingSessionLocal(info={"coalesce": False})
+
+        try:
+            threads = _run_concurrently(
+                lambda: catalog.featured(first, limit=5),
+                [lambda: catalog.featured(refresher, limit=5)],
+            )
+            catalog.release.set()
+            for thread in threads:
+                thread.join()
+        finally:
+            first.close()
+            refresher.close()
+
+        assert catalog.calls == 2
+
+    def test_disabled(self, db_session, test_book, monkeypatch):
+        """Test the decorator steps aside when coalescing is off."""
+        monkeypatch.setattr(
+            "app.core.single_flight.settings.SINGLE_FLIGHT_ENABLED", False
+        )
+
+        assert crud_book.get_with_details(db_session, id=test_book.id) == test_book
+        assert single_flight.in_flight() == 0
@@ -0,0 +1,116 @@
+"""
+Test the slow-query log and its admin endpoint.
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.core.slow_queries import SlowQueryLog, normalize_sql, parameter_shapes
+from tests.conftest import engine
+
+
+@pytest.fixture
+def slow_log(monkeypatch):
+    # A zero threshold captures every statement of the test engine
+    log = SlowQueryLog(0, size=500)
+    log.install(engine)
+    monkeypatch.setattr("app.api.v1.endpoints.slow_queries.slow_query_log", log)
+    yield log
+    log.remove(engine)
+
+
+class TestNormalization:
+    """Test statements and parameters are stripped of values."""
+
+    def test_normalize_sql(self):
+        """Test literals, parameters and IN lists become placeholders."""
+        statement = """
+            SELECT books.id FROM books
+            WHERE books.title = 'It''s' AND books.id IN (%(id_1)s, %(id_2)s)
+            AND books.author_id = ? AND books.rating > 4.5
+            LIMIT 10 OFFSET :offset
+        """
+
+        assert normalize_sql(statement) == (
+            "SELECT books.id FROM books WHERE books.title = ? "
+            "AND books.id IN (?, ...) AND books.author_id = ? "
+            "AND books.rating > ? LIMIT ? OFFSET ?"
+        )
+
+    def test_parameter_shapes(self):
+        """Test parameters are reduced to their types and lengths."""
+        assert parameter_shapes({"title": "Dune", "id": 3, "cover": None}) == {
+            "title": "str[4]",
+            "id": "int",
+            "cover": "NoneType",
+        }
+        assert parameter_shapes((1, "abc")) == ["int", "str[3]"]
+        assert parameter_shapes([(1,), (2,)], executemany=True) == {
+            "rows": 2,
+            "row": ["int"],
+        }
+
+
+class TestSlowQueryLog:
+    """Test slow statements are attributed and listed."""
+
+    def test_capture(self, client, slow_log, api_v1_prefix, auth_headers, test_book):
+        """Test entries name the CRUD method and the route template."""
+        response = client.get(
+            f"{api_v1_prefix}/books/{test_book.id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        entries = [
+            entry
+            for entry in slow_log.entries()
+            if entry.route == f"GET {api_v1_prefix}/books/{{book_id}}"
+        ]
+        book_query = next(
+            entry
+            for entry in entries
+            if entry.crud_method == "CRUDBook.get_with_details"
+        )
+        assert "FROM books" in book_query.statement
+        # SQLite takes positional parameters
+        assert set(book_query.parameters) == {"int"}
+        assert book_query.plan is None
+
+    def test_ring_buffer(self, db_session):
+        """Test only the newest entries are kept."""
+        log = SlowQueryLog(0, size=2)
+        log.install(engine)
+        try:
+            for number in range(3):
+                db_session.execute(text(f"SELECT {number}"))
+        finally:
+            log.remove(engine)
+
+        assert [entry.statement for entry in log.entries()] == ["SELECT ?"] * 2
+        assert len(log.entries()) == 2
+
+    def test_endpoint(self, client, slow_log, api_v1_prefix, admin_headers):
+        """Test admins can filter and clear the log."""
+        client.get(f"{api_v1_prefix}/books/public/")
+        url = f"{api_v1_prefix}/slow-queries/"
+
+        response = client.get(
+            url,
+            params={"route": f"GET {api_v1_prefix}/books/public/", "limit": 1},
+            headers=admin_headers,
+        )
+        data = response.json()
+        assert response.status_code == 200
+        assert len(data["data"]) == 1
+        assert data["meta"]["total"] >= 1
+        assert data["meta"]["threshold_ms"] == 0
+        assert data["data"][0]["route"] == f"GET {api_v1_prefix}/books/public/"
+
+        assert client.delete(url, headers=admin_headers).status_code == 200
+        assert slow_log.entries() == []
+
+    def test_admin_only(self, client, api_v1_prefix, auth_headers):
+        """Test regular users cannot read the log."""
+        response = client.get(f"{api_v1_prefix}/slow-queries/", headers=auth_headers)
+
+        assert response.status_code == 403
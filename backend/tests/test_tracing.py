@@ -0,0 +1,115 @@
+"""
+Test OpenTelemetry spans across requests, SQL, storage, email and hashing.
+"""
+
+import json
+
+import pytest
+from fastapi import BackgroundTasks, Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.auth import get_password_hash
+from app.core.database import get_db
+from app.core.supabase_client import LocalStorageClient
+from app.core.tracing import _exporter, setup_tracing, traced, with_trace_context
+from app.crud.book import crud_book
+from app.services.email_service import EmailService
+from tests.conftest import engine
+
+pytest.importorskip("opentelemetry.sdk")
+pytest.importorskip("opentelemetry.instrumentation.fastapi")
+
+from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+
+@traced("job.step")
+def job_step():
+    pass
+
+
+def background_job():
+    job_step()
+
+
+@pytest.fixture(scope="module")
+def spans():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    app = FastAPI()
+
+    @app.post("/books/{book_id}/work")
+    def work(
+        book_id: int,
+        background_tasks: BackgroundTasks,
+        db: Session = Depends(get_db),
+    ):
+        crud_book.get(db, id=book_id)
+        get_password_hash("secret")
+        storage = LocalStorageClient()
+        storage.delete_file(storage.upload_file(b"cover", "cover.png"))
+        EmailService()._send_email("reader@example.com", "Hello", "<p>Hi</p>")
+        background_tasks.add_task(with_trace_context(background_job))
+        return {}
+
+    assert setup_tracing(app, engine, tracer_provider=provider)
+    yield app, exporter
+    SQLAlchemyInstrumentor().uninstrument()
+    provider.shutdown()
+
+
+class TestTracing:
+    """Test a request produces one trace covering its work."""
+
+    def test_request_trace(self, spans, db_session, tmp_path, monkeypatch):
+        """Test route, SQL, storage, email, hashing and background spans."""
+        app, exporter = spans
+        exporter.clear()
+        monkeypatch.setattr("app.core.settings.settings.UPLOAD_FOLDER", str(tmp_path))
+        app.dependency_overrides[get_db] = lambda: db_session
+
+        response = TestClient(app).post("/books/1/work")
+        assert response.status_code == 200
+
+        finished = exporter.get_finished_spans()
+        by_name = {span.name: span for span in finished}
+        server = by_name["POST /books/{book_id}/work"]
+        for name in (
+            "password.hash",
+            "storage.upload",
+            "storage.delete",
+            "email.send",
+            "background background_job",
+            "job.step",
+        ):
+            assert by_name[name].context.trace_id == server.context.trace_id, name
+        assert any(
+            span.name.startswith("SELECT")
+            and span.context.trace_id == server.context.trace_id
+            for span in finished
+        )
+        assert by_name["job.step"].parent.span_id == (
+            by_name["background background_job"].context.span_id
+        )
+
+    def test_file_exporter(self, tmp_path, monkeypatch):
+        """Test spans are appended as JSON lines for offline use."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        monkeypatch.setattr("app.core.tracing.settings.TRACING_EXPORTER", "file")
+        monkeypatch.setattr("app.core.tracing.settings.TRACING_FILE_PATH", str(path))
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(_exporter()))
+
+        with provider.get_tracer("test").start_as_current_span("outer"):
+            with provider.get_tracer("test").start_as_current_span("inner"):
+                pass
+        provider.shutdown()
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["name"] for line in lines] == ["inner", "outer"]
@@ -5,7 +5,12 @@ import io
 from unittest.mock import patch
 
 import pytest
-from app.core.supabase_client import supabase_client
+from app.core.settings import settings
+from app.core.supabase_client import (
+    LOCAL_STORAGE_PATH,
+    LocalStorageClient,
+    supabase_client,
+)
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
@@ -390,6 +395,36 @@ class TestSupabaseClient:
             assert True
 
 
+class TestLocalStorageClient:
+    """Test the local storage stand-in."""
+
+    @pytest.fixture
+    def storage(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "UPLOAD_FOLDER", str(tmp_path))
+        return LocalStorageClient()
+
+    def test_upload_download_delete(self, storage, tmp_path):
+        """Test a file round trip through local storage."""
+        url = storage.upload_file(b"cover", "cover.png", "image/png", folder="covers")
+
+        assert url.startswith(f"{LOCAL_STORAGE_PATH}/covers/") and url.endswith(".png")
+        assert storage.download_file(url) == b"cover"
+        assert storage.delete_file(url) is True
+        assert storage.download_file(url) is None
+        assert not list(tmp_path.rglob("*.png"))
+
+    def test_refuses_paths_outside_root(self, storage, tmp_path):
+        """Test URLs cannot reach files outside the upload folder."""
+        secret = tmp_path.parent / "secret.txt"
+        secret.write_text("secret")
+
+        url = f"{LOCAL_STORAGE_PATH}/../secret.txt"
+        assert storage.download_file(url) is None
+        assert storage.delete_file(url) is False
+        assert storage.download_file("https://example.com/covers/a.png") is None
+        assert secret.exists()
+
+
 class TestFileValidation:
     """Test file validation utilities."""
 